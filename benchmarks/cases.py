@@ -0,0 +1,194 @@
+"""
+Benchmark cases: representative arguments for every tool.
+
+Histories use 20 years of trading days (~5,200 rows), cross-sections the
+fake backend's full market (2,500 tickers by default). A case is
+``(label, tool name, kwargs)``; labels with a ``[...]`` suffix are
+variants of the same tool.
+"""
+
+# Trading day used by single-date cases (a Friday)
+DATE = "20240105"
+
+# 20-year daily history
+HISTORY_START = "20040102"
+HISTORY_END = "20231229"
+
+# 5-year history for datasets with shorter upstream coverage
+RECENT_START = "20190102"
+
+TOOL_CASES: list[tuple[str, str, dict]] = [
+    # Stock prices
+    (
+        "get_stock_ohlcv",
+        "get_stock_ohlcv",
+        {"ticker": "005930", "start_date": HISTORY_START, "end_date": HISTORY_END},
+    ),
+    (
+        "get_stock_ohlcv[columns]",
+        "get_stock_ohlcv",
+        {
+            "ticker": "005930",
+            "start_date": HISTORY_START,
+            "end_date": HISTORY_END,
+            "response_format": "columns",
+        },
+    ),
+    (
+        "get_stock_ohlcv_batch",
+        "get_stock_ohlcv_batch",
+        {
+            "tickers": ["005930", "000660", "035420", "035720", "005380"],
+            "start_date": RECENT_START,
+            "end_date": HISTORY_END,
+        },
+    ),
+    (
+        "get_market_ohlcv_by_date",
+        "get_market_ohlcv_by_date",
+        {"date": DATE, "market": "ALL"},
+    ),
+    (
+        "get_market_ohlcv_by_date[top_n]",
+        "get_market_ohlcv_by_date",
+        {
+            "date": DATE,
+            "market": "ALL",
+            "columns": ["종가", "등락률"],
+            "sort_by": "등락률",
+            "top_n": 20,
+        },
+    ),
+    (
+        "get_market_ohlcv_by_date[page]",
+        "get_market_ohlcv_by_date",
+        {"date": DATE, "market": "ALL", "page_size": 500},
+    ),
+    (
+        "get_market_price_change",
+        "get_market_price_change",
+        {"start_date": "20231201", "end_date": DATE, "market": "ALL"},
+    ),
+    (
+        "screen_stocks",
+        "screen_stocks",
+        {"date": DATE, "market": "ALL", "max_per": 10, "max_pbr": 1, "limit": 50},
+    ),
+    # Market cap and fundamentals
+    (
+        "get_market_cap_by_date",
+        "get_market_cap_by_date",
+        {"ticker": "005930", "start_date": HISTORY_START, "end_date": HISTORY_END},
+    ),
+    (
+        "get_market_cap_by_ticker",
+        "get_market_cap_by_ticker",
+        {"date": DATE, "market": "ALL"},
+    ),
+    (
+        "get_market_fundamental_by_date",
+        "get_market_fundamental_by_date",
+        {"ticker": "005930", "start_date": HISTORY_START, "end_date": HISTORY_END},
+    ),
+    (
+        "get_market_fundamental_by_ticker",
+        "get_market_fundamental_by_ticker",
+        {"date": DATE, "market": "ALL"},
+    ),
+    # Tickers
+    (
+        "get_market_ticker_list",
+        "get_market_ticker_list",
+        {"date": DATE, "market": "KOSPI"},
+    ),
+    ("get_market_ticker_name", "get_market_ticker_name", {"ticker": "005930"}),
+    ("search_tickers", "search_tickers", {"query": "삼성"}),
+    ("get_ticker_info", "get_ticker_info", {"ticker": "005930"}),
+    # Investors
+    (
+        "get_market_trading_value_by_date",
+        "get_market_trading_value_by_date",
+        {"ticker": "005930", "start_date": RECENT_START, "end_date": HISTORY_END},
+    ),
+    (
+        "get_market_trading_volume_by_investor",
+        "get_market_trading_volume_by_investor",
+        {"start_date": "20231201", "end_date": DATE, "ticker": "KOSPI"},
+    ),
+    (
+        "get_market_trading_value_by_investor",
+        "get_market_trading_value_by_investor",
+        {"start_date": "20231201", "end_date": DATE, "ticker": "005930"},
+    ),
+    (
+        "get_market_net_purchases_of_equities",
+        "get_market_net_purchases_of_equities",
+        {
+            "start_date": "20231201",
+            "end_date": DATE,
+            "market": "ALL",
+            "investor": "외국인",
+        },
+    ),
+    # Foreign investment
+    (
+        "get_exhaustion_rates_of_foreign_investment",
+        "get_exhaustion_rates_of_foreign_investment",
+        {"start_date": DATE, "market": "KOSPI"},
+    ),
+    (
+        "get_exhaustion_rates_of_foreign_investment[ticker]",
+        "get_exhaustion_rates_of_foreign_investment",
+        {"start_date": RECENT_START, "end_date": HISTORY_END, "ticker": "005930"},
+    ),
+    # Short selling
+    (
+        "get_shorting_status_by_date",
+        "get_shorting_status_by_date",
+        {"ticker": "005930", "start_date": RECENT_START, "end_date": HISTORY_END},
+    ),
+    (
+        "get_shorting_volume_by_ticker",
+        "get_shorting_volume_by_ticker",
+        {"date": DATE, "market": "KOSPI"},
+    ),
+    (
+        "get_shorting_balance_top50",
+        "get_shorting_balance_top50",
+        {"date": DATE, "market": "KOSPI"},
+    ),
+    (
+        "get_shorting_volume_top50",
+        "get_shorting_volume_top50",
+        {"date": DATE, "market": "KOSPI"},
+    ),
+    # Indices
+    (
+        "get_index_ticker_list",
+        "get_index_ticker_list",
+        {"date": DATE, "market": "KOSPI"},
+    ),
+    ("get_index_ticker_name", "get_index_ticker_name", {"ticker": "1001"}),
+    (
+        "get_index_ohlcv",
+        "get_index_ohlcv",
+        {"ticker": "1001", "start_date": HISTORY_START, "end_date": HISTORY_END},
+    ),
+    (
+        "get_index_fundamental",
+        "get_index_fundamental",
+        {"start_date": RECENT_START, "end_date": HISTORY_END, "ticker": "1001"},
+    ),
+    (
+        "get_index_portfolio_deposit_file",
+        "get_index_portfolio_deposit_file",
+        {"ticker": "1028", "date": DATE},
+    ),
+    # ETFs
+    ("get_etf_ticker_list", "get_etf_ticker_list", {"date": DATE}),
+    (
+        "get_etf_ohlcv_by_date",
+        "get_etf_ohlcv_by_date",
+        {"ticker": "360000", "start_date": "20140102", "end_date": HISTORY_END},
+    ),
+]
@@ -0,0 +1,94 @@
+"""
+Compare two benchmark result files written by ``benchmarks/run.py``.
+
+Prints every metric that changed by more than the threshold and fails when
+one got worse: latency, memory and response size going up, or REST
+throughput going down. Changes smaller than ``--min-ms`` milliseconds are
+treated as noise.
+
+Example:
+    python benchmarks/compare.py benchmarks/results/a1b2c3d.json \\
+        benchmarks/results/e4f5a6b.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# (section, metric, higher is better)
+METRICS = (
+    ("tools", "median_ms", False),
+    ("tools", "p95_ms", False),
+    ("tools", "upstream_calls", False),
+    ("tools", "response_bytes", False),
+    ("tools", "peak_memory_kib", False),
+    ("formatters", "median_ms", False),
+    ("rest", "requests_per_sec", True),
+    ("rest", "median_ms", False),
+)
+
+
+def compare(
+    base: dict, head: dict, threshold: float, min_ms: float
+) -> list[tuple[str, str, float, float, float, bool]]:
+    """
+    Return the metrics that changed by more than ``threshold`` percent.
+
+    Returns:
+        (section/case, metric, base value, head value, change %, regressed)
+        tuples
+    """
+    changes = []
+    for section, metric, higher_is_better in METRICS:
+        base_cases = base.get(section, {})
+        for case, head_result in head.get(section, {}).items():
+            old = base_cases.get(case, {}).get(metric)
+            new = head_result.get(metric)
+            if old is None or new is None or old == new:
+                continue
+            if metric.endswith("_ms") and abs(new - old) < min_ms:
+                continue
+            change = (new - old) / old * 100 if old else float("inf")
+            if abs(change) < threshold:
+                continue
+            regressed = change < 0 if higher_is_better else change > 0
+            changes.append((f"{section}/{case}", metric, old, new, change, regressed))
+    return changes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0)
+    parser.add_argument("--min-ms", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    base = json.loads(args.base.read_text())
+    head = json.loads(args.head.read_text())
+    print(
+        f"{base['meta'].get('commit')} -> {head['meta'].get('commit')} "
+        f"(threshold {args.threshold:g}%)"
+    )
+
+    if base["meta"].get("config") != head["meta"].get("config"):
+        print("  warning: the runs used different settings (meta.config)")
+
+    changes = compare(base, head, args.threshold, args.min_ms)
+    for case, metric, old, new, change, regressed in sorted(
+        changes, key=lambda c: (not c[5], c[0], c[1])
+    ):
+        mark = "WORSE" if regressed else "better"
+        print(f"  {mark:6s} {case} {metric}: {old:g} -> {new:g} ({change:+.1f}%)")
+
+    regressions = sum(1 for change in changes if change[5])
+    if regressions:
+        print(f"FAIL: {regressions} regressions")
+        return 1
+    print("OK: no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
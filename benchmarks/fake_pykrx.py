@@ -0,0 +1,520 @@
+"""
+Deterministic, offline stand-in for ``pykrx.stock``.
+
+``FakeStock`` exposes every pykrx function the tools call and returns
+realistic-size DataFrames with pykrx's column names: full-market
+cross-sections of ``tickers`` stocks (2,500 by default) and daily
+histories spanning the requested range (e.g. ~5,200 rows for 20 years).
+Values are derived from a hash of the call's arguments, so identical calls
+return identical frames across runs and machines.
+
+Each "scraping" call sleeps for ``latency`` seconds (plus up to ``jitter``
+seconds, also deterministic) to model KRX round trips. Name lookups, which
+pykrx answers from local data, do not sleep.
+
+Example:
+    fake = FakeStock(tickers=2500, latency=0.05)
+    with fake.installed():
+        from pykrx_mcp import tools
+        tools.get_market_ohlcv_by_date("20240105", "ALL")
+    print(fake.calls)
+"""
+
+import contextlib
+import sys
+import threading
+import time
+import types
+import zlib
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+MARKETS = ("KOSPI", "KOSDAQ", "KONEX")
+
+# Well-known tickers kept at the front so benchmark cases can name them
+KNOWN_TICKERS = {
+    "005930": "삼성전자",
+    "000660": "SK하이닉스",
+    "035420": "NAVER",
+    "035720": "카카오",
+    "005380": "현대차",
+    "051910": "LG화학",
+    "068270": "셀트리온",
+    "247540": "에코프로비엠",
+}
+
+INDEX_TICKERS = {
+    "KOSPI": [str(1001 + i) for i in range(45)],
+    "KOSDAQ": [str(2001 + i) for i in range(35)],
+    "KRX": [str(5042 + i) for i in range(20)],
+}
+
+INVESTORS = (
+    "금융투자",
+    "보험",
+    "투신",
+    "사모",
+    "은행",
+    "기타금융",
+    "연기금",
+    "기관합계",
+    "기타법인",
+    "개인",
+    "외국인",
+    "기타외국인",
+    "전체",
+)
+
+
+def _seed(*parts: Any) -> int:
+    return zlib.crc32(repr(parts).encode("utf-8"))
+
+
+def _business_days(fromdate: str, todate: str) -> pd.DatetimeIndex:
+    return pd.bdate_range(
+        pd.Timestamp(str(fromdate)), pd.Timestamp(str(todate)), name="날짜"
+    )
+
+
+class FakeStock(types.ModuleType):
+    """Module-like pykrx ``stock`` stand-in with deterministic data."""
+
+    def __init__(
+        self,
+        tickers: int = 2500,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        etfs: int = 800,
+    ) -> None:
+        super().__init__("pykrx.stock")
+        self.latency = latency
+        self.jitter = jitter
+        self.calls: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+        codes = list(KNOWN_TICKERS)
+        step = 0
+        while len(codes) < tickers:
+            code = f"{(step * 37 + 20) % 999_990:06d}"
+            if code not in KNOWN_TICKERS:
+                codes.append(code)
+            step += 1
+        codes = codes[:tickers]
+        konex = max(len(codes) // 40, 1)
+        kospi = (len(codes) - konex) * 2 // 5
+        self.market_of = {
+            code: "KOSPI"
+            if i < kospi
+            else "KOSDAQ"
+            if i < len(codes) - konex
+            else "KONEX"
+            for i, code in enumerate(codes)
+        }
+        self.names = {
+            code: KNOWN_TICKERS.get(code, f"종목{code}") for code in self.market_of
+        }
+        self.etf_tickers = [f"{360000 + i * 7:06d}" for i in range(etfs)]
+
+    # ----- plumbing -----
+
+    def _scrape(self, name: str, *args: Any) -> np.random.Generator:
+        """Count the call, sleep like a KRX round trip and seed its data."""
+        with self._lock:
+            self.calls[name] += 1
+        rng = np.random.default_rng(_seed(name, *args))
+        delay = self.latency + (self.jitter * rng.random() if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        return rng
+
+    def _tickers(self, market: str) -> list[str]:
+        market = str(market).upper()
+        if market == "ALL":
+            return list(self.market_of)
+        return [code for code, m in self.market_of.items() if m == market]
+
+    @contextlib.contextmanager
+    def installed(self) -> Iterator["FakeStock"]:
+        """
+        Serve ``pykrx.stock`` from this fake while the block runs.
+
+        Replaces the ``pykrx`` modules in ``sys.modules`` (so later imports
+        never load the real package or touch the network) and the ``stock``
+        global of already imported tool modules.
+        """
+        package = types.ModuleType("pykrx")
+        package.stock = self
+        saved = {name: sys.modules.get(name) for name in ("pykrx", "pykrx.stock")}
+        sys.modules["pykrx"] = package
+        sys.modules["pykrx.stock"] = self
+        patched = {}
+        for name, module in list(sys.modules.items()):
+            if name.startswith("pykrx_mcp.tools.") and hasattr(module, "stock"):
+                patched[module] = module.stock
+                module.stock = self
+        try:
+            yield self
+        finally:
+            for module, original in patched.items():
+                module.stock = original
+            for name, module in saved.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
+
+    # ----- generators -----
+
+    def _prices(self, rng: np.random.Generator, rows: int) -> dict[str, np.ndarray]:
+        close = rng.lognormal(mean=10.0, sigma=1.2, size=rows).round(-1) + 100
+        spread = rng.uniform(0.0, 0.03, size=rows)
+        open_ = (close * (1 + rng.normal(0, 0.01, rows))).round(-1)
+        volume = rng.integers(1_000, 20_000_000, size=rows)
+        return {
+            "시가": open_.astype("int64"),
+            "고가": (np.maximum(open_, close) * (1 + spread)).astype("int64"),
+            "저가": (np.minimum(open_, close) * (1 - spread)).astype("int64"),
+            "종가": close.astype("int64"),
+            "거래량": volume,
+            "거래대금": (volume * close).astype("int64"),
+            "등락률": rng.normal(0, 2.5, size=rows).round(2),
+        }
+
+    def _history(self, rng: np.random.Generator, fromdate: str, todate: str) -> tuple:
+        days = _business_days(fromdate, todate)
+        steps = rng.normal(0.0003, 0.02, size=len(days))
+        close = (rng.uniform(5_000, 500_000) * np.exp(np.cumsum(steps))).round(-1)
+        return days, close
+
+    def _ohlcv_history(self, rng, fromdate, todate) -> pd.DataFrame:
+        days, close = self._history(rng, fromdate, todate)
+        rows = len(days)
+        spread = rng.uniform(0.0, 0.03, size=rows)
+        open_ = np.concatenate((close[:1], close[:-1]))
+        volume = rng.integers(10_000, 30_000_000, size=rows)
+        change = np.zeros(rows)
+        change[1:] = (close[1:] / close[:-1] - 1) * 100
+        return pd.DataFrame(
+            {
+                "시가": open_.astype("int64"),
+                "고가": (np.maximum(open_, close) * (1 + spread)).astype("int64"),
+                "저가": (np.minimum(open_, close) * (1 - spread)).astype("int64"),
+                "종가": close.astype("int64"),
+                "거래량": volume,
+                "거래대금": (volume * close).astype("int64"),
+                "등락률": change.round(2),
+            },
+            index=days,
+        )
+
+    def _fundamentals(self, rng: np.random.Generator, rows: int) -> dict:
+        eps = rng.normal(3_000, 4_000, size=rows).round()
+        bps = rng.uniform(1_000, 200_000, size=rows).round()
+        price = rng.lognormal(10.0, 1.2, size=rows)
+        dps = np.maximum(rng.normal(500, 600, size=rows), 0).round()
+        return {
+            "BPS": bps.astype("int64"),
+            "PER": np.where(eps > 0, price / np.maximum(eps, 1), 0).round(2),
+            "PBR": (price / bps).round(2),
+            "EPS": eps.astype("int64"),
+            "DIV": (dps / price * 100).round(2),
+            "DPS": dps.astype("int64"),
+        }
+
+    def _cross_section(self, data: dict, tickers: list[str]) -> pd.DataFrame:
+        return pd.DataFrame(data, index=pd.Index(tickers, name="티커"))
+
+    # ----- tickers and names -----
+
+    def get_market_ticker_list(self, date=None, market="KOSPI"):
+        self._scrape("get_market_ticker_list", date, market)
+        return self._tickers(market)
+
+    def get_market_ticker_name(self, ticker):
+        self.calls["get_market_ticker_name"] += 1
+        return self.names.get(str(ticker), "")
+
+    def get_previous_business_days(self, fromdate=None, todate=None, **kwargs):
+        self._scrape("get_previous_business_days", fromdate, todate)
+        return list(_business_days(fromdate, todate))
+
+    # ----- stock prices -----
+
+    def get_market_ohlcv(self, date, market="KOSPI", **kwargs):
+        rng = self._scrape("get_market_ohlcv", date, market)
+        tickers = self._tickers(market)
+        return self._cross_section(self._prices(rng, len(tickers)), tickers)
+
+    def get_market_ohlcv_by_date(
+        self, fromdate, todate, ticker, freq="d", adjusted=True, **kwargs
+    ):
+        rng = self._scrape("get_market_ohlcv_by_date", ticker, adjusted)
+        return self._ohlcv_history(rng, fromdate, todate)
+
+    def get_market_price_change(self, fromdate, todate, market="KOSPI", **kwargs):
+        rng = self._scrape("get_market_price_change", fromdate, todate, market)
+        tickers = self._tickers(market)
+        prices = self._prices(rng, len(tickers))
+        start = prices["시가"]
+        end = (start * (1 + prices["등락률"] / 100)).astype("int64")
+        return self._cross_section(
+            {
+                "종목명": [self.names[t] for t in tickers],
+                "시가": start,
+                "종가": end,
+                "변동폭": end - start,
+                "등락률": prices["등락률"],
+                "거래량": prices["거래량"],
+                "거래대금": prices["거래대금"],
+            },
+            tickers,
+        )
+
+    # ----- fundamentals and market cap -----
+
+    def get_market_fundamental(self, date, market="KOSPI", **kwargs):
+        rng = self._scrape("get_market_fundamental", date, market)
+        tickers = self._tickers(market)
+        return self._cross_section(self._fundamentals(rng, len(tickers)), tickers)
+
+    get_market_fundamental_by_ticker = get_market_fundamental
+
+    def get_market_fundamental_by_date(self, fromdate, todate, ticker, **kwargs):
+        rng = self._scrape("get_market_fundamental_by_date", ticker)
+        days = _business_days(fromdate, todate)
+        return pd.DataFrame(self._fundamentals(rng, len(days)), index=days)
+
+    def get_market_cap(self, date, market="ALL", **kwargs):
+        rng = self._scrape("get_market_cap", date, market)
+        tickers = self._tickers(market)
+        prices = self._prices(rng, len(tickers))
+        shares = rng.integers(1_000_000, 6_000_000_000, size=len(tickers))
+        return self._cross_section(
+            {
+                "종가": prices["종가"],
+                "시가총액": prices["종가"] * shares,
+                "거래량": prices["거래량"],
+                "거래대금": prices["거래대금"],
+                "상장주식수": shares,
+            },
+            tickers,
+        )
+
+    get_market_cap_by_ticker = get_market_cap
+
+    def get_market_cap_by_date(self, fromdate, todate, ticker, **kwargs):
+        rng = self._scrape("get_market_cap_by_date", ticker)
+        shares = int(rng.integers(1_000_000, 6_000_000_000))
+        df = self._ohlcv_history(rng, fromdate, todate)
+        return pd.DataFrame(
+            {
+                "시가총액": df["종가"] * shares,
+                "거래량": df["거래량"],
+                "거래대금": df["거래대금"],
+                "상장주식수": shares,
+            },
+            index=df.index,
+        )
+
+    # ----- investors -----
+
+    def _by_investor(self, name: str, fromdate, todate, ticker) -> pd.DataFrame:
+        rng = self._scrape(name, fromdate, todate, ticker)
+        sell = rng.integers(10_000, 50_000_000, size=len(INVESTORS))
+        buy = rng.integers(10_000, 50_000_000, size=len(INVESTORS))
+        return pd.DataFrame(
+            {"매도": sell, "매수": buy, "순매수": buy - sell},
+            index=pd.Index(INVESTORS, name="투자자구분"),
+        )
+
+    def get_market_trading_volume_by_investor(self, fromdate, todate, ticker, **kw):
+        return self._by_investor(
+            "get_market_trading_volume_by_investor", fromdate, todate, ticker
+        )
+
+    def get_market_trading_value_by_investor(self, fromdate, todate, ticker, **kw):
+        return self._by_investor(
+            "get_market_trading_value_by_investor", fromdate, todate, ticker
+        )
+
+    def get_market_net_purchases_of_equities(
+        self, fromdate, todate, market="KOSPI", investor="개인", **kwargs
+    ):
+        rng = self._scrape(
+            "get_market_net_purchases_of_equities", fromdate, todate, market, investor
+        )
+        tickers = self._tickers(market)
+        rows = len(tickers)
+        sell_volume = rng.integers(0, 5_000_000, size=rows)
+        buy_volume = rng.integers(0, 5_000_000, size=rows)
+        price = rng.lognormal(10.0, 1.2, size=rows).astype("int64")
+        df = self._cross_section(
+            {
+                "종목명": [self.names[t] for t in tickers],
+                "매도거래량": sell_volume,
+                "매수거래량": buy_volume,
+                "순매수거래량": buy_volume - sell_volume,
+                "매도거래대금": sell_volume * price,
+                "매수거래대금": buy_volume * price,
+                "순매수거래대금": (buy_volume - sell_volume) * price,
+            },
+            tickers,
+        )
+        return df.sort_values("순매수거래대금", ascending=False)
+
+    get_market_net_purchases_of_equities_by_ticker = (
+        get_market_net_purchases_of_equities
+    )
+
+    def get_market_trading_value_by_date(self, fromdate, todate, ticker, **kwargs):
+        rng = self._scrape("get_market_trading_value_by_date", ticker)
+        days = _business_days(fromdate, todate)
+        columns = ("기관합계", "기타법인", "개인", "외국인합계")
+        data = {c: rng.integers(-5e10, 5e10, size=len(days)) for c in columns}
+        data["전체"] = np.zeros(len(days), dtype="int64")
+        return pd.DataFrame(data, index=days)
+
+    # ----- foreign investment -----
+
+    def get_exhaustion_rates_of_foreign_investment(
+        self, fromdate, todate=None, ticker=None, market="KOSPI", balance_limit=False
+    ):
+        rng = self._scrape(
+            "get_exhaustion_rates_of_foreign_investment",
+            fromdate,
+            todate,
+            ticker,
+            market,
+            balance_limit,
+        )
+        if ticker is not None:
+            index = _business_days(fromdate, todate or fromdate)
+        else:
+            index = pd.Index(self._tickers(market), name="티커")
+        rows = len(index)
+        shares = rng.integers(1_000_000, 6_000_000_000, size=rows)
+        held = (shares * rng.uniform(0, 0.6, size=rows)).astype("int64")
+        return pd.DataFrame(
+            {
+                "상장주식수": shares,
+                "보유수량": held,
+                "지분율": (held / shares * 100).round(2),
+                "한도수량": shares,
+                "한도소진률": (held / shares * 100).round(2),
+            },
+            index=index,
+        )
+
+    # ----- short selling -----
+
+    def get_shorting_status_by_date(self, fromdate, todate, ticker, **kwargs):
+        rng = self._scrape("get_shorting_status_by_date", ticker)
+        days = _business_days(fromdate, todate)
+        rows = len(days)
+        volume = rng.integers(0, 2_000_000, size=rows)
+        balance = rng.integers(0, 50_000_000, size=rows)
+        price = rng.lognormal(10.0, 1.0, size=rows).astype("int64")
+        return pd.DataFrame(
+            {
+                "거래량": volume,
+                "잔고수량": balance,
+                "거래대금": volume * price,
+                "잔고금액": balance * price,
+            },
+            index=days,
+        )
+
+    def get_shorting_volume_by_ticker(self, date, market="KOSPI", **kwargs):
+        rng = self._scrape("get_shorting_volume_by_ticker", date, market)
+        tickers = self._tickers(market)
+        short = rng.integers(0, 500_000, size=len(tickers))
+        total = short + rng.integers(1_000, 20_000_000, size=len(tickers))
+        return self._cross_section(
+            {"공매도": short, "매수": total, "비중": (short / total * 100).round(2)},
+            tickers,
+        )
+
+    def _top50(self, name: str, date, market, columns: tuple[str, ...]):
+        rng = self._scrape(name, date, market)
+        tickers = self._tickers(market)[:50]
+        data = {"순위": np.arange(1, len(tickers) + 1)}
+        for column in columns:
+            data[column] = rng.integers(1_000, 10_000_000_000, size=len(tickers))
+        data["비중"] = rng.uniform(0, 20, size=len(tickers)).round(2)
+        return self._cross_section(data, tickers)
+
+    def get_shorting_balance_top50(self, date, market="KOSPI", **kwargs):
+        return self._top50(
+            "get_shorting_balance_top50",
+            date,
+            market,
+            ("공매도잔고", "상장주식수", "공매도금액", "시가총액"),
+        )
+
+    def get_shorting_volume_top50(self, date, market="KOSPI", **kwargs):
+        return self._top50(
+            "get_shorting_volume_top50",
+            date,
+            market,
+            ("공매도거래대금", "총거래대금", "직전40일거래대금평균"),
+        )
+
+    # ----- indices -----
+
+    def get_index_ticker_list(self, date=None, market="KOSPI"):
+        self._scrape("get_index_ticker_list", date, market)
+        return list(INDEX_TICKERS.get(str(market).upper(), []))
+
+    def get_index_ticker_name(self, ticker):
+        self.calls["get_index_ticker_name"] += 1
+        return f"지수{ticker}"
+
+    def get_index_ohlcv(self, fromdate, todate, ticker, freq="d", **kwargs):
+        rng = self._scrape("get_index_ohlcv", ticker, freq)
+        df = self._ohlcv_history(rng, fromdate, todate)
+        df["상장시가총액"] = df["거래대금"] * 1000
+        return df.drop(columns=["등락률"])
+
+    def get_index_fundamental(self, fromdate, todate=None, ticker=None, **kwargs):
+        rng = self._scrape("get_index_fundamental", fromdate, todate, ticker)
+        if ticker is not None:
+            index = _business_days(fromdate, todate or fromdate)
+        else:
+            index = pd.Index(
+                [f"지수{t}" for t in INDEX_TICKERS["KOSPI"]], name="지수명"
+            )
+        rows = len(index)
+        return pd.DataFrame(
+            {
+                "종가": rng.uniform(500, 4_000, size=rows).round(2),
+                "등락률": rng.normal(0, 1.2, size=rows).round(2),
+                "PER": rng.uniform(5, 30, size=rows).round(2),
+                "선행PER": rng.uniform(5, 30, size=rows).round(2),
+                "PBR": rng.uniform(0.5, 3, size=rows).round(2),
+                "배당수익률": rng.uniform(0, 5, size=rows).round(2),
+            },
+            index=index,
+        )
+
+    def get_index_portfolio_deposit_file(self, ticker, date=None, **kwargs):
+        rng = self._scrape("get_index_portfolio_deposit_file", ticker, date)
+        codes = list(self.market_of)
+        size = min(200, len(codes))
+        return sorted(rng.choice(codes, size=size, replace=False).tolist())
+
+    # ----- ETFs -----
+
+    def get_etf_ticker_list(self, date=None):
+        self._scrape("get_etf_ticker_list", date)
+        return list(self.etf_tickers)
+
+    def get_etf_ohlcv_by_date(self, fromdate, todate, ticker, **kwargs):
+        rng = self._scrape("get_etf_ohlcv_by_date", ticker)
+        df = self._ohlcv_history(rng, fromdate, todate)
+        df.insert(0, "NAV", (df["종가"] * 1.001).round(2))
+        df["기초지수"] = (df["종가"] / 10).round(2)
+        return df.drop(columns=["등락률"])
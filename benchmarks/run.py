@@ -0,0 +1,383 @@
+"""
+Offline benchmark suite for the tools, formatters and REST API.
+
+Serves ``pykrx.stock`` from the deterministic ``FakeStock`` backend (no
+network), then measures:
+
+- tools: cold and warm end-to-end latency, per-stage time (``_timing``),
+  upstream calls, response size and peak traced memory of every case in
+  ``cases.TOOL_CASES``
+- formatters: throughput of the DataFrame formatters and stream encoders
+  on a full-market cross-section and a 20-year history
+- rest: requests/sec and latency of every REST tool endpoint (and the
+  streaming endpoint) through an in-process ASGI client
+
+Results are written as JSON (default ``benchmarks/results/<commit>.json``)
+so runs can be diffed with ``benchmarks/compare.py``. Caches configured via
+``PYKRX_MCP_*`` variables are cleared unless ``--keep-env`` is given, and
+INFO logging is disabled so terminal output does not skew the numbers.
+
+Example:
+    python benchmarks/run.py
+    python benchmarks/run.py --suites tools --latency-ms 50 --repeat 10
+    python benchmarks/run.py --cases get_stock_ohlcv,screen_stocks
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCH_DIR.parent
+sys.path[:0] = [str(ROOT_DIR / "src"), str(BENCH_DIR)]
+
+from cases import DATE, HISTORY_END, HISTORY_START, TOOL_CASES  # noqa: E402
+from fake_pykrx import FakeStock  # noqa: E402
+
+SUITES = ("tools", "formatters", "rest")
+
+# Settings that would make runs depend on local state
+ISOLATED_ENV = (
+    "PYKRX_MCP_CACHE_DIR",
+    "PYKRX_MCP_MEMORY_CACHE",
+    "PYKRX_MCP_STORE_DIR",
+    "PYKRX_MCP_SNAPSHOT_MAX_DAYS",
+    "PYKRX_MCP_RANGE_CHUNK_MONTHS",
+    "PYKRX_MCP_CALENDAR_PATH",
+    "PYKRX_MCP_CALENDAR_FETCH",
+    "PYKRX_MCP_TICKER_MASTER_PATH",
+    "PYKRX_MCP_WARMUP",
+    "PYKRX_MCP_REFRESH",
+    "PYKRX_MCP_RESPONSE_FORMAT",
+)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Latency summary (ms) of a list of durations in seconds."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "min_ms": _ms(ordered[0]),
+        "median_ms": _ms(statistics.median(ordered)),
+        "p95_ms": _ms(p95),
+        "mean_ms": _ms(statistics.fmean(ordered)),
+    }
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, default=str, ensure_ascii=False).encode("utf-8"))
+
+
+# ===== Suites =====
+
+
+def bench_tools(
+    fake: FakeStock, cases: list[tuple[str, str, dict]], repeat: int
+) -> dict[str, dict]:
+    """Time every tool case end to end."""
+    from pykrx_mcp import tools
+
+    os.environ["PYKRX_MCP_TIMING"] = "1"
+    results = {}
+    for label, name, kwargs in cases:
+        func = tools.load_tool(name)
+
+        fake.calls.clear()
+        started = time.perf_counter()
+        result = func(**kwargs)
+        cold = time.perf_counter() - started
+        upstream = sum(fake.calls.values())
+
+        if "error" in result:
+            results[label] = {"tool": name, "error": str(result["error"])}
+            print(f"  {label}: ERROR {result['error']}")
+            continue
+
+        warm, stages = [], {}
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func(**kwargs)
+            warm.append(time.perf_counter() - started)
+            for stage, ms in result["_timing"]["stages_ms"].items():
+                stages.setdefault(stage, []).append(ms)
+
+        tracemalloc.start()
+        func(**kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        result.pop("_timing")
+        results[label] = {
+            "tool": name,
+            "cold_ms": _ms(cold),
+            **summarize(warm),
+            "stages_ms": {
+                stage: round(statistics.median(values), 3)
+                for stage, values in stages.items()
+            },
+            "upstream_calls": upstream,
+            "response_bytes": _json_size(result),
+            "peak_memory_kib": round(peak / 1024, 1),
+        }
+        print(
+            f"  {label}: median {results[label]['median_ms']:.1f} ms, "
+            f"{results[label]['response_bytes'] / 1024:.0f} KiB"
+        )
+    os.environ.pop("PYKRX_MCP_TIMING", None)
+    return results
+
+
+def bench_formatters(tickers: int, repeat: int) -> dict[str, dict]:
+    """Measure formatter and stream encoder throughput."""
+    from pykrx_mcp.utils.formatters import (
+        RESPONSE_FORMATS,
+        STREAM_MEDIA_TYPES,
+        format_dataframe_response,
+        format_dict_response,
+        iter_dataframe_chunks,
+    )
+
+    data = FakeStock(tickers=tickers)
+    cross_section = data.get_market_ohlcv(DATE, "ALL")
+    history = data.get_market_ohlcv_by_date(HISTORY_START, HISTORY_END, "005930")
+
+    def encode_stream(df, stream_format):
+        return "".join(iter_dataframe_chunks(df, stream_format, ticker="005930"))
+
+    cases = []
+    for response_format in RESPONSE_FORMATS:
+        cases.append(
+            (
+                f"format_dict_response[cross_section,{response_format}]",
+                cross_section,
+                lambda df, f=response_format: format_dict_response(df, f),
+            )
+        )
+        cases.append(
+            (
+                f"format_dataframe_response[history,{response_format}]",
+                history,
+                lambda df, f=response_format: format_dataframe_response(df, f),
+            )
+        )
+    for stream_format in STREAM_MEDIA_TYPES:
+        cases.append(
+            (
+                f"iter_dataframe_chunks[history,{stream_format}]",
+                history,
+                lambda df, f=stream_format: encode_stream(df, f),
+            )
+        )
+
+    results = {}
+    for label, df, encode in cases:
+        output = encode(df)
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            encode(df)
+            samples.append(time.perf_counter() - started)
+        size = len(output.encode("utf-8")) if isinstance(output, str) else None
+        median = statistics.median(samples)
+        results[label] = {
+            "rows": len(df),
+            **summarize(samples),
+            "rows_per_sec": round(len(df) / median),
+            "output_bytes": size if size is not None else _json_size(output),
+        }
+        results[label]["mb_per_sec"] = round(
+            results[label]["output_bytes"] / median / 1e6, 2
+        )
+        print(f"  {label}: {results[label]['rows_per_sec']:,} rows/s")
+    return results
+
+
+async def _load(client, path: str, body: dict, requests: int, concurrency: int):
+    latencies, statuses, sizes = [], {}, []
+    queue = list(range(requests))
+
+    async def worker() -> None:
+        while queue:
+            queue.pop()
+            started = time.perf_counter()
+            response = await client.post(path, json=body)
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            sizes.append(len(response.content))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, statuses, sizes
+
+
+def bench_rest(
+    cases: list[tuple[str, str, dict]], requests: int, concurrency: int
+) -> dict[str, dict]:
+    """Load every REST tool endpoint through an in-process ASGI client."""
+    import httpx
+
+    from pykrx_mcp.rest_api import app
+
+    routes = {route.path for route in app.routes}
+    targets = [
+        (label, f"/tools/{name}", kwargs)
+        for label, name, kwargs in cases
+        if f"/tools/{name}" in routes
+    ]
+    targets.append(
+        (
+            "stream/get_stock_ohlcv[ndjson]",
+            "/stream/get_stock_ohlcv",
+            {
+                "tickers": ["005930", "000660", "035420", "035720", "005380"],
+                "start_date": HISTORY_START,
+                "end_date": HISTORY_END,
+            },
+        )
+    )
+
+    async def run() -> dict[str, dict]:
+        results = {}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None
+        ) as client:
+            for label, path, body in targets:
+                # Warm-up: loads the tool module and fills in-memory tiers
+                await client.post(path, json=body)
+                elapsed, latencies, statuses, sizes = await _load(
+                    client, path, body, requests, concurrency
+                )
+                results[label] = {
+                    "path": path,
+                    "requests": requests,
+                    "concurrency": concurrency,
+                    "requests_per_sec": round(requests / elapsed, 1),
+                    **summarize(latencies),
+                    "statuses": {str(k): v for k, v in sorted(statuses.items())},
+                    "response_bytes": int(statistics.median(sizes)),
+                }
+                print(f"  {label}: {results[label]['requests_per_sec']:,} req/s")
+        return results
+
+    return asyncio.run(run())
+
+
+# ===== Entry point =====
+
+
+def _git(*args: str) -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", *args], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def environment_info() -> dict[str, Any]:
+    import numpy
+    import pandas
+
+    commit = _git("rev-parse", "--short", "HEAD")
+    return {
+        "commit": commit,
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--suites", default=",".join(SUITES))
+    parser.add_argument(
+        "--cases", default=None, help="Comma-separated case labels (default: all)"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tickers", type=int, default=2500)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rest-requests", type=int, default=50)
+    parser.add_argument("--rest-concurrency", type=int, default=8)
+    parser.add_argument("--keep-env", action="store_true")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    suites = [s.strip() for s in args.suites.split(",") if s.strip()]
+    unknown = sorted(set(suites) - set(SUITES))
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(unknown)}")
+    cases = TOOL_CASES
+    if args.cases:
+        wanted = set(args.cases.split(","))
+        cases = [case for case in TOOL_CASES if case[0] in wanted]
+
+    if not args.keep_env:
+        for name in ISOLATED_ENV:
+            os.environ.pop(name, None)
+    logging.disable(logging.INFO)
+
+    fake = FakeStock(
+        tickers=args.tickers,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+    )
+    report: dict[str, Any] = {
+        "meta": {
+            **environment_info(),
+            "config": {
+                key: value for key, value in vars(args).items() if key != "output"
+            },
+        }
+    }
+    with fake.installed():
+        if "tools" in suites:
+            print("tools:")
+            report["tools"] = bench_tools(fake, cases, args.repeat)
+        if "formatters" in suites:
+            print("formatters:")
+            report["formatters"] = bench_formatters(args.tickers, args.repeat)
+        if "rest" in suites:
+            print("rest:")
+            report["rest"] = bench_rest(
+                cases, args.rest_requests, args.rest_concurrency
+            )
+
+    output = Path(
+        args.output
+        or BENCH_DIR / "results" / f"{report['meta']['commit'] or 'local'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+    print(f"Wrote {output}")
+
+    errors = [label for label, r in report.get("tools", {}).items() if "error" in r]
+    if errors:
+        print(f"FAIL: tool cases returned errors: {', '.join(errors)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Cold-start import benchmark for the MCP server.
+
+Runs ``python -X importtime -c "import pykrx_mcp.server"`` in fresh
+interpreters, reports the median cumulative import time and the slowest
+top-level packages, and fails when the median exceeds the budget or when a
+module that must stay lazy (pykrx, pandas) is imported at start-up.
+
+Example:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --budget-ms 1000
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Median cumulative import time allowed for pykrx_mcp.server (ms)
+DEFAULT_BUDGET_MS = 1500
+
+# Modules that tool calls load on first use and start-up must not import
+LAZY_MODULES = ("pykrx", "pandas", "numpy", "matplotlib")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Map each imported module to its cumulative import time (µs)."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+    return cumulative
+
+
+def measure(module: str) -> dict[str, int]:
+    """Import ``module`` in a fresh interpreter and return its timings."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="pykrx_mcp.server")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    totals = [run[args.module] / 1000 for run in runs]
+    median_ms = statistics.median(totals)
+
+    last = runs[-1]
+    top_level = {name: us for name, us in last.items() if "." not in name}
+    print(f"{args.module}: median {median_ms:.0f} ms over {args.runs} runs")
+    print(f"  runs: {', '.join(f'{t:.0f}' for t in totals)} ms")
+    print("  slowest top-level imports (last run):")
+    for name, us in sorted(top_level.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"    {us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in last]
+    if eager:
+        print(f"FAIL: imported at start-up: {', '.join(eager)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"FAIL: median {median_ms:.0f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print(f"OK: within {args.budget_ms:.0f} ms budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+pykrx-mcp-ingest: fill the local Parquet market-data store.
+
+The first run backfills history from ``--start``; later runs append only
+the trading days after the last ingested date, so a daily cron job after
+market close keeps the store current.
+
+Example:
+    pykrx-mcp-ingest --store ./krx-store --start 20150101
+    pykrx-mcp-ingest --store ./krx-store
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Any
+
+import pandas as pd
+
+from .utils.cache import KST, SETTLED_HOUR
+from .utils.store import DATASETS, MARKETS, MarketStore, snapshot_frame
+from .utils.trading_calendar import get_trading_calendar
+from .utils.validators import validate_date_format
+
+logger = logging.getLogger(__name__)
+
+# A chunk at least this long without any trading day means the business-day
+# lookup failed rather than the market being closed
+_MAX_CLOSED_DAYS = 14
+
+
+def _shift(date: str, days: int) -> str:
+    return (datetime.strptime(date, "%Y%m%d") + timedelta(days=days)).strftime("%Y%m%d")
+
+
+def default_end_date(now: datetime | None = None) -> str:
+    """Return the latest date whose closing data is final (YYYYMMDD)."""
+    now = now or datetime.now(KST)
+    if now.hour < SETTLED_HOUR:
+        now -= timedelta(days=1)
+    return now.strftime("%Y%m%d")
+
+
+def plan_ranges(
+    coverage: tuple[str, str] | None, start: str | None, end: str
+) -> list[tuple[str, str, bool]]:
+    """
+    Work out which date ranges still need ingesting.
+
+    Args:
+        coverage: Current (start, end) coverage of the dataset, if any
+        start: Requested backfill start, or None to only append
+        end: Last date to ingest
+
+    Returns:
+        List of (start, end, backfill) ranges; backfill ranges extend the
+        coverage backwards and must be ingested newest month first
+
+    Raises:
+        ValueError: If the dataset is empty and no start date was given
+    """
+    if coverage is None:
+        if start is None:
+            raise ValueError("The store is empty; pass --start to backfill")
+        return [(start, end, False)] if start <= end else []
+
+    ranges = []
+    if start is not None and start < coverage[0]:
+        ranges.append((start, _shift(coverage[0], -1), True))
+    if end > coverage[1]:
+        ranges.append((_shift(coverage[1], 1), end, False))
+    return ranges
+
+
+def _month_chunks(start: str, end: str) -> list[tuple[str, str]]:
+    chunks = []
+    chunk_start = start
+    while chunk_start <= end:
+        first = datetime.strptime(chunk_start[:6] + "01", "%Y%m%d")
+        next_month = (first + timedelta(days=32)).replace(day=1)
+        chunk_end = min(end, _shift(next_month.strftime("%Y%m%d"), -1))
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = _shift(chunk_end, 1)
+    return chunks
+
+
+def ingest_range(
+    store: MarketStore,
+    dataset: str,
+    start: str,
+    end: str,
+    module: Any,
+    backfill: bool = False,
+) -> int:
+    """
+    Fetch every trading day in a range and write it to the store.
+
+    Data is written and the coverage extended one month at a time, so an
+    interrupted run resumes where it stopped.
+
+    Args:
+        store: Target store
+        dataset: Dataset name (key of DATASETS)
+        start: First date (YYYYMMDD)
+        end: Last date (YYYYMMDD)
+        module: pykrx ``stock`` module (or a stand-in)
+        backfill: Ingest newest month first, extending coverage backwards
+
+    Returns:
+        Number of trading days written
+
+    Raises:
+        RuntimeError: If pykrx returns no data for a trading day
+    """
+    spec = DATASETS[dataset]
+    fetch = getattr(module, spec.fetch)
+    chunks = _month_chunks(start, end)
+    if backfill:
+        chunks.reverse()
+
+    written = 0
+    for chunk_start, chunk_end in chunks:
+        days = module.get_previous_business_days(fromdate=chunk_start, todate=chunk_end)
+        span = (
+            datetime.strptime(chunk_end, "%Y%m%d")
+            - datetime.strptime(chunk_start, "%Y%m%d")
+        ).days + 1
+        if not days and span >= _MAX_CLOSED_DAYS:
+            raise RuntimeError(
+                f"No trading days found for {chunk_start}-{chunk_end}; "
+                "the business-day lookup probably failed"
+            )
+        get_trading_calendar().record(
+            chunk_start, chunk_end, (day.strftime("%Y%m%d") for day in days)
+        )
+
+        snapshots = {}
+        for day in days:
+            date = day.strftime("%Y%m%d")
+            frames = []
+            for market in MARKETS:
+                df = fetch(date, market=market)
+                if df is not None and not df.empty:
+                    frames.append(snapshot_frame(df, date, market))
+            if not frames:
+                raise RuntimeError(f"No {dataset} data returned for {date}")
+            snapshots[date] = pd.concat(frames, ignore_index=True)
+
+        if snapshots:
+            store.write_days(dataset, snapshots)
+        store.extend_coverage(dataset, chunk_start, chunk_end)
+        written += len(snapshots)
+        logger.info(
+            f"[{dataset}] {chunk_start}-{chunk_end}: {len(snapshots)} trading days"
+        )
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the ingestion command."""
+    parser = argparse.ArgumentParser(
+        description="Fill the local pykrx-mcp market-data store (Parquet)"
+    )
+    parser.add_argument(
+        "--store",
+        default=os.getenv("PYKRX_MCP_STORE_DIR"),
+        help="Store directory (default: $PYKRX_MCP_STORE_DIR)",
+    )
+    parser.add_argument(
+        "--start",
+        help="Backfill start date YYYYMMDD (required on the first run)",
+    )
+    parser.add_argument(
+        "--end",
+        help="Last date YYYYMMDD (default: today after 18:00 KST, else yesterday)",
+    )
+    parser.add_argument(
+        "--datasets",
+        default=",".join(DATASETS),
+        help=f"Comma-separated datasets (default: {','.join(DATASETS)})",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+
+    if not args.store:
+        parser.error("--store or PYKRX_MCP_STORE_DIR is required")
+
+    end = args.end or default_end_date()
+    for option, value in (("--start", args.start), ("--end", end)):
+        if value is not None:
+            valid, msg = validate_date_format(value)
+            if not valid:
+                parser.error(f"{option}: {msg}")
+
+    datasets = [name.strip() for name in args.datasets.split(",") if name.strip()]
+    unknown = [name for name in datasets if name not in DATASETS]
+    if unknown:
+        parser.error(f"Unknown datasets: {', '.join(unknown)}")
+
+    try:
+        store = MarketStore(args.store)
+    except ImportError as e:
+        logger.error(str(e))
+        return 1
+
+    from pykrx import stock
+
+    failed = False
+    for dataset in datasets:
+        try:
+            ranges = plan_ranges(store.coverage(dataset), args.start, end)
+            if not ranges:
+                logger.info(f"[{dataset}] Already up to date")
+            for range_start, range_end, backfill in ranges:
+                written = ingest_range(
+                    store, dataset, range_start, range_end, stock, backfill
+                )
+                logger.info(
+                    f"[{dataset}] Ingested {written} trading days "
+                    f"({range_start}-{range_end})"
+                )
+        except Exception as e:
+            logger.error(f"[{dataset}] Ingestion failed: {e}")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,13 +13,14 @@ def screen_undervalued_stocks(
     """
     Screen for potentially undervalued stocks based on fundamental metrics.
 
-    This prompt guides AI through a multi-step screening workflow.
+    This prompt guides AI through a server-side screen (``screen_stocks``)
+    followed by interpretation of the results.
 
     Args:
         max_per: Maximum PER (Price-to-Earnings Ratio) threshold (default: 10.0)
         max_pbr: Maximum PBR (Price-to-Book Ratio) threshold (default: 1.0)
         market: Target market - "KOSPI", "KOSDAQ", or "ALL" (default: "KOSPI")
-        min_market_cap: Minimum market cap in billions KRW (default: 1000 = 1조원)
+        min_market_cap: Minimum market cap in 억원 (default: 1000 = 1,000억원)
         sort_by: Sort results by - "PER", "PBR", "MarketCap", "EPS" (default: "PER")
 
     Returns:
@@ -38,86 +39,31 @@ def screen_undervalued_stocks(
 
 **실행 단계**
 
-### Step 1: 전체 종목 리스트 조회
+### Step 1: 서버 측 스크리닝
 
-{"KOSPI와 KOSDAQ 모두 조회:" if market == "ALL" else f"{market} 종목만 조회:"}
+전종목 기본 지표·시가총액 조회, 필터링, 정렬을 한 번의 호출로 수행합니다
+(종목별로 반복 조회하지 마세요):
 
 ```python
-# {"KOSPI 종목" if market != "ALL" else "KOSPI + KOSDAQ 종목"}
-kospi_tickers = get_market_ticker_list("{today}", "KOSPI")
-{"kosdaq_tickers = get_market_ticker_list('" + today + "', " if market == "ALL" else ""}
-{"    'KOSDAQ')" if market == "ALL" else ""}
-{"all_tickers = list(kospi_tickers) + list(kosdaq_tickers)" if market == "ALL" else ""}
-```
-
-### Step 2: 기본 지표 데이터 조회
-
-**주의**: 전체 종목을 한 번에 조회할 수 없으므로, 날짜 기준으로 조회:
-
-```python
-# 특정 날짜의 전체 시장 기본 지표
-fundamental_data = get_market_fundamental_by_date(
+result = screen_stocks(
     date="{today}",
-    market="{market if market != "ALL" else "KOSPI"}"
+    market="{market}",
+    max_per={max_per},
+    max_pbr={max_pbr},
+    min_market_cap={min_market_cap},  # 억원 단위
+    exclude_loss=True,  # PER/PBR/EPS가 0 이하인 적자·자본잠식 종목 제외
+    sort_by="{sort_by}",
+    limit=30,
+    snap_to_trading_day=True,  # 휴장일이면 직전 거래일 기준
 )
-
-{"# KOSDAQ도 조회 (market='ALL'인 경우)" if market == "ALL" else ""}
-{"fundamental_kosdaq = get_market_fundamental_by_date(" if market == "ALL" else ""}
-{"    date='" + today + "', market='KOSDAQ')" if market == "ALL" else ""}
-{"fundamental_data = pd.concat([fundamental_data, " if market == "ALL" else ""}
-{"    fundamental_kosdaq])" if market == "ALL" else ""}
-```
-
-### Step 3: 시가총액 데이터 조회 (필터링용)
-
-```python
-# 시가총액은 별도 조회가 필요할 수 있음
-# get_market_cap_by_date는 개별 종목용이므로,
-# fundamental 데이터에 시가총액이 포함되어 있는지 확인
-
-# 만약 포함되어 있지 않다면:
-# 각 종목의 시가총액을 순회하며 조회 (시간 소요)
 ```
 
-### Step 4: 필터링
-
-DataFrame을 활용한 필터링:
-
-```python
-# 1. PER 필터
-filtered = fundamental_data[fundamental_data['PER'] <= {max_per}]
-
-# 2. PBR 필터
-filtered = filtered[filtered['PBR'] <= {max_pbr}]
-
-# 3. 시가총액 필터 (단위 확인 필요)
-# 만약 시가총액이 '억원' 단위라면:
-filtered = filtered[filtered['시가총액'] >= {min_market_cap}]
-
-# 4. 음수 제거 (적자 기업 제외)
-filtered = filtered[filtered['PER'] > 0]
-filtered = filtered[filtered['PBR'] > 0]
-filtered = filtered[filtered['EPS'] > 0]
-```
-
-### Step 5: 정렬 및 상위 종목 추출
-
-```python
-# {sort_by} 기준 오름차순 정렬
-sorted_stocks = filtered.sort_values(by='{sort_by}', ascending=True)
-
-# 상위 30개 추출
-top_30 = sorted_stocks.head(30)
-```
-
-### Step 6: 종목명 추가 (가독성 향상)
-
-```python
-# Ticker 코드를 종목명으로 변환
-top_30['종목명'] = top_30.index.map(lambda t: get_market_ticker_name(t)['name'])
-```
+- `data`: 조건을 만족하는 상위 30개 종목 (종목명, PER, PBR, EPS, BPS, DIV,
+  DPS, 종가, 시가총액)
+- `matched`: 조건을 만족한 전체 종목 수
+- `date`: 실제 조회한 거래일
 
-### Step 7: 결과 시각화
+### Step 2: 결과 시각화
 
 **표 형식 출력:**
 ```
@@ -131,12 +77,12 @@ top_30['종목명'] = top_30.index.map(lambda t: get_market_ticker_name(t)['name
 - Y축: PER 또는 PBR
 - 막대 차트 또는 산점도
 
-### Step 8: 추가 분석 (선택사항)
+### Step 3: 추가 분석 (선택사항)
 
 **상위 종목의 최근 주가 추이:**
 ```python
 # 1위 종목의 최근 1개월 주가
-top_ticker = top_30.index[0]
+top_ticker = next(iter(result["data"]))
 get_stock_ohlcv(top_ticker, "20260101", "{today}")
 ```
 
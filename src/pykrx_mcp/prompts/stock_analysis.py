@@ -140,20 +140,15 @@ def analyze_stock_by_name(
 
 ### Step 1: Ticker 조회
 
-먼저 KOSPI에서 검색:
+종목명으로 검색 (KOSPI/KOSDAQ/KONEX 전체, 한 번의 호출):
 ```
-get_market_ticker_list("{end_str}", "KOSPI")
+search_tickers("{stock_name}")
 ```
 
-결과에서 "{stock_name}" 검색:
-- 반환된 ticker 목록에서 종목명 매칭
-- `get_market_ticker_name(ticker)`로 각 ticker의 이름 확인
-- "{stock_name}"과 일치하는 ticker 찾기
-
-KOSPI에서 못 찾으면 KOSDAQ 시도:
-```
-get_market_ticker_list("{end_str}", "KOSDAQ")
-```
+결과에서 ticker 선택:
+- `match`가 "exact"인 결과를 우선 사용
+- 일치하는 결과가 여러 개면 사용자에게 확인
+- 결과가 없으면 더 짧은 이름(예: "삼성")이나 초성(예: "ㅅㅅ")으로 다시 검색
 
 ### Step 2: Ticker를 찾은 후
 
@@ -0,0 +1,275 @@
+"""
+Scheduled end-of-day refresh for the long-running (SSE and REST) servers.
+
+With ``PYKRX_MCP_REFRESH`` enabled, a background thread wakes up every day
+at ``PYKRX_MCP_REFRESH_TIME`` (KST, after the market has closed) and fetches
+the latest trading day's end-of-day datasets:
+
+- the local Parquet store (if configured) is appended through ``ingest``
+- the ticker master is rebuilt
+- full-market OHLCV, fundamental and market-cap snapshots are fetched into
+  the caches
+- the market-wide OHLCV, shorting and investor-flow tools are called, so
+  their responses land in the disk and memory caches
+
+The next morning's queries for that day are then cache hits, and upstream
+traffic moves to off-peak hours. Days that were already refreshed (e.g.
+weekends and holidays, whose latest trading day does not change) are
+skipped.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from . import tools
+from .warmup import KST, latest_trading_day
+
+logger = logging.getLogger(__name__)
+
+# Default refresh time (KST), after closing data has settled
+DEFAULT_REFRESH_TIME = "18:30"
+
+MARKETS = ("KOSPI", "KOSDAQ")
+OHLCV_MARKETS = ("KOSPI", "KOSDAQ", "KONEX", "ALL")
+INVESTORS = ("외국인", "기관합계", "개인")
+
+# Full-market snapshots (``store.DATASETS``) fetched for snapshot slicing,
+# screening and the cross-sectional tools
+SNAPSHOT_DATASETS = ("ohlcv", "fundamental", "market_cap")
+
+
+def refresh_enabled() -> bool:
+    """Return whether ``PYKRX_MCP_REFRESH`` asks for the daily refresh."""
+    return os.getenv("PYKRX_MCP_REFRESH", "").strip().lower() in ("1", "true", "yes")
+
+
+def parse_refresh_time(value: str) -> tuple[int, int]:
+    """
+    Parse an ``HH:MM`` refresh time.
+
+    Raises:
+        ValueError: If the value is not a valid time of day
+    """
+    try:
+        hour, minute = (int(part) for part in value.split(":"))
+    except ValueError:
+        raise ValueError(f"Refresh time must be HH:MM, got: '{value}'") from None
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"Refresh time must be HH:MM, got: '{value}'")
+    return hour, minute
+
+
+def next_run_time(now: datetime, at: tuple[int, int]) -> datetime:
+    """Return the first scheduled refresh time after ``now``."""
+    scheduled = now.replace(hour=at[0], minute=at[1], second=0, microsecond=0)
+    if scheduled <= now:
+        scheduled += timedelta(days=1)
+    return scheduled
+
+
+def refresh_store(date: str, module: Any) -> int:
+    """
+    Append the day to every store dataset (no-op without a store).
+
+    Returns:
+        Number of trading days written
+    """
+    from .ingest import ingest_range, plan_ranges
+    from .utils.store import DATASETS, get_market_store
+
+    store = get_market_store()
+    if store is None:
+        return 0
+
+    written = 0
+    for dataset in DATASETS:
+        coverage = store.coverage(dataset)
+        # An empty dataset starts at this day; backfills are left to ingest
+        ranges = plan_ranges(coverage, date if coverage is None else None, date)
+        for start, end, backfill in ranges:
+            written += ingest_range(store, dataset, start, end, module, backfill)
+    return written
+
+
+def refresh_day(date: str, module: Any) -> list[str]:
+    """
+    Fetch one trading day's end-of-day datasets into the store and caches.
+
+    Args:
+        date: Trading day (YYYYMMDD)
+        module: pykrx ``stock`` module (or a stand-in)
+
+    Returns:
+        Error messages of the steps that failed
+    """
+    from .utils.cache import fetch_snapshot
+    from .utils.ticker_master import get_ticker_master
+
+    errors = []
+
+    def step(label: str, func: Callable, *args: Any) -> None:
+        try:
+            result = func(*args)
+        except Exception as e:
+            errors.append(f"{label}: {e}")
+            return
+        if isinstance(result, dict) and "error" in result:
+            errors.append(f"{label}: {result['error']}")
+
+    step("store", refresh_store, date, module)
+    step("ticker_master", get_ticker_master, module)
+    for dataset in SNAPSHOT_DATASETS:
+        step(f"snapshot:{dataset}", fetch_snapshot, module, dataset, date)
+    for market in OHLCV_MARKETS:
+        step(f"market_ohlcv:{market}", tools.get_market_ohlcv_by_date, date, market)
+    for market in MARKETS:
+        step(
+            f"shorting_volume:{market}",
+            tools.get_shorting_volume_by_ticker,
+            date,
+            market,
+        )
+        step(
+            f"shorting_balance_top50:{market}",
+            tools.get_shorting_balance_top50,
+            date,
+            market,
+        )
+        step(
+            f"shorting_volume_top50:{market}",
+            tools.get_shorting_volume_top50,
+            date,
+            market,
+        )
+        step(
+            f"investor_volume:{market}",
+            tools.get_market_trading_volume_by_investor,
+            date,
+            date,
+            market,
+        )
+        step(
+            f"investor_value:{market}",
+            tools.get_market_trading_value_by_investor,
+            date,
+            date,
+            market,
+        )
+        for investor in INVESTORS:
+            step(
+                f"net_purchases:{market}:{investor}",
+                tools.get_market_net_purchases_of_equities,
+                date,
+                date,
+                market,
+                investor,
+            )
+    return errors
+
+
+class RefreshScheduler:
+    """Background thread running ``refresh_day`` once per trading day."""
+
+    def __init__(self, at: tuple[int, int], module: Any = None) -> None:
+        self.at = at
+        self.module = module
+        self.last_date: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._loop, name="pykrx-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run_once(self, now: datetime | None = None) -> str | None:
+        """
+        Refresh the latest trading day unless it was already refreshed.
+
+        Returns:
+            The refreshed date, or None if there was nothing to do
+        """
+        if self.module is None:
+            self.module = tools.load_pykrx()
+        date = latest_trading_day(self.module, now)
+        if date == self.last_date:
+            logger.info(f"End-of-day refresh: {date} already refreshed")
+            return None
+
+        started = time.perf_counter()
+        errors = refresh_day(date, self.module)
+        for error in errors:
+            logger.warning(f"End-of-day refresh {date}: {error}")
+        logger.info(
+            f"End-of-day refresh for {date} finished in "
+            f"{time.perf_counter() - started:.1f}s ({len(errors)} errors)"
+        )
+        self.last_date = date
+        return date
+
+    def _loop(self) -> None:
+        now = datetime.now(KST)
+        # Catch up at start-up if today's refresh time has already passed
+        if now >= now.replace(hour=self.at[0], minute=self.at[1]):
+            self._run_safely()
+        while True:
+            now = datetime.now(KST)
+            wait = (next_run_time(now, self.at) - now).total_seconds()
+            if self._stop.wait(wait):
+                return
+            self._run_safely()
+
+    def _run_safely(self) -> None:
+        try:
+            self.run_once()
+        except Exception as e:
+            logger.error(f"End-of-day refresh failed: {e}")
+
+
+_scheduler: RefreshScheduler | None = None
+
+
+def start_refresh_scheduler() -> RefreshScheduler | None:
+    """
+    Start the daily refresh thread if ``PYKRX_MCP_REFRESH`` is enabled.
+
+    Environment:
+        PYKRX_MCP_REFRESH: Enable the scheduler ("1")
+        PYKRX_MCP_REFRESH_TIME: Daily refresh time, HH:MM KST (default 18:30)
+
+    Returns:
+        The running scheduler, or None when disabled or misconfigured
+    """
+    global _scheduler
+    if not refresh_enabled() or _scheduler is not None:
+        return _scheduler
+    try:
+        at = parse_refresh_time(
+            os.getenv("PYKRX_MCP_REFRESH_TIME", DEFAULT_REFRESH_TIME)
+        )
+    except ValueError as e:
+        logger.warning(f"End-of-day refresh disabled: {e}")
+        return None
+    _scheduler = RefreshScheduler(at)
+    _scheduler.start()
+    logger.info(f"End-of-day refresh scheduled daily at {at[0]:02d}:{at[1]:02d} KST")
+    return _scheduler
+
+
+def stop_refresh_scheduler() -> None:
+    """Stop the daily refresh thread, if running."""
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.stop(timeout=0)
+        _scheduler = None
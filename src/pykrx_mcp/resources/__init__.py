@@ -2,8 +2,10 @@
 
 from .info import get_krx_info
 from .manual import get_pykrx_manual
+from .stats import get_server_stats
 
 __all__ = [
     "get_krx_info",
     "get_pykrx_manual",
+    "get_server_stats",
 ]
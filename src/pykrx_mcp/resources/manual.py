@@ -41,6 +41,11 @@ def get_pykrx_manual() -> str:
     - **Tool:** `get_stock_ohlcv`
     - **Why:** Provides Open, High, Low, Close, Volume data
 
+    ### Comparing Several Stocks
+    - **Question:** "Compare Samsung, SK Hynix and Naver over the last quarter"
+    - **Tool:** `get_stock_ohlcv_batch`
+    - **Why:** Fetches all tickers in parallel in a single call
+
     ### Finding Ticker Codes
     - **Question:** "What's the ticker for Samsung Electronics?"
     - **Approach:** Korean stock tickers are numeric. Major stocks:
@@ -48,12 +53,21 @@ def get_pykrx_manual() -> str:
       - SK Hynix: 000660
       - Naver: 035420
       - Kakao: 035720
-    - **Future tool:** `get_ticker_by_name` (not yet implemented)
+    - **Tool:** `search_tickers` (e.g., `search_tickers("삼성전자")`)
+    - **Why:** Resolves names from a local ticker master in one call; accepts
+      partial names and initial consonants (e.g., "ㅅㅅㅈㅈ")
 
     ### Market-wide Analysis
     - **Question:** "List all KOSPI stocks"
     - **Future tool:** `get_market_ticker_list` (not yet implemented)
 
+    ### Stock Screening
+    - **Question:** "Find KOSPI stocks with PER under 10 and PBR under 1"
+    - **Tool:** `screen_stocks`
+      (e.g., `screen_stocks("20240105", max_per=10, max_pbr=1)`)
+    - **Why:** Filters and sorts the whole market on the server and returns
+      only the matching stocks, instead of one call per ticker
+
     ### Investor Trading Patterns
     - **Question:** "Show foreign investor buying/selling for Samsung"
     - **Future tool:** `get_market_net_purchases_of_equities_by_ticker`
@@ -65,6 +79,16 @@ def get_pykrx_manual() -> str:
     - **DO:** Fetch data in chunks (1-2 years at a time)
     - **Reason:** Prevents timeout and reduces server load
 
+    ### For Market-wide Tables
+    - **DON'T:** Fetch all ~2,700 stocks and filter them yourself
+    - **DO:** Pass `columns`, `tickers`, `where`, `sort_by` and `top_n`
+      (e.g., `columns=["등락률"], sort_by="등락률", top_n=20`)
+    - **Reason:** Rows and columns are selected on the server, so only the
+      requested data is returned
+    - **When you need every row:** Pass `page_size` (e.g., 500) and call
+      again with the returned `next_cursor` (same other arguments) until it
+      is null; later pages are served from memory without re-fetching
+
     ### For Multiple Stocks
     - **DON'T:** Make 100+ sequential requests without delay
     - **DO:** Batch requests and add small delays between calls
@@ -0,0 +1,20 @@
+"""Runtime statistics resource."""
+
+import json
+
+from ..utils.executor import get_worker_pool
+from ..utils.singleflight import upstream_calls
+from ..utils.stats import tool_stats
+
+
+def get_server_stats() -> str:
+    """Per-tool latency statistics and worker pool usage as JSON."""
+    return json.dumps(
+        {
+            "worker_pool": get_worker_pool().stats(),
+            "upstream_calls": upstream_calls.stats(),
+            "tools": tool_stats.snapshot(),
+        },
+        ensure_ascii=False,
+        indent=2,
+    )
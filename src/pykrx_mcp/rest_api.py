@@ -5,36 +5,82 @@ This provides a FastAPI REST API that wraps pykrx-mcp tools
 for use with ChatGPT Custom GPT Actions.
 """
 
+import asyncio
+import json
 import logging
 import sys
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    PlainTextResponse,
+    StreamingResponse,
+)
 from pydantic import BaseModel, Field
 
+from pykrx_mcp.refresh import start_refresh_scheduler, stop_refresh_scheduler
+
+# Import MCP tools
 from pykrx_mcp.tools.etf_price import (
     get_etf_ohlcv_by_date as get_etf_ohlcv_impl,
 )
 from pykrx_mcp.tools.etf_price import (
     get_etf_ticker_list as get_etf_ticker_list_impl,
 )
+from pykrx_mcp.tools.foreign_investment import (
+    get_exhaustion_rates_of_foreign_investment as get_foreign_exhaustion_impl,
+)
 from pykrx_mcp.tools.fundamental import (
     get_market_fundamental_by_date as get_fundamental_impl,
 )
+from pykrx_mcp.tools.fundamental import (
+    get_market_fundamental_by_ticker as get_market_fundamental_impl,
+)
 from pykrx_mcp.tools.market_cap import get_market_cap_by_date as get_market_cap_impl
-
-# Import MCP tools
+from pykrx_mcp.tools.market_cap import (
+    get_market_cap_by_ticker as get_market_cap_by_ticker_impl,
+)
+from pykrx_mcp.tools.market_data import (
+    get_market_ohlcv_by_date as get_market_ohlcv_impl,
+)
+from pykrx_mcp.tools.screening import screen_stocks as screen_stocks_impl
+from pykrx_mcp.tools.stock_price import (
+    MAX_BATCH_TICKERS,
+    check_ohlcv_arguments,
+    get_stock_ohlcv_frame,
+)
 from pykrx_mcp.tools.stock_price import get_stock_ohlcv as get_stock_ohlcv_impl
+from pykrx_mcp.tools.stock_price import (
+    get_stock_ohlcv_batch as get_stock_ohlcv_batch_impl,
+)
 from pykrx_mcp.tools.ticker_info import (
     get_market_ticker_list as get_ticker_list_impl,
 )
 from pykrx_mcp.tools.ticker_info import (
     get_market_ticker_name as get_ticker_name_impl,
 )
+from pykrx_mcp.tools.ticker_info import get_ticker_info as get_ticker_info_impl
+from pykrx_mcp.tools.ticker_info import search_tickers as search_tickers_impl
 from pykrx_mcp.tools.trading_value import (
     get_market_trading_value_by_date as get_trading_value_impl,
 )
+from pykrx_mcp.utils.executor import (
+    WorkerPoolSaturatedError,
+    get_worker_pool,
+    run_tool,
+    shutdown_worker_pool,
+)
+from pykrx_mcp.utils.formatters import (
+    DEFAULT_STREAM_BATCH_ROWS,
+    STREAM_MEDIA_TYPES,
+    iter_dataframe_chunks,
+)
+from pykrx_mcp.utils.metrics import CONTENT_TYPE, render_metrics
+from pykrx_mcp.warmup import health_status, start_warmup
 
 # Configure logging
 logging.basicConfig(
@@ -44,11 +90,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the worker pool (and cache warm-up, daily refresh) with the app."""
+    get_worker_pool()
+    start_warmup()
+    start_refresh_scheduler()
+    yield
+    stop_refresh_scheduler()
+    shutdown_worker_pool(wait=False)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="pykrx-mcp REST API",
     description="Korean stock market data API for ChatGPT Actions",
     version="0.1.3",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -61,8 +120,56 @@ app.add_middleware(
 )
 
 
+# Upper bound on rows per chunk of the streaming endpoints
+MAX_STREAM_BATCH_ROWS = 10_000
+
+
 # Request models
-class StockOHLCVRequest(BaseModel):
+class SelectionRequest(BaseModel):
+    """Row and column selection shared by the DataFrame-returning tools."""
+
+    columns: list[str] | None = Field(
+        None, description="Columns to return (default: all)"
+    )
+    where: list[str] | None = Field(
+        None,
+        description=(
+            "Row filters '<column> <op> <value>' that must all hold "
+            "(op: >, >=, <, <=, ==, !=; e.g., ['종가 >= 70000'])"
+        ),
+    )
+    sort_by: str | None = Field(None, description="Column to sort rows by")
+    ascending: bool = Field(False, description="Sort ascending")
+    top_n: int | None = Field(
+        None, description="Return only the first N rows after filtering and sorting"
+    )
+
+    def selection(self) -> dict:
+        """Return the selection parameters as tool keyword arguments."""
+        return self.model_dump(
+            include={"columns", "where", "sort_by", "ascending", "top_n"}
+        )
+
+
+class PaginationRequest(BaseModel):
+    """Cursor pagination shared by the full-market tools."""
+
+    page_size: int | None = Field(
+        None,
+        description=(
+            "Rows per page (1-1000); the response carries next_cursor "
+            "(null on the last page)"
+        ),
+    )
+    cursor: str | None = Field(
+        None,
+        description=(
+            "next_cursor of the previous page; repeat the other fields unchanged"
+        ),
+    )
+
+
+class StockOHLCVRequest(SelectionRequest):
     ticker: str = Field(..., description="6-digit stock ticker code (e.g., '005930')")
     start_date: str = Field(
         ..., description="Start date in YYYYMMDD format (e.g., '20240101')"
@@ -71,6 +178,54 @@ class StockOHLCVRequest(BaseModel):
         ..., description="End date in YYYYMMDD format (e.g., '20240131')"
     )
     adjusted: bool = Field(True, description="Whether to adjust for stock splits")
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records' (default), 'table', 'both' or 'columns'"
+        ),
+    )
+
+
+class StockOHLCVBatchRequest(SelectionRequest):
+    tickers: list[str] = Field(
+        ...,
+        description="List of 6-digit stock ticker codes (e.g., ['005930', '000660'])",
+    )
+    start_date: str = Field(
+        ..., description="Start date in YYYYMMDD format (e.g., '20240101')"
+    )
+    end_date: str = Field(
+        ..., description="End date in YYYYMMDD format (e.g., '20240131')"
+    )
+    adjusted: bool = Field(True, description="Whether to adjust for stock splits")
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records' (default), 'table', 'both' or 'columns'"
+        ),
+    )
+
+
+class StockOHLCVStreamRequest(SelectionRequest):
+    tickers: list[str] = Field(
+        ...,
+        description="List of 6-digit stock ticker codes (e.g., ['005930', '000660'])",
+    )
+    start_date: str = Field(
+        ..., description="Start date in YYYYMMDD format (e.g., '20140101')"
+    )
+    end_date: str = Field(
+        ..., description="End date in YYYYMMDD format (e.g., '20231231')"
+    )
+    adjusted: bool = Field(True, description="Whether to adjust for stock splits")
+    stream_format: str = Field(
+        "ndjson",
+        description="'ndjson' (one JSON object per row) or 'csv' (one header row)",
+    )
+    batch_rows: int = Field(
+        DEFAULT_STREAM_BATCH_ROWS,
+        description=f"Rows encoded per streamed chunk (1-{MAX_STREAM_BATCH_ROWS})",
+    )
 
 
 class TickerListRequest(BaseModel):
@@ -84,7 +239,20 @@ class TickerNameRequest(BaseModel):
     ticker: str = Field(..., description="6-digit stock ticker code (e.g., '005930')")
 
 
-class MarketCapRequest(BaseModel):
+class TickerSearchRequest(BaseModel):
+    query: str = Field(
+        ..., description="Company name or part of it (e.g., '삼성', 'NAVER')"
+    )
+    market: str | None = Field(
+        None, description="Restrict to 'KOSPI', 'KOSDAQ' or 'KONEX' (default: all)"
+    )
+    limit: int = Field(10, description="Maximum number of results (1-50)")
+    include_delisted: bool = Field(
+        False, description="Include companies that are no longer listed"
+    )
+
+
+class MarketCapRequest(SelectionRequest):
     ticker: str = Field(..., description="6-digit stock ticker code (e.g., '005930')")
     start_date: str = Field(
         ..., description="Start date in YYYYMMDD format (e.g., '20240101')"
@@ -92,9 +260,15 @@ class MarketCapRequest(BaseModel):
     end_date: str = Field(
         ..., description="End date in YYYYMMDD format (e.g., '20240131')"
     )
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records' (default), 'table', 'both' or 'columns'"
+        ),
+    )
 
 
-class FundamentalRequest(BaseModel):
+class FundamentalRequest(SelectionRequest):
     ticker: str = Field(..., description="6-digit stock ticker code (e.g., '005930')")
     start_date: str = Field(
         ..., description="Start date in YYYYMMDD format (e.g., '20240101')"
@@ -102,9 +276,78 @@ class FundamentalRequest(BaseModel):
     end_date: str = Field(
         ..., description="End date in YYYYMMDD format (e.g., '20240131')"
     )
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records' (default), 'table', 'both' or 'columns'"
+        ),
+    )
+
+
+class CrossSectionRequest(SelectionRequest, PaginationRequest):
+    date: str = Field(..., description="Date in YYYYMMDD format (e.g., '20240105')")
+    market: str = Field(
+        "ALL", description="Market: 'ALL' (default), 'KOSPI', 'KOSDAQ' or 'KONEX'"
+    )
+    tickers: list[str] | None = Field(
+        None, description="Tickers to return (default: the whole market)"
+    )
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records', 'table', 'both' (default) or 'columns'"
+        ),
+    )
+    snap_to_trading_day: bool = Field(
+        False, description="Use the previous trading day if the date is a holiday"
+    )
+
+
+class MarketOHLCVRequest(SelectionRequest, PaginationRequest):
+    date: str = Field(..., description="Date in YYYYMMDD format (e.g., '20240105')")
+    market: str = Field(
+        "KOSPI", description="Market: 'KOSPI', 'KOSDAQ', 'KONEX' or 'ALL'"
+    )
+    tickers: list[str] | None = Field(
+        None, description="Tickers to return (default: the whole market)"
+    )
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records', 'table', 'both' (default) or 'columns'"
+        ),
+    )
+    snap_to_trading_day: bool = Field(
+        False, description="Use the previous trading day if the date is a holiday"
+    )
+
+
+class ForeignExhaustionRequest(SelectionRequest, PaginationRequest):
+    start_date: str = Field(
+        ..., description="Date (or start date with ticker) in YYYYMMDD format"
+    )
+    end_date: str | None = Field(
+        None, description="End date in YYYYMMDD format (used with ticker)"
+    )
+    ticker: str | None = Field(
+        None, description="6-digit ticker for a daily series (used with end_date)"
+    )
+    market: str = Field("KOSPI", description="Market: 'KOSPI', 'KOSDAQ' or 'KONEX'")
+    balance_limit: bool = Field(
+        False, description="Only stocks with a foreign ownership limit"
+    )
+    tickers: list[str] | None = Field(
+        None, description="Tickers to return (default: the whole market)"
+    )
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records', 'table', 'both' (default) or 'columns'"
+        ),
+    )
 
 
-class TradingValueRequest(BaseModel):
+class TradingValueRequest(SelectionRequest):
     ticker: str = Field(..., description="6-digit stock ticker code (e.g., '005930')")
     start_date: str = Field(
         ..., description="Start date in YYYYMMDD format (e.g., '20240101')"
@@ -112,9 +355,51 @@ class TradingValueRequest(BaseModel):
     end_date: str = Field(
         ..., description="End date in YYYYMMDD format (e.g., '20240131')"
     )
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records' (default), 'table', 'both' or 'columns'"
+        ),
+    )
 
 
-class ETFOHLCVRequest(BaseModel):
+class ScreenRequest(BaseModel):
+    date: str = Field(..., description="Date in YYYYMMDD format (e.g., '20240105')")
+    market: str = Field(
+        "KOSPI", description="Market: 'KOSPI', 'KOSDAQ', 'KONEX' or 'ALL'"
+    )
+    min_per: float | None = Field(None, description="Minimum PER")
+    max_per: float | None = Field(None, description="Maximum PER")
+    min_pbr: float | None = Field(None, description="Minimum PBR")
+    max_pbr: float | None = Field(None, description="Maximum PBR")
+    min_market_cap: float | None = Field(
+        None, description="Minimum market cap in 억원 (100 million KRW)"
+    )
+    max_market_cap: float | None = Field(
+        None, description="Maximum market cap in 억원 (100 million KRW)"
+    )
+    min_div: float | None = Field(None, description="Minimum dividend yield (%)")
+    exclude_loss: bool = Field(
+        True, description="Exclude stocks with PER, PBR or EPS of zero or below"
+    )
+    sort_by: str = Field(
+        "PER",
+        description="Sort column: PER, PBR, EPS, BPS, DIV, DPS, 시가총액 or 종가",
+    )
+    ascending: bool = Field(True, description="Sort ascending")
+    limit: int = Field(30, description="Maximum number of stocks (1-100)")
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records', 'table', 'both' (default) or 'columns'"
+        ),
+    )
+    snap_to_trading_day: bool = Field(
+        False, description="Use the previous trading day if the date is a holiday"
+    )
+
+
+class ETFOHLCVRequest(SelectionRequest):
     ticker: str = Field(
         ..., description="ETF ticker code (e.g., '152100' for KODEX 레버리지)"
     )
@@ -124,17 +409,46 @@ class ETFOHLCVRequest(BaseModel):
     end_date: str = Field(
         ..., description="End date in YYYYMMDD format (e.g., '20240131')"
     )
+    response_format: str | None = Field(
+        None,
+        description=(
+            "Response shape: 'records' (default), 'table', 'both' or 'columns'"
+        ),
+    )
 
 
 class ETFTickerListRequest(BaseModel):
     date: str = Field(..., description="Date in YYYYMMDD format (e.g., '20240101')")
 
 
+async def run_in_worker_pool(func: Callable, **kwargs) -> dict:
+    """
+    Run a blocking tool implementation on the shared worker pool.
+
+    Keeps slow KRX scrapes off the event loop so other requests are served
+    concurrently. Responds with 503 when the pool's queue is full.
+    """
+    try:
+        return await run_tool(func, **kwargs)
+    except WorkerPoolSaturatedError as e:
+        logger.warning(f"Rejecting {func.__name__}: {e}")
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
+        ) from e
+
+
 # Endpoints
-@app.get("/health")
+@app.get("/health", responses={503: {"description": "Cache warm-up in progress"}})
 async def health():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+    """Health check endpoint (503 until the cache warm-up completes)."""
+    status_code, body = health_status()
+    return JSONResponse(body, status_code=status_code)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics (tool, upstream, cache and worker pool)."""
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
 
 
 @app.get("/privacy-policy", response_class=HTMLResponse)
@@ -319,29 +633,174 @@ async def get_stock_ohlcv(request: StockOHLCVRequest):
     """Get stock OHLCV data."""
     try:
         logger.info(f"Fetching OHLCV for {request.ticker}")
-        result = get_stock_ohlcv_impl(
+        result = await run_in_worker_pool(
+            get_stock_ohlcv_impl,
             ticker=request.ticker,
             start_date=request.start_date,
             end_date=request.end_date,
             adjusted=request.adjusted,
+            response_format=request.response_format,
+            **request.selection(),
         )
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_stock_ohlcv: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.post("/tools/get_stock_ohlcv_batch")
+async def get_stock_ohlcv_batch(request: StockOHLCVBatchRequest):
+    """Get OHLCV data for several stocks at once."""
+    try:
+        logger.info(f"Fetching OHLCV for {len(request.tickers)} tickers")
+        result = await run_in_worker_pool(
+            get_stock_ohlcv_batch_impl,
+            tickers=request.tickers,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            adjusted=request.adjusted,
+            response_format=request.response_format,
+            **request.selection(),
+        )
+        if "error" in result:
+            raise HTTPException(status_code=400, detail=result["error"])
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_stock_ohlcv_batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+def _load_ohlcv_frame(request: StockOHLCVStreamRequest, ticker: str) -> asyncio.Future:
+    """Start fetching one ticker's OHLCV frame on the worker pool."""
+    return asyncio.ensure_future(
+        run_tool(
+            get_stock_ohlcv_frame,
+            ticker,
+            request.start_date,
+            request.end_date,
+            request.adjusted,
+            **request.selection(),
+        )
+    )
+
+
+async def _stream_stock_ohlcv(
+    request: StockOHLCVStreamRequest, tickers: list[str], first: asyncio.Future
+) -> AsyncIterator[str]:
+    """
+    Yield every ticker's rows as NDJSON or CSV chunks.
+
+    The next ticker is fetched on the worker pool while the current one is
+    being sent, so at most two tickers' frames are held at once. Any ticker
+    whose data fails to load is reported as an ``{"ticker", "error"}`` line
+    in NDJSON and skipped in CSV.
+    """
+    pending, following = first, None
+    header = True
+    try:
+        for index, ticker in enumerate(tickers):
+            following = (
+                _load_ohlcv_frame(request, tickers[index + 1])
+                if index + 1 < len(tickers)
+                else None
+            )
+            try:
+                df = await pending
+            except Exception as e:
+                logger.warning(f"Streaming OHLCV for {ticker} failed: {e}")
+                if request.stream_format == "ndjson":
+                    yield json.dumps({"ticker": ticker, "error": str(e)}) + "\n"
+            else:
+                for chunk in iter_dataframe_chunks(
+                    df,
+                    request.stream_format,
+                    request.batch_rows,
+                    header=header,
+                    ticker=ticker,
+                ):
+                    yield chunk
+                header = False
+            pending = following
+    finally:
+        # The client may disconnect mid-stream
+        for future in (pending, following):
+            if future is not None and not future.done():
+                future.cancel()
+
+
+@app.post(
+    "/stream/get_stock_ohlcv",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Rows as NDJSON or CSV, sent in chunks",
+            "content": {media_type: {} for media_type in STREAM_MEDIA_TYPES.values()},
+        }
+    },
+)
+async def stream_stock_ohlcv(request: StockOHLCVStreamRequest):
+    """Stream OHLCV rows for one or more stocks as NDJSON or CSV."""
+    tickers = list(dict.fromkeys(request.tickers))
+    if not tickers or len(tickers) > MAX_BATCH_TICKERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"tickers must list 1 to {MAX_BATCH_TICKERS} tickers",
+        )
+    if request.stream_format not in STREAM_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"stream_format must be one of {list(STREAM_MEDIA_TYPES)}",
+        )
+    if not 1 <= request.batch_rows <= MAX_STREAM_BATCH_ROWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"batch_rows must be between 1 and {MAX_STREAM_BATCH_ROWS}",
+        )
+
+    # Reject invalid arguments with a 400 before responding; per-ticker data
+    # errors are reported in the stream, whichever ticker they hit
+    try:
+        check_ohlcv_arguments(
+            tickers, request.start_date, request.end_date, **request.selection()
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    logger.info(f"Streaming OHLCV for {len(tickers)} tickers")
+    # Start the first fetch before responding, so an overloaded server still
+    # answers 503 instead of a stream of errors
+    first = _load_ohlcv_frame(request, tickers[0])
+    await asyncio.wait([first])
+    if isinstance(first.exception(), WorkerPoolSaturatedError):
+        raise HTTPException(
+            status_code=503, detail=str(first.exception()), headers={"Retry-After": "1"}
+        )
+
+    return StreamingResponse(
+        _stream_stock_ohlcv(request, tickers, first),
+        media_type=STREAM_MEDIA_TYPES[request.stream_format],
+    )
+
+
 @app.post("/tools/get_market_ticker_list")
 async def get_market_ticker_list(request: TickerListRequest):
     """Get list of stock tickers."""
     try:
         logger.info(f"Fetching ticker list for {request.market}")
-        result = get_ticker_list_impl(date=request.date, market=request.market)
+        result = await run_in_worker_pool(
+            get_ticker_list_impl, date=request.date, market=request.market
+        )
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_market_ticker_list: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -352,28 +811,73 @@ async def get_market_ticker_name(request: TickerNameRequest):
     """Get company name from ticker."""
     try:
         logger.info(f"Fetching name for {request.ticker}")
-        result = get_ticker_name_impl(ticker=request.ticker)
+        result = await run_in_worker_pool(get_ticker_name_impl, ticker=request.ticker)
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_market_ticker_name: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.post("/tools/search_tickers")
+async def search_tickers(request: TickerSearchRequest):
+    """Find stocks by company name (exact, prefix, partial or fuzzy)."""
+    try:
+        logger.info(f"Searching tickers for {request.query}")
+        result = await run_in_worker_pool(
+            search_tickers_impl,
+            query=request.query,
+            market=request.market,
+            limit=request.limit,
+            include_delisted=request.include_delisted,
+        )
+        if "error" in result:
+            raise HTTPException(status_code=400, detail=result["error"])
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in search_tickers: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.post("/tools/get_ticker_info")
+async def get_ticker_info(request: TickerNameRequest):
+    """Get company name, market and listing status for a ticker."""
+    try:
+        logger.info(f"Fetching ticker info for {request.ticker}")
+        result = await run_in_worker_pool(get_ticker_info_impl, ticker=request.ticker)
+        if "error" in result:
+            raise HTTPException(status_code=400, detail=result["error"])
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_ticker_info: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @app.post("/tools/get_market_cap_by_date")
 async def get_market_cap_by_date(request: MarketCapRequest):
     """Get market cap data."""
     try:
         logger.info(f"Fetching market cap for {request.ticker}")
-        result = get_market_cap_impl(
+        result = await run_in_worker_pool(
+            get_market_cap_impl,
             ticker=request.ticker,
             start_date=request.start_date,
             end_date=request.end_date,
+            response_format=request.response_format,
+            **request.selection(),
         )
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_market_cap_by_date: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -384,50 +888,162 @@ async def get_market_fundamental_by_date(request: FundamentalRequest):
     """Get fundamental data."""
     try:
         logger.info(f"Fetching fundamental data for {request.ticker}")
-        result = get_fundamental_impl(
+        result = await run_in_worker_pool(
+            get_fundamental_impl,
             ticker=request.ticker,
             start_date=request.start_date,
             end_date=request.end_date,
+            response_format=request.response_format,
+            **request.selection(),
         )
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_market_fundamental_by_date: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.post("/tools/get_market_fundamental_by_ticker")
+async def get_market_fundamental_by_ticker(request: CrossSectionRequest):
+    """Get fundamental data for all stocks on a date."""
+    try:
+        logger.info(f"Fetching market fundamentals for {request.date}")
+        result = await run_in_worker_pool(
+            get_market_fundamental_impl,
+            **request.model_dump(exclude_none=True),
+        )
+        if "error" in result:
+            raise HTTPException(status_code=400, detail=result["error"])
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_market_fundamental_by_ticker: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.post("/tools/get_market_cap_by_ticker")
+async def get_market_cap_by_ticker(request: CrossSectionRequest):
+    """Get market cap data for all stocks on a date."""
+    try:
+        logger.info(f"Fetching market caps for {request.date}")
+        result = await run_in_worker_pool(
+            get_market_cap_by_ticker_impl,
+            **request.model_dump(exclude_none=True),
+        )
+        if "error" in result:
+            raise HTTPException(status_code=400, detail=result["error"])
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_market_cap_by_ticker: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.post("/tools/get_market_ohlcv_by_date")
+async def get_market_ohlcv_by_date(request: MarketOHLCVRequest):
+    """Get OHLCV for all stocks on a date (paginate with page_size/cursor)."""
+    try:
+        logger.info(f"Fetching market OHLCV for {request.market} on {request.date}")
+        result = await run_in_worker_pool(
+            get_market_ohlcv_impl,
+            **request.model_dump(exclude_none=True),
+        )
+        if "error" in result:
+            raise HTTPException(status_code=400, detail=result["error"])
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_market_ohlcv_by_date: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.post("/tools/get_exhaustion_rates_of_foreign_investment")
+async def get_exhaustion_rates_of_foreign_investment(
+    request: ForeignExhaustionRequest,
+):
+    """Get foreign ownership and limit exhaustion rates (paginated)."""
+    try:
+        logger.info(
+            f"Fetching foreign exhaustion rates for "
+            f"{request.ticker or request.market} from {request.start_date}"
+        )
+        result = await run_in_worker_pool(
+            get_foreign_exhaustion_impl,
+            **request.model_dump(exclude_none=True),
+        )
+        if "error" in result:
+            raise HTTPException(status_code=400, detail=result["error"])
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_exhaustion_rates_of_foreign_investment: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @app.post("/tools/get_market_trading_value_by_date")
 async def get_market_trading_value_by_date(request: TradingValueRequest):
     """Get investor trading value (supply/demand analysis)."""
     try:
         logger.info(f"Fetching trading value for {request.ticker}")
-        result = get_trading_value_impl(
+        result = await run_in_worker_pool(
+            get_trading_value_impl,
             ticker=request.ticker,
             start_date=request.start_date,
             end_date=request.end_date,
+            response_format=request.response_format,
+            **request.selection(),
         )
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_market_trading_value_by_date: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.post("/tools/screen_stocks")
+async def screen_stocks(request: ScreenRequest):
+    """Screen all stocks by PER, PBR, market cap and dividend yield."""
+    try:
+        logger.info(f"Screening {request.market} stocks on {request.date}")
+        result = await run_in_worker_pool(screen_stocks_impl, **request.model_dump())
+        if "error" in result:
+            raise HTTPException(status_code=400, detail=result["error"])
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in screen_stocks: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @app.post("/tools/get_etf_ohlcv_by_date")
 async def get_etf_ohlcv_by_date(request: ETFOHLCVRequest):
     """Get ETF OHLCV data."""
     try:
         logger.info(f"Fetching ETF OHLCV for {request.ticker}")
-        result = get_etf_ohlcv_impl(
+        result = await run_in_worker_pool(
+            get_etf_ohlcv_impl,
             ticker=request.ticker,
             start_date=request.start_date,
             end_date=request.end_date,
+            response_format=request.response_format,
+            **request.selection(),
         )
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_etf_ohlcv_by_date: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -438,10 +1054,12 @@ async def get_etf_ticker_list(request: ETFTickerListRequest):
     """Get list of ETF tickers."""
     try:
         logger.info(f"Fetching ETF ticker list for {request.date}")
-        result = get_etf_ticker_list_impl(date=request.date)
+        result = await run_in_worker_pool(get_etf_ticker_list_impl, date=request.date)
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in get_etf_ticker_list: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -11,82 +11,21 @@ import os
 import sys
 
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
 
 from .prompts import (
     analyze_investor_flow,
     analyze_stock_by_name,
     screen_undervalued_stocks,
 )
-from .resources import get_krx_info, get_pykrx_manual
-from .tools import (
-    get_etf_ohlcv_by_date as get_etf_ohlcv_impl,
-)
-from .tools import (
-    get_etf_ticker_list as get_etf_ticker_list_impl,
-)
-from .tools import (
-    get_exhaustion_rates_of_foreign_investment as get_foreign_investment_impl,
-)
-from .tools import (
-    get_index_fundamental as get_index_fundamental_impl,
-)
-from .tools import (
-    get_index_ohlcv as get_index_ohlcv_impl,
-)
-from .tools import (
-    get_index_portfolio_deposit_file as get_index_portfolio_impl,
-)
-from .tools import (
-    get_index_ticker_list as get_index_ticker_list_impl,
-)
-from .tools import (
-    get_index_ticker_name as get_index_ticker_name_impl,
-)
-from .tools import (
-    get_market_cap_by_date as get_market_cap_impl,
-)
-from .tools import (
-    get_market_fundamental_by_date as get_fundamental_impl,
-)
-from .tools import (
-    get_market_net_purchases_of_equities as get_net_purchases_impl,
-)
-from .tools import (
-    get_market_ohlcv_by_date as get_market_ohlcv_impl,
-)
-from .tools import (
-    get_market_price_change as get_price_change_impl,
-)
-from .tools import (
-    get_market_ticker_list as get_ticker_list_impl,
-)
-from .tools import (
-    get_market_ticker_name as get_ticker_name_impl,
-)
-from .tools import (
-    get_market_trading_value_by_date as get_trading_value_impl,
-)
-from .tools import (
-    get_market_trading_value_by_investor as get_trading_value_investor_impl,
-)
-from .tools import (
-    get_market_trading_volume_by_investor as get_trading_volume_investor_impl,
-)
-from .tools import (
-    get_shorting_balance_top50 as get_shorting_balance_top50_impl,
-)
-from .tools import (
-    get_shorting_status_by_date as get_shorting_status_impl,
-)
-from .tools import (
-    get_shorting_volume_by_ticker as get_shorting_volume_impl,
-)
-from .tools import (
-    get_shorting_volume_top50 as get_shorting_volume_top50_impl,
-)
-from .tools import (
-    get_stock_ohlcv as get_stock_ohlcv_impl,
-)
+from .refresh import start_refresh_scheduler
+from .resources import get_krx_info, get_pykrx_manual, get_server_stats
+from .tools import lazy_tool
+from .utils.executor import WorkerPoolSaturatedError, run_tool
+from .utils.formatters import format_error_response
+from .utils.metrics import CONTENT_TYPE, render_metrics
+from .warmup import health_status, start_warmup
 
 # Configure logging to stderr BEFORE creating FastMCP instance
 # (MCP uses stdout for protocol communication)
@@ -102,6 +41,19 @@ logger = logging.getLogger(__name__)
 mcp = FastMCP("pykrx-mcp")
 
 
+@mcp.custom_route("/health", methods=["GET"])
+async def _health(request: Request) -> JSONResponse:
+    """Readiness check for the SSE transport (503 while warming up)."""
+    status_code, body = health_status()
+    return JSONResponse(body, status_code=status_code)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def _metrics(request: Request) -> PlainTextResponse:
+    """Prometheus metrics for the SSE transport."""
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
+
+
 # ===== MCP Resources =====
 # Resources provide static documentation that AI models can read
 
@@ -118,6 +70,12 @@ def _resource_pykrx_manual() -> str:
     return get_pykrx_manual()
 
 
+@mcp.resource("krx://server-stats")
+def _resource_server_stats() -> str:
+    """Per-tool latency and worker pool statistics (JSON)."""
+    return get_server_stats()
+
+
 # ===== MCP Prompts =====
 # Prompts provide pre-built workflows for common analysis tasks
 
@@ -185,7 +143,7 @@ def prompt_screen_undervalued_stocks(
         max_per: Maximum PER threshold (default: 10.0)
         max_pbr: Maximum PBR threshold (default: 1.0)
         market: Target market - "KOSPI", "KOSDAQ", "ALL" (default: "KOSPI")
-        min_market_cap: Minimum market cap in billions KRW (default: 1000)
+        min_market_cap: Minimum market cap in 억원 (default: 1000 = 1,000억원)
         sort_by: Sort by - "PER", "PBR", "MarketCap", "EPS" (default: "PER")
 
     Example:
@@ -195,12 +153,39 @@ def prompt_screen_undervalued_stocks(
 
 
 # ===== MCP Tools =====
-# Tools are callable functions that AI models can invoke
+# Tools are callable functions that AI models can invoke.
+# They are async so concurrent SSE sessions don't serialize on blocking
+# pykrx calls: the work is dispatched to the shared worker pool.
+
+
+async def _run_tool(name: str, *args, **kwargs) -> dict:
+    """
+    Run a tool implementation on the worker pool, reporting overload.
+
+    The implementation is resolved inside the worker, so the first call
+    imports its module (and pykrx) without blocking the event loop.
+    """
+    try:
+        return await run_tool(lazy_tool(name), *args, **kwargs)
+    except WorkerPoolSaturatedError as e:
+        logger.warning(f"Rejecting {name}: {e}")
+        return format_error_response(
+            f"Server is busy, please retry shortly ({e})", function=name
+        )
 
 
 @mcp.tool()
-def get_stock_ohlcv(
-    ticker: str, start_date: str, end_date: str, adjusted: bool = True
+async def get_stock_ohlcv(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    adjusted: bool = True,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict:
     """
     Retrieve OHLCV (Open, High, Low, Close, Volume) data for a Korean stock.
@@ -217,6 +202,14 @@ def get_stock_ohlcv(
         end_date: End date in YYYYMMDD format (e.g., "20240131").
         adjusted: Whether to return adjusted prices (default: True).
                   Adjusted prices account for stock splits and dividends.
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "records")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["종가 >= 70000"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary containing OHLCV data with dates as keys and price/volume
@@ -227,11 +220,80 @@ def get_stock_ohlcv(
         get_stock_ohlcv("005930", "20240101", "20240131", True)
         Returns Samsung Electronics stock data for January 2024.
     """
-    return get_stock_ohlcv_impl(ticker, start_date, end_date, adjusted)
+    return await _run_tool(
+        "get_stock_ohlcv",
+        ticker,
+        start_date,
+        end_date,
+        adjusted,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+
+
+@mcp.tool()
+async def get_stock_ohlcv_batch(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    adjusted: bool = True,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
+    """
+    Retrieve OHLCV data for several Korean stocks in one call.
+
+    Prefer this over repeated get_stock_ohlcv calls when comparing stocks or
+    analyzing a portfolio: tickers are fetched in parallel and returned in a
+    single response. Failures are reported per ticker.
+
+    Args:
+        tickers: List of 6-digit ticker codes (e.g., ["005930", "000660"]),
+                 at most 50.
+        start_date: Start date in YYYYMMDD format (e.g., "20240101").
+        end_date: End date in YYYYMMDD format (e.g., "20240131").
+        adjusted: Whether to return adjusted prices (default: True).
+        response_format: Response shape of each ticker's entry - "records",
+            "table" (text table), "both" or "columns" (default: "records")
+        columns: Columns to return for each ticker (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["등락률 > 5"])
+        sort_by: Column to sort each ticker's rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows per ticker
+
+    Returns:
+        Dictionary with "results" (ticker -> OHLCV response) and "errors"
+        (ticker -> error message)
+
+    Example:
+        get_stock_ohlcv_batch(["005930", "000660"], "20240101", "20240131")
+    """
+    return await _run_tool(
+        "get_stock_ohlcv_batch",
+        tickers,
+        start_date,
+        end_date,
+        adjusted,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_market_ticker_list(date: str, market: str = "KOSPI") -> dict:
+async def get_market_ticker_list(date: str, market: str = "KOSPI") -> dict:
     """
     Retrieve list of stock tickers for a specific market.
 
@@ -246,11 +308,11 @@ def get_market_ticker_list(date: str, market: str = "KOSPI") -> dict:
         get_market_ticker_list("20240101", "KOSPI")
         Returns list of all KOSPI stocks on 2024-01-01
     """
-    return get_ticker_list_impl(date, market)
+    return await _run_tool("get_market_ticker_list", date, market)
 
 
 @mcp.tool()
-def get_market_ticker_name(ticker: str) -> dict:
+async def get_market_ticker_name(ticker: str) -> dict:
     """
     Get the name of a stock from its ticker code.
 
@@ -264,11 +326,67 @@ def get_market_ticker_name(ticker: str) -> dict:
         get_market_ticker_name("005930")
         Returns {"ticker": "005930", "name": "삼성전자"}
     """
-    return get_ticker_name_impl(ticker)
+    return await _run_tool("get_market_ticker_name", ticker)
 
 
 @mcp.tool()
-def get_market_fundamental_by_date(ticker: str, start_date: str, end_date: str) -> dict:
+async def search_tickers(
+    query: str,
+    market: str | None = None,
+    limit: int = 10,
+    include_delisted: bool = False,
+) -> dict:
+    """
+    Find Korean stocks by company name (exact, prefix, partial or fuzzy).
+
+    Use this to turn a company name into a ticker code in one call instead
+    of listing tickers and checking names one by one. Supports Korean
+    initial-consonant queries (e.g., "ㅅㅅㅈㅈ" for 삼성전자).
+
+    Args:
+        query: Company name or part of it (e.g., "삼성", "하이닉스", "NAVER")
+        market: Restrict to "KOSPI", "KOSDAQ" or "KONEX" (default: all)
+        limit: Maximum number of results (1-50, default: 10)
+        include_delisted: Include companies no longer listed (default: False)
+
+    Returns:
+        Dictionary with matches (ticker, name, market, match type, score)
+
+    Example:
+        search_tickers("삼성전자")
+    """
+    return await _run_tool("search_tickers", query, market, limit, include_delisted)
+
+
+@mcp.tool()
+async def get_ticker_info(ticker: str) -> dict:
+    """
+    Get the company name, market and listing status for a ticker.
+
+    Args:
+        ticker: 6-digit stock ticker code (e.g., "005930")
+
+    Returns:
+        Dictionary with ticker, name, market (KOSPI/KOSDAQ/KONEX) and listed
+
+    Example:
+        get_ticker_info("005930")
+    """
+    return await _run_tool("get_ticker_info", ticker)
+
+
+@mcp.tool()
+async def get_market_fundamental_by_date(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
     """
     Retrieve fundamental data (PER, PBR, dividend yield, etc.) for a stock.
 
@@ -278,6 +396,14 @@ def get_market_fundamental_by_date(ticker: str, start_date: str, end_date: str)
         ticker: Stock ticker symbol (e.g., "005930" for Samsung Electronics)
         start_date: Start date in YYYYMMDD format (e.g., "20240101")
         end_date: End date in YYYYMMDD format (e.g., "20240131")
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "records")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["PER <= 10"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary containing fundamental data (BPS, PER, PBR, EPS, DIV, DPS)
@@ -286,11 +412,98 @@ def get_market_fundamental_by_date(ticker: str, start_date: str, end_date: str)
         get_market_fundamental_by_date("005930", "20240101", "20240131")
         Returns Samsung fundamental data for January 2024
     """
-    return get_fundamental_impl(ticker, start_date, end_date)
+    return await _run_tool(
+        "get_market_fundamental_by_date",
+        ticker,
+        start_date,
+        end_date,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_market_cap_by_date(ticker: str, start_date: str, end_date: str) -> dict:
+async def get_market_fundamental_by_ticker(
+    date: str,
+    market: str = "ALL",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> dict:
+    """
+    Retrieve fundamental data (PER, PBR, dividend yield, etc.) for all stocks.
+
+    One call covers the whole market for a date; use it instead of calling
+    get_market_fundamental_by_date once per ticker.
+
+    Args:
+        date: Date in YYYYMMDD format
+        market: Market type - KOSPI/KOSDAQ/KONEX/ALL (default: ALL)
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        snap_to_trading_day: Query the previous trading day when `date` is a
+            weekend or KRX holiday (default: False, which returns an error)
+        columns: Columns to return (default: all - BPS, PER, PBR, EPS, DIV, DPS)
+        tickers: Tickers to return (default: the whole market)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["PER <= 10", "DIV > 3"])
+        sort_by: Column to sort by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N stocks after sorting
+        page_size: Rows per page (1-1000). Returns one page plus
+            `next_cursor` instead of thousands of rows at once
+        cursor: `next_cursor` from the previous page; pass the same other
+            arguments to get the next page
+
+    Returns:
+        Dictionary with data keyed by ticker, the market's stock count
+        (total) and the number returned (count)
+
+    Example:
+        get_market_fundamental_by_ticker(
+            "20240105", "KOSPI", columns=["DIV"], sort_by="DIV", top_n=20
+        )
+    """
+    return await _run_tool(
+        "get_market_fundamental_by_ticker",
+        date,
+        market,
+        response_format,
+        snap_to_trading_day,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+        page_size=page_size,
+        cursor=cursor,
+    )
+
+
+@mcp.tool()
+async def get_market_cap_by_date(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
     """
     Retrieve market capitalization data for a stock.
 
@@ -301,16 +514,110 @@ def get_market_cap_by_date(ticker: str, start_date: str, end_date: str) -> dict:
         ticker: 6-digit stock ticker code (e.g., "005930" for Samsung Electronics)
         start_date: Start date in YYYYMMDD format (e.g., "20240101")
         end_date: End date in YYYYMMDD format (e.g., "20240131")
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "records")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["거래량 >= 1000000"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with market cap data including 시가총액, 거래량, 거래대금, 상장주식수
     """
-    return get_market_cap_impl(ticker, start_date, end_date)
+    return await _run_tool(
+        "get_market_cap_by_date",
+        ticker,
+        start_date,
+        end_date,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_market_trading_value_by_date(
-    ticker: str, start_date: str, end_date: str
+async def get_market_cap_by_ticker(
+    date: str,
+    market: str = "ALL",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> dict:
+    """
+    Retrieve market capitalization data for all stocks on a date.
+
+    One call covers the whole market, largest market cap first; use it
+    instead of calling get_market_cap_by_date once per ticker.
+
+    Args:
+        date: Date in YYYYMMDD format
+        market: Market type - KOSPI/KOSDAQ/KONEX/ALL (default: ALL)
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        snap_to_trading_day: Query the previous trading day when `date` is a
+            weekend or KRX holiday (default: False, which returns an error)
+        columns: Columns to return (default: all - 종가, 시가총액, 거래량,
+            거래대금, 상장주식수)
+        tickers: Tickers to return (default: the whole market)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["거래대금 >= 10000000000"])
+        sort_by: Column to sort by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N stocks after sorting
+        page_size: Rows per page (1-1000). Returns one page plus
+            `next_cursor` instead of thousands of rows at once
+        cursor: `next_cursor` from the previous page; pass the same other
+            arguments to get the next page
+
+    Returns:
+        Dictionary with data keyed by ticker, the market's stock count
+        (total) and the number returned (count)
+
+    Example:
+        get_market_cap_by_ticker(
+            "20240105", "KOSPI", columns=["시가총액"], top_n=10
+        )
+    """
+    return await _run_tool(
+        "get_market_cap_by_ticker",
+        date,
+        market,
+        response_format,
+        snap_to_trading_day,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+        page_size=page_size,
+        cursor=cursor,
+    )
+
+
+@mcp.tool()
+async def get_market_trading_value_by_date(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict:
     """
     Retrieve trading value by investor type for supply/demand analysis.
@@ -322,15 +629,44 @@ def get_market_trading_value_by_date(
         ticker: 6-digit stock ticker code (e.g., "005930" for Samsung Electronics)
         start_date: Start date in YYYYMMDD format (e.g., "20240101")
         end_date: End date in YYYYMMDD format (e.g., "20240131")
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "records")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["외국인 > 0"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with trading value by investor type (금융투자, 외국인, 개인, etc.)
     """
-    return get_trading_value_impl(ticker, start_date, end_date)
+    return await _run_tool(
+        "get_market_trading_value_by_date",
+        ticker,
+        start_date,
+        end_date,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_etf_ohlcv_by_date(ticker: str, start_date: str, end_date: str) -> dict:
+async def get_etf_ohlcv_by_date(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
     """
     Retrieve ETF OHLCV (Open, High, Low, Close, Volume) data.
 
@@ -340,6 +676,14 @@ def get_etf_ohlcv_by_date(ticker: str, start_date: str, end_date: str) -> dict:
         ticker: ETF ticker symbol (e.g., "069500" for KODEX 200)
         start_date: Start date in YYYYMMDD format (e.g., "20240101")
         end_date: End date in YYYYMMDD format (e.g., "20240131")
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "records")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["종가 >= 10000"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary containing ETF OHLCV data with NAV information
@@ -348,11 +692,22 @@ def get_etf_ohlcv_by_date(ticker: str, start_date: str, end_date: str) -> dict:
         get_etf_ohlcv_by_date("069500", "20240101", "20240131")
         Returns KODEX 200 ETF price data for January 2024
     """
-    return get_etf_ohlcv_impl(ticker, start_date, end_date)
+    return await _run_tool(
+        "get_etf_ohlcv_by_date",
+        ticker,
+        start_date,
+        end_date,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_etf_ticker_list(date: str) -> dict:
+async def get_etf_ticker_list(date: str) -> dict:
     """
     Retrieve list of all ETF tickers traded on a specific date.
 
@@ -366,14 +721,14 @@ def get_etf_ticker_list(date: str) -> dict:
         get_etf_ticker_list("20240101")
         Returns list of all ETFs traded on 2024-01-01
     """
-    return get_etf_ticker_list_impl(date)
+    return await _run_tool("get_etf_ticker_list", date)
 
 
 # ===== Index Tools =====
 
 
 @mcp.tool()
-def get_index_ticker_list(date: str = None, market: str = "KOSPI") -> dict:
+async def get_index_ticker_list(date: str = None, market: str = "KOSPI") -> dict:
     """
     Get list of index tickers (KOSPI/KOSDAQ indices).
 
@@ -387,11 +742,11 @@ def get_index_ticker_list(date: str = None, market: str = "KOSPI") -> dict:
     Example:
         get_index_ticker_list("20240101", "KOSPI")
     """
-    return get_index_ticker_list_impl(date, market)
+    return await _run_tool("get_index_ticker_list", date, market)
 
 
 @mcp.tool()
-def get_index_ticker_name(ticker: str) -> dict:
+async def get_index_ticker_name(ticker: str) -> dict:
     """
     Get the name of an index from its ticker.
 
@@ -404,12 +759,21 @@ def get_index_ticker_name(ticker: str) -> dict:
     Example:
         get_index_ticker_name("1001")
     """
-    return get_index_ticker_name_impl(ticker)
+    return await _run_tool("get_index_ticker_name", ticker)
 
 
 @mcp.tool()
-def get_index_ohlcv(
-    ticker: str, start_date: str, end_date: str, freq: str = "d"
+async def get_index_ohlcv(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    freq: str = "d",
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict:
     """
     Get index OHLCV data.
@@ -419,6 +783,14 @@ def get_index_ohlcv(
         start_date: Start date in YYYYMMDD format
         end_date: End date in YYYYMMDD format
         freq: Frequency - d (daily), m (monthly), y (yearly)
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["등락률 < -2"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with index OHLCV data
@@ -426,12 +798,32 @@ def get_index_ohlcv(
     Example:
         get_index_ohlcv("1001", "20240101", "20240131", "d")
     """
-    return get_index_ohlcv_impl(ticker, start_date, end_date, freq)
+    return await _run_tool(
+        "get_index_ohlcv",
+        ticker,
+        start_date,
+        end_date,
+        freq,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_index_fundamental(
-    start_date: str, end_date: str = None, ticker: str = None
+async def get_index_fundamental(
+    start_date: str,
+    end_date: str = None,
+    ticker: str = None,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict:
     """
     Get index fundamental data (PER/PBR/dividend yield).
@@ -440,6 +832,14 @@ def get_index_fundamental(
         start_date: Start date in YYYYMMDD format
         end_date: End date (optional, for specific index over time)
         ticker: Index ticker (optional, for specific index)
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["PER <= 10"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with fundamental indicators
@@ -447,11 +847,22 @@ def get_index_fundamental(
     Example:
         get_index_fundamental("20240101", "20240131", "1001")
     """
-    return get_index_fundamental_impl(start_date, end_date, ticker)
+    return await _run_tool(
+        "get_index_fundamental",
+        start_date,
+        end_date,
+        ticker,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_index_portfolio_deposit_file(ticker: str, date: str = None) -> dict:
+async def get_index_portfolio_deposit_file(ticker: str, date: str = None) -> dict:
     """
     Get constituent stocks of an index.
 
@@ -465,14 +876,24 @@ def get_index_portfolio_deposit_file(ticker: str, date: str = None) -> dict:
     Example:
         get_index_portfolio_deposit_file("1005")
     """
-    return get_index_portfolio_impl(ticker, date)
+    return await _run_tool("get_index_portfolio_deposit_file", ticker, date)
 
 
 # ===== Short Selling Tools =====
 
 
 @mcp.tool()
-def get_shorting_status_by_date(ticker: str, start_date: str, end_date: str) -> dict:
+async def get_shorting_status_by_date(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
     """
     Get short selling status for a stock.
 
@@ -480,6 +901,14 @@ def get_shorting_status_by_date(ticker: str, start_date: str, end_date: str) ->
         ticker: 6-digit stock ticker
         start_date: Start date in YYYYMMDD format
         end_date: End date in YYYYMMDD format
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["비중 > 1"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with short selling volume and balance data
@@ -487,17 +916,50 @@ def get_shorting_status_by_date(ticker: str, start_date: str, end_date: str) ->
     Example:
         get_shorting_status_by_date("005930", "20240101", "20240131")
     """
-    return get_shorting_status_impl(ticker, start_date, end_date)
+    return await _run_tool(
+        "get_shorting_status_by_date",
+        ticker,
+        start_date,
+        end_date,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_shorting_volume_by_ticker(date: str, market: str = "KOSPI") -> dict:
+async def get_shorting_volume_by_ticker(
+    date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
     """
     Get short selling volume for all stocks on a date.
 
     Args:
         date: Date in YYYYMMDD format
         market: Market type - KOSPI/KOSDAQ/KONEX
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        snap_to_trading_day: Query the previous trading day when `date` is a
+            weekend or KRX holiday (default: False, which returns an error)
+        columns: Columns to return (default: all)
+        tickers: Tickers (row labels) to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["비중 > 10"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with short selling volume by ticker
@@ -505,17 +967,51 @@ def get_shorting_volume_by_ticker(date: str, market: str = "KOSPI") -> dict:
     Example:
         get_shorting_volume_by_ticker("20240101", "KOSPI")
     """
-    return get_shorting_volume_impl(date, market)
+    return await _run_tool(
+        "get_shorting_volume_by_ticker",
+        date,
+        market,
+        response_format,
+        snap_to_trading_day,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_shorting_balance_top50(date: str, market: str = "KOSPI") -> dict:
+async def get_shorting_balance_top50(
+    date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
     """
     Get top 50 stocks by short selling balance ratio.
 
     Args:
         date: Date in YYYYMMDD format
         market: Market type - KOSPI or KOSDAQ
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        snap_to_trading_day: Query the previous trading day when `date` is a
+            weekend or KRX holiday (default: False, which returns an error)
+        columns: Columns to return (default: all)
+        tickers: Tickers (row labels) to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["비중 > 1"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with top 50 stocks ranked by short balance
@@ -523,17 +1019,51 @@ def get_shorting_balance_top50(date: str, market: str = "KOSPI") -> dict:
     Example:
         get_shorting_balance_top50("20240101", "KOSPI")
     """
-    return get_shorting_balance_top50_impl(date, market)
+    return await _run_tool(
+        "get_shorting_balance_top50",
+        date,
+        market,
+        response_format,
+        snap_to_trading_day,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_shorting_volume_top50(date: str, market: str = "KOSPI") -> dict:
+async def get_shorting_volume_top50(
+    date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
     """
     Get top 50 stocks by short selling trading ratio.
 
     Args:
         date: Date in YYYYMMDD format
         market: Market type - KOSPI or KOSDAQ
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        snap_to_trading_day: Query the previous trading day when `date` is a
+            weekend or KRX holiday (default: False, which returns an error)
+        columns: Columns to return (default: all)
+        tickers: Tickers (row labels) to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["비중 > 10"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with top 50 stocks ranked by short volume
@@ -541,15 +1071,35 @@ def get_shorting_volume_top50(date: str, market: str = "KOSPI") -> dict:
     Example:
         get_shorting_volume_top50("20240101", "KOSPI")
     """
-    return get_shorting_volume_top50_impl(date, market)
+    return await _run_tool(
+        "get_shorting_volume_top50",
+        date,
+        market,
+        response_format,
+        snap_to_trading_day,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 # ===== Investor Trading Tools =====
 
 
 @mcp.tool()
-def get_market_trading_volume_by_investor(
-    start_date: str, end_date: str, ticker: str
+async def get_market_trading_volume_by_investor(
+    start_date: str,
+    end_date: str,
+    ticker: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict:
     """
     Get net purchase volume by investor type.
@@ -558,6 +1108,14 @@ def get_market_trading_volume_by_investor(
         start_date: Start date in YYYYMMDD format
         end_date: End date in YYYYMMDD format
         ticker: Stock ticker or market (KOSPI/KOSDAQ/KONEX/ALL)
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["순매수 > 0"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with investor trading volume (buy/sell/net)
@@ -565,12 +1123,31 @@ def get_market_trading_volume_by_investor(
     Example:
         get_market_trading_volume_by_investor("20240101", "20240131", "005930")
     """
-    return get_trading_volume_investor_impl(start_date, end_date, ticker)
+    return await _run_tool(
+        "get_market_trading_volume_by_investor",
+        start_date,
+        end_date,
+        ticker,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_market_trading_value_by_investor(
-    start_date: str, end_date: str, ticker: str
+async def get_market_trading_value_by_investor(
+    start_date: str,
+    end_date: str,
+    ticker: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict:
     """
     Get net purchase value by investor type.
@@ -579,6 +1156,14 @@ def get_market_trading_value_by_investor(
         start_date: Start date in YYYYMMDD format
         end_date: End date in YYYYMMDD format
         ticker: Stock ticker or market (KOSPI/KOSDAQ/KONEX/ALL)
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["순매수 > 0"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with investor trading value (buy/sell/net)
@@ -586,12 +1171,33 @@ def get_market_trading_value_by_investor(
     Example:
         get_market_trading_value_by_investor("20240101", "20240131", "KOSPI")
     """
-    return get_trading_value_investor_impl(start_date, end_date, ticker)
+    return await _run_tool(
+        "get_market_trading_value_by_investor",
+        start_date,
+        end_date,
+        ticker,
+        response_format,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 @mcp.tool()
-def get_market_net_purchases_of_equities(
-    start_date: str, end_date: str, market: str, investor: str
+async def get_market_net_purchases_of_equities(
+    start_date: str,
+    end_date: str,
+    market: str,
+    investor: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict:
     """
     Get top stocks by net purchases for specific investor type.
@@ -601,6 +1207,15 @@ def get_market_net_purchases_of_equities(
         end_date: End date in YYYYMMDD format
         market: Market type (KOSPI/KOSDAQ/KONEX/ALL)
         investor: Investor type (금융투자/보험/투신/사모/은행/기관합계/개인/외국인 etc.)
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        columns: Columns to return (default: all)
+        tickers: Tickers (row labels) to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["순매수거래대금 > 0"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary with top stocks ranked by net purchases
@@ -608,19 +1223,41 @@ def get_market_net_purchases_of_equities(
     Example:
         get_market_net_purchases_of_equities("20240101", "20240131", "KOSPI", "외국인")
     """
-    return get_net_purchases_impl(start_date, end_date, market, investor)
+    return await _run_tool(
+        "get_market_net_purchases_of_equities",
+        start_date,
+        end_date,
+        market,
+        investor,
+        response_format,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
 
 
 # ===== Foreign Investment Tools =====
 
 
 @mcp.tool()
-def get_exhaustion_rates_of_foreign_investment(
+async def get_exhaustion_rates_of_foreign_investment(
     start_date: str,
     end_date: str = None,
     ticker: str = None,
     market: str = "KOSPI",
     balance_limit: bool = False,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
 ) -> dict:
     """
     Get foreign ownership and investment limit exhaustion rates.
@@ -631,6 +1268,19 @@ def get_exhaustion_rates_of_foreign_investment(
         ticker: Stock ticker (optional, for specific stock)
         market: Market type - KOSPI/KOSDAQ/KONEX
         balance_limit: Only show stocks with foreign ownership limits
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        columns: Columns to return (default: all)
+        tickers: Tickers (row labels) to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["한도소진률 > 50"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
+        page_size: Rows per page (1-1000). Returns one page plus
+            `next_cursor` instead of thousands of rows at once
+        cursor: `next_cursor` from the previous page; pass the same other
+            arguments to get the next page
 
     Returns:
         Dictionary with foreign ownership data
@@ -638,8 +1288,22 @@ def get_exhaustion_rates_of_foreign_investment(
     Example:
         get_exhaustion_rates_of_foreign_investment("20240101", market="KOSPI")
     """
-    return get_foreign_investment_impl(
-        start_date, end_date, ticker, market, balance_limit
+    return await _run_tool(
+        "get_exhaustion_rates_of_foreign_investment",
+        start_date,
+        end_date,
+        ticker,
+        market,
+        balance_limit,
+        response_format,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+        page_size=page_size,
+        cursor=cursor,
     )
 
 
@@ -647,13 +1311,41 @@ def get_exhaustion_rates_of_foreign_investment(
 
 
 @mcp.tool()
-def get_market_ohlcv_by_date(date: str, market: str = "KOSPI") -> dict:
+async def get_market_ohlcv_by_date(
+    date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> dict:
     """
     Get OHLCV for all stocks on a specific date.
 
     Args:
         date: Date in YYYYMMDD format
         market: Market type - KOSPI/KOSDAQ/KONEX/ALL
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        snap_to_trading_day: Query the previous trading day when `date` is a
+            weekend or KRX holiday (default: False, which returns an error)
+        columns: Columns to return (default: all)
+        tickers: Tickers (row labels) to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["등락률 > 5"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
+        page_size: Rows per page (1-1000). Returns one page plus
+            `next_cursor` instead of thousands of rows at once
+        cursor: `next_cursor` from the previous page; pass the same other
+            arguments to get the next page
 
     Returns:
         Dictionary with OHLCV data for all stocks
@@ -661,12 +1353,37 @@ def get_market_ohlcv_by_date(date: str, market: str = "KOSPI") -> dict:
     Example:
         get_market_ohlcv_by_date("20240101", "KOSPI")
     """
-    return get_market_ohlcv_impl(date, market)
+    return await _run_tool(
+        "get_market_ohlcv_by_date",
+        date,
+        market,
+        response_format,
+        snap_to_trading_day,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+        page_size=page_size,
+        cursor=cursor,
+    )
 
 
 @mcp.tool()
-def get_market_price_change(
-    start_date: str, end_date: str, market: str = "KOSPI"
+async def get_market_price_change(
+    start_date: str,
+    end_date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
 ) -> dict:
     """
     Get price change for all stocks over a period.
@@ -675,6 +1392,19 @@ def get_market_price_change(
         start_date: Start date in YYYYMMDD format
         end_date: End date in YYYYMMDD format
         market: Market type - KOSPI/KOSDAQ/KONEX/ALL
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        columns: Columns to return (default: all)
+        tickers: Tickers (row labels) to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["등락률 > 5"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
+        page_size: Rows per page (1-1000). Returns one page plus
+            `next_cursor` instead of thousands of rows at once
+        cursor: `next_cursor` from the previous page; pass the same other
+            arguments to get the next page
 
     Returns:
         Dictionary with price changes for all stocks
@@ -682,7 +1412,94 @@ def get_market_price_change(
     Example:
         get_market_price_change("20240101", "20240131", "KOSPI")
     """
-    return get_price_change_impl(start_date, end_date, market)
+    return await _run_tool(
+        "get_market_price_change",
+        start_date,
+        end_date,
+        market,
+        response_format,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+        page_size=page_size,
+        cursor=cursor,
+    )
+
+
+@mcp.tool()
+async def screen_stocks(
+    date: str,
+    market: str = "KOSPI",
+    min_per: float | None = None,
+    max_per: float | None = None,
+    min_pbr: float | None = None,
+    max_pbr: float | None = None,
+    min_market_cap: float | None = None,
+    max_market_cap: float | None = None,
+    min_div: float | None = None,
+    exclude_loss: bool = True,
+    sort_by: str = "PER",
+    ascending: bool = True,
+    limit: int = 30,
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+) -> dict:
+    """
+    Screen all stocks by PER, PBR, market cap and dividend yield.
+
+    Filtering and sorting run on the server over one day's full-market
+    fundamentals and market caps; only the matching rows are returned.
+    Use this instead of fetching ticker lists and fundamentals to filter
+    them yourself.
+
+    Args:
+        date: Date in YYYYMMDD format
+        market: Market type - KOSPI/KOSDAQ/KONEX/ALL
+        min_per: Minimum PER
+        max_per: Maximum PER
+        min_pbr: Minimum PBR
+        max_pbr: Maximum PBR
+        min_market_cap: Minimum market cap in 억원 (100 million KRW)
+        max_market_cap: Maximum market cap in 억원
+        min_div: Minimum dividend yield (%)
+        exclude_loss: Drop stocks with PER, PBR or EPS <= 0 (default: True)
+        sort_by: PER/PBR/EPS/BPS/DIV/DPS/시가총액 (or "MarketCap")/종가
+        ascending: Sort ascending (default: True)
+        limit: Maximum number of stocks to return (1-100, default: 30)
+        response_format: Response shape - "records", "table" (text table),
+            "both" or "columns" (column arrays; default: "both")
+        snap_to_trading_day: Query the previous trading day when `date` is a
+            weekend or KRX holiday (default: False, which returns an error)
+
+    Returns:
+        Dictionary with the matching stocks, the total match count and the
+        number returned
+
+    Example:
+        screen_stocks("20240105", "KOSPI", max_per=10, max_pbr=1,
+                      min_market_cap=1000)
+    """
+    return await _run_tool(
+        "screen_stocks",
+        date,
+        market,
+        min_per,
+        max_per,
+        min_pbr,
+        max_pbr,
+        min_market_cap,
+        max_market_cap,
+        min_div,
+        exclude_loss,
+        sort_by,
+        ascending,
+        limit,
+        response_format,
+        snap_to_trading_day,
+    )
 
 
 def main():
@@ -712,6 +1529,8 @@ def main():
         logger.info(
             f"Starting pykrx-mcp server with SSE transport on {args.host}:{args.port}"
         )
+        start_warmup()
+        start_refresh_scheduler()
         mcp.run(transport="sse", host=args.host, port=args.port)
     else:
         logger.info("Starting pykrx-mcp server with stdio transport")
@@ -1,37 +1,95 @@
-"""Explicit MCP tools for pykrx."""
-
-from .etf_price import get_etf_ohlcv_by_date, get_etf_ticker_list
-from .foreign_investment import get_exhaustion_rates_of_foreign_investment
-from .fundamental import get_market_fundamental_by_date
-from .index import (
-    get_index_fundamental,
-    get_index_ohlcv,
-    get_index_portfolio_deposit_file,
-    get_index_ticker_list,
-    get_index_ticker_name,
-)
-from .investor import (
-    get_market_net_purchases_of_equities,
-    get_market_trading_value_by_investor,
-    get_market_trading_volume_by_investor,
-)
-from .market_cap import get_market_cap_by_date
-from .market_data import get_market_ohlcv_by_date, get_market_price_change
-from .shorting import (
-    get_shorting_balance_top50,
-    get_shorting_status_by_date,
-    get_shorting_volume_by_ticker,
-    get_shorting_volume_top50,
-)
-from .stock_price import get_stock_ohlcv
-from .ticker_info import get_market_ticker_list, get_market_ticker_name
-from .trading_value import get_market_trading_value_by_date
+"""Explicit MCP tools for pykrx.
+
+Tool modules import pykrx and pandas, which dominate server start-up time,
+so they are loaded lazily (PEP 562): a tool's module is imported the first
+time the tool is accessed, not when the package is imported.
+"""
+
+import contextlib
+import importlib
+import sys
+from collections.abc import Callable
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .etf_price import get_etf_ohlcv_by_date, get_etf_ticker_list
+    from .foreign_investment import get_exhaustion_rates_of_foreign_investment
+    from .fundamental import (
+        get_market_fundamental_by_date,
+        get_market_fundamental_by_ticker,
+    )
+    from .index import (
+        get_index_fundamental,
+        get_index_ohlcv,
+        get_index_portfolio_deposit_file,
+        get_index_ticker_list,
+        get_index_ticker_name,
+    )
+    from .investor import (
+        get_market_net_purchases_of_equities,
+        get_market_trading_value_by_investor,
+        get_market_trading_volume_by_investor,
+    )
+    from .market_cap import get_market_cap_by_date, get_market_cap_by_ticker
+    from .market_data import get_market_ohlcv_by_date, get_market_price_change
+    from .screening import screen_stocks
+    from .shorting import (
+        get_shorting_balance_top50,
+        get_shorting_status_by_date,
+        get_shorting_volume_by_ticker,
+        get_shorting_volume_top50,
+    )
+    from .stock_price import get_stock_ohlcv, get_stock_ohlcv_batch
+    from .ticker_info import (
+        get_market_ticker_list,
+        get_market_ticker_name,
+        get_ticker_info,
+        search_tickers,
+    )
+    from .trading_value import get_market_trading_value_by_date
+
+# Tool name -> module defining it
+_TOOL_MODULES = {
+    "get_etf_ohlcv_by_date": "etf_price",
+    "get_etf_ticker_list": "etf_price",
+    "get_exhaustion_rates_of_foreign_investment": "foreign_investment",
+    "get_market_fundamental_by_date": "fundamental",
+    "get_market_fundamental_by_ticker": "fundamental",
+    "get_index_fundamental": "index",
+    "get_index_ohlcv": "index",
+    "get_index_portfolio_deposit_file": "index",
+    "get_index_ticker_list": "index",
+    "get_index_ticker_name": "index",
+    "get_market_net_purchases_of_equities": "investor",
+    "get_market_trading_value_by_investor": "investor",
+    "get_market_trading_volume_by_investor": "investor",
+    "get_market_cap_by_date": "market_cap",
+    "get_market_cap_by_ticker": "market_cap",
+    "get_market_ohlcv_by_date": "market_data",
+    "get_market_price_change": "market_data",
+    "screen_stocks": "screening",
+    "get_shorting_balance_top50": "shorting",
+    "get_shorting_status_by_date": "shorting",
+    "get_shorting_volume_by_ticker": "shorting",
+    "get_shorting_volume_top50": "shorting",
+    "get_stock_ohlcv": "stock_price",
+    "get_stock_ohlcv_batch": "stock_price",
+    "get_market_ticker_list": "ticker_info",
+    "get_market_ticker_name": "ticker_info",
+    "search_tickers": "ticker_info",
+    "get_ticker_info": "ticker_info",
+    "get_market_trading_value_by_date": "trading_value",
+}
 
 __all__ = [
     # Stock data
     "get_stock_ohlcv",
+    "get_stock_ohlcv_batch",
     "get_market_ticker_list",
     "get_market_ticker_name",
+    "search_tickers",
+    "get_ticker_info",
     "get_market_fundamental_by_date",
     "get_market_cap_by_date",
     "get_market_trading_value_by_date",
@@ -58,4 +116,68 @@ __all__ = [
     # Market-wide data
     "get_market_ohlcv_by_date",
     "get_market_price_change",
+    "get_market_fundamental_by_ticker",
+    "get_market_cap_by_ticker",
+    "screen_stocks",
+    # Lazy loading
+    "load_pykrx",
+    "load_tool",
+    "lazy_tool",
 ]
+
+
+def load_pykrx() -> ModuleType:
+    """
+    Import and return ``pykrx.stock``.
+
+    pykrx prints its KRX login notice to stdout when first imported; that
+    output is sent to stderr so it cannot corrupt the MCP stdio stream.
+    """
+    if "pykrx.stock" not in sys.modules:
+        with contextlib.redirect_stdout(sys.stderr):
+            importlib.import_module("pykrx.stock")
+    return sys.modules["pykrx.stock"]
+
+
+def load_tool(name: str) -> Callable:
+    """
+    Import a tool's module on first use and return the tool function.
+
+    Raises:
+        AttributeError: If ``name`` is not a known tool
+    """
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_path = f"{__name__}.{module_name}"
+    if module_path not in sys.modules:
+        load_pykrx()
+        importlib.import_module(module_path)
+    func = getattr(sys.modules[module_path], name)
+    globals()[name] = func
+    return func
+
+
+def lazy_tool(name: str) -> Callable:
+    """
+    Return a stand-in for a tool that defers loading it until called.
+
+    Lets callers resolve the implementation on a worker thread, so the
+    first call's imports never block the event loop.
+    """
+    if name not in _TOOL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return load_tool(name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+def __getattr__(name: str) -> Any:
+    return load_tool(name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
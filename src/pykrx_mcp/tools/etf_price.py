@@ -5,10 +5,13 @@ import logging
 from pykrx import stock
 
 from ..utils import (
+    cached_call,
     format_dataframe_response,
     format_error_response,
     mcp_tool_error_handler,
+    select_frame,
     validate_date_format,
+    validate_response_format,
     validate_ticker_format,
 )
 
@@ -16,7 +19,17 @@ logger = logging.getLogger(__name__)
 
 
 @mcp_tool_error_handler
-def get_etf_ohlcv_by_date(ticker: str, start_date: str, end_date: str) -> dict:
+def get_etf_ohlcv_by_date(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
     """
     Retrieve ETF OHLCV (Open, High, Low, Close, Volume) data.
 
@@ -27,6 +40,14 @@ def get_etf_ohlcv_by_date(ticker: str, start_date: str, end_date: str) -> dict:
         ticker: ETF ticker symbol (e.g., "069500" for KODEX 200)
         start_date: Start date in YYYYMMDD format (e.g., "20240101")
         end_date: End date in YYYYMMDD format (e.g., "20240131")
+        response_format: Response shape - "records" (default), "table"
+            (text table), "both" or "columns" (column-oriented data).
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["종가 >= 10000"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary containing ETF OHLCV data with dates as keys and
@@ -50,9 +71,17 @@ def get_etf_ohlcv_by_date(ticker: str, start_date: str, end_date: str) -> dict:
     if not valid:
         return format_error_response(msg, end_date=end_date)
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return format_error_response(msg, response_format=response_format)
+
     # Fetch ETF OHLCV data
-    df = stock.get_etf_ohlcv_by_date(
-        fromdate=start_date, todate=end_date, ticker=ticker
+    df = cached_call(
+        stock,
+        "get_etf_ohlcv_by_date",
+        fromdate=start_date,
+        todate=end_date,
+        ticker=ticker,
     )
 
     # Check for empty results
@@ -64,9 +93,17 @@ def get_etf_ohlcv_by_date(ticker: str, start_date: str, end_date: str) -> dict:
             end_date=end_date,
         )
 
+    df = select_frame(
+        df,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
     # Format successful response
     return format_dataframe_response(
-        df, ticker=ticker, start_date=start_date, end_date=end_date
+        df, response_format, ticker=ticker, start_date=start_date, end_date=end_date
     )
 
 
@@ -91,7 +128,7 @@ def get_etf_ticker_list(date: str) -> dict:
         return format_error_response(msg, date=date)
 
     # Fetch ETF ticker list
-    tickers = stock.get_etf_ticker_list(date)
+    tickers = cached_call(stock, "get_etf_ticker_list", date)
 
     if len(tickers) == 0:
         return format_error_response(f"No ETFs found on {date}", date=date)
@@ -6,9 +6,16 @@ from typing import Any
 
 from pykrx import stock
 
+from ..utils.cache import cached_call
 from ..utils.decorators import handle_pykrx_errors
-from ..utils.formatters import dict_to_table
-from ..utils.validators import validate_date_format, validate_ticker
+from ..utils.formatters import format_dict_response
+from ..utils.frames import select_frame
+from ..utils.pagination import Pager
+from ..utils.validators import (
+    validate_date_format,
+    validate_response_format,
+    validate_ticker,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +27,15 @@ def get_exhaustion_rates_of_foreign_investment(
     ticker: str = None,
     market: str = "KOSPI",
     balance_limit: bool = False,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """
     외국인 보유량 및 한도소진률을 조회합니다.
@@ -30,10 +46,23 @@ def get_exhaustion_rates_of_foreign_investment(
         ticker: 종목코드 (6자리, end_date와 함께 사용 시 일자별 조회)
         market: 시장 구분 (KOSPI/KOSDAQ/KONEX, 기본값: KOSPI)
         balance_limit: 외국인 보유한도 제한 종목만 조회 여부
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        tickers: 반환할 종목코드 목록 (전종목 조회 시, 기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["한도소진률 > 50"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
+        page_size: 페이지당 행 수 (1-1000, 지정 시 페이지 단위로 반환)
+        cursor: 이전 페이지 응답의 next_cursor (다음 페이지 조회,
+            나머지 인자는 첫 페이지와 동일하게 전달)
 
     Returns:
         Dict containing:
         - data: 상장주식수/보유수량/지분율/한도수량/한도소진률
+        - next_cursor: 다음 페이지 커서 (페이지 조회 시, 마지막 페이지는 None)
         - error: 오류 발생 시 오류 메시지
     """
     logger.info(
@@ -41,6 +70,10 @@ def get_exhaustion_rates_of_foreign_investment(
         f"from {start_date} to {end_date or start_date}"
     )
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(start_date):
         return {
             "error": "Invalid start_date format. Use YYYYMMDD (e.g., '20240101').",
@@ -60,8 +93,28 @@ def get_exhaustion_rates_of_foreign_investment(
                 "ticker": ticker,
             }
 
-        df = stock.get_exhaustion_rates_of_foreign_investment(
-            start_date, end_date, ticker
+        pager = Pager(
+            "get_exhaustion_rates_of_foreign_investment",
+            page_size,
+            cursor,
+            start_date=start_date,
+            end_date=end_date,
+            ticker=ticker,
+            columns=columns,
+            tickers=tickers,
+            where=where,
+            sort_by=sort_by,
+            ascending=ascending,
+            top_n=top_n,
+        )
+        df = pager.load(
+            lambda: cached_call(
+                stock,
+                "get_exhaustion_rates_of_foreign_investment",
+                start_date,
+                end_date,
+                ticker,
+            )
         )
 
         if df.empty:
@@ -72,17 +125,24 @@ def get_exhaustion_rates_of_foreign_investment(
                 "end_date": end_date,
             }
 
-        # Convert to dict with date as string
-        result_dict = df.to_dict(orient="index")
-        formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-        return {
-            "ticker": ticker,
-            "start_date": start_date,
-            "end_date": end_date,
-            "data": formatted_dict,
-            "table": dict_to_table(formatted_dict),
-        }
+        df = select_frame(
+            df,
+            columns=columns,
+            tickers=tickers,
+            where=where,
+            sort_by=sort_by,
+            ascending=ascending,
+            top_n=top_n,
+        )
+        df, page = pager.page(df)
+        return format_dict_response(
+            df,
+            response_format,
+            ticker=ticker,
+            start_date=start_date,
+            end_date=end_date,
+            **page,
+        )
 
     else:
         # 특정 일자의 전종목 조회
@@ -93,8 +153,28 @@ def get_exhaustion_rates_of_foreign_investment(
                 "market": market,
             }
 
-        df = stock.get_exhaustion_rates_of_foreign_investment(
-            start_date, market=market_upper, balance_limit=balance_limit
+        pager = Pager(
+            "get_exhaustion_rates_of_foreign_investment",
+            page_size,
+            cursor,
+            date=start_date,
+            market=market_upper,
+            balance_limit=balance_limit,
+            columns=columns,
+            tickers=tickers,
+            where=where,
+            sort_by=sort_by,
+            ascending=ascending,
+            top_n=top_n,
+        )
+        df = pager.load(
+            lambda: cached_call(
+                stock,
+                "get_exhaustion_rates_of_foreign_investment",
+                start_date,
+                market=market_upper,
+                balance_limit=balance_limit,
+            )
         )
 
         if df.empty:
@@ -104,14 +184,20 @@ def get_exhaustion_rates_of_foreign_investment(
                 "market": market,
             }
 
-        # Convert to dict with ticker as key
-        result_dict = df.to_dict(orient="index")
-        formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-        return {
-            "date": start_date,
-            "market": market_upper,
-            "balance_limit": balance_limit,
-            "data": formatted_dict,
-            "table": dict_to_table(formatted_dict),
-        }
+        df = select_frame(
+            df,
+            columns=columns,
+            tickers=tickers,
+            where=where,
+            sort_by=sort_by,
+            ascending=ascending,
+            top_n=top_n,
+        )
+        df, page = pager.page(df)
+        return format_dict_response(
+            df,
+            response_format,
+            date=start_date,
+            market=market_upper,
+            balance_limit=balance_limit,
+        )
@@ -6,9 +6,11 @@ from typing import Any
 
 from pykrx import stock
 
+from ..utils.cache import cached_call
 from ..utils.decorators import handle_pykrx_errors
-from ..utils.formatters import dict_to_table
-from ..utils.validators import validate_date_format
+from ..utils.formatters import format_dict_response
+from ..utils.frames import select_frame
+from ..utils.validators import validate_date_format, validate_response_format
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +45,9 @@ def get_index_ticker_list(date: str = None, market: str = "KOSPI") -> dict[str,
         }
 
     if date:
-        tickers = stock.get_index_ticker_list(date, market=market_upper)
+        tickers = cached_call(stock, "get_index_ticker_list", date, market=market_upper)
     else:
-        tickers = stock.get_index_ticker_list(market=market_upper)
+        tickers = cached_call(stock, "get_index_ticker_list", market=market_upper)
 
     if not tickers:
         return {"error": "No index tickers found.", "date": date, "market": market}
@@ -58,7 +60,7 @@ def get_index_ticker_list(date: str = None, market: str = "KOSPI") -> dict[str,
     }
 
 
-@handle_pykrx_errors
+@handle_pykrx_errors(cache_ttl=86400)
 def get_index_ticker_name(ticker: str) -> dict[str, Any]:
     """
     지수 티커의 이름을 조회합니다.
@@ -76,7 +78,7 @@ def get_index_ticker_name(ticker: str) -> dict[str, Any]:
     if not ticker:
         return {"error": "Ticker is required.", "ticker": ticker}
 
-    name = stock.get_index_ticker_name(ticker)
+    name = cached_call(stock, "get_index_ticker_name", ticker)
 
     if not name:
         return {"error": "Index name not found.", "ticker": ticker}
@@ -86,7 +88,16 @@ def get_index_ticker_name(ticker: str) -> dict[str, Any]:
 
 @handle_pykrx_errors
 def get_index_ohlcv(
-    ticker: str, start_date: str, end_date: str, freq: str = "d"
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    freq: str = "d",
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict[str, Any]:
     """
     지수의 OHLCV를 조회합니다.
@@ -96,6 +107,14 @@ def get_index_ohlcv(
         start_date: 조회 시작일 (YYYYMMDD 형식, 예: '20240101')
         end_date: 조회 종료일 (YYYYMMDD 형식, 예: '20240131')
         freq: 조회 주기 (d: 일별, m: 월별, y: 연별, 기본값: d)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["등락률 < -2"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
 
     Returns:
         Dict containing:
@@ -106,6 +125,10 @@ def get_index_ohlcv(
         f"Fetching index OHLCV for {ticker} from {start_date} to {end_date} ({freq})"
     )
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(start_date) or not validate_date_format(end_date):
         return {
             "error": "Invalid date format. Use YYYYMMDD (e.g., '20240101').",
@@ -116,7 +139,7 @@ def get_index_ohlcv(
     if freq not in ["d", "m", "y"]:
         return {"error": "Invalid frequency. Must be one of: d, m, y", "freq": freq}
 
-    df = stock.get_index_ohlcv(start_date, end_date, ticker, freq=freq)
+    df = cached_call(stock, "get_index_ohlcv", start_date, end_date, ticker, freq=freq)
 
     if df.empty:
         return {
@@ -126,23 +149,35 @@ def get_index_ohlcv(
             "end_date": end_date,
         }
 
-    # Convert to dict with date as string
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "ticker": ticker,
-        "start_date": start_date,
-        "end_date": end_date,
-        "frequency": freq,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-    }
+    df = select_frame(
+        df,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    return format_dict_response(
+        df,
+        response_format,
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+        frequency=freq,
+    )
 
 
 @handle_pykrx_errors
 def get_index_fundamental(
-    start_date: str, end_date: str = None, ticker: str = None
+    start_date: str,
+    end_date: str = None,
+    ticker: str = None,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict[str, Any]:
     """
     지수의 fundamental 정보(PER/PBR/배당수익률)를 조회합니다.
@@ -151,6 +186,14 @@ def get_index_fundamental(
         start_date: 조회 시작일 (YYYYMMDD 형식)
         end_date: 조회 종료일 (YYYYMMDD 형식, 생략 시 start_date의 모든 지수)
         ticker: 지수 티커 (예: '1001', end_date와 함께 사용)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["PER <= 10"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
 
     Returns:
         Dict containing:
@@ -162,6 +205,10 @@ def get_index_fundamental(
         f"from {start_date} to {end_date or start_date}"
     )
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(start_date):
         return {
             "error": "Invalid start_date format. Use YYYYMMDD (e.g., '20240101').",
@@ -180,9 +227,9 @@ def get_index_fundamental(
                 "start_date": start_date,
                 "end_date": end_date,
             }
-        df = stock.get_index_fundamental(start_date, end_date, ticker)
+        df = cached_call(stock, "get_index_fundamental", start_date, end_date, ticker)
     else:
-        df = stock.get_index_fundamental(start_date)
+        df = cached_call(stock, "get_index_fundamental", start_date)
 
     if df.empty:
         return {
@@ -192,17 +239,21 @@ def get_index_fundamental(
             "ticker": ticker,
         }
 
-    # Convert to dict with date/index name as string
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "start_date": start_date,
-        "end_date": end_date,
-        "ticker": ticker,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-    }
+    df = select_frame(
+        df,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    return format_dict_response(
+        df,
+        response_format,
+        start_date=start_date,
+        end_date=end_date,
+        ticker=ticker,
+    )
 
 
 @handle_pykrx_errors
@@ -228,9 +279,9 @@ def get_index_portfolio_deposit_file(ticker: str, date: str = None) -> dict[str,
         }
 
     if date:
-        tickers = stock.get_index_portfolio_deposit_file(ticker, date)
+        tickers = cached_call(stock, "get_index_portfolio_deposit_file", ticker, date)
     else:
-        tickers = stock.get_index_portfolio_deposit_file(ticker)
+        tickers = cached_call(stock, "get_index_portfolio_deposit_file", ticker)
 
     if not tickers:
         return {"error": "No constituents found.", "ticker": ticker, "date": date}
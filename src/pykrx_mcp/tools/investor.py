@@ -6,16 +6,31 @@ from typing import Any
 
 from pykrx import stock
 
+from ..utils.cache import cached_call
 from ..utils.decorators import handle_pykrx_errors
-from ..utils.formatters import dict_to_table
-from ..utils.validators import validate_date_format, validate_ticker
+from ..utils.formatters import format_dict_response
+from ..utils.frames import select_frame
+from ..utils.validators import (
+    validate_date_format,
+    validate_response_format,
+    validate_ticker,
+)
 
 logger = logging.getLogger(__name__)
 
 
 @handle_pykrx_errors
 def get_market_trading_volume_by_investor(
-    start_date: str, end_date: str, ticker: str, market: str = None
+    start_date: str,
+    end_date: str,
+    ticker: str,
+    market: str = None,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict[str, Any]:
     """
     투자자별 순매수 거래량을 조회합니다.
@@ -25,6 +40,14 @@ def get_market_trading_volume_by_investor(
         end_date: 조회 종료일 (YYYYMMDD 형식, 예: '20240131')
         ticker: 종목코드 또는 시장 구분 (6자리 종목코드 또는 KOSPI/KOSDAQ/KONEX/ALL)
         market: 사용하지 않음 (deprecated, ticker에 시장 구분 직접 입력)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["순매수 > 0"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
 
     Returns:
         Dict containing:
@@ -36,6 +59,10 @@ def get_market_trading_volume_by_investor(
         f"from {start_date} to {end_date}"
     )
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(start_date) or not validate_date_format(end_date):
         return {
             "error": "Invalid date format. Use YYYYMMDD (e.g., '20240101').",
@@ -47,8 +74,12 @@ def get_market_trading_volume_by_investor(
     ticker_upper = ticker.upper()
     if ticker_upper in ["KOSPI", "KOSDAQ", "KONEX", "ALL"]:
         # Market query
-        df = stock.get_market_trading_volume_by_investor(
-            start_date, end_date, ticker_upper
+        df = cached_call(
+            stock,
+            "get_market_trading_volume_by_investor",
+            start_date,
+            end_date,
+            ticker_upper,
         )
     else:
         # Stock ticker query
@@ -57,7 +88,9 @@ def get_market_trading_volume_by_investor(
                 "error": "Invalid ticker format. Must be 6 digits or market name.",
                 "ticker": ticker,
             }
-        df = stock.get_market_trading_volume_by_investor(start_date, end_date, ticker)
+        df = cached_call(
+            stock, "get_market_trading_volume_by_investor", start_date, end_date, ticker
+        )
 
     if df.empty:
         return {
@@ -67,22 +100,34 @@ def get_market_trading_volume_by_investor(
             "end_date": end_date,
         }
 
-    # Convert to dict
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "ticker": ticker,
-        "start_date": start_date,
-        "end_date": end_date,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-    }
+    df = select_frame(
+        df,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    return format_dict_response(
+        df,
+        response_format,
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+    )
 
 
 @handle_pykrx_errors
 def get_market_trading_value_by_investor(
-    start_date: str, end_date: str, ticker: str
+    start_date: str,
+    end_date: str,
+    ticker: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict[str, Any]:
     """
     투자자별 순매수 거래대금을 조회합니다.
@@ -91,6 +136,14 @@ def get_market_trading_value_by_investor(
         start_date: 조회 시작일 (YYYYMMDD 형식, 예: '20240101')
         end_date: 조회 종료일 (YYYYMMDD 형식, 예: '20240131')
         ticker: 종목코드 또는 시장 구분 (6자리 종목코드 또는 KOSPI/KOSDAQ/KONEX/ALL)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["순매수 > 0"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
 
     Returns:
         Dict containing:
@@ -102,6 +155,10 @@ def get_market_trading_value_by_investor(
         f"from {start_date} to {end_date}"
     )
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(start_date) or not validate_date_format(end_date):
         return {
             "error": "Invalid date format. Use YYYYMMDD (e.g., '20240101').",
@@ -113,8 +170,12 @@ def get_market_trading_value_by_investor(
     ticker_upper = ticker.upper()
     if ticker_upper in ["KOSPI", "KOSDAQ", "KONEX", "ALL"]:
         # Market query
-        df = stock.get_market_trading_value_by_investor(
-            start_date, end_date, ticker_upper
+        df = cached_call(
+            stock,
+            "get_market_trading_value_by_investor",
+            start_date,
+            end_date,
+            ticker_upper,
         )
     else:
         # Stock ticker query
@@ -123,7 +184,9 @@ def get_market_trading_value_by_investor(
                 "error": "Invalid ticker format. Must be 6 digits or market name.",
                 "ticker": ticker,
             }
-        df = stock.get_market_trading_value_by_investor(start_date, end_date, ticker)
+        df = cached_call(
+            stock, "get_market_trading_value_by_investor", start_date, end_date, ticker
+        )
 
     if df.empty:
         return {
@@ -133,22 +196,36 @@ def get_market_trading_value_by_investor(
             "end_date": end_date,
         }
 
-    # Convert to dict
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "ticker": ticker,
-        "start_date": start_date,
-        "end_date": end_date,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-    }
+    df = select_frame(
+        df,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    return format_dict_response(
+        df,
+        response_format,
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+    )
 
 
 @handle_pykrx_errors
 def get_market_net_purchases_of_equities(
-    start_date: str, end_date: str, market: str, investor: str
+    start_date: str,
+    end_date: str,
+    market: str,
+    investor: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict[str, Any]:
     """
     투자자별 순매수 상위 종목을 조회합니다.
@@ -160,6 +237,15 @@ def get_market_net_purchases_of_equities(
         investor: 투자자 구분
             (금융투자/보험/투신/사모/은행/기타금융/연기금/기관합계/
             기타법인/개인/외국인/기타외국인/전체)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        tickers: 반환할 종목코드 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["순매수거래대금 > 0"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
 
     Returns:
         Dict containing:
@@ -171,6 +257,10 @@ def get_market_net_purchases_of_equities(
         f"from {start_date} to {end_date}"
     )
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(start_date) or not validate_date_format(end_date):
         return {
             "error": "Invalid date format. Use YYYYMMDD (e.g., '20240101').",
@@ -206,8 +296,13 @@ def get_market_net_purchases_of_equities(
             "investor": investor,
         }
 
-    df = stock.get_market_net_purchases_of_equities(
-        start_date, end_date, market_upper, investor
+    df = cached_call(
+        stock,
+        "get_market_net_purchases_of_equities",
+        start_date,
+        end_date,
+        market_upper,
+        investor,
     )
 
     if df.empty:
@@ -219,15 +314,20 @@ def get_market_net_purchases_of_equities(
             "end_date": end_date,
         }
 
-    # Convert to dict with ticker as key
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "market": market_upper,
-        "investor": investor,
-        "start_date": start_date,
-        "end_date": end_date,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-    }
+    df = select_frame(
+        df,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    return format_dict_response(
+        df,
+        response_format,
+        market=market_upper,
+        investor=investor,
+        start_date=start_date,
+        end_date=end_date,
+    )
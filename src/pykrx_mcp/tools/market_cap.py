@@ -3,16 +3,35 @@
 from pykrx import stock
 
 from ..utils import (
+    cached_call,
     format_dataframe_response,
+    format_dict_response,
     format_error_response,
     mcp_tool_error_handler,
+    select_frame,
     validate_date_format,
+    validate_response_format,
     validate_ticker_format,
 )
+from ..utils.cache import fetch_cross_section
+from ..utils.pagination import Pager
+from ..utils.trading_calendar import resolve_trading_date
+
+MARKETS = ("KOSPI", "KOSDAQ", "KONEX", "ALL")
 
 
 @mcp_tool_error_handler
-def get_market_cap_by_date(ticker: str, start_date: str, end_date: str) -> dict:
+def get_market_cap_by_date(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
     """
     Retrieve market capitalization data for a stock.
 
@@ -20,6 +39,14 @@ def get_market_cap_by_date(ticker: str, start_date: str, end_date: str) -> dict:
         ticker: 6-digit stock ticker code (e.g., "005930" for Samsung Electronics)
         start_date: Start date in YYYYMMDD format (e.g., "20240101")
         end_date: End date in YYYYMMDD format (e.g., "20240131")
+        response_format: Response shape - "records" (default), "table"
+            (text table), "both" or "columns" (column-oriented data).
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["거래량 >= 1000000"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary containing:
@@ -52,9 +79,17 @@ def get_market_cap_by_date(ticker: str, start_date: str, end_date: str) -> dict:
     if not valid:
         return format_error_response(msg, date=end_date, field="end_date")
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return format_error_response(msg, response_format=response_format)
+
     # Fetch market cap data from pykrx
-    df = stock.get_market_cap_by_date(
-        fromdate=start_date, todate=end_date, ticker=ticker
+    df = cached_call(
+        stock,
+        "get_market_cap_by_date",
+        fromdate=start_date,
+        todate=end_date,
+        ticker=ticker,
     )
 
     if df.empty:
@@ -66,6 +101,139 @@ def get_market_cap_by_date(ticker: str, start_date: str, end_date: str) -> dict:
             end_date=end_date,
         )
 
+    df = select_frame(
+        df,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
     return format_dataframe_response(
-        df, ticker=ticker, start_date=start_date, end_date=end_date
+        df, response_format, ticker=ticker, start_date=start_date, end_date=end_date
+    )
+
+
+@mcp_tool_error_handler
+def get_market_cap_by_ticker(
+    date: str,
+    market: str = "ALL",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> dict:
+    """
+    Retrieve market capitalization data for all stocks on a date.
+
+    One call returns the whole market, sorted by market cap (largest
+    first), so use this instead of calling get_market_cap_by_date once per
+    ticker for rankings and cross-sectional comparisons.
+
+    Args:
+        date: Date in YYYYMMDD format (e.g., "20240105")
+        market: Market - "ALL" (default), "KOSPI", "KOSDAQ" or "KONEX"
+        response_format: Response shape - "records", "table" (text table),
+            "both" (default) or "columns" (column-oriented data).
+        snap_to_trading_day: Query the previous trading day when ``date``
+            is a weekend or KRX holiday (default: False, which returns an
+            error)
+        columns: Columns to return (default: all of 종가, 시가총액, 거래량,
+            거래대금, 상장주식수)
+        tickers: Tickers to return (default: the whole market)
+        where: Row filters that must all hold (e.g., ["거래대금 >= 10000000000"])
+        sort_by: Column to sort by (default: upstream order, by 시가총액)
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N stocks after sorting
+        page_size: Rows per page (1-1000); returns one page and a
+            ``next_cursor`` instead of the whole selection
+        cursor: ``next_cursor`` of the previous page (pass the same other
+            arguments as for the first page)
+
+    Returns:
+        Dictionary containing:
+        - date: Trading date queried
+        - market: Market queried
+        - total: Number of stocks in the market
+        - count: Number of stocks returned
+        - offset, page_size, total_rows, next_cursor: Page position when
+          paginating (next_cursor is None on the last page)
+        - data: Market cap data keyed by ticker
+
+    Example:
+        get_market_cap_by_ticker(
+            "20240105", "KOSPI", columns=["시가총액"], top_n=10
+        )
+        Returns the 10 largest KOSPI stocks by market cap
+    """
+    valid, msg = validate_date_format(date)
+    if not valid:
+        return format_error_response(msg, date=date)
+
+    market_upper = market.upper()
+    if market_upper not in MARKETS:
+        return format_error_response(
+            f"Invalid market. Must be one of: {', '.join(MARKETS)}", market=market
+        )
+
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return format_error_response(msg, response_format=response_format)
+
+    trading_date, msg = resolve_trading_date(stock, date, snap_to_trading_day)
+    if msg:
+        return format_error_response(msg, date=date, market=market)
+
+    pager = Pager(
+        "get_market_cap_by_ticker",
+        page_size,
+        cursor,
+        date=trading_date,
+        market=market_upper,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    df = pager.load(
+        lambda: fetch_cross_section(stock, "market_cap", trading_date, market_upper)
+    )
+
+    if df.empty:
+        return format_error_response(
+            f"No market cap data found for {market_upper} on {trading_date}",
+            date=date,
+            market=market,
+        )
+
+    selected = select_frame(
+        df,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+
+    metadata = {"date": trading_date, "market": market_upper}
+    if trading_date != date:
+        metadata["requested_date"] = date
+
+    selected, page = pager.page(selected)
+    return format_dict_response(
+        selected,
+        response_format,
+        **metadata,
+        total=len(df),
+        count=len(selected),
+        **page,
     )
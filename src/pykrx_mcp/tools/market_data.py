@@ -6,29 +6,65 @@ from typing import Any
 
 from pykrx import stock
 
+from ..utils.cache import cached_call
 from ..utils.decorators import handle_pykrx_errors
-from ..utils.formatters import dict_to_table
-from ..utils.validators import validate_date_format
+from ..utils.formatters import format_dict_response
+from ..utils.frames import select_frame
+from ..utils.pagination import Pager
+from ..utils.trading_calendar import resolve_trading_date
+from ..utils.validators import validate_date_format, validate_response_format
 
 logger = logging.getLogger(__name__)
 
 
 @handle_pykrx_errors
-def get_market_ohlcv_by_date(date: str, market: str = "KOSPI") -> dict[str, Any]:
+def get_market_ohlcv_by_date(
+    date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> dict[str, Any]:
     """
     특정 일자의 전종목 시세를 조회합니다.
 
     Args:
         date: 조회 일자 (YYYYMMDD 형식, 예: '20240101')
         market: 시장 구분 (KOSPI/KOSDAQ/KONEX/ALL, 기본값: KOSPI)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        snap_to_trading_day: 휴장일이면 직전 거래일로 조회 (기본값: False,
+            False면 휴장일은 오류 반환)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        tickers: 반환할 종목코드 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["등락률 > 5"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
+        page_size: 페이지당 행 수 (1-1000, 지정 시 페이지 단위로 반환)
+        cursor: 이전 페이지 응답의 next_cursor (다음 페이지 조회,
+            나머지 인자는 첫 페이지와 동일하게 전달)
 
     Returns:
         Dict containing:
         - data: 종목별 시가/고가/저가/종가/거래량/거래대금/등락률
+        - next_cursor: 다음 페이지 커서 (페이지 조회 시, 마지막 페이지는 None)
         - error: 오류 발생 시 오류 메시지
     """
     logger.info(f"Fetching market OHLCV for {market} on {date}")
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(date):
         return {
             "error": "Invalid date format. Use YYYYMMDD (e.g., '20240101').",
@@ -42,7 +78,28 @@ def get_market_ohlcv_by_date(date: str, market: str = "KOSPI") -> dict[str, Any]
             "market": market,
         }
 
-    df = stock.get_market_ohlcv(date, market=market_upper)
+    trading_date, msg = resolve_trading_date(stock, date, snap_to_trading_day)
+    if msg:
+        return {"error": msg, "date": date, "market": market}
+
+    pager = Pager(
+        "get_market_ohlcv_by_date",
+        page_size,
+        cursor,
+        date=trading_date,
+        market=market_upper,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    df = pager.load(
+        lambda: cached_call(
+            stock, "get_market_ohlcv", trading_date, market=market_upper
+        )
+    )
 
     if df.empty:
         return {
@@ -51,22 +108,43 @@ def get_market_ohlcv_by_date(date: str, market: str = "KOSPI") -> dict[str, Any]
             "market": market,
         }
 
-    # Convert to dict with ticker as key
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "date": date,
-        "market": market_upper,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-        "count": len(formatted_dict),
-    }
+    metadata = {"date": trading_date, "market": market_upper}
+    if trading_date != date:
+        metadata["requested_date"] = date
+
+    df = select_frame(
+        df,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    df, page = pager.page(df)
+    return format_dict_response(
+        df,
+        response_format,
+        **metadata,
+        count=len(df),
+        **page,
+    )
 
 
 @handle_pykrx_errors
 def get_market_price_change(
-    start_date: str, end_date: str, market: str = "KOSPI"
+    start_date: str,
+    end_date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """
     특정 기간 동안의 전종목 가격 변동을 조회합니다.
@@ -75,16 +153,33 @@ def get_market_price_change(
         start_date: 조회 시작일 (YYYYMMDD 형식, 예: '20240101')
         end_date: 조회 종료일 (YYYYMMDD 형식, 예: '20240131')
         market: 시장 구분 (KOSPI/KOSDAQ/KONEX/ALL, 기본값: KOSPI)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        tickers: 반환할 종목코드 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["등락률 > 5"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
+        page_size: 페이지당 행 수 (1-1000, 지정 시 페이지 단위로 반환)
+        cursor: 이전 페이지 응답의 next_cursor (다음 페이지 조회,
+            나머지 인자는 첫 페이지와 동일하게 전달)
 
     Returns:
         Dict containing:
         - data: 종목별 시가/종가/변동폭/등락률/거래량/거래대금
+        - next_cursor: 다음 페이지 커서 (페이지 조회 시, 마지막 페이지는 None)
         - error: 오류 발생 시 오류 메시지
     """
     logger.info(
         f"Fetching market price change for {market} from {start_date} to {end_date}"
     )
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(start_date) or not validate_date_format(end_date):
         return {
             "error": "Invalid date format. Use YYYYMMDD (e.g., '20240101').",
@@ -99,7 +194,25 @@ def get_market_price_change(
             "market": market,
         }
 
-    df = stock.get_market_price_change(start_date, end_date, market=market_upper)
+    pager = Pager(
+        "get_market_price_change",
+        page_size,
+        cursor,
+        start_date=start_date,
+        end_date=end_date,
+        market=market_upper,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    df = pager.load(
+        lambda: cached_call(
+            stock, "get_market_price_change", start_date, end_date, market=market_upper
+        )
+    )
 
     if df.empty:
         return {
@@ -109,15 +222,22 @@ def get_market_price_change(
             "market": market,
         }
 
-    # Convert to dict with ticker as key
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "start_date": start_date,
-        "end_date": end_date,
-        "market": market_upper,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-        "count": len(formatted_dict),
-    }
+    df = select_frame(
+        df,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    df, page = pager.page(df)
+    return format_dict_response(
+        df,
+        response_format,
+        start_date=start_date,
+        end_date=end_date,
+        market=market_upper,
+        count=len(df),
+        **page,
+    )
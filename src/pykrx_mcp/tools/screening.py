@@ -0,0 +1,184 @@
+"""전종목 밸류에이션 스크리닝 도구."""
+
+import logging
+from typing import Any
+
+import pandas as pd
+from pykrx import stock
+
+from ..utils.cache import cached_call, fetch_snapshot
+from ..utils.decorators import handle_pykrx_errors
+from ..utils.formatters import format_dict_response
+from ..utils.ticker_master import peek_ticker_master
+from ..utils.trading_calendar import resolve_trading_date
+from ..utils.validators import validate_date_format, validate_response_format
+
+logger = logging.getLogger(__name__)
+
+MARKETS = ("KOSPI", "KOSDAQ", "KONEX", "ALL")
+
+# Sortable columns; "MarketCap" is accepted as an alias of 시가총액
+SORT_COLUMNS = ("PER", "PBR", "EPS", "BPS", "DIV", "DPS", "시가총액", "종가")
+SORT_ALIASES = {"MARKETCAP": "시가총액"}
+
+MAX_SCREEN_RESULTS = 100
+
+# Market-cap thresholds are given in 억원
+_EOK = 100_000_000
+
+
+def _between(series: pd.Series, low: float | None, high: float | None) -> pd.Series:
+    mask = pd.Series(True, index=series.index)
+    if low is not None:
+        mask &= series >= low
+    if high is not None:
+        mask &= series <= high
+    return mask
+
+
+def _ticker_names(tickers: list[str]) -> list[str]:
+    master = peek_ticker_master()
+    names = []
+    for ticker in tickers:
+        entry = master.get(ticker) if master is not None else None
+        if entry is None:
+            # Without a loaded master, fall back to (cached) per-ticker lookups
+            names.append(str(cached_call(stock, "get_market_ticker_name", ticker)))
+        else:
+            names.append(entry.name)
+    return names
+
+
+@handle_pykrx_errors
+def screen_stocks(
+    date: str,
+    market: str = "KOSPI",
+    min_per: float | None = None,
+    max_per: float | None = None,
+    min_pbr: float | None = None,
+    max_pbr: float | None = None,
+    min_market_cap: float | None = None,
+    max_market_cap: float | None = None,
+    min_div: float | None = None,
+    exclude_loss: bool = True,
+    sort_by: str = "PER",
+    ascending: bool = True,
+    limit: int = 30,
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+) -> dict[str, Any]:
+    """
+    PER/PBR/시가총액/배당수익률 조건으로 전종목을 스크리닝합니다.
+
+    하루치 전종목 기본 지표와 시가총액 스냅샷(캐시 공유)을 결합해 서버에서
+    필터링과 정렬을 수행하고, 조건을 만족하는 상위 종목만 반환합니다.
+
+    Args:
+        date: 조회 일자 (YYYYMMDD 형식, 예: '20240105')
+        market: 시장 구분 (KOSPI/KOSDAQ/KONEX/ALL, 기본값: KOSPI)
+        min_per: 최소 PER
+        max_per: 최대 PER
+        min_pbr: 최소 PBR
+        max_pbr: 최대 PBR
+        min_market_cap: 최소 시가총액 (억원)
+        max_market_cap: 최대 시가총액 (억원)
+        min_div: 최소 배당수익률 (%)
+        exclude_loss: PER/PBR/EPS가 0 이하인 종목(적자, 자본잠식) 제외
+            (기본값: True)
+        sort_by: 정렬 기준 (PER/PBR/EPS/BPS/DIV/DPS/시가총액/종가,
+            기본값: PER)
+        ascending: 오름차순 정렬 여부 (기본값: True)
+        limit: 최대 반환 종목 수 (1-100, 기본값: 30)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        snap_to_trading_day: 휴장일이면 직전 거래일로 조회 (기본값: False,
+            False면 휴장일은 오류 반환)
+
+    Returns:
+        Dict containing:
+        - data: 종목별 종목명/PER/PBR/EPS/BPS/DIV/DPS/종가/시가총액
+        - matched: 조건을 만족한 전체 종목 수
+        - count: 반환된 종목 수
+        - error: 오류 발생 시 오류 메시지
+    """
+    logger.info(f"Screening {market} stocks on {date}")
+
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
+    valid, msg = validate_date_format(date)
+    if not valid:
+        return {"error": msg, "date": date}
+
+    market_upper = market.upper()
+    if market_upper not in MARKETS:
+        return {
+            "error": "Invalid market. Must be one of: KOSPI, KOSDAQ, KONEX, ALL",
+            "market": market,
+        }
+
+    sort_column = SORT_ALIASES.get(sort_by.upper(), sort_by.upper())
+    if sort_column not in SORT_COLUMNS:
+        return {
+            "error": f"Invalid sort_by. Must be one of: {', '.join(SORT_COLUMNS)}",
+            "sort_by": sort_by,
+        }
+
+    if not 1 <= limit <= MAX_SCREEN_RESULTS:
+        return {
+            "error": f"limit must be between 1 and {MAX_SCREEN_RESULTS}",
+            "limit": limit,
+        }
+
+    trading_date, msg = resolve_trading_date(stock, date, snap_to_trading_day)
+    if msg:
+        return {"error": msg, "date": date, "market": market}
+
+    # Both snapshots are full-market (ALL) frames shared with the other
+    # cross-sectional tools, so repeated screens cost no upstream calls
+    fundamental = fetch_snapshot(stock, "fundamental", trading_date)
+    market_cap = fetch_snapshot(stock, "market_cap", trading_date)
+    if fundamental.empty or market_cap.empty:
+        return {
+            "error": "No data found for the given date.",
+            "date": date,
+            "market": market,
+        }
+
+    df = fundamental.join(market_cap[["종가", "시가총액"]], how="inner")
+    if market_upper != "ALL":
+        tickers = cached_call(
+            stock, "get_market_ticker_list", trading_date, market=market_upper
+        )
+        df = df[df.index.isin(list(tickers))]
+
+    mask = _between(df["PER"], min_per, max_per)
+    mask &= _between(df["PBR"], min_pbr, max_pbr)
+    mask &= _between(
+        df["시가총액"],
+        None if min_market_cap is None else min_market_cap * _EOK,
+        None if max_market_cap is None else max_market_cap * _EOK,
+    )
+    if min_div is not None:
+        mask &= df["DIV"] >= min_div
+    if exclude_loss:
+        mask &= (df["PER"] > 0) & (df["PBR"] > 0) & (df["EPS"] > 0)
+
+    matched = df[mask]
+    result = matched.sort_values(sort_column, ascending=ascending, kind="stable")
+    result = result.head(limit)
+    result.insert(0, "종목명", _ticker_names([str(t) for t in result.index]))
+
+    metadata = {"date": trading_date, "market": market_upper}
+    if trading_date != date:
+        metadata["requested_date"] = date
+
+    return format_dict_response(
+        result,
+        response_format,
+        **metadata,
+        sort_by=sort_column,
+        matched=int(mask.sum()),
+        count=len(result),
+    )
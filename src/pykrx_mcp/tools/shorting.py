@@ -6,16 +6,31 @@ from typing import Any
 
 from pykrx import stock
 
+from ..utils.cache import cached_call, cached_range_call
 from ..utils.decorators import handle_pykrx_errors
-from ..utils.formatters import dict_to_table
-from ..utils.validators import validate_date_format, validate_ticker
+from ..utils.formatters import format_dict_response
+from ..utils.frames import select_frame
+from ..utils.trading_calendar import resolve_trading_date
+from ..utils.validators import (
+    validate_date_format,
+    validate_response_format,
+    validate_ticker,
+)
 
 logger = logging.getLogger(__name__)
 
 
 @handle_pykrx_errors
 def get_shorting_status_by_date(
-    ticker: str, start_date: str, end_date: str
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict[str, Any]:
     """
     특정 종목의 공매도 현황을 조회합니다.
@@ -24,6 +39,14 @@ def get_shorting_status_by_date(
         ticker: 6자리 종목코드 (예: '005930')
         start_date: 조회 시작일 (YYYYMMDD 형식, 예: '20240101')
         end_date: 조회 종료일 (YYYYMMDD 형식, 예: '20240131')
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["비중 > 1"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
 
     Returns:
         Dict containing:
@@ -34,6 +57,10 @@ def get_shorting_status_by_date(
         f"Fetching shorting status for {ticker} from {start_date} to {end_date}"
     )
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     # Validate inputs
     if not validate_ticker(ticker):
         return {"error": "Invalid ticker format. Must be 6 digits.", "ticker": ticker}
@@ -45,7 +72,13 @@ def get_shorting_status_by_date(
             "end_date": end_date,
         }
 
-    df = stock.get_shorting_status_by_date(start_date, end_date, ticker)
+    df = cached_range_call(
+        stock,
+        "get_shorting_status_by_date",
+        fromdate=start_date,
+        todate=end_date,
+        ticker=ticker,
+    )
 
     if df.empty:
         return {
@@ -55,27 +88,53 @@ def get_shorting_status_by_date(
             "end_date": end_date,
         }
 
-    # Convert to dict with date as string
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "ticker": ticker,
-        "start_date": start_date,
-        "end_date": end_date,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-    }
+    df = select_frame(
+        df,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    return format_dict_response(
+        df,
+        response_format,
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+    )
 
 
 @handle_pykrx_errors
-def get_shorting_volume_by_ticker(date: str, market: str = "KOSPI") -> dict[str, Any]:
+def get_shorting_volume_by_ticker(
+    date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict[str, Any]:
     """
     특정 일자의 전종목 공매도 거래량을 조회합니다.
 
     Args:
         date: 조회 일자 (YYYYMMDD 형식, 예: '20240101')
         market: 시장 구분 (KOSPI/KOSDAQ/KONEX, 기본값: KOSPI)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        snap_to_trading_day: 휴장일이면 직전 거래일로 조회 (기본값: False,
+            False면 휴장일은 오류 반환)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        tickers: 반환할 종목코드 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["비중 > 10"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
 
     Returns:
         Dict containing:
@@ -84,6 +143,10 @@ def get_shorting_volume_by_ticker(date: str, market: str = "KOSPI") -> dict[str,
     """
     logger.info(f"Fetching shorting volume for {market} on {date}")
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(date):
         return {
             "error": "Invalid date format. Use YYYYMMDD (e.g., '20240101').",
@@ -97,7 +160,11 @@ def get_shorting_volume_by_ticker(date: str, market: str = "KOSPI") -> dict[str,
             "market": market,
         }
 
-    df = stock.get_shorting_volume_by_ticker(date, market_upper)
+    trading_date, msg = resolve_trading_date(stock, date, snap_to_trading_day)
+    if msg:
+        return {"error": msg, "date": date, "market": market}
+
+    df = cached_call(stock, "get_shorting_volume_by_ticker", trading_date, market_upper)
 
     if df.empty:
         return {
@@ -106,26 +173,56 @@ def get_shorting_volume_by_ticker(date: str, market: str = "KOSPI") -> dict[str,
             "market": market,
         }
 
-    # Convert to dict with ticker as key
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "date": date,
-        "market": market_upper,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-    }
+    metadata = {"date": trading_date, "market": market_upper}
+    if trading_date != date:
+        metadata["requested_date"] = date
+
+    df = select_frame(
+        df,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    return format_dict_response(
+        df,
+        response_format,
+        **metadata,
+    )
 
 
 @handle_pykrx_errors
-def get_shorting_balance_top50(date: str, market: str = "KOSPI") -> dict[str, Any]:
+def get_shorting_balance_top50(
+    date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict[str, Any]:
     """
     공매도 잔고 비중 상위 50개 종목을 조회합니다.
 
     Args:
         date: 조회 일자 (YYYYMMDD 형식, 예: '20240101')
         market: 시장 구분 (KOSPI/KOSDAQ, 기본값: KOSPI)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        snap_to_trading_day: 휴장일이면 직전 거래일로 조회 (기본값: False,
+            False면 휴장일은 오류 반환)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        tickers: 반환할 종목코드 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["비중 > 1"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
 
     Returns:
         Dict containing:
@@ -134,6 +231,10 @@ def get_shorting_balance_top50(date: str, market: str = "KOSPI") -> dict[str, An
     """
     logger.info(f"Fetching top 50 shorting balance for {market} on {date}")
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(date):
         return {
             "error": "Invalid date format. Use YYYYMMDD (e.g., '20240101').",
@@ -147,7 +248,13 @@ def get_shorting_balance_top50(date: str, market: str = "KOSPI") -> dict[str, An
             "market": market,
         }
 
-    df = stock.get_shorting_balance_top50(date, market=market_upper)
+    trading_date, msg = resolve_trading_date(stock, date, snap_to_trading_day)
+    if msg:
+        return {"error": msg, "date": date, "market": market}
+
+    df = cached_call(
+        stock, "get_shorting_balance_top50", trading_date, market=market_upper
+    )
 
     if df.empty:
         return {
@@ -156,26 +263,56 @@ def get_shorting_balance_top50(date: str, market: str = "KOSPI") -> dict[str, An
             "market": market,
         }
 
-    # Convert to dict with ticker as key
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "date": date,
-        "market": market_upper,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-    }
+    metadata = {"date": trading_date, "market": market_upper}
+    if trading_date != date:
+        metadata["requested_date"] = date
+
+    df = select_frame(
+        df,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    return format_dict_response(
+        df,
+        response_format,
+        **metadata,
+    )
 
 
 @handle_pykrx_errors
-def get_shorting_volume_top50(date: str, market: str = "KOSPI") -> dict[str, Any]:
+def get_shorting_volume_top50(
+    date: str,
+    market: str = "KOSPI",
+    response_format: str | None = None,
+    snap_to_trading_day: bool = False,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict[str, Any]:
     """
     공매도 거래 비중 상위 50개 종목을 조회합니다.
 
     Args:
         date: 조회 일자 (YYYYMMDD 형식, 예: '20240101')
         market: 시장 구분 (KOSPI/KOSDAQ, 기본값: KOSPI)
+        response_format: 응답 형태 (records: data만, table: 표 텍스트만,
+            both: 둘 다, columns: 컬럼 단위 data, 기본값: both)
+        snap_to_trading_day: 휴장일이면 직전 거래일로 조회 (기본값: False,
+            False면 휴장일은 오류 반환)
+        columns: 반환할 컬럼 목록 (기본값: 전체)
+        tickers: 반환할 종목코드 목록 (기본값: 전체)
+        where: 행 필터 조건 "<컬럼> <연산자> <값>", 모두 만족하는 행만 반환
+            (연산자: >, >=, <, <=, ==, !=, 예: ["비중 > 10"])
+        sort_by: 정렬 기준 컬럼
+        ascending: 오름차순 정렬 여부 (기본값: False, 내림차순)
+        top_n: 필터링·정렬 후 상위 N개 행만 반환
 
     Returns:
         Dict containing:
@@ -184,6 +321,10 @@ def get_shorting_volume_top50(date: str, market: str = "KOSPI") -> dict[str, Any
     """
     logger.info(f"Fetching top 50 shorting volume for {market} on {date}")
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return {"error": msg, "response_format": response_format}
+
     if not validate_date_format(date):
         return {
             "error": "Invalid date format. Use YYYYMMDD (e.g., '20240101').",
@@ -197,7 +338,11 @@ def get_shorting_volume_top50(date: str, market: str = "KOSPI") -> dict[str, Any
             "market": market,
         }
 
-    df = stock.get_shorting_volume_top50(date, market_upper)
+    trading_date, msg = resolve_trading_date(stock, date, snap_to_trading_day)
+    if msg:
+        return {"error": msg, "date": date, "market": market}
+
+    df = cached_call(stock, "get_shorting_volume_top50", trading_date, market_upper)
 
     if df.empty:
         return {
@@ -206,13 +351,21 @@ def get_shorting_volume_top50(date: str, market: str = "KOSPI") -> dict[str, Any
             "market": market,
         }
 
-    # Convert to dict with ticker as key
-    result_dict = df.to_dict(orient="index")
-    formatted_dict = {str(k): v for k, v in result_dict.items()}
-
-    return {
-        "date": date,
-        "market": market_upper,
-        "data": formatted_dict,
-        "table": dict_to_table(formatted_dict),
-    }
+    metadata = {"date": trading_date, "market": market_upper}
+    if trading_date != date:
+        metadata["requested_date"] = date
+
+    df = select_frame(
+        df,
+        columns=columns,
+        tickers=tickers,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
+    return format_dict_response(
+        df,
+        response_format,
+        **metadata,
+    )
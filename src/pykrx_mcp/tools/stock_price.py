@@ -1,23 +1,118 @@
 """Stock price related MCP tools."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
+import pandas as pd
 from pykrx import stock
 
 from ..utils import (
+    cached_range_call,
+    check_selection,
     format_dataframe_response,
     format_error_response,
     mcp_tool_error_handler,
+    select_frame,
     validate_date_format,
+    validate_response_format,
     validate_ticker_format,
 )
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on tickers per batch request
+MAX_BATCH_TICKERS = 50
+
+# Default number of tickers fetched in parallel by a batch request
+DEFAULT_BATCH_CONCURRENCY = 4
+
+# Columns of pykrx's get_market_ohlcv_by_date (adjusted prices may omit some)
+OHLCV_COLUMNS = ("시가", "고가", "저가", "종가", "거래량", "거래대금", "등락률")
+
+
+def _fetch_ohlcv(
+    ticker: str, start_date: str, end_date: str, adjusted: bool
+) -> pd.DataFrame:
+    return cached_range_call(
+        stock,
+        "get_market_ohlcv_by_date",
+        fromdate=start_date,
+        todate=end_date,
+        ticker=ticker,
+        adjusted=adjusted,
+    )
+
+
+def check_ohlcv_arguments(
+    tickers: list[str], start_date: str, end_date: str, **selection: Any
+) -> None:
+    """
+    Validate OHLCV arguments without fetching any data.
+
+    Lets the REST streaming endpoint reject a bad request before it starts
+    responding, so only per-ticker data errors reach the stream.
+
+    Raises:
+        ValueError: If a ticker, date or selection argument is invalid
+    """
+    for valid, msg in (
+        *(validate_ticker_format(ticker) for ticker in tickers),
+        validate_date_format(start_date),
+        validate_date_format(end_date),
+    ):
+        if not valid:
+            raise ValueError(msg)
+    check_selection(OHLCV_COLUMNS, **selection)
+
+
+def get_stock_ohlcv_frame(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    adjusted: bool = True,
+    **selection: Any,
+) -> pd.DataFrame:
+    """
+    Return one stock's OHLCV as a DataFrame instead of a tool response.
+
+    Used by the REST streaming endpoint, which encodes the rows itself in
+    batches rather than building the whole response dict.
+
+    Args:
+        ticker: 6-digit ticker symbol
+        start_date: Start date in YYYYMMDD format
+        end_date: End date in YYYYMMDD format
+        adjusted: Whether to return adjusted prices
+        **selection: columns, where, sort_by, ascending, top_n
+            (see ``select_frame``)
+
+    Raises:
+        ValueError: If an argument is invalid or there is no data
+    """
+    check_ohlcv_arguments([ticker], start_date, end_date, **selection)
+
+    df = _fetch_ohlcv(ticker, start_date, end_date, adjusted)
+    if df.empty:
+        raise ValueError(
+            f"No data found for ticker {ticker} in the specified date range"
+        )
+    return select_frame(df, **selection)
+
 
 @mcp_tool_error_handler
 def get_stock_ohlcv(
-    ticker: str, start_date: str, end_date: str, adjusted: bool = True
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    adjusted: bool = True,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict:
     """
     Retrieve OHLCV (Open, High, Low, Close, Volume) data for a Korean stock.
@@ -34,6 +129,14 @@ def get_stock_ohlcv(
         end_date: End date in YYYYMMDD format (e.g., "20240131").
         adjusted: Whether to return adjusted prices (default: True).
                   Adjusted prices account for stock splits and dividends.
+        response_format: Response shape - "records" (default), "table"
+            (text table), "both" or "columns" (column-oriented data).
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["종가 >= 70000"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary containing OHLCV data with dates as keys and price/volume
@@ -57,10 +160,12 @@ def get_stock_ohlcv(
     if not valid:
         return format_error_response(msg, end_date=end_date)
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return format_error_response(msg, response_format=response_format)
+
     # Fetch data from pykrx (domain logic)
-    df = stock.get_market_ohlcv_by_date(
-        fromdate=start_date, todate=end_date, ticker=ticker, adjusted=adjusted
-    )
+    df = _fetch_ohlcv(ticker, start_date, end_date, adjusted)
 
     # Check for empty results
     if df.empty:
@@ -71,11 +176,125 @@ def get_stock_ohlcv(
             end_date=end_date,
         )
 
+    df = select_frame(
+        df,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
     # Format successful response
     return format_dataframe_response(
         df,
+        response_format,
         ticker=ticker,
         start_date=start_date,
         end_date=end_date,
         adjusted=adjusted,
     )
+
+
+@mcp_tool_error_handler
+def get_stock_ohlcv_batch(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    adjusted: bool = True,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> dict:
+    """
+    Retrieve OHLCV data for several Korean stocks in one call.
+
+    Tickers are fetched in parallel (bounded by ``PYKRX_MCP_BATCH_CONCURRENCY``,
+    default 4). A failure for one ticker is reported under ``errors`` and does
+    not affect the others.
+
+    Args:
+        tickers: List of 6-digit ticker symbols (at most 50)
+        start_date: Start date in YYYYMMDD format (e.g., "20240101").
+        end_date: End date in YYYYMMDD format (e.g., "20240131").
+        adjusted: Whether to return adjusted prices (default: True).
+        response_format: Response shape of each ticker's entry - "records"
+            (default), "table", "both" or "columns".
+        columns, where, sort_by, ascending, top_n: Row and column selection
+            applied to each ticker's rows (see get_stock_ohlcv)
+
+    Returns:
+        Dictionary with ``results`` (ticker -> get_stock_ohlcv response)
+        and ``errors`` (ticker -> error message)
+
+    Example:
+        get_stock_ohlcv_batch(["005930", "000660"], "20240101", "20240131")
+    """
+    if not tickers:
+        return format_error_response("tickers must not be empty", tickers=tickers)
+
+    # Drop duplicates, keeping the caller's order
+    tickers = list(dict.fromkeys(tickers))
+    if len(tickers) > MAX_BATCH_TICKERS:
+        return format_error_response(
+            f"At most {MAX_BATCH_TICKERS} tickers per request, got {len(tickers)}",
+            ticker_count=len(tickers),
+        )
+
+    valid, msg = validate_date_format(start_date)
+    if not valid:
+        return format_error_response(msg, start_date=start_date)
+
+    valid, msg = validate_date_format(end_date)
+    if not valid:
+        return format_error_response(msg, end_date=end_date)
+
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return format_error_response(msg, response_format=response_format)
+
+    concurrency = int(
+        os.getenv("PYKRX_MCP_BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY)
+    )
+
+    def fetch(ticker: str) -> dict:
+        return get_stock_ohlcv(
+            ticker,
+            start_date,
+            end_date,
+            adjusted,
+            response_format,
+            columns=columns,
+            where=where,
+            sort_by=sort_by,
+            ascending=ascending,
+            top_n=top_n,
+        )
+
+    # A private pool: per-ticker calls must not compete with (and deadlock on)
+    # the shared worker pool that is running this batch call
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(tickers))),
+        thread_name_prefix="pykrx-batch",
+    ) as executor:
+        responses = list(executor.map(fetch, tickers))
+
+    results = {}
+    errors = {}
+    for ticker, response in zip(tickers, responses, strict=True):
+        if "error" in response:
+            errors[ticker] = response["error"]
+        else:
+            results[ticker] = response
+
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "adjusted": adjusted,
+        "ticker_count": len(tickers),
+        "error_count": len(errors),
+        "results": results,
+        "errors": errors,
+    }
@@ -5,11 +5,13 @@ import logging
 from pykrx import stock
 
 from ..utils import (
+    cached_call,
     format_error_response,
     mcp_tool_error_handler,
     validate_date_format,
     validate_ticker_format,
 )
+from ..utils.ticker_master import MARKETS, get_ticker_master, peek_ticker_master
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +47,7 @@ def get_market_ticker_list(date: str, market: str = "KOSPI") -> dict:
         )
 
     # Fetch ticker list
-    tickers = stock.get_market_ticker_list(date, market=market)
+    tickers = cached_call(stock, "get_market_ticker_list", date, market=market)
 
     if len(tickers) == 0:
         return format_error_response(
@@ -65,7 +67,7 @@ def get_market_ticker_list(date: str, market: str = "KOSPI") -> dict:
     }
 
 
-@mcp_tool_error_handler
+@mcp_tool_error_handler(cache_ttl=86400)
 def get_market_ticker_name(ticker: str) -> dict:
     """
     Get the name of a stock from its ticker code.
@@ -85,8 +87,14 @@ def get_market_ticker_name(ticker: str) -> dict:
     if not valid:
         return format_error_response(msg, ticker=ticker)
 
+    # Answer from the ticker master when it is loaded (no upstream call)
+    master = peek_ticker_master()
+    entry = master.get(ticker) if master is not None else None
+    if entry is not None:
+        return {"ticker": ticker, "name": entry.name}
+
     # Fetch ticker name
-    name = stock.get_market_ticker_name(ticker)
+    name = cached_call(stock, "get_market_ticker_name", ticker)
 
     if not name or name == "":
         return format_error_response(
@@ -94,3 +102,108 @@ def get_market_ticker_name(ticker: str) -> dict:
         )
 
     return {"ticker": ticker, "name": name}
+
+
+# Upper bound on search_tickers results
+MAX_SEARCH_RESULTS = 50
+
+
+@mcp_tool_error_handler
+def search_tickers(
+    query: str,
+    market: str | None = None,
+    limit: int = 10,
+    include_delisted: bool = False,
+) -> dict:
+    """
+    Find stocks by company name using the ticker master.
+
+    Matches exact names, prefixes, substrings, Korean initial consonants
+    (e.g., "ㅅㅅㅈㅈ" for 삼성전자) and close spellings, without per-ticker
+    upstream calls.
+
+    Args:
+        query: Company name or part of it (e.g., "삼성", "하이닉스", "NAVER")
+        market: Restrict to "KOSPI", "KOSDAQ" or "KONEX" (default: all)
+        limit: Maximum number of results (1-50, default: 10)
+        include_delisted: Include companies no longer listed (default: False)
+
+    Returns:
+        Dictionary with matches ordered by relevance
+
+    Example:
+        search_tickers("삼성전자")
+        Returns {"results": [{"ticker": "005930", "name": "삼성전자",
+                 "market": "KOSPI", "match": "exact", ...}, ...]}
+    """
+    if not query or not query.strip():
+        return format_error_response("Query must not be empty", query=query)
+
+    market_upper = market.upper() if market is not None else None
+    if market_upper is not None and market_upper not in MARKETS:
+        return format_error_response(
+            f"Market must be one of {list(MARKETS)}, got: '{market}'",
+            query=query,
+            market=market,
+        )
+
+    if not 1 <= limit <= MAX_SEARCH_RESULTS:
+        return format_error_response(
+            f"Limit must be between 1 and {MAX_SEARCH_RESULTS}, got: {limit}",
+            query=query,
+            limit=limit,
+        )
+
+    master = get_ticker_master(stock)
+    matches = master.search(query, market_upper, limit, include_delisted)
+
+    return {
+        "query": query,
+        "market": market_upper,
+        "count": len(matches),
+        "results": [
+            {
+                "ticker": entry.ticker,
+                "name": entry.name,
+                "market": entry.market,
+                "listed": entry.listed,
+                "match": match,
+                "score": score,
+            }
+            for entry, match, score in matches
+        ],
+    }
+
+
+@mcp_tool_error_handler
+def get_ticker_info(ticker: str) -> dict:
+    """
+    Get the name, market and listing status of a stock from the ticker master.
+
+    Args:
+        ticker: 6-digit stock ticker code (e.g., "005930")
+
+    Returns:
+        Dictionary with ticker, name, market and listing status
+
+    Example:
+        get_ticker_info("005930")
+        Returns {"ticker": "005930", "name": "삼성전자", "market": "KOSPI",
+                 "listed": True, ...}
+    """
+    valid, msg = validate_ticker_format(ticker)
+    if not valid:
+        return format_error_response(msg, ticker=ticker)
+
+    master = get_ticker_master(stock)
+    entry = master.get(ticker)
+    if entry is None:
+        return format_error_response(f"Ticker {ticker} not found", ticker=ticker)
+
+    return {
+        "ticker": entry.ticker,
+        "name": entry.name,
+        "market": entry.market,
+        "listed": entry.listed,
+        "master_date": master.date,
+    }
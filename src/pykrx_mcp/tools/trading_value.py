@@ -3,17 +3,28 @@
 from pykrx import stock
 
 from ..utils import (
+    cached_call,
     format_dataframe_response,
     format_error_response,
     mcp_tool_error_handler,
+    select_frame,
     validate_date_format,
+    validate_response_format,
     validate_ticker_format,
 )
 
 
 @mcp_tool_error_handler
 def get_market_trading_value_by_date(
-    ticker: str, start_date: str, end_date: str
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    response_format: str | None = None,
+    columns: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
 ) -> dict:
     """
     Retrieve trading value by investor type for supply/demand analysis.
@@ -25,6 +36,14 @@ def get_market_trading_value_by_date(
         ticker: 6-digit stock ticker code (e.g., "005930" for Samsung Electronics)
         start_date: Start date in YYYYMMDD format (e.g., "20240101")
         end_date: End date in YYYYMMDD format (e.g., "20240131")
+        response_format: Response shape - "records" (default), "table"
+            (text table), "both" or "columns" (column-oriented data).
+        columns: Columns to return (default: all)
+        where: Row filters "<column> <op> <value>" that must all hold
+            (op: >, >=, <, <=, ==, !=; e.g., ["외국인 > 0"])
+        sort_by: Column to sort rows by
+        ascending: Sort ascending instead of descending (default: False)
+        top_n: Return only the first N rows after filtering and sorting
 
     Returns:
         Dictionary containing:
@@ -61,9 +80,17 @@ def get_market_trading_value_by_date(
     if not valid:
         return format_error_response(msg, date=end_date, field="end_date")
 
+    valid, msg = validate_response_format(response_format)
+    if not valid:
+        return format_error_response(msg, response_format=response_format)
+
     # Fetch trading value data from pykrx
-    df = stock.get_market_trading_value_by_date(
-        fromdate=start_date, todate=end_date, ticker=ticker
+    df = cached_call(
+        stock,
+        "get_market_trading_value_by_date",
+        fromdate=start_date,
+        todate=end_date,
+        ticker=ticker,
     )
 
     if df.empty:
@@ -80,6 +107,14 @@ def get_market_trading_value_by_date(
             end_date=end_date,
         )
 
+    df = select_frame(
+        df,
+        columns=columns,
+        where=where,
+        sort_by=sort_by,
+        ascending=ascending,
+        top_n=top_n,
+    )
     return format_dataframe_response(
-        df, ticker=ticker, start_date=start_date, end_date=end_date
+        df, response_format, ticker=ticker, start_date=start_date, end_date=end_date
     )
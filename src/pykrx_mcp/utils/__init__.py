@@ -1,13 +1,68 @@
-"""Utility functions for pykrx-mcp."""
+"""Utility functions for pykrx-mcp.
 
-from .decorators import mcp_tool_error_handler
-from .formatters import format_dataframe_response, format_error_response
-from .validators import validate_date_format, validate_ticker_format
+Exports are resolved lazily (PEP 562) so that importing a light submodule
+such as ``utils.executor`` does not pull in pandas via ``utils.cache``.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache import cached_call, cached_range_call
+    from .decorators import mcp_tool_error_handler
+    from .formatters import (
+        format_dataframe_response,
+        format_dict_response,
+        format_error_response,
+    )
+    from .frames import check_selection, select_frame
+    from .pagination import Pager
+    from .validators import (
+        validate_date_format,
+        validate_response_format,
+        validate_ticker_format,
+    )
+
+# Export name -> submodule defining it
+_EXPORTS = {
+    "cached_call": "cache",
+    "cached_range_call": "cache",
+    "mcp_tool_error_handler": "decorators",
+    "format_dataframe_response": "formatters",
+    "format_dict_response": "formatters",
+    "format_error_response": "formatters",
+    "check_selection": "frames",
+    "select_frame": "frames",
+    "Pager": "pagination",
+    "validate_date_format": "validators",
+    "validate_response_format": "validators",
+    "validate_ticker_format": "validators",
+}
 
 __all__ = [
+    "cached_call",
+    "cached_range_call",
     "mcp_tool_error_handler",
     "format_dataframe_response",
+    "format_dict_response",
     "format_error_response",
+    "check_selection",
+    "select_frame",
+    "Pager",
     "validate_date_format",
+    "validate_response_format",
     "validate_ticker_format",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
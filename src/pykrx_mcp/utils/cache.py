@@ -0,0 +1,946 @@
+"""Caches for pykrx query results.
+
+KRX end-of-day data never changes once a trading session has closed, so
+pykrx results for fully-closed date ranges are stored on local disk without
+expiry. Queries that touch today before its closing data has settled (or
+carry no date at all) are cached with a short TTL instead.
+
+The cache is opt-in: set ``PYKRX_MCP_CACHE_DIR`` to enable it.
+
+When the local Parquet store is configured (see ``store``), ``cached_call``
+answers supported queries from it before consulting the disk cache.
+
+Date-range queries made through ``cached_range_call`` are cached as
+covered intervals per series, so extending a range fetches only the
+missing days. With ``PYKRX_MCP_RANGE_CHUNK_MONTHS`` set, fetched ranges are
+also split into calendar-aligned chunks fetched in parallel.
+
+With ``PYKRX_MCP_SNAPSHOT_MAX_DAYS`` set, short single-ticker range queries
+are rebuilt from full-market daily snapshots (one upstream call per day,
+shared by every ticker) instead of one upstream call per ticker.
+
+A separate in-process LRU tier (``MemoryCache``) memoizes whole tool
+responses inside ``mcp_tool_error_handler``; set ``PYKRX_MCP_MEMORY_CACHE``
+to enable it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from .metrics import upstream_errors, upstream_latency
+from .singleflight import upstream_calls
+from .store import DATASETS, DATE_COLUMN, get_market_store, parse_range_query
+from .timing import timed
+from .trading_calendar import get_trading_calendar
+
+logger = logging.getLogger(__name__)
+
+KST = ZoneInfo("Asia/Seoul")
+
+# Seconds to keep results whose date range touches today (or has no date)
+DEFAULT_TODAY_TTL = 300.0
+
+# Hour (KST) after which today's closing data is considered final
+SETTLED_HOUR = 18
+
+# Default bounds for the in-process memory cache
+DEFAULT_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+
+# Snapshot slicing is disabled unless PYKRX_MCP_SNAPSHOT_MAX_DAYS is set
+DEFAULT_SNAPSHOT_MAX_DAYS = 0
+
+# Bound on full-market daily snapshots kept in memory for slicing
+DEFAULT_SNAPSHOT_ENTRIES = 256
+
+# Range chunking is disabled unless PYKRX_MCP_RANGE_CHUNK_MONTHS is set
+DEFAULT_RANGE_CHUNK_MONTHS = 0
+
+# Default number of range chunks fetched in parallel
+DEFAULT_RANGE_CONCURRENCY = 4
+
+# Adjusted prices are rewritten retroactively on splits/dividends,
+# so even fully-closed adjusted ranges are only kept for a day
+ADJUSTED_TTL = 86400.0
+
+
+def today_kst() -> str:
+    """Return today's date in Korea (YYYYMMDD)."""
+    return datetime.now(KST).strftime("%Y%m%d")
+
+
+def closing_settled() -> bool:
+    """Return whether today's closing data is final (past ``SETTLED_HOUR`` KST)."""
+    return datetime.now(KST).hour >= SETTLED_HOUR
+
+
+def _is_date(value: Any) -> bool:
+    return isinstance(value, str) and len(value) == 8 and value.isdigit()
+
+
+def normalize_value(value: Any) -> Any:
+    """
+    Normalize an argument value for cache keys.
+
+    Strings are stripped and upper-cased so that e.g. "kospi" and "KOSPI"
+    map to the same key. Sequences are normalized element-wise.
+    """
+    if isinstance(value, str):
+        return value.strip().upper()
+    if isinstance(value, (list, tuple)):
+        return [normalize_value(v) for v in value]
+    return value
+
+
+def make_cache_key(name: str, args: tuple, kwargs: dict) -> str:
+    """
+    Build a stable cache key from a pykrx function name and its arguments.
+
+    Args:
+        name: pykrx function name (e.g., "get_market_ohlcv_by_date")
+        args: Positional arguments
+        kwargs: Keyword arguments
+
+    Returns:
+        Hex digest identifying the call
+    """
+    payload = json.dumps(
+        {
+            "fn": name,
+            "args": normalize_value(args),
+            "kwargs": {k: normalize_value(v) for k, v in sorted(kwargs.items())},
+        },
+        sort_keys=True,
+        default=str,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compute_ttl(args: tuple, kwargs: dict, today_ttl: float) -> float | None:
+    """
+    Decide how long a result may be cached.
+
+    Today's data counts as closed once ``SETTLED_HOUR`` has passed, so
+    results fetched in the evening (e.g. by the end-of-day refresh) are
+    still cached the next morning.
+
+    Args:
+        args: Positional arguments of the pykrx call
+        kwargs: Keyword arguments of the pykrx call
+        today_ttl: TTL for results that may still change
+
+    Returns:
+        TTL in seconds, or None if the result never expires
+    """
+    dates = [v for v in (*args, *kwargs.values()) if _is_date(v)]
+    if not dates:
+        return today_ttl
+    latest, today = max(dates), today_kst()
+    if latest > today or (latest == today and not closing_settled()):
+        return today_ttl
+    if kwargs.get("adjusted"):
+        return ADJUSTED_TTL
+    return None
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if hasattr(value, "empty"):
+        return bool(value.empty)
+    try:
+        return len(value) == 0
+    except TypeError:
+        return False
+
+
+class DiskCache:
+    """Pickle-based key/value store on local disk with optional expiry."""
+
+    def __init__(self, directory: str | Path, today_ttl: float = DEFAULT_TODAY_TTL):
+        self.directory = Path(directory)
+        self.today_ttl = today_ttl
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["value"]
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value; ``ttl=None`` keeps it forever."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "expires_at": None if ttl is None else time.time() + ttl,
+            "value": value,
+        }
+        # Write atomically so concurrent readers never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def stats(self) -> dict:
+        """Return lookup counters (approximate under concurrency)."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for path in self.directory.glob("*/*.pkl"):
+            path.unlink(missing_ok=True)
+
+
+class MemoryCache:
+    """
+    Thread-safe in-process LRU cache with per-entry TTL.
+
+    Bounded both by entry count and by the approximate byte size of the
+    stored values. Least recently used entries are evicted first.
+    """
+
+    def __init__(
+        self, max_entries: int, max_bytes: int = DEFAULT_MEMORY_MAX_BYTES
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (expires_at, size, value)
+        self._entries: OrderedDict[str, tuple[float | None, int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.total_bytes -= size
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, size: int, ttl: float | None = None) -> None:
+        """
+        Store a value, evicting least recently used entries as needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Approximate size of the value in bytes
+            ttl: Seconds until expiry, or None to keep until evicted
+        """
+        if size > self.max_bytes:
+            return
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            self._entries[key] = (expires_at, size, value)
+            self.total_bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self.total_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> dict:
+        """Return entry count, byte usage and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_UNSET = object()
+_disk_cache: Any = _UNSET
+_memory_cache: Any = _UNSET
+
+
+def configure_disk_cache(
+    directory: str | Path | None, today_ttl: float = DEFAULT_TODAY_TTL
+) -> DiskCache | None:
+    """
+    Enable (or disable with ``None``) the shared disk cache.
+
+    Args:
+        directory: Cache directory, or None to disable caching
+        today_ttl: TTL in seconds for results that touch today
+
+    Returns:
+        The configured cache, or None if disabled
+    """
+    global _disk_cache
+    _disk_cache = DiskCache(directory, today_ttl) if directory else None
+    return _disk_cache
+
+
+def get_disk_cache() -> DiskCache | None:
+    """
+    Return the shared disk cache, configured from the environment on first use.
+
+    Environment:
+        PYKRX_MCP_CACHE_DIR: Cache directory (caching is disabled if unset)
+        PYKRX_MCP_CACHE_TTL: TTL in seconds for results that touch today
+    """
+    if _disk_cache is _UNSET:
+        configure_disk_cache(
+            os.getenv("PYKRX_MCP_CACHE_DIR"),
+            float(os.getenv("PYKRX_MCP_CACHE_TTL", DEFAULT_TODAY_TTL)),
+        )
+    return _disk_cache
+
+
+def configure_memory_cache(
+    max_entries: int, max_bytes: int = DEFAULT_MEMORY_MAX_BYTES
+) -> MemoryCache | None:
+    """
+    Enable (or disable with ``max_entries=0``) the tool response memory cache.
+
+    Args:
+        max_entries: Maximum number of cached responses, 0 to disable
+        max_bytes: Maximum total size of cached responses in bytes
+
+    Returns:
+        The configured cache, or None if disabled
+    """
+    global _memory_cache
+    _memory_cache = MemoryCache(max_entries, max_bytes) if max_entries > 0 else None
+    return _memory_cache
+
+
+def get_memory_cache() -> MemoryCache | None:
+    """
+    Return the tool response memory cache, configured from the environment.
+
+    Environment:
+        PYKRX_MCP_MEMORY_CACHE: Maximum number of entries (disabled if unset/0)
+        PYKRX_MCP_MEMORY_CACHE_BYTES: Maximum total size in bytes
+    """
+    if _memory_cache is _UNSET:
+        configure_memory_cache(
+            int(os.getenv("PYKRX_MCP_MEMORY_CACHE", "0")),
+            int(os.getenv("PYKRX_MCP_MEMORY_CACHE_BYTES", DEFAULT_MEMORY_MAX_BYTES)),
+        )
+    return _memory_cache
+
+
+def _prime_shared(value: Any) -> None:
+    """
+    Build a DataFrame's lazy index engines before it is shared.
+
+    pandas builds an index's hash engine on first use without locking, so
+    threads first touching the same frame concurrently (e.g. callers
+    coalesced onto one fetch) can see it half-built and fail spuriously
+    with "DataFrame index must be unique".
+    """
+    if isinstance(value, pd.DataFrame):
+        value.index.is_unique  # noqa: B018
+        value.columns.is_unique  # noqa: B018
+
+
+@timed("fetch")
+def cached_call(module: Any, name: str, *args: Any, **kwargs: Any) -> Any:
+    """
+    Call ``module.<name>(*args, **kwargs)`` through the shared disk cache.
+
+    Queries covered by the local market-data store are read from it first.
+    Concurrent identical calls (after argument normalization) are coalesced
+    into a single upstream fetch whose result is shared by all callers, so
+    returned DataFrames must not be mutated in place.
+
+    Empty results are never cached, since pykrx also returns empty
+    DataFrames on transient scraping failures.
+
+    Args:
+        module: Module exposing the pykrx function (usually ``pykrx.stock``)
+        name: Function name (e.g., "get_market_ohlcv_by_date")
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        The (possibly cached) function result
+
+    Example:
+        >>> cached_call(stock, "get_market_ohlcv", "20240102", market="KOSPI")
+    """
+    return _call(module, name, args, kwargs, get_disk_cache())
+
+
+def _call(
+    module: Any, name: str, args: tuple, kwargs: dict, cache: DiskCache | None
+) -> Any:
+    """``cached_call`` with an explicit disk cache (None to skip storing)."""
+    func = getattr(module, name)
+
+    store = get_market_store()
+    if store is not None:
+        try:
+            value = store.lookup(name, args, kwargs)
+        except Exception as e:
+            logger.warning(f"[{name}] Local store read failed, fetching live: {e}")
+            value = None
+        if value is not None:
+            logger.debug(f"[{name}] Served from local store")
+            return value
+
+    value = slice_snapshots(module, name, args, kwargs)
+    if value is not None:
+        logger.debug(f"[{name}] Sliced from daily snapshots")
+        return value
+
+    key = make_cache_key(name, args, kwargs)
+
+    if cache is not None:
+        value = cache.get(key)
+        if value is not None:
+            logger.debug(f"[{name}] Disk cache hit")
+            return value
+
+    def fetch() -> Any:
+        started = time.perf_counter()
+        try:
+            value = func(*args, **kwargs)
+        except Exception:
+            upstream_errors.inc(function=name)
+            raise
+        finally:
+            upstream_latency.observe(time.perf_counter() - started, function=name)
+        _prime_shared(value)
+        if cache is not None and not _is_empty(value):
+            cache.set(key, value, compute_ttl(args, kwargs, cache.today_ttl))
+        return value
+
+    return upstream_calls.do(key, fetch)
+
+
+def split_range(start: str, end: str, months: int) -> list[tuple[str, str]]:
+    """
+    Split a date range into calendar chunks of ``months`` months.
+
+    Chunks are aligned to a fixed month grid (not to ``start``), so
+    overlapping ranges produce identical interior chunks and share their
+    cache entries. The first and last chunks extend past the range to the
+    chunk boundaries.
+
+    Example:
+        >>> split_range("20240115", "20240310", 1)
+        [('20240101', '20240131'), ('20240201', '20240229'),
+         ('20240301', '20240331')]
+    """
+    first, last = pd.Timestamp(start), pd.Timestamp(end)
+    index = (first.year * 12 + first.month - 1) // months * months
+    chunks = []
+    while True:
+        chunk_start = pd.Timestamp(year=index // 12, month=index % 12 + 1, day=1)
+        if chunk_start > last:
+            return chunks
+        index += months
+        chunk_end = pd.Timestamp(
+            year=index // 12, month=index % 12 + 1, day=1
+        ) - pd.Timedelta(days=1)
+        chunks.append((chunk_start.strftime("%Y%m%d"), chunk_end.strftime("%Y%m%d")))
+
+
+def missing_intervals(
+    covered: list[tuple[str, str]], start: str, end: str
+) -> list[tuple[str, str]]:
+    """
+    Return the parts of [start, end] outside every covered interval.
+
+    All bounds are inclusive YYYYMMDD dates.
+
+    Example:
+        >>> missing_intervals([("20240101", "20240630")], "20240101", "20240930")
+        [('20240701', '20240930')]
+    """
+    gaps = []
+    day, last = pd.Timestamp(start), pd.Timestamp(end)
+    one_day = pd.Timedelta(days=1)
+    for covered_start, covered_end in sorted(covered):
+        low, high = pd.Timestamp(covered_start), pd.Timestamp(covered_end)
+        if high < day:
+            continue
+        if low > last:
+            break
+        if low > day:
+            gaps.append((day.strftime("%Y%m%d"), (low - one_day).strftime("%Y%m%d")))
+        day = high + one_day
+        if day > last:
+            return gaps
+    gaps.append((day.strftime("%Y%m%d"), end))
+    return gaps
+
+
+def _fetch_range(
+    module: Any,
+    name: str,
+    fromdate: str,
+    todate: str,
+    kwargs: dict,
+    persist: bool = True,
+) -> tuple[Any, list[tuple[str, str]]]:
+    """
+    Fetch [fromdate, todate], in parallel month chunks if configured.
+
+    With ``persist=False`` the calls skip the per-call disk cache entries,
+    for callers that store the rows themselves (the interval cache).
+
+    An empty chunk between chunks with rows cannot be a listing boundary,
+    so it is taken for a transient scraping failure: it is fetched once
+    more, and if still empty the call fails rather than return a frame with
+    a hole. Empty leading or trailing chunks (before listing, after
+    delisting, days not traded yet) are returned as is.
+
+    Returns:
+        The frame, and the sub-ranges spanning trading days that came back
+        empty (which callers must not record as permanently covered)
+
+    Raises:
+        RuntimeError: If an interior chunk is still empty when refetched
+    """
+    cache = get_disk_cache() if persist else None
+    calendar = get_trading_calendar()
+
+    def fetch(chunk: tuple[str, str]) -> Any:
+        chunk_kwargs = {"fromdate": chunk[0], "todate": chunk[1], **kwargs}
+        return _call(module, name, (), chunk_kwargs, cache)
+
+    def empty_ranges(chunks: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        return [chunk for chunk in chunks if calendar.trading_days(*chunk)]
+
+    months = int(os.getenv("PYKRX_MCP_RANGE_CHUNK_MONTHS", DEFAULT_RANGE_CHUNK_MONTHS))
+    chunks = [(fromdate, todate)]
+    if months > 0:
+        chunks = split_range(fromdate, todate, months)
+        chunks[0] = (fromdate, chunks[0][1])
+        chunks[-1] = (chunks[-1][0], todate)
+    if len(chunks) == 1:
+        df = fetch((fromdate, todate))
+        return df, empty_ranges(chunks) if _is_empty(df) else []
+
+    concurrency = int(
+        os.getenv("PYKRX_MCP_RANGE_CONCURRENCY", DEFAULT_RANGE_CONCURRENCY)
+    )
+
+    # A private pool, like batch requests: chunk calls must not wait on the
+    # shared worker pool that is running this call
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(chunks))),
+        thread_name_prefix="pykrx-range",
+    ) as executor:
+        results = list(executor.map(fetch, chunks))
+
+    filled = [i for i, df in enumerate(results) if not _is_empty(df)]
+    if not filled:
+        return pd.DataFrame(), empty_ranges(chunks)
+    for i in range(filled[0] + 1, filled[-1]):
+        if _is_empty(results[i]) and empty_ranges([chunks[i]]):
+            results[i] = fetch(chunks[i])
+            if _is_empty(results[i]):
+                start, end = chunks[i]
+                raise RuntimeError(
+                    f"Upstream returned no rows for {start}-{end} inside "
+                    f"{fromdate}-{todate}; try again later"
+                )
+
+    df = pd.concat(
+        [df for df in results[filled[0] : filled[-1] + 1] if not _is_empty(df)]
+    )
+    empty = empty_ranges(chunks[: filled[0]] + chunks[filled[-1] + 1 :])
+    return df[~df.index.duplicated(keep="last")], empty
+
+
+def _covered_pieces(
+    start: str, end: str, kwargs: dict, today_ttl: float
+) -> list[tuple[str, str, float | None]]:
+    """
+    Return a freshly fetched interval as (start, end, expires_at) pieces.
+
+    The part before today is split from the part touching today, so only
+    the latter expires after ``today_ttl`` and a rolling window refetches
+    just its newest days.
+    """
+    today = today_kst()
+    pieces = [(start, end)]
+    if start < today <= end:
+        yesterday = (pd.Timestamp(today) - pd.Timedelta(days=1)).strftime("%Y%m%d")
+        pieces = [(start, yesterday), (today, end)]
+    now = time.time()
+    covered = []
+    for piece_start, piece_end in pieces:
+        ttl = compute_ttl((piece_start, piece_end), kwargs, today_ttl)
+        covered.append((piece_start, piece_end, None if ttl is None else now + ttl))
+    return covered
+
+
+def _coalesce(
+    intervals: list[tuple[str, str, float | None]],
+) -> list[tuple[str, str, float | None]]:
+    """Merge overlapping or adjacent intervals that never expire."""
+    merged: list[tuple[str, str, float | None]] = []
+    for start, end, expires_at in sorted(intervals, key=lambda i: i[:2]):
+        if merged and expires_at is None and merged[-1][2] is None:
+            previous_start, previous_end, _ = merged[-1]
+            next_day = pd.Timestamp(previous_end) + pd.Timedelta(days=1)
+            if pd.Timestamp(start) <= next_day:
+                merged[-1] = (previous_start, max(previous_end, end), None)
+                continue
+        merged.append((start, end, expires_at))
+    return merged
+
+
+# Striped locks serializing read-modify-write of one series' interval entry;
+# never held across upstream fetches
+_SERIES_LOCKS = [threading.Lock() for _ in range(64)]
+
+
+def _live_intervals(entry: dict) -> list[tuple[str, str, float | None]]:
+    now = time.time()
+    return [
+        interval
+        for interval in entry["intervals"]
+        if interval[2] is None or interval[2] > now
+    ]
+
+
+def _fill_range(
+    cache: DiskCache,
+    module: Any,
+    name: str,
+    fromdate: str,
+    todate: str,
+    kwargs: dict,
+) -> Any:
+    """
+    Answer a range query from the series' interval entry, fetching only gaps.
+
+    One disk cache entry per series (function + non-date arguments, e.g.
+    one ticker) holds the rows fetched so far and the date intervals they
+    cover, each with its own expiry. Gaps are fetched without the lock and
+    merged into the entry as it is by then, so concurrent queries of the
+    same series never lose each other's rows.
+    """
+    key = make_cache_key(f"{name}:intervals", (), kwargs)
+    lock = _SERIES_LOCKS[int(key[:8], 16) % len(_SERIES_LOCKS)]
+    with lock:
+        entry = cache.get(key) or {"frame": None, "intervals": []}
+    frame = entry["frame"]
+    gaps = missing_intervals([i[:2] for i in _live_intervals(entry)], fromdate, todate)
+    if not gaps:
+        logger.debug(f"[{name}] Range served from interval cache")
+        return _slice_range(frame, fromdate, todate)
+
+    calendar = get_trading_calendar()
+    today = today_kst()
+    has_rows = frame is not None and not frame.empty
+    expires_at = time.time() + cache.today_ttl
+    # Intervals recorded without rows: None for weekends and known
+    # holidays, the today TTL for days that may simply not be traded yet
+    closed = []
+    fetched = []
+    for start, end in gaps:
+        if not calendar.trading_days(start, end):
+            # Only weekends or known holidays: nothing to fetch
+            closed.append((start, end, None))
+            continue
+        df, empty = _fetch_range(module, name, start, end, kwargs, persist=False)
+        if not _is_empty(df) and not isinstance(df.index, pd.DatetimeIndex):
+            return _fetch_range(module, name, fromdate, todate, kwargs)[0]
+        if not _is_empty(df):
+            # Empty edge chunks stay uncovered (they may be transient
+            # failures) unless they are days not traded yet
+            closed.extend((s, e, expires_at) for s, e in empty if s >= today)
+            fetched.append((start, end, df, missing_intervals(empty, start, end)))
+            continue
+        interior = (
+            has_rows
+            and frame.index[0] < pd.Timestamp(start)
+            and pd.Timestamp(end) < frame.index[-1]
+        )
+        if not interior:
+            # Today or later, unobserved holidays, before listing or after
+            # delisting: remember briefly that there is nothing yet
+            closed.append((start, end, expires_at))
+            continue
+        # A closed gap between cached rows should have rows: pykrx also
+        # returns empty frames on transient scraping failures, so refetch
+        # the whole range rather than answer with only the cached part
+        logger.warning(
+            f"[{name}] No rows for {start}-{end}, refetching {fromdate}-{todate}"
+        )
+        df, empty = _fetch_range(module, name, fromdate, todate, kwargs, persist=False)
+        if _is_empty(df):
+            return df
+        closed.extend((s, e, expires_at) for s, e in empty if s >= today)
+        fetched = [(fromdate, todate, df, missing_intervals(empty, fromdate, todate))]
+        break
+
+    with lock:
+        entry = cache.get(key) or {"frame": None, "intervals": []}
+        intervals = _live_intervals(entry) + closed
+        frame = entry["frame"]
+        if fetched:
+            parts = []
+            if frame is not None:
+                # Refetched days replace whatever was stored for them
+                stale = pd.Series(False, index=frame.index)
+                for start, end, *_ in fetched:
+                    stale |= (frame.index >= pd.Timestamp(start)) & (
+                        frame.index <= pd.Timestamp(end)
+                    )
+                parts.append(frame[~stale.to_numpy()])
+            parts.extend(df for _, _, df, _ in fetched)
+            frame = pd.concat(parts).sort_index()
+            for _, _, _, covered in fetched:
+                for start, end in covered:
+                    intervals.extend(
+                        _covered_pieces(start, end, kwargs, cache.today_ttl)
+                    )
+        cache.set(key, {"frame": frame, "intervals": _coalesce(intervals)})
+
+    return _slice_range(frame, fromdate, todate)
+
+
+def _slice_range(frame: Any, fromdate: str, todate: str) -> Any:
+    if frame is None:
+        return pd.DataFrame()
+    return frame[
+        (frame.index >= pd.Timestamp(fromdate)) & (frame.index <= pd.Timestamp(todate))
+    ]
+
+
+@timed("fetch")
+def cached_range_call(
+    module: Any, name: str, fromdate: str, todate: str, **kwargs: Any
+) -> Any:
+    """
+    Call a pykrx date-range function, fetching only days not cached yet.
+
+    With the disk cache enabled, each series (function + non-date
+    arguments, e.g. one ticker's OHLCV) keeps one entry holding the rows
+    fetched so far and the date intervals they cover. A query fetches only
+    the sub-intervals missing from that coverage (skipping gaps made only of
+    weekends and known holidays) and merges them in, so extending
+    "20240101-20240630" to "20240101-20240930" fetches July to September,
+    and a rolling window that grows by a day costs one day of upstream data.
+    Intervals touching today expire after the cache's today TTL and
+    adjusted prices after ``ADJUSTED_TTL``, like whole-range entries.
+    Fetched rows are stored only in the series' entry. A gap that has
+    trading days but comes back empty is remembered for the today TTL when
+    it may simply have no rows (today or later, before the first or after
+    the last cached row). An empty gap between cached rows is taken for a
+    transient scraping failure, so the whole range is refetched and stored
+    rather than return just the cached part.
+
+    With ``PYKRX_MCP_RANGE_CHUNK_MONTHS`` set, each fetched interval is
+    further split by ``split_range`` into month chunks fetched in parallel
+    (at most ``PYKRX_MCP_RANGE_CONCURRENCY`` at once) through the same
+    tiers as ``cached_call``. A chunk that comes back empty between chunks
+    with rows is refetched once and otherwise fails the call, so a
+    transient scraping failure never leaves a hole in the result.
+
+    Without either (or for non-daily ``freq``) this is a plain
+    ``cached_call(module, name, fromdate=..., todate=..., **kwargs)``.
+
+    Args:
+        module: Module exposing the pykrx function
+        name: Function name taking ``fromdate``/``todate``
+            (e.g., "get_market_ohlcv_by_date")
+        fromdate: Start date in YYYYMMDD format
+        todate: End date in YYYYMMDD format
+        **kwargs: Other keyword arguments (e.g., ticker, adjusted)
+
+    Returns:
+        The function result for exactly [fromdate, todate]
+    """
+    if (
+        kwargs.get("freq", "d") != "d"
+        or not (_is_date(fromdate) and _is_date(todate))
+        or fromdate > todate
+    ):
+        return cached_call(module, name, fromdate=fromdate, todate=todate, **kwargs)
+
+    cache = get_disk_cache()
+    if cache is not None:
+        return _fill_range(cache, module, name, fromdate, todate, kwargs)
+    return _fetch_range(module, name, fromdate, todate, kwargs)[0]
+
+
+_snapshot_memory = MemoryCache(DEFAULT_SNAPSHOT_ENTRIES, DEFAULT_MEMORY_MAX_BYTES)
+
+
+@timed("fetch")
+def fetch_snapshot(module: Any, dataset: str, date: str) -> pd.DataFrame:
+    """
+    Return the full-market (market="ALL") snapshot of a dataset for one date.
+
+    Snapshots are kept in memory and fetched through ``cached_call``, so the
+    store, disk cache and single-flight tiers all apply.
+
+    Args:
+        module: Module exposing the pykrx functions
+        dataset: Dataset name (key of ``store.DATASETS``)
+        date: Date in YYYYMMDD format
+
+    Returns:
+        Snapshot indexed by ticker (possibly empty)
+    """
+    name = DATASETS[dataset].fetch
+    key = make_cache_key(name, (date,), {"market": "ALL"})
+    df = _snapshot_memory.get(key)
+    if df is None:
+        df = cached_call(module, name, date, market="ALL")
+        # An empty or all-zero full-market snapshot means KRX was closed
+        get_trading_calendar().mark(
+            date, not _is_empty(df) and not (df.select_dtypes("number") == 0).all(None)
+        )
+        if not _is_empty(df):
+            today_ttl = float(os.getenv("PYKRX_MCP_CACHE_TTL", DEFAULT_TODAY_TTL))
+            _snapshot_memory.set(
+                key,
+                df,
+                int(df.memory_usage(deep=True).sum()),
+                compute_ttl((date,), {}, today_ttl),
+            )
+    return df
+
+
+def fetch_cross_section(
+    module: Any, dataset: str, date: str, market: str
+) -> pd.DataFrame:
+    """
+    Return one market's snapshot of a dataset for one date.
+
+    market="ALL" is served by ``fetch_snapshot``, so it shares the snapshot
+    memory with screening and snapshot slicing; single markets go through
+    ``cached_call``.
+
+    Args:
+        module: Module exposing the pykrx functions
+        dataset: Dataset name (key of ``store.DATASETS``)
+        date: Date in YYYYMMDD format
+        market: KOSPI, KOSDAQ, KONEX or ALL
+
+    Returns:
+        Snapshot indexed by ticker (possibly empty)
+    """
+    if market == "ALL":
+        return fetch_snapshot(module, dataset, date)
+    return cached_call(module, DATASETS[dataset].fetch, date, market=market)
+
+
+def slice_snapshots(
+    module: Any, name: str, args: tuple, kwargs: dict
+) -> pd.DataFrame | None:
+    """
+    Rebuild a single-ticker range query from full-market daily snapshots.
+
+    Applies to unadjusted ``get_market_ohlcv_by_date``,
+    ``get_market_fundamental_by_date`` and ``get_market_cap_by_date`` calls
+    spanning at most ``PYKRX_MCP_SNAPSHOT_MAX_DAYS`` calendar days. Days
+    whose snapshot is empty or all zeros (market holidays) are skipped.
+
+    Args:
+        module: Module exposing the pykrx functions
+        name: pykrx function name
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+
+    Returns:
+        DataFrame shaped like the pykrx result, or None if slicing does not
+        apply (the caller then fetches the ticker directly)
+    """
+    max_days = int(os.getenv("PYKRX_MCP_SNAPSHOT_MAX_DAYS", DEFAULT_SNAPSHOT_MAX_DAYS))
+    if max_days <= 0:
+        return None
+    query = parse_range_query(name, args, kwargs)
+    if query is None:
+        return None
+
+    dataset, ticker, start, end = query
+    if (pd.Timestamp(end) - pd.Timestamp(start)).days + 1 > max_days:
+        return None
+
+    columns = list(DATASETS[dataset].by_date_columns)
+    rows = []
+    # Known holidays are skipped without fetching their (empty) snapshots
+    for date in get_trading_calendar().trading_days(start, end):
+        day = pd.Timestamp(date)
+        snapshot = fetch_snapshot(module, dataset, date)
+        if _is_empty(snapshot) or ticker not in snapshot.index:
+            continue
+        if (snapshot[columns] == 0).all(axis=None):
+            continue
+        row = snapshot.loc[[ticker], columns]
+        row.index = pd.DatetimeIndex([day], name=DATE_COLUMN)
+        rows.append(row)
+
+    if not rows:
+        return None
+    return pd.concat(rows)
@@ -1,14 +1,50 @@
 """Decorators for MCP tool error handling."""
 
+import inspect
+import itertools
+import json
 import logging
+import os
+import time
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
 
+from .cache import (
+    DEFAULT_TODAY_TTL,
+    compute_ttl,
+    get_memory_cache,
+    make_cache_key,
+)
+from .metrics import (
+    tool_in_flight,
+    tool_latency,
+    tool_requests,
+    tool_response_bytes,
+    tool_stage_latency,
+)
+from .timing import stage, start_timer, stop_timer, timing_enabled, timing_summary
+
 logger = logging.getLogger(__name__)
 
+# Without the memory cache (which needs every response's size anyway), only
+# one in this many successful responses is measured for the size histogram
+DEFAULT_SIZE_SAMPLE_EVERY = 20
+
+
+def _size_sample_every() -> int:
+    """Return ``PYKRX_MCP_METRICS_SIZE_SAMPLE`` (0 disables sampling)."""
+    return int(os.getenv("PYKRX_MCP_METRICS_SIZE_SAMPLE", DEFAULT_SIZE_SAMPLE_EVERY))
+
+
+def _response_size(result: dict) -> int:
+    """Approximate the serialized size of a tool response in bytes."""
+    return len(json.dumps(result, default=str, ensure_ascii=False).encode("utf-8"))
+
 
-def mcp_tool_error_handler(func: Callable) -> Callable:
+def mcp_tool_error_handler(
+    func: Callable | None = None, *, cache_ttl: float | None = None
+) -> Callable:
     """
     Decorator for MCP tools to provide consistent error handling.
 
@@ -16,23 +52,76 @@ def mcp_tool_error_handler(func: Callable) -> Callable:
     - Automatic logging of function calls and results
     - Convert exceptions to MCP-compatible dict responses
     - Include input parameters in error responses for debugging
+    - Memoize successful responses when the memory cache is enabled
+    - Record request count, latency, response size and in-flight metrics
+      (response sizes are sampled unless the memory cache needs them)
+    - Time the call's stages (see ``timing``), returned as ``_timing``
+      when ``PYKRX_MCP_TIMING`` is set
 
     pykrx handles domain-specific errors (invalid dates, missing data, etc.)
     This decorator only ensures MCP protocol compliance (dict responses).
 
+    Can be used bare (``@mcp_tool_error_handler``) or with a per-tool TTL
+    policy (``@mcp_tool_error_handler(cache_ttl=86400)``). Without
+    ``cache_ttl`` the TTL is derived from the date arguments, like the
+    disk cache: closed ranges never expire, ranges touching today use
+    ``PYKRX_MCP_MEMORY_CACHE_TTL`` seconds.
+
     Args:
         func: The MCP tool function to wrap
+        cache_ttl: Fixed memory cache TTL in seconds for this tool
 
     Returns:
         Wrapped function that returns dict on success or error
     """
+    if func is None:
+        return lambda f: mcp_tool_error_handler(f, cache_ttl=cache_ttl)
+
+    signature = inspect.signature(func)
+    today_ttl = float(os.getenv("PYKRX_MCP_MEMORY_CACHE_TTL", DEFAULT_TODAY_TTL))
+    successes = itertools.count()
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> dict:
         func_name = func.__name__
         logger.info(f"[{func_name}] Called with kwargs={kwargs}")
 
+        started = time.perf_counter()
+        tool_in_flight.inc(tool=func_name)
+        timer, token = start_timer()
+        try:
+            result = _call(func_name, *args, **kwargs)
+        finally:
+            stop_timer(token)
+            tool_in_flight.dec(tool=func_name)
+            elapsed = time.perf_counter() - started
+            tool_latency.observe(elapsed, tool=func_name)
+        failed = not isinstance(result, dict) or "error" in result
+        status = "error" if failed else "ok"
+        tool_requests.inc(tool=func_name, status=status)
+
+        stages = timer.finish(elapsed)
+        for name, seconds in stages.items():
+            tool_stage_latency.observe(seconds, tool=func_name, stage=name)
+        if isinstance(result, dict) and timing_enabled():
+            result = {**result, "_timing": timing_summary(stages, elapsed)}
+        return result
+
+    def _call(func_name: str, *args: Any, **kwargs: Any) -> dict:
         try:
+            memory_cache = get_memory_cache()
+            if memory_cache is not None:
+                with stage("cache"):
+                    # Bind so positional (MCP) and keyword (REST) calls share
+                    # a key
+                    bound = signature.bind(*args, **kwargs)
+                    bound.apply_defaults()
+                    key = make_cache_key(func_name, (), bound.arguments)
+                    cached = memory_cache.get(key)
+                if cached is not None:
+                    logger.info(f"[{func_name}] Memory cache hit")
+                    return dict(cached)
+
             result = func(*args, **kwargs)
 
             # Count data rows if available for logging
@@ -43,6 +132,21 @@ def mcp_tool_error_handler(func: Callable) -> Callable:
             else:
                 logger.info(f"[{func_name}] Success")
 
+            if isinstance(result, dict) and "error" not in result:
+                every = _size_sample_every()
+                sampled = every > 0 and next(successes) % every == 0
+                if memory_cache is not None or sampled:
+                    with stage("size_accounting"):
+                        size = _response_size(result)
+                    tool_response_bytes.observe(size, tool=func_name)
+                if memory_cache is not None:
+                    ttl = cache_ttl
+                    if ttl is None:
+                        ttl = compute_ttl((), bound.arguments, today_ttl)
+                    with stage("cache"):
+                        memory_cache.set(key, result, size, ttl)
+                    result = dict(result)
+
             return result
 
         except Exception as e:
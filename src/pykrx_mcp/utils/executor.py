@@ -0,0 +1,158 @@
+"""Bounded worker pool for blocking pykrx calls.
+
+pykrx scrapes KRX synchronously, so async servers must not call it on the
+event loop. ``BoundedExecutor`` runs those calls on a fixed-size thread pool
+and rejects new work once the pool and its queue are full, letting callers
+shed load (e.g., with HTTP 503) instead of piling up requests.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from .stats import tool_stats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_QUEUE = 32
+
+
+class WorkerPoolSaturatedError(RuntimeError):
+    """Raised when the worker pool and its queue are both full."""
+
+
+class BoundedExecutor:
+    """Thread pool that accepts at most ``max_workers + max_queue`` tasks."""
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pykrx-worker"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    def submit(self, func: Callable, *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule ``func(*args, **kwargs)`` on the pool.
+
+        Raises:
+            WorkerPoolSaturatedError: If no worker or queue slot is free
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                raise WorkerPoolSaturatedError(
+                    f"Worker pool saturated ({self._in_flight} requests in flight)"
+                )
+            self._in_flight += 1
+
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run ``func`` on the pool and await its result."""
+        return await asyncio.wrap_future(self.submit(partial(func, *args, **kwargs)))
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def stats(self) -> dict:
+        """Return pool size, queue limit and number of in-flight tasks."""
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": in_flight,
+            "queued": max(0, in_flight - self.max_workers),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and release the worker threads."""
+        self._executor.shutdown(wait=wait)
+
+
+_worker_pool: BoundedExecutor | None = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> BoundedExecutor:
+    """
+    Return the shared worker pool, created from the environment on first use.
+
+    Environment:
+        PYKRX_MCP_WORKERS: Number of worker threads (default: 8)
+        PYKRX_MCP_MAX_QUEUE: Requests allowed to wait for a worker (default: 32)
+    """
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = BoundedExecutor(
+                int(os.getenv("PYKRX_MCP_WORKERS", DEFAULT_MAX_WORKERS)),
+                int(os.getenv("PYKRX_MCP_MAX_QUEUE", DEFAULT_MAX_QUEUE)),
+            )
+            logger.info(
+                f"Worker pool started with {_worker_pool.max_workers} workers, "
+                f"queue limit {_worker_pool.max_queue}"
+            )
+        return _worker_pool
+
+
+def shutdown_worker_pool(wait: bool = True) -> None:
+    """Shut down the shared worker pool; a new one is created on next use."""
+    global _worker_pool
+    with _worker_pool_lock:
+        pool, _worker_pool = _worker_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+async def run_tool(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking tool function on the shared worker pool.
+
+    Records queue wait and total latency per tool in ``tool_stats``.
+
+    Raises:
+        WorkerPoolSaturatedError: If the pool cannot accept more work
+    """
+    name = func.__name__
+    submitted = time.perf_counter()
+    started = submitted
+
+    def call() -> Any:
+        nonlocal started
+        started = time.perf_counter()
+        return func(*args, **kwargs)
+
+    try:
+        result = await get_worker_pool().run(call)
+    except WorkerPoolSaturatedError:
+        tool_stats.record_rejected(name)
+        raise
+    except BaseException:
+        tool_stats.record(
+            name, time.perf_counter() - submitted, started - submitted, error=True
+        )
+        raise
+    tool_stats.record(
+        name,
+        time.perf_counter() - submitted,
+        started - submitted,
+        error=isinstance(result, dict) and "error" in result,
+    )
+    return result
@@ -1,10 +1,67 @@
 """Response formatters for MCP tools."""
 
-from typing import Any
+from __future__ import annotations
 
-import pandas as pd
+import os
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
+from .timing import timed
 
+if TYPE_CHECKING:
+    # Imported at call time instead: the server imports this module for
+    # format_error_response and should start without loading pandas
+    import pandas as pd
+
+# Response shapes selectable per call via ``response_format``:
+# - "records": data only
+# - "table": human-readable table text only
+# - "both": data and table text
+# - "columns": column-oriented data ({"columns", "index", "values"}), which
+#   avoids repeating column names on every row of long series
+RESPONSE_FORMATS = ("records", "table", "both", "columns")
+
+# Encodings of the REST streaming endpoints and their media types:
+# newline-delimited JSON (one object per row) or CSV
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Rows encoded per streamed chunk
+DEFAULT_STREAM_BATCH_ROWS = 500
+
+
+def resolve_response_format(response_format: str | None, default: str) -> str:
+    """
+    Resolve the effective response format for a tool call.
+
+    Precedence: explicit ``response_format`` argument, then the
+    ``PYKRX_MCP_RESPONSE_FORMAT`` environment variable, then the tool's
+    own default (its historical response shape).
+
+    Args:
+        response_format: Format requested by the caller, or None
+        default: Tool-specific default format
+
+    Returns:
+        One of RESPONSE_FORMATS
+
+    Raises:
+        ValueError: If the resolved format is not supported
+    """
+    resolved = (
+        response_format or os.getenv("PYKRX_MCP_RESPONSE_FORMAT") or default
+    ).lower()
+    if resolved not in RESPONSE_FORMATS:
+        raise ValueError(
+            f"response_format must be one of {list(RESPONSE_FORMATS)}, "
+            f"got: '{resolved}'"
+        )
+    return resolved
+
+
+@timed("table")
 def dict_to_table(data: dict) -> str:
     """
     Convert dictionary data to a simple table format.
@@ -35,16 +92,32 @@ def dict_to_table(data: dict) -> str:
     return "\n".join(f"{k}: {v}" for k, v in data.items())
 
 
-def format_dataframe_response(df: pd.DataFrame, **metadata: Any) -> dict:
+def _dataframe_to_table(df: pd.DataFrame) -> str:
+    return dict_to_table({str(k): v for k, v in df.to_dict(orient="index").items()})
+
+
+def _dataframe_to_columns(df: pd.DataFrame, index: list) -> dict:
+    return {
+        "columns": [str(c) for c in df.columns],
+        "index": index,
+        "values": df.to_dict(orient="split")["data"],
+    }
+
+
+@timed("transform")
+def format_dataframe_response(
+    df: pd.DataFrame, response_format: str | None = None, **metadata: Any
+) -> dict:
     """
     Convert pandas DataFrame to MCP-compatible dict response.
 
     Args:
         df: pandas DataFrame to convert
+        response_format: "records" (default), "table", "both" or "columns"
         **metadata: Additional metadata to include (ticker, dates, etc.)
 
     Returns:
-        Dictionary with metadata and data records
+        Dictionary with metadata and data records (and/or table text)
 
     Example:
         >>> df = pd.DataFrame({'Close': [70000, 71000]})
@@ -56,19 +129,118 @@ def format_dataframe_response(df: pd.DataFrame, **metadata: Any) -> dict:
             'data': [{'Close': 70000}, {'Close': 71000}]
         }
     """
-    # Reset index to make date column accessible
-    df_copy = df.reset_index()
+    import pandas as pd
 
-    # Convert datetime columns to string format (YYYY-MM-DD)
-    for col in df_copy.columns:
-        if pd.api.types.is_datetime64_any_dtype(df_copy[col]):
-            df_copy[col] = df_copy[col].dt.strftime("%Y-%m-%d")
+    response_format = resolve_response_format(response_format, "records")
+    response = {**metadata, "row_count": len(df)}
 
-    return {
-        **metadata,
-        "row_count": len(df),
-        "data": df_copy.to_dict(orient="records"),
-    }
+    if response_format in ("records", "both"):
+        # Reset index to make date column accessible
+        df_copy = df.reset_index()
+
+        # Convert datetime columns to string format (YYYY-MM-DD)
+        for col in df_copy.columns:
+            if pd.api.types.is_datetime64_any_dtype(df_copy[col]):
+                df_copy[col] = df_copy[col].dt.strftime("%Y-%m-%d")
+
+        response["data"] = df_copy.to_dict(orient="records")
+
+    if response_format == "columns":
+        if isinstance(df.index, pd.DatetimeIndex):
+            index = list(df.index.strftime("%Y-%m-%d"))
+        else:
+            index = df.index.tolist()
+        response["data"] = _dataframe_to_columns(df, index)
+
+    if response_format in ("table", "both"):
+        response["table"] = _dataframe_to_table(df)
+
+    return response
+
+
+@timed("transform")
+def format_dict_response(
+    df: pd.DataFrame, response_format: str | None = None, **metadata: Any
+) -> dict:
+    """
+    Convert pandas DataFrame to a dict keyed by index (ticker or date).
+
+    Used by the market-wide tools, whose ``data`` maps each index label to
+    its row.
+
+    Args:
+        df: pandas DataFrame to convert
+        response_format: "records", "table", "both" (default) or "columns"
+        **metadata: Additional metadata to include (date, market, etc.)
+
+    Returns:
+        Dictionary with metadata plus ``data`` and/or ``table``
+
+    Example:
+        >>> df = pd.DataFrame({'종가': [70000]}, index=['005930'])
+        >>> format_dict_response(df, "records", market="KOSPI")
+        {'market': 'KOSPI', 'data': {'005930': {'종가': 70000}}}
+    """
+    response_format = resolve_response_format(response_format, "both")
+    response = dict(metadata)
+
+    if response_format == "columns":
+        response["data"] = _dataframe_to_columns(df, [str(k) for k in df.index])
+        return response
+
+    formatted_dict = {str(k): v for k, v in df.to_dict(orient="index").items()}
+    if response_format in ("records", "both"):
+        response["data"] = formatted_dict
+    if response_format in ("table", "both"):
+        response["table"] = dict_to_table(formatted_dict)
+    return response
+
+
+def iter_dataframe_chunks(
+    df: pd.DataFrame,
+    stream_format: str,
+    batch_rows: int = DEFAULT_STREAM_BATCH_ROWS,
+    header: bool = True,
+    **fields: Any,
+) -> Iterator[str]:
+    """
+    Encode a DataFrame as NDJSON or CSV text, ``batch_rows`` rows at a time.
+
+    Only one batch is converted at once, so the encoded output never exists
+    in full; streaming responses send each chunk as soon as it is yielded.
+    The index becomes a regular column (dates as YYYY-MM-DD) and ``fields``
+    are prepended to every row as constant columns.
+
+    Args:
+        df: pandas DataFrame to encode
+        stream_format: "ndjson" or "csv" (see STREAM_MEDIA_TYPES)
+        batch_rows: Rows per chunk
+        header: Emit the CSV header row before the first chunk
+        **fields: Constant columns (e.g., ticker="005930")
+
+    Yields:
+        Encoded chunks, each ending with a newline
+
+    Example:
+        >>> df = pd.DataFrame({'종가': [70000]}, index=['005930'])
+        >>> list(iter_dataframe_chunks(df, "ndjson", market="KOSPI"))
+        ['{"market":"KOSPI","index":"005930","종가":70000}\n']
+    """
+    import pandas as pd
+
+    for start in range(0, len(df), batch_rows):
+        batch = df.iloc[start : start + batch_rows].reset_index()
+        for col in batch.columns:
+            if pd.api.types.is_datetime64_any_dtype(batch[col]):
+                batch[col] = batch[col].dt.strftime("%Y-%m-%d")
+        for position, (name, value) in enumerate(fields.items()):
+            batch.insert(position, name, value)
+
+        if stream_format == "ndjson":
+            text = batch.to_json(orient="records", lines=True, force_ascii=False)
+            yield text if text.endswith("\n") else text + "\n"
+        else:
+            yield batch.to_csv(index=False, header=header and start == 0)
 
 
 def format_error_response(message: str, **context: Any) -> dict:
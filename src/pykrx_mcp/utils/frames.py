@@ -0,0 +1,169 @@
+"""Server-side row and column selection for DataFrame-returning tools.
+
+Cross-sectional tools return one row per listed stock (~2,700 rows for
+market="ALL") and range tools one row per day. Every DataFrame-returning
+tool accepts the same selection parameters and applies them with
+``select_frame`` before the frame is converted to a response, so only the
+requested rows and columns reach the client:
+
+- ``tickers``: keep only these index labels (ticker-indexed tools)
+- ``where``: simple predicates such as ``"등락률 > 5"`` or ``"PER <= 10"``
+- ``sort_by`` / ``ascending``: sort rows by a column
+- ``top_n``: keep the first N rows after filtering and sorting
+- ``columns``: keep only these columns
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from .timing import timed
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Comparison operators accepted in ``where`` predicates
+OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+_PREDICATE = re.compile(r"^\s*(.+?)\s*(>=|<=|==|!=|>|<)\s*(.+?)\s*$")
+
+
+def parse_predicate(expression: str) -> tuple[str, str, float | str]:
+    """
+    Parse a ``"<column> <operator> <value>"`` row filter.
+
+    Numeric values may use thousands separators ("1,000,000"); anything
+    else is compared as a string (surrounding quotes are stripped).
+
+    Example:
+        >>> parse_predicate("거래량 >= 1,000,000")
+        ('거래량', '>=', 1000000.0)
+
+    Raises:
+        ValueError: If the expression is not a comparison
+    """
+    match = _PREDICATE.match(expression)
+    if not match:
+        raise ValueError(
+            f"Invalid filter '{expression}'. Use '<column> <op> <value>' with op "
+            f"one of {', '.join(OPERATORS)} (e.g., '등락률 > 5')"
+        )
+    column, op, raw = match.groups()
+    try:
+        value: float | str = float(raw.replace(",", ""))
+    except ValueError:
+        value = raw.strip("'\"")
+    return column, op, value
+
+
+def _check_columns(available: Any, names: list[str], field: str) -> None:
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValueError(
+            f"Unknown {field}: {', '.join(map(str, unknown))}. "
+            f"Available columns: {', '.join(map(str, available))}"
+        )
+
+
+def check_selection(
+    available: Any,
+    *,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> list[tuple[str, str, float | str]]:
+    """
+    Validate ``select_frame`` arguments against a frame's column names.
+
+    Lets callers reject a bad selection before fetching any data.
+
+    Args:
+        available: Column names the frame has (or will have)
+        columns, tickers, where, sort_by, ascending, top_n: As for
+            ``select_frame``
+
+    Returns:
+        The parsed ``where`` predicates
+
+    Raises:
+        ValueError: If a column or filter is invalid or ``top_n`` is not
+            positive
+    """
+    if columns is not None:
+        _check_columns(available, columns, "columns")
+    if sort_by is not None:
+        _check_columns(available, [sort_by], "sort_by column")
+    if top_n is not None and top_n < 1:
+        raise ValueError(f"top_n must be a positive integer, got: {top_n}")
+    predicates = [parse_predicate(expression) for expression in where or []]
+    _check_columns(available, [column for column, _, _ in predicates], "filter columns")
+    return predicates
+
+
+@timed("transform")
+def select_frame(
+    df: pd.DataFrame,
+    *,
+    columns: list[str] | None = None,
+    tickers: list[str] | None = None,
+    where: list[str] | None = None,
+    sort_by: str | None = None,
+    ascending: bool = False,
+    top_n: int | None = None,
+) -> pd.DataFrame:
+    """
+    Filter, sort, limit and project a tool's DataFrame.
+
+    Args:
+        df: Tool result
+        columns: Columns to keep, in order (default: all)
+        tickers: Index labels (tickers) to keep (default: all)
+        where: Row filters, all of which must hold (see ``parse_predicate``)
+        sort_by: Column to sort by (default: keep the upstream order)
+        ascending: Sort ascending instead of descending
+        top_n: Keep only the first N rows after filtering and sorting
+
+    Returns:
+        The selected frame (``df`` itself if nothing was requested)
+
+    Raises:
+        ValueError: If a column or filter is invalid or ``top_n`` is not
+            positive
+    """
+    predicates = check_selection(
+        df.columns, columns=columns, where=where, sort_by=sort_by, top_n=top_n
+    )
+
+    if tickers is not None:
+        df = df[df.index.astype(str).isin([str(t) for t in tickers])]
+    if predicates:
+        mask = None
+        for column, op, value in predicates:
+            try:
+                condition = OPERATORS[op](df[column], value)
+            except TypeError:
+                raise ValueError(
+                    f"Cannot compare column '{column}' with {value!r}"
+                ) from None
+            mask = condition if mask is None else mask & condition
+        df = df[mask]
+    if sort_by is not None:
+        df = df.sort_values(sort_by, ascending=ascending, kind="stable")
+    if top_n is not None:
+        df = df.head(top_n)
+    if columns is not None:
+        df = df[list(columns)]
+    return df
@@ -0,0 +1,271 @@
+"""Prometheus-style metrics for the REST and SSE servers.
+
+Tool calls are measured in ``mcp_tool_error_handler`` (request counts by
+status, latency, per-stage time, response size and in-flight calls) and
+upstream pykrx
+calls in ``cached_call`` (latency and errors per pykrx function).
+``render_metrics`` adds the current cache, worker pool and single-flight
+counters and renders everything in the Prometheus text exposition format,
+served at ``/metrics``.
+
+The module has no third-party dependencies and does not import pandas, so
+the servers can expose it without slowing down start-up.
+"""
+
+import sys
+import threading
+from collections import defaultdict
+from collections.abc import Iterable
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+BYTES_BUCKETS = tuple(1024 * 4**i for i in range(9))  # 1 KiB .. 64 MiB
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self._values: dict[Labels, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        with self._lock:
+            self._values[tuple(sorted(labels.items()))] += amount
+
+    def samples(self) -> Iterable[tuple[str, Labels, float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield self.name, labels, value
+
+
+class Gauge(Counter):
+    """Value that goes up and down, with labels."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets, with labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...]) -> None:
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets) + (float("inf"),)
+        # labels -> (bucket counts, sum, count)
+        self._values: dict[Labels, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self) -> Iterable[tuple[str, Labels, float]]:
+        with self._lock:
+            items = [
+                (labels, list(counts), total, count)
+                for labels, (counts, total, count) in self._values.items()
+            ]
+        for labels, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                yield f"{self.name}_bucket", labels + (("le", le),), cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self.metrics: list[Counter | Histogram] = []
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._add(Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._add(Gauge(name, help_text))
+
+    def histogram(
+        self, name: str, help_text: str, buckets: tuple[float, ...]
+    ) -> Histogram:
+        return self._add(Histogram(name, help_text, buckets))
+
+    def _add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def reset(self) -> None:
+        """Drop all recorded values (for tests)."""
+        for metric in self.metrics:
+            with metric._lock:
+                metric._values.clear()
+
+
+registry = MetricsRegistry()
+
+tool_requests = registry.counter(
+    "pykrx_mcp_tool_requests_total", "Tool calls by tool and status (ok/error)"
+)
+tool_latency = registry.histogram(
+    "pykrx_mcp_tool_latency_seconds",
+    "Tool call latency in seconds, including cache lookups",
+    LATENCY_BUCKETS,
+)
+tool_response_bytes = registry.histogram(
+    "pykrx_mcp_tool_response_bytes",
+    "Serialized size of successful tool responses in bytes (sampled)",
+    BYTES_BUCKETS,
+)
+tool_in_flight = registry.gauge(
+    "pykrx_mcp_tool_in_flight", "Tool calls currently executing"
+)
+tool_stage_latency = registry.histogram(
+    "pykrx_mcp_tool_stage_seconds",
+    "Time spent per stage of a tool call (see utils.timing), in seconds",
+    LATENCY_BUCKETS,
+)
+upstream_latency = registry.histogram(
+    "pykrx_mcp_upstream_latency_seconds",
+    "Latency of pykrx (KRX) calls that missed every cache, in seconds",
+    LATENCY_BUCKETS,
+)
+upstream_errors = registry.counter(
+    "pykrx_mcp_upstream_errors_total", "pykrx calls that raised, by function"
+)
+
+
+def _runtime_samples() -> list[tuple[str, str, str, list[tuple[Labels, float]]]]:
+    """Collect point-in-time values from the caches, pool and single-flight."""
+    from .executor import get_worker_pool
+    from .singleflight import upstream_calls
+    from .stats import tool_stats
+
+    families = []
+
+    caches = {}
+    # Only report caches whose (pandas-importing) modules are already loaded
+    cache_module = sys.modules.get("pykrx_mcp.utils.cache")
+    if cache_module is not None:
+        memory_cache = cache_module.get_memory_cache()
+        if memory_cache is not None:
+            caches["response"] = memory_cache.stats()
+        caches["snapshot"] = cache_module._snapshot_memory.stats()
+        disk_cache = cache_module.get_disk_cache()
+        if disk_cache is not None:
+            caches["disk"] = disk_cache.stats()
+    pagination_module = sys.modules.get("pykrx_mcp.utils.pagination")
+    if pagination_module is not None:
+        caches["pages"] = pagination_module._page_frames.stats()
+
+    for field, kind, help_text in (
+        ("hits", "counter", "Cache hits by cache"),
+        ("misses", "counter", "Cache misses by cache"),
+        ("evictions", "counter", "Cache evictions by cache"),
+        ("entries", "gauge", "Entries held by in-memory caches"),
+        ("bytes", "gauge", "Approximate bytes held by in-memory caches"),
+    ):
+        suffix = "_total" if kind == "counter" else ""
+        values = [
+            ((("cache", name),), stats[field])
+            for name, stats in caches.items()
+            if field in stats
+        ]
+        families.append((f"pykrx_mcp_cache_{field}{suffix}", kind, help_text, values))
+
+    pool = get_worker_pool().stats()
+    for field, help_text in (
+        ("in_flight", "Tasks running or queued on the worker pool"),
+        ("queued", "Tasks waiting for a worker"),
+        ("max_workers", "Worker pool size"),
+    ):
+        families.append(
+            (f"pykrx_mcp_worker_pool_{field}", "gauge", help_text, [((), pool[field])])
+        )
+
+    flights = upstream_calls.stats()
+    families.append(
+        (
+            "pykrx_mcp_upstream_in_flight",
+            "gauge",
+            "Distinct pykrx calls currently executing",
+            [((), flights["in_flight"])],
+        )
+    )
+    families.append(
+        (
+            "pykrx_mcp_upstream_coalesced_total",
+            "counter",
+            "Calls that joined an identical in-flight pykrx call",
+            [((), flights["coalesced"])],
+        )
+    )
+    families.append(
+        (
+            "pykrx_mcp_tool_rejected_total",
+            "counter",
+            "Tool calls rejected because the worker pool was saturated",
+            [
+                ((("tool", name),), entry["rejected"])
+                for name, entry in tool_stats.snapshot().items()
+            ],
+        )
+    )
+    return families
+
+
+def render_metrics() -> str:
+    """Render every metric in the Prometheus text exposition format."""
+    lines = []
+    for metric in registry.metrics:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    for name, kind, help_text, values in _runtime_samples():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in values:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,167 @@
+"""Cursor pagination for large full-market responses.
+
+A full-market tool (e.g. ``get_market_ohlcv_by_date(date, "ALL")``) returns
+thousands of rows. With ``page_size`` set, the tool returns one page and a
+``next_cursor``; passing that cursor back (with the same arguments) returns
+the following page.
+
+The fetched DataFrame is memoized per query for ``PAGE_TTL`` seconds, so
+later pages are sliced from memory instead of re-scraping KRX, and every
+page of one walk is cut from the same frame. Cursors are opaque tokens
+encoding the offset, the page size and a fingerprint of the query; a cursor
+replayed against different arguments is rejected.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from .cache import DEFAULT_MEMORY_MAX_BYTES, MemoryCache, make_cache_key
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+MAX_PAGE_SIZE = 1000
+
+# Seconds a paginated query's frame is kept for its later pages
+PAGE_TTL = 600.0
+
+# Bound on concurrently paginated queries kept in memory
+DEFAULT_PAGE_ENTRIES = 32
+
+# Hex digits of the query key embedded in cursors
+_FINGERPRINT_CHARS = 16
+
+_page_frames = MemoryCache(DEFAULT_PAGE_ENTRIES, DEFAULT_MEMORY_MAX_BYTES)
+
+
+def encode_cursor(fingerprint: str, offset: int, page_size: int) -> str:
+    """Encode a page position as an opaque URL-safe token."""
+    payload = json.dumps({"q": fingerprint, "o": offset, "n": page_size})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int, int]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Returns:
+        (query fingerprint, offset, page size)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        fingerprint, offset, page_size = payload["q"], payload["o"], payload["n"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise ValueError(f"Invalid cursor: '{cursor}'") from None
+    if not (
+        isinstance(fingerprint, str)
+        and isinstance(offset, int)
+        and isinstance(page_size, int)
+        and offset >= 0
+    ):
+        raise ValueError(f"Invalid cursor: '{cursor}'")
+    return fingerprint, offset, page_size
+
+
+class Pager:
+    """
+    One paginated tool call.
+
+    Example:
+        pager = Pager("get_market_ohlcv_by_date", page_size, cursor,
+                      date=date, market=market)
+        df = pager.load(lambda: cached_call(stock, "get_market_ohlcv", ...))
+        df = select_frame(df, ...)
+        df, page = pager.page(df)
+        return format_dict_response(df, response_format, **page)
+
+    Without ``page_size`` and ``cursor`` the pager is inactive: ``load``
+    simply fetches and ``page`` returns the whole frame.
+    """
+
+    def __init__(
+        self, name: str, page_size: int | None, cursor: str | None, **query: Any
+    ) -> None:
+        """
+        Args:
+            name: Tool name
+            page_size: Rows per page (1-1000), or None for no pagination
+            cursor: ``next_cursor`` of the previous page, or None for the
+                first page
+            **query: Every argument that shapes the result (not the
+                response format)
+
+        Raises:
+            ValueError: If the cursor is invalid, belongs to another query
+                or the page size is out of range
+        """
+        self.key = make_cache_key(name, (), query)
+        self.offset = 0
+        if cursor is not None:
+            fingerprint, self.offset, cursor_size = decode_cursor(cursor)
+            if fingerprint != self.key[:_FINGERPRINT_CHARS]:
+                raise ValueError(
+                    "cursor does not belong to this query; pass the same "
+                    "arguments as for the first page"
+                )
+            if page_size is None:
+                page_size = cursor_size
+        if page_size is not None and not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(
+                f"page_size must be between 1 and {MAX_PAGE_SIZE}, got: {page_size}"
+            )
+        self.page_size = page_size
+
+    @property
+    def active(self) -> bool:
+        return self.page_size is not None
+
+    def load(self, fetch: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return the query's frame, from memory for pages after the first.
+
+        Args:
+            fetch: Fetches the frame (called on the first page or when the
+                memoized frame has expired)
+        """
+        if not self.active:
+            return fetch()
+        df = _page_frames.get(self.key) if self.offset else None
+        if df is None:
+            df = fetch()
+            if not df.empty:
+                _page_frames.set(
+                    self.key, df, int(df.memory_usage(deep=True).sum()), PAGE_TTL
+                )
+        return df
+
+    def page(self, df: pd.DataFrame) -> tuple[pd.DataFrame, dict[str, Any]]:
+        """
+        Cut the current page out of the (selected) frame.
+
+        Returns:
+            (page rows, pagination metadata: offset, page_size, total_rows
+            and next_cursor, which is None on the last page)
+        """
+        if not self.active:
+            return df, {}
+        end = self.offset + self.page_size
+        next_cursor = None
+        if end < len(df):
+            next_cursor = encode_cursor(
+                self.key[:_FINGERPRINT_CHARS], end, self.page_size
+            )
+        return df.iloc[self.offset : end], {
+            "offset": self.offset,
+            "page_size": self.page_size,
+            "total_rows": len(df),
+            "next_cursor": next_cursor,
+        }
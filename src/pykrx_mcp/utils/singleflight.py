@@ -0,0 +1,88 @@
+"""Request coalescing for identical in-flight pykrx queries.
+
+When several callers ask for the same data at the same moment, only the
+first one (the leader) runs the upstream fetch; the others wait for it and
+receive the same result (or exception).
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Identity of the call (e.g., a normalized cache key)
+            fn: Zero-argument function performing the fetch
+
+        Returns:
+            The result of ``fn``, possibly produced by another thread.
+            Shared results must be treated as read-only.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Return the number of distinct calls currently executing."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> dict:
+        """Return executed, coalesced and in-flight call counts."""
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+upstream_calls = SingleFlight()
@@ -0,0 +1,116 @@
+"""Per-tool latency statistics for sizing the worker pool."""
+
+import threading
+from collections import deque
+
+# Number of recent samples kept per tool for percentile estimates
+DEFAULT_WINDOW = 1000
+
+
+def _percentile(sorted_samples: list[float], pct: float) -> float:
+    index = min(
+        len(sorted_samples) - 1, int(round(pct / 100 * (len(sorted_samples) - 1)))
+    )
+    return sorted_samples[index]
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+class ToolLatencyStats:
+    """
+    Thread-safe latency recorder keyed by tool name.
+
+    Each call records the time spent waiting for a worker (queue wait) and
+    the total latency. Percentiles are computed over a sliding window of
+    recent samples; counters cover the whole process lifetime.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self.window = window
+        self._lock = threading.Lock()
+        self._tools: dict[str, dict] = {}
+
+    def _entry(self, name: str) -> dict:
+        entry = self._tools.get(name)
+        if entry is None:
+            entry = {
+                "count": 0,
+                "errors": 0,
+                "rejected": 0,
+                "total_seconds": 0.0,
+                "max_seconds": 0.0,
+                "latency": deque(maxlen=self.window),
+                "wait": deque(maxlen=self.window),
+            }
+            self._tools[name] = entry
+        return entry
+
+    def record(
+        self, name: str, latency: float, wait: float = 0.0, error: bool = False
+    ) -> None:
+        """
+        Record one completed call.
+
+        Args:
+            name: Tool name
+            latency: Total seconds from dispatch to completion
+            wait: Seconds spent queued before a worker picked it up
+            error: Whether the call raised
+        """
+        with self._lock:
+            entry = self._entry(name)
+            entry["count"] += 1
+            entry["errors"] += int(error)
+            entry["total_seconds"] += latency
+            entry["max_seconds"] = max(entry["max_seconds"], latency)
+            entry["latency"].append(latency)
+            entry["wait"].append(wait)
+
+    def record_rejected(self, name: str) -> None:
+        """Record a call rejected because the worker pool was saturated."""
+        with self._lock:
+            self._entry(name)["rejected"] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Return a JSON-serializable summary per tool.
+
+        Returns:
+            Dict mapping tool name to count, errors, rejected, mean/max and
+            p50/p95/p99 latency plus mean/p95 queue wait (all in milliseconds)
+        """
+        with self._lock:
+            tools = {
+                name: (dict(entry), sorted(entry["latency"]), sorted(entry["wait"]))
+                for name, entry in self._tools.items()
+            }
+
+        summary = {}
+        for name, (entry, latency, wait) in tools.items():
+            item = {
+                "count": entry["count"],
+                "errors": entry["errors"],
+                "rejected": entry["rejected"],
+            }
+            if entry["count"]:
+                item.update(
+                    mean_ms=_ms(entry["total_seconds"] / entry["count"]),
+                    max_ms=_ms(entry["max_seconds"]),
+                    p50_ms=_ms(_percentile(latency, 50)),
+                    p95_ms=_ms(_percentile(latency, 95)),
+                    p99_ms=_ms(_percentile(latency, 99)),
+                    wait_mean_ms=_ms(sum(wait) / len(wait)),
+                    wait_p95_ms=_ms(_percentile(wait, 95)),
+                )
+            summary[name] = item
+        return summary
+
+    def reset(self) -> None:
+        """Drop all recorded samples and counters."""
+        with self._lock:
+            self._tools.clear()
+
+
+tool_stats = ToolLatencyStats()
@@ -0,0 +1,426 @@
+"""Local Parquet store of daily full-market KRX snapshots.
+
+Each dataset (OHLCV, fundamentals, market cap, shorting volume) keeps one
+row per ticker per trading day, partitioned into monthly Parquet files::
+
+    <root>/<dataset>/<YYYY>/<YYYYMM>.parquet
+    <root>/<dataset>/manifest.json
+
+The manifest records the calendar range the ingestion command has fully
+processed. Queries are answered from the store only when that range covers
+them; everything else falls through to the caches and live pykrx scraping.
+
+The store is opt-in: set ``PYKRX_MCP_STORE_DIR`` and fill it with
+``pykrx-mcp-ingest``. Reading and writing require the ``pyarrow`` extra
+(``pip install "pykrx-mcp[store]"``).
+"""
+
+import importlib.util
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DATE_COLUMN = "날짜"
+TICKER_COLUMN = "티커"
+MARKET_COLUMN = "시장"
+
+MARKETS = ("KOSPI", "KOSDAQ", "KONEX")
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """A daily full-market snapshot kept in the store."""
+
+    name: str
+    # pykrx function returning one market's snapshot for a date
+    fetch: str
+    # Columns returned by the matching single-ticker, by-date pykrx function
+    by_date_columns: tuple[str, ...]
+    # Column the snapshot is sorted by (descending), if any
+    sort_by: str | None = None
+
+
+DATASETS = {
+    "ohlcv": Dataset(
+        "ohlcv",
+        "get_market_ohlcv_by_ticker",
+        ("시가", "고가", "저가", "종가", "거래량", "거래대금", "등락률"),
+    ),
+    "fundamental": Dataset(
+        "fundamental",
+        "get_market_fundamental_by_ticker",
+        ("BPS", "PER", "PBR", "EPS", "DIV", "DPS"),
+    ),
+    "market_cap": Dataset(
+        "market_cap",
+        "get_market_cap_by_ticker",
+        ("시가총액", "거래량", "거래대금", "상장주식수"),
+        sort_by="시가총액",
+    ),
+    "shorting": Dataset(
+        "shorting",
+        "get_shorting_volume_by_ticker",
+        ("공매도", "매수", "비중"),
+    ),
+}
+
+# pykrx single-ticker range queries served from the store:
+# function -> (dataset, positional parameter names)
+_RANGE_QUERIES = {
+    "get_market_ohlcv_by_date": (
+        "ohlcv",
+        ("fromdate", "todate", "ticker", "freq", "adjusted"),
+    ),
+    "get_market_fundamental_by_date": (
+        "fundamental",
+        ("fromdate", "todate", "ticker", "freq"),
+    ),
+    "get_market_cap_by_date": ("market_cap", ("fromdate", "todate", "ticker", "freq")),
+}
+
+# pykrx full-market snapshot queries served from the store:
+# function -> (dataset, positional parameter names, default market)
+_SNAPSHOT_QUERIES = {
+    "get_market_ohlcv": ("ohlcv", ("date", "market"), "KOSPI"),
+    "get_market_ohlcv_by_ticker": ("ohlcv", ("date", "market"), "KOSPI"),
+    "get_market_fundamental": ("fundamental", ("date", "market"), "KOSPI"),
+    "get_market_fundamental_by_ticker": ("fundamental", ("date", "market"), "KOSPI"),
+    "get_market_cap": ("market_cap", ("date", "market"), "ALL"),
+    "get_market_cap_by_ticker": ("market_cap", ("date", "market"), "ALL"),
+    "get_shorting_volume_by_ticker": ("shorting", ("date", "market"), "KOSPI"),
+}
+
+
+def require_pyarrow() -> None:
+    """
+    Raise a helpful error if the Parquet engine is missing.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ImportError(
+            "The local market-data store requires pyarrow. "
+            'Install it with: pip install "pykrx-mcp[store]"'
+        )
+
+
+def _to_timestamp(date: str) -> pd.Timestamp:
+    return pd.Timestamp(datetime.strptime(date, "%Y%m%d"))
+
+
+def _is_date(value: Any) -> bool:
+    return isinstance(value, str) and len(value) == 8 and value.isdigit()
+
+
+def _shift_date(date: str, days: int) -> str:
+    return (datetime.strptime(date, "%Y%m%d") + timedelta(days=days)).strftime("%Y%m%d")
+
+
+def _month_keys(start: str, end: str) -> list[str]:
+    """Return the YYYYMM keys of every month between two dates (inclusive)."""
+    keys = []
+    year, month = int(start[:4]), int(start[4:6])
+    while f"{year}{month:02d}" <= end[:6]:
+        keys.append(f"{year}{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return keys
+
+
+def _bind(names: tuple[str, ...], args: tuple, kwargs: dict) -> dict | None:
+    if len(args) > len(names):
+        return None
+    params = dict(zip(names, args, strict=False))
+    for key, value in kwargs.items():
+        if key not in names or key in params:
+            return None
+        params[key] = value
+    return params
+
+
+def parse_range_query(
+    name: str, args: tuple, kwargs: dict
+) -> tuple[str, str, str, str] | None:
+    """
+    Recognize a daily single-ticker range query answerable from snapshots.
+
+    Adjusted OHLCV is excluded: adjusted history is rewritten retroactively
+    on splits/dividends, so it cannot be rebuilt from raw daily snapshots.
+
+    Args:
+        name: pykrx function name
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+
+    Returns:
+        Tuple of (dataset, ticker, start, end), or None if not supported
+    """
+    if name not in _RANGE_QUERIES:
+        return None
+    dataset, names = _RANGE_QUERIES[name]
+    params = _bind(names, args, kwargs)
+    if (
+        params is None
+        or not {"fromdate", "todate", "ticker"} <= params.keys()
+        or params.get("freq", "d") != "d"
+        or not all(_is_date(params[key]) for key in ("fromdate", "todate"))
+    ):
+        return None
+    if dataset == "ohlcv" and params.get("adjusted", True):
+        return None
+    return dataset, params["ticker"], params["fromdate"], params["todate"]
+
+
+class MarketStore:
+    """Reader/writer for the Parquet snapshot store."""
+
+    def __init__(self, root: str | Path):
+        require_pyarrow()
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # ----- Coverage -----
+
+    def _manifest_path(self, dataset: str) -> Path:
+        return self.root / dataset / "manifest.json"
+
+    def coverage(self, dataset: str) -> tuple[str, str] | None:
+        """Return the (start, end) calendar range ingested for a dataset."""
+        try:
+            manifest = json.loads(self._manifest_path(dataset).read_text())
+        except FileNotFoundError:
+            return None
+        return manifest["start"], manifest["end"]
+
+    def covers(self, dataset: str, start: str, end: str) -> bool:
+        """Return True if every day between start and end has been ingested."""
+        coverage = self.coverage(dataset)
+        return coverage is not None and coverage[0] <= start and end <= coverage[1]
+
+    def extend_coverage(self, dataset: str, start: str, end: str) -> None:
+        """
+        Record that the range [start, end] has been ingested.
+
+        Raises:
+            ValueError: If the range would leave a hole in the coverage
+        """
+        coverage = self.coverage(dataset)
+        if coverage is not None:
+            if start > _shift_date(coverage[1], 1) or end < _shift_date(
+                coverage[0], -1
+            ):
+                raise ValueError(
+                    f"Range {start}-{end} is not contiguous with the "
+                    f"{dataset} coverage {coverage[0]}-{coverage[1]}"
+                )
+            start, end = min(start, coverage[0]), max(end, coverage[1])
+
+        path = self._manifest_path(dataset)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "start": start,
+            "end": end,
+            "markets": list(MARKETS),
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self._atomic_write(path, lambda f: f.write(json.dumps(manifest).encode()))
+
+    # ----- Writing -----
+
+    def _month_path(self, dataset: str, month: str) -> Path:
+        return self.root / dataset / month[:4] / f"{month}.parquet"
+
+    def _atomic_write(self, path: Path, write: Any) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def write_days(self, dataset: str, snapshots: dict[str, pd.DataFrame]) -> None:
+        """
+        Store full-market snapshots, replacing any rows for the same dates.
+
+        Args:
+            dataset: Dataset name (key of DATASETS)
+            snapshots: Date (YYYYMMDD) -> snapshot with ticker index and a
+                market column, as built by ``snapshot_frame``
+        """
+        by_month: dict[str, list[pd.DataFrame]] = {}
+        for date, frame in snapshots.items():
+            by_month.setdefault(date[:6], []).append(frame)
+
+        for month, frames in by_month.items():
+            new = pd.concat(frames, ignore_index=True)
+            path = self._month_path(dataset, month)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.exists():
+                old = pd.read_parquet(path)
+                old = old[~old[DATE_COLUMN].isin(new[DATE_COLUMN].unique())]
+                new = pd.concat([old, new], ignore_index=True)
+            # Ticker-major order keeps single-ticker scans to few row groups
+            new = new.sort_values([TICKER_COLUMN, DATE_COLUMN], ignore_index=True)
+            self._atomic_write(path, lambda f, df=new: df.to_parquet(f, index=False))
+
+    # ----- Reading -----
+
+    def _read(
+        self, dataset: str, start: str, end: str, filters: list, columns: list | None
+    ) -> pd.DataFrame:
+        frames = []
+        for month in _month_keys(start, end):
+            path = self._month_path(dataset, month)
+            if path.exists():
+                frames.append(pd.read_parquet(path, columns=columns, filters=filters))
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
+
+    def read_ticker(
+        self, dataset: str, ticker: str, start: str, end: str
+    ) -> pd.DataFrame | None:
+        """
+        Return one ticker's rows over a date range, indexed by date.
+
+        The columns match the corresponding pykrx ``*_by_date`` function.
+
+        Returns:
+            DataFrame, or None if the range is not covered or has no rows
+        """
+        if not self.covers(dataset, start, end):
+            return None
+        columns = list(DATASETS[dataset].by_date_columns)
+        df = self._read(
+            dataset,
+            start,
+            end,
+            filters=[
+                (TICKER_COLUMN, "==", ticker),
+                (DATE_COLUMN, ">=", _to_timestamp(start)),
+                (DATE_COLUMN, "<=", _to_timestamp(end)),
+            ],
+            columns=[DATE_COLUMN, *columns],
+        )
+        if df.empty:
+            return None
+        return df.set_index(DATE_COLUMN).sort_index()
+
+    def read_snapshot(
+        self, dataset: str, date: str, market: str = "ALL"
+    ) -> pd.DataFrame | None:
+        """
+        Return a full-market snapshot for one date, indexed by ticker.
+
+        Args:
+            dataset: Dataset name (key of DATASETS)
+            date: Date in YYYYMMDD format
+            market: KOSPI/KOSDAQ/KONEX, or ALL for every market
+
+        Returns:
+            DataFrame, or None if the date is not covered or has no rows
+        """
+        if not self.covers(dataset, date, date):
+            return None
+        filters = [(DATE_COLUMN, "==", _to_timestamp(date))]
+        if market != "ALL":
+            filters.append((MARKET_COLUMN, "==", market))
+        df = self._read(dataset, date, date, filters=filters, columns=None)
+        if df.empty:
+            return None
+
+        df = df.drop(columns=[DATE_COLUMN, MARKET_COLUMN]).set_index(TICKER_COLUMN)
+        sort_by = DATASETS[dataset].sort_by
+        if sort_by is not None:
+            df = df.sort_values(sort_by, ascending=False)
+        return df
+
+    def lookup(self, name: str, args: tuple, kwargs: dict) -> pd.DataFrame | None:
+        """
+        Answer a pykrx call from the store if it is supported and covered.
+
+        Args:
+            name: pykrx function name
+            args: Positional arguments of the call
+            kwargs: Keyword arguments of the call
+
+        Returns:
+            The stored equivalent of the pykrx result, or None on a miss
+        """
+        query = parse_range_query(name, args, kwargs)
+        if query is not None:
+            return self.read_ticker(*query)
+
+        if name in _SNAPSHOT_QUERIES:
+            dataset, names, default_market = _SNAPSHOT_QUERIES[name]
+            params = _bind(names, args, kwargs)
+            if params is None or "date" not in params:
+                return None
+            market = str(params.get("market", default_market)).upper()
+            if market not in (*MARKETS, "ALL"):
+                return None
+            return self.read_snapshot(dataset, params["date"], market)
+
+        return None
+
+
+def snapshot_frame(df: pd.DataFrame, date: str, market: str) -> pd.DataFrame:
+    """
+    Turn a pykrx full-market snapshot into store rows.
+
+    Args:
+        df: Snapshot indexed by ticker
+        date: Snapshot date (YYYYMMDD)
+        market: Market the snapshot belongs to
+
+    Returns:
+        DataFrame with date, ticker and market columns prepended
+    """
+    rows = df.reset_index()
+    rows = rows.rename(columns={rows.columns[0]: TICKER_COLUMN})
+    rows.insert(0, DATE_COLUMN, _to_timestamp(date))
+    rows.insert(2, MARKET_COLUMN, market)
+    return rows
+
+
+_UNSET = object()
+_market_store: Any = _UNSET
+
+
+def configure_market_store(root: str | Path | None) -> MarketStore | None:
+    """
+    Enable (or disable with ``None``) the shared market-data store.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    global _market_store
+    _market_store = MarketStore(root) if root else None
+    return _market_store
+
+
+def get_market_store() -> MarketStore | None:
+    """
+    Return the shared market-data store, configured from the environment.
+
+    Environment:
+        PYKRX_MCP_STORE_DIR: Store directory (the store is disabled if unset)
+    """
+    if _market_store is _UNSET:
+        try:
+            configure_market_store(os.getenv("PYKRX_MCP_STORE_DIR"))
+        except ImportError as e:
+            logger.warning(f"Local market-data store disabled: {e}")
+            configure_market_store(None)
+    return _market_store
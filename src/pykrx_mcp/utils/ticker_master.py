@@ -0,0 +1,288 @@
+"""In-memory ticker master: ticker <-> name <-> market lookup table.
+
+Resolving a company name used to take a ticker-list call per market plus a
+name call per ticker. The master is built once per trading day from the
+KOSPI/KOSDAQ/KONEX ticker lists, kept in memory and persisted to disk, and
+answers ticker and name lookups without any upstream call:
+
+- ``get(ticker)`` and exact name lookups are dictionary hits
+- ``search(query)`` ranks exact, prefix, substring, Korean initial-consonant
+  (초성, e.g. "ㅅㅅㅈㅈ") and fuzzy name matches
+
+Tickers that drop out of the lists on a rebuild are kept and marked as no
+longer listed, so names of delisted companies still resolve.
+
+The master is persisted to ``PYKRX_MCP_TICKER_MASTER_PATH`` (default:
+``ticker_master.json`` in ``PYKRX_MCP_CACHE_DIR``) when either is set.
+"""
+
+import difflib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .trading_calendar import KST, get_trading_calendar, resolve_trading_date
+
+logger = logging.getLogger(__name__)
+
+MASTER_FILENAME = "ticker_master.json"
+
+MARKETS = ("KOSPI", "KOSDAQ", "KONEX")
+
+# Initial consonants (초성) in Hangul syllable order
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+# Minimum difflib similarity for fuzzy matches
+FUZZY_CUTOFF = 0.6
+
+
+@dataclass(frozen=True)
+class TickerEntry:
+    """One stock in the ticker master."""
+
+    ticker: str
+    name: str
+    market: str
+    listed: bool = True
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a company name for matching (no spaces, upper-case)."""
+    return "".join(name.split()).upper()
+
+
+def chosung(text: str) -> str:
+    """Return the initial consonants of the Hangul syllables in ``text``."""
+    initials = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        initials.append(_CHOSUNG[code // 588] if 0 <= code < 11172 else char)
+    return "".join(initials)
+
+
+def _is_chosung_query(query: str) -> bool:
+    return all(char in _CHOSUNG for char in query)
+
+
+class TickerMaster:
+    """Lookup table of tickers, names and markets."""
+
+    def __init__(self, entries: list[TickerEntry], date: str | None = None) -> None:
+        self.date = date
+        self.by_ticker = {entry.ticker: entry for entry in entries}
+        self.by_name: dict[str, list[TickerEntry]] = {}
+        # Listed companies first, so exact name hits prefer them
+        for entry in sorted(entries, key=lambda e: not e.listed):
+            self.by_name.setdefault(normalize_name(entry.name), []).append(entry)
+        self._chosung = {key: chosung(key) for key in self.by_name}
+
+    def __len__(self) -> int:
+        return len(self.by_ticker)
+
+    def get(self, ticker: str) -> TickerEntry | None:
+        """Return the entry for a ticker, if known."""
+        return self.by_ticker.get(ticker)
+
+    def lookup_name(self, name: str) -> list[TickerEntry]:
+        """Return the entries whose name matches exactly (ignoring spaces/case)."""
+        return list(self.by_name.get(normalize_name(name), []))
+
+    def search(
+        self,
+        query: str,
+        market: str | None = None,
+        limit: int = 10,
+        include_delisted: bool = False,
+    ) -> list[tuple[TickerEntry, str, float]]:
+        """
+        Search names by exact, prefix, substring, 초성 and fuzzy match.
+
+        Args:
+            query: Company name or part of it (Korean or English)
+            market: Restrict results to one market
+            limit: Maximum number of results
+            include_delisted: Include companies that are no longer listed
+
+        Returns:
+            List of (entry, match type, score) sorted by score
+        """
+        key = normalize_name(query)
+        if not key:
+            return []
+
+        scored: dict[str, tuple[TickerEntry, str, float]] = {}
+
+        def add(name_key: str, match: str, score: float) -> None:
+            for entry in self.by_name[name_key]:
+                if market and entry.market != market:
+                    continue
+                if not entry.listed and not include_delisted:
+                    continue
+                if entry.ticker not in scored or scored[entry.ticker][2] < score:
+                    scored[entry.ticker] = (entry, match, score)
+
+        initials = _is_chosung_query(key)
+        for name_key in self.by_name:
+            if name_key == key:
+                add(name_key, "exact", 1.0)
+            elif name_key.startswith(key):
+                add(name_key, "prefix", 0.9 - 0.001 * (len(name_key) - len(key)))
+            elif key in name_key:
+                add(name_key, "substring", 0.8 - 0.001 * len(name_key))
+            elif initials and self._chosung[name_key].startswith(key):
+                add(name_key, "chosung", 0.7 - 0.001 * len(name_key))
+
+        if len(scored) < limit and not initials:
+            for name_key in difflib.get_close_matches(
+                key, self.by_name, n=limit, cutoff=FUZZY_CUTOFF
+            ):
+                ratio = difflib.SequenceMatcher(None, key, name_key).ratio()
+                add(name_key, "fuzzy", round(0.6 * ratio, 3))
+
+        results = sorted(scored.values(), key=lambda r: (-r[2], r[0].ticker))
+        return results[:limit]
+
+    def to_json(self) -> dict:
+        return {
+            "date": self.date,
+            "tickers": [asdict(entry) for entry in self.by_ticker.values()],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "TickerMaster":
+        entries = [TickerEntry(**entry) for entry in data.get("tickers", [])]
+        return cls(entries, data.get("date"))
+
+
+def build_ticker_master(
+    module: Any, date: str, previous: TickerMaster | None = None
+) -> TickerMaster:
+    """
+    Build the master from one trading day's ticker lists.
+
+    Tickers known to ``previous`` but missing from the lists are kept as
+    no longer listed. The per-market lists go through ``cached_call``, so
+    they share the disk cache and single-flight coalescing with the tools;
+    names are looked up directly, as one cache entry per ticker would only
+    fill the disk cache with short-lived files.
+
+    Args:
+        module: Module exposing the pykrx functions
+        date: Trading day (YYYYMMDD)
+        previous: Earlier master to carry delisted tickers over from
+    """
+    # Imported lazily: the cache pulls in pandas
+    from .cache import cached_call
+
+    entries = {}
+    for market in MARKETS:
+        for ticker in cached_call(
+            module, "get_market_ticker_list", date, market=market
+        ):
+            name = module.get_market_ticker_name(ticker)
+            if name:
+                entries[ticker] = TickerEntry(ticker, str(name), market)
+    if not entries:
+        raise RuntimeError(f"No tickers listed on {date}")
+
+    if previous is not None:
+        for ticker, entry in previous.by_ticker.items():
+            if ticker not in entries:
+                entries[ticker] = TickerEntry(ticker, entry.name, entry.market, False)
+    return TickerMaster(list(entries.values()), date)
+
+
+def _master_path() -> Path | None:
+    path = os.getenv("PYKRX_MCP_TICKER_MASTER_PATH")
+    if not path and os.getenv("PYKRX_MCP_CACHE_DIR"):
+        path = str(Path(os.environ["PYKRX_MCP_CACHE_DIR"]) / MASTER_FILENAME)
+    return Path(path) if path else None
+
+
+def _load(path: Path) -> TickerMaster | None:
+    try:
+        return TickerMaster.from_json(json.loads(path.read_text()))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable ticker master {path}: {e}")
+        return None
+
+
+def _save(master: TickerMaster, path: Path) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write atomically so concurrent readers never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(master.to_json(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to save ticker master {path}: {e}")
+
+
+_master: TickerMaster | None = None
+_master_lock = threading.Lock()
+
+
+def peek_ticker_master() -> TickerMaster | None:
+    """Return the in-memory master without building or loading it."""
+    return _master
+
+
+def set_ticker_master(master: TickerMaster | None) -> None:
+    """Replace the in-memory master (``None`` forces a reload)."""
+    global _master
+    with _master_lock:
+        _master = master
+
+
+def get_ticker_master(module: Any) -> TickerMaster:
+    """
+    Return the ticker master for the latest trading day.
+
+    Loads the persisted master or builds a new one when the in-memory copy
+    is missing or from an earlier trading day. Only one thread builds at a
+    time; concurrent callers wait for it.
+
+    Args:
+        module: Module exposing the pykrx functions (used to build)
+    """
+    global _master
+    today = datetime.now(KST).strftime("%Y%m%d")
+    date, _ = resolve_trading_date(module, today, snap=True)
+    date = date or today
+
+    with _master_lock:
+        if _master is not None and _master.date == date:
+            return _master
+
+        path = _master_path()
+        stored = _load(path) if path is not None and _master is None else None
+        if stored is not None and stored.date == date:
+            _master = stored
+            return _master
+
+        previous = _master or stored
+        logger.info(f"Building ticker master for {date}")
+        try:
+            master = build_ticker_master(module, date, previous)
+        except RuntimeError:
+            # Today's lists are empty until KRX publishes the session
+            fallback = get_trading_calendar().previous_trading_day(date)
+            if fallback is None:
+                raise
+            master = build_ticker_master(module, fallback, previous)
+        # Keyed by the requested day so it is rebuilt at most once per day
+        master.date = date
+        _master = master
+        if path is not None:
+            _save(_master, path)
+        logger.info(f"Ticker master ready: {len(_master)} tickers")
+        return _master
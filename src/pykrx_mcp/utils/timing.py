@@ -0,0 +1,123 @@
+"""Per-stage timing of tool calls.
+
+``mcp_tool_error_handler`` starts a ``StageTimer`` for every tool call, and
+the shared helpers mark their work with ``stage`` spans:
+
+- ``validate``: argument validators and trading-date resolution
+- ``fetch``: pykrx queries through ``cached_call`` and friends (store,
+  disk cache and upstream)
+- ``transform``: row/column selection and DataFrame-to-dict conversion
+- ``table``: table text rendering (``dict_to_table``)
+- ``size_accounting``: the extra JSON encoding that measures a response's
+  size for the memory cache and the (sampled) size metric; the transport's
+  own encoding happens after the call and is not timed
+- ``cache``: response memory cache lookups and stores
+- ``other``: the rest of the call (tool-specific pandas work)
+
+Spans record exclusive time: a fetch made while resolving a trading date
+counts as ``fetch``, not ``validate``, so the stages add up to the call's
+total. Spans outside a tool call (e.g. warm-up) cost a context-variable
+lookup and record nothing.
+
+Stage durations feed the ``pykrx_mcp_tool_stage_seconds`` histogram; with
+``PYKRX_MCP_TIMING=1`` they are also returned in each response's
+``_timing`` field.
+"""
+
+import os
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any
+
+_current_timer: ContextVar["StageTimer | None"] = ContextVar(
+    "pykrx_mcp_stage_timer", default=None
+)
+
+
+def timing_enabled() -> bool:
+    """Return whether ``PYKRX_MCP_TIMING`` asks for ``_timing`` in responses."""
+    return os.getenv("PYKRX_MCP_TIMING", "").strip().lower() in ("1", "true", "yes")
+
+
+class StageTimer:
+    """Exclusive time per stage for one tool call."""
+
+    def __init__(self) -> None:
+        self.stages: dict[str, float] = {}
+        # Open spans: [stage, start, time spent in child spans]
+        self._stack: list[list] = []
+
+    def start(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def stop(self) -> None:
+        name, started, children = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        self.stages[name] = self.stages.get(name, 0.0) + elapsed - children
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def finish(self, total: float) -> dict[str, float]:
+        """Return the stage durations, with the untracked rest as ``other``."""
+        stages = dict(self.stages)
+        stages["other"] = max(total - sum(stages.values()), 0.0)
+        return stages
+
+
+class stage:
+    """
+    Context manager timing a block as one stage of the current tool call.
+
+    Example:
+        with stage("transform"):
+            records = df.to_dict(orient="records")
+    """
+
+    __slots__ = ("name", "_timer")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._timer: StageTimer | None = None
+
+    def __enter__(self) -> None:
+        self._timer = _current_timer.get()
+        if self._timer is not None:
+            self._timer.start(self.name)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """Decorator timing every call of a function as stage ``name``."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_timer() -> tuple[StageTimer, Any]:
+    """Start timing a tool call; pass the token to ``stop_timer``."""
+    timer = StageTimer()
+    return timer, _current_timer.set(timer)
+
+
+def stop_timer(token: Any) -> None:
+    _current_timer.reset(token)
+
+
+def timing_summary(stages: dict[str, float], total: float) -> dict[str, Any]:
+    """Format stage durations for the ``_timing`` response field."""
+    return {
+        "total_ms": round(total * 1000, 3),
+        "stages_ms": {name: round(value * 1000, 3) for name, value in stages.items()},
+    }
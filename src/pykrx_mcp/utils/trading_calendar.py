@@ -0,0 +1,274 @@
+"""KRX trading-calendar index.
+
+Single-date tools used to pass weekends and holidays straight to pykrx,
+paying a full scrape to learn that the result is empty. The calendar lets
+them resolve non-trading dates locally:
+
+- weekends are always non-trading
+- holidays are known for days the calendar has observed: full-market
+  snapshots (snapshot slicing, the end-of-day refresh), store ingestion,
+  and, with ``PYKRX_MCP_CALENDAR_FETCH`` enabled, one pykrx business-day
+  lookup per month
+
+Weekdays the calendar has not observed are "unknown" and treated as
+trading days, so the calendar never rejects a date it cannot vouch for.
+
+The index is kept in memory and persisted as JSON to
+``PYKRX_MCP_CALENDAR_PATH`` (default: ``trading_calendar.json`` in
+``PYKRX_MCP_CACHE_DIR``) when either is set.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from .timing import timed
+
+logger = logging.getLogger(__name__)
+
+KST = ZoneInfo("Asia/Seoul")
+
+CALENDAR_FILENAME = "trading_calendar.json"
+
+# Longest KRX closure to walk back over when snapping to a previous session
+_MAX_CLOSED_DAYS = 14
+
+
+def _parse(date: str) -> datetime:
+    return datetime.strptime(date, "%Y%m%d")
+
+
+def _format(day: datetime) -> str:
+    return day.strftime("%Y%m%d")
+
+
+def _today() -> str:
+    return datetime.now(KST).strftime("%Y%m%d")
+
+
+def is_weekend(date: str) -> bool:
+    """Return whether a YYYYMMDD date falls on a Saturday or Sunday."""
+    return _parse(date).weekday() >= 5
+
+
+class TradingCalendar:
+    """Thread-safe index of observed KRX trading days and holidays."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        # Weekday (YYYYMMDD) -> whether KRX held a session
+        self._days: dict[str, bool] = {}
+        if self.path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable trading calendar {self.path}: {e}")
+            return
+        for date in data.get("trading_days", []):
+            self._days[date] = True
+        for date in data.get("holidays", []):
+            self._days[date] = False
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            "trading_days": sorted(d for d, trading in self._days.items() if trading),
+            "holidays": sorted(d for d, trading in self._days.items() if not trading),
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save trading calendar {self.path}: {e}")
+
+    def status(self, date: str) -> bool | None:
+        """
+        Return whether KRX held a session on a date.
+
+        Returns:
+            True for a trading day, False for a weekend or known holiday,
+            None if the date has not been observed
+        """
+        if is_weekend(date):
+            return False
+        with self._lock:
+            return self._days.get(date)
+
+    def mark(self, date: str, trading: bool) -> None:
+        """
+        Record one observed date.
+
+        Closures are only recorded for past dates: an empty result for today
+        may just mean the session has not opened yet.
+        """
+        if is_weekend(date) or (not trading and date >= _today()):
+            return
+        with self._lock:
+            if self._days.get(date) == trading:
+                return
+            self._days[date] = trading
+            self._save()
+
+    def record(self, start: str, end: str, trading_days: Iterable[str]) -> None:
+        """
+        Record a fully observed range: weekdays not in ``trading_days`` are
+        holidays. Days from today on are left unknown.
+        """
+        trading = set(trading_days)
+        last = min(end, _format(_parse(_today()) - timedelta(days=1)))
+        day = _parse(start)
+        changed = False
+        with self._lock:
+            while _format(day) <= last:
+                date = _format(day)
+                if day.weekday() < 5 and self._days.get(date) != (date in trading):
+                    self._days[date] = date in trading
+                    changed = True
+                day += timedelta(days=1)
+            if changed:
+                self._save()
+
+    def previous_trading_day(self, date: str) -> str | None:
+        """
+        Return the closest day before ``date`` not known to be closed.
+
+        Returns:
+            YYYYMMDD date, or None if no candidate lies within two weeks
+        """
+        day = _parse(date)
+        for _ in range(_MAX_CLOSED_DAYS):
+            day -= timedelta(days=1)
+            if self.status(_format(day)) is not False:
+                return _format(day)
+        return None
+
+    def trading_days(self, start: str, end: str) -> list[str]:
+        """Return the days in [start, end] not known to be closed."""
+        days = []
+        day, last = _parse(start), _parse(end)
+        while day <= last:
+            if self.status(_format(day)) is not False:
+                days.append(_format(day))
+            day += timedelta(days=1)
+        return days
+
+    def expected_sessions(self, start: str, end: str) -> int | None:
+        """
+        Return the number of sessions in [start, end], if fully known.
+
+        Range tools use this to check whether a cached result is complete.
+
+        Returns:
+            Session count, or None if any weekday in the range is unknown
+        """
+        days = self.trading_days(start, end)
+        if any(self.status(date) is None for date in days):
+            return None
+        return len(days)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._days)
+
+
+_calendar: TradingCalendar | None = None
+_calendar_lock = threading.Lock()
+
+
+def configure_trading_calendar(path: str | Path | None) -> TradingCalendar:
+    """Replace the shared calendar (persisted to ``path`` if given)."""
+    global _calendar
+    with _calendar_lock:
+        _calendar = TradingCalendar(path)
+    return _calendar
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """
+    Return the shared trading calendar, configured from the environment.
+
+    Environment:
+        PYKRX_MCP_CALENDAR_PATH: JSON file to persist the calendar to
+        PYKRX_MCP_CACHE_DIR: Used for the default path if the above is unset
+    """
+    global _calendar
+    with _calendar_lock:
+        if _calendar is None:
+            path = os.getenv("PYKRX_MCP_CALENDAR_PATH")
+            if not path and os.getenv("PYKRX_MCP_CACHE_DIR"):
+                path = str(Path(os.environ["PYKRX_MCP_CACHE_DIR"]) / CALENDAR_FILENAME)
+            _calendar = TradingCalendar(path)
+        return _calendar
+
+
+def _fetch_month(calendar: TradingCalendar, module: Any, date: str) -> None:
+    """Look up the business days of ``date``'s month through pykrx."""
+    from .cache import cached_call
+
+    first = _parse(date[:6] + "01")
+    month_end = _format((first + timedelta(days=32)).replace(day=1) - timedelta(days=1))
+    yesterday = _format(_parse(_today()) - timedelta(days=1))
+    end = min(month_end, yesterday)
+    if end < _format(first):
+        return
+    days = cached_call(
+        module, "get_previous_business_days", fromdate=_format(first), todate=end
+    )
+    calendar.record(_format(first), end, (_format(day) for day in days))
+
+
+@timed("validate")
+def resolve_trading_date(
+    module: Any, date: str, snap: bool = False
+) -> tuple[str | None, str | None]:
+    """
+    Check a single-date query against the trading calendar.
+
+    Args:
+        module: Module exposing the pykrx functions (for month lookups)
+        date: Requested date in YYYYMMDD format
+        snap: Use the previous trading day when ``date`` is not one
+
+    Returns:
+        (date to query, None) or (None, error message) if ``date`` is
+        known to be closed and ``snap`` is False
+    """
+    calendar = get_trading_calendar()
+    try:
+        status = calendar.status(date)
+    except ValueError:
+        # Malformed dates are left to the tool's own validation
+        return date, None
+    if status is None and os.getenv("PYKRX_MCP_CALENDAR_FETCH", "") == "1":
+        try:
+            _fetch_month(calendar, module, date)
+        except Exception as e:
+            logger.warning(f"Trading calendar lookup for {date[:6]} failed: {e}")
+        status = calendar.status(date)
+    if status is not False:
+        return date, None
+
+    previous = calendar.previous_trading_day(date)
+    if snap and previous is not None:
+        logger.info(f"{date} is not a trading day; using {previous}")
+        return previous, None
+    hint = f" (previous trading day: {previous})" if previous else ""
+    return None, f"{date} is not a KRX trading day{hint}."
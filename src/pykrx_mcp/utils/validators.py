@@ -1,6 +1,10 @@
 """Input validators for MCP tools."""
 
+from .formatters import RESPONSE_FORMATS
+from .timing import timed
 
+
+@timed("validate")
 def validate_date_format(date_str: str) -> tuple[bool, str]:
     """
     Validate date string is in YYYYMMDD format.
@@ -38,6 +42,7 @@ def validate_date_format(date_str: str) -> tuple[bool, str]:
     return True, ""
 
 
+@timed("validate")
 def validate_ticker_format(ticker: str) -> tuple[bool, str]:
     """
     Validate ticker is 6-digit Korean stock code.
@@ -78,6 +83,32 @@ def validate_ticker_format(ticker: str) -> tuple[bool, str]:
     return True, ""
 
 
+@timed("validate")
+def validate_response_format(response_format: str | None) -> tuple[bool, str]:
+    """
+    Validate the requested response shape.
+
+    Args:
+        response_format: Requested format, or None for the default
+
+    Returns:
+        Tuple of (is_valid, error_message)
+
+    Examples:
+        >>> validate_response_format("records")
+        (True, "")
+        >>> validate_response_format("xml")
+        (False, "response_format must be one of [...], got: 'xml'")
+    """
+    if response_format is None or response_format.lower() in RESPONSE_FORMATS:
+        return True, ""
+    msg = (
+        f"response_format must be one of {list(RESPONSE_FORMATS)}, "
+        f"got: '{response_format}'"
+    )
+    return False, msg
+
+
 def validate_ticker(ticker: str) -> bool:
     """
     Check if ticker is valid 6-digit format (convenience function).
@@ -0,0 +1,220 @@
+"""
+Cache warm-up for the long-running (SSE and REST) servers.
+
+With ``PYKRX_MCP_WARMUP`` enabled, the server prefetches the latest trading
+day's commonly requested data through the regular tools on start-up, so the
+disk and memory caches are hot before the first agent arrives:
+
+- full-market OHLCV (``get_market_ohlcv_by_date``, market "ALL")
+- stock ticker lists (KOSPI, KOSDAQ, KONEX) and the ticker master
+- index ticker lists and names (KOSPI, KOSDAQ)
+- index constituents for ``PYKRX_MCP_WARMUP_INDICES``
+
+Warm-up runs on a background thread; ``/health`` reports the instance as
+not ready (HTTP 503) until it finishes, so load balancers never route to a
+cold instance. Failed steps are logged and reported but do not block
+readiness.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from . import tools
+from .utils.ticker_master import get_ticker_master
+
+logger = logging.getLogger(__name__)
+
+KST = ZoneInfo("Asia/Seoul")
+
+STOCK_MARKETS = ("KOSPI", "KOSDAQ", "KONEX")
+INDEX_MARKETS = ("KOSPI", "KOSDAQ")
+
+# KOSPI, KOSPI 200, KOSDAQ
+DEFAULT_WARMUP_INDICES = "1001,1028,2001"
+
+
+def warmup_enabled() -> bool:
+    """Return whether ``PYKRX_MCP_WARMUP`` asks for a start-up warm-up."""
+    return os.getenv("PYKRX_MCP_WARMUP", "").strip().lower() in ("1", "true", "yes")
+
+
+def warmup_indices() -> list[str]:
+    """Index tickers whose constituents are prefetched."""
+    value = os.getenv("PYKRX_MCP_WARMUP_INDICES", DEFAULT_WARMUP_INDICES)
+    return [ticker.strip() for ticker in value.split(",") if ticker.strip()]
+
+
+class WarmupState:
+    """Thread-safe progress of the start-up warm-up."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.status = "disabled"
+        self.date: str | None = None
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.calls = 0
+        self.errors: list[str] = []
+
+    def ready(self) -> bool:
+        """Whether the instance may receive traffic."""
+        return self.status in ("disabled", "complete")
+
+    def start(self) -> None:
+        with self._lock:
+            self.status = "running"
+            self.date = None
+            self.started_at = time.time()
+            self.finished_at = None
+            self.calls = 0
+            self.errors = []
+
+    def record(self, label: str, result: Any) -> None:
+        with self._lock:
+            self.calls += 1
+            if isinstance(result, dict) and "error" in result:
+                self.errors.append(f"{label}: {result['error']}")
+
+    def fail(self, label: str, error: Exception) -> None:
+        with self._lock:
+            self.errors.append(f"{label}: {error}")
+
+    def finish(self) -> None:
+        with self._lock:
+            self.status = "complete"
+            self.finished_at = time.time()
+
+    def snapshot(self) -> dict:
+        """Warm-up progress as a JSON-compatible dict."""
+        with self._lock:
+            snapshot = {"status": self.status}
+            if self.status == "disabled":
+                return snapshot
+            end = self.finished_at or time.time()
+            snapshot.update(
+                date=self.date,
+                calls=self.calls,
+                error_count=len(self.errors),
+                errors=self.errors[:10],
+                elapsed_seconds=round(end - self.started_at, 1),
+            )
+            return snapshot
+
+
+warmup_state = WarmupState()
+
+
+def health_status() -> tuple[int, dict]:
+    """
+    Build the ``/health`` response.
+
+    Returns:
+        (HTTP status code, body): 200 once ready, 503 while warming up
+    """
+    body = {"warmup": warmup_state.snapshot()}
+    if warmup_state.ready():
+        return 200, {"status": "healthy", **body}
+    return 503, {"status": "warming_up", **body}
+
+
+def latest_trading_day(module: Any = None, now: datetime | None = None) -> str:
+    """
+    Return the latest trading day whose closing data is final (YYYYMMDD).
+
+    Args:
+        module: pykrx ``stock`` module (or a stand-in); imported if None
+        now: Current time (defaults to now in KST)
+    """
+    # Imported lazily: the cache pulls in pandas
+    from .utils.cache import SETTLED_HOUR
+
+    module = module or tools.load_pykrx()
+    now = now or datetime.now(KST)
+    if now.hour < SETTLED_HOUR:
+        now -= timedelta(days=1)
+    return module.get_nearest_business_day_in_a_week(now.strftime("%Y%m%d"))
+
+
+def run_warmup(state: WarmupState = warmup_state, module: Any = None) -> None:
+    """
+    Prefetch the latest trading day's data through the tools.
+
+    Args:
+        state: Progress tracker to update
+        module: pykrx ``stock`` module used to find the latest trading day
+    """
+    state.start()
+    logger.info("Cache warm-up started")
+
+    def step(label: str, func: Callable, *args: Any) -> Any:
+        try:
+            result = func(*args)
+        except Exception as e:
+            logger.warning(f"Warm-up step {label} failed: {e}")
+            state.fail(label, e)
+            return None
+        state.record(label, result)
+        return result
+
+    try:
+        date = latest_trading_day(module)
+        state.date = date
+
+        step("market_ohlcv", tools.get_market_ohlcv_by_date, date, "ALL")
+
+        for market in STOCK_MARKETS:
+            step(f"ticker_list:{market}", tools.get_market_ticker_list, date, market)
+        # Ticker names are served from the ticker master
+        step("ticker_master", get_ticker_master, module or tools.load_pykrx())
+
+        for market in INDEX_MARKETS:
+            listing = step(
+                f"index_list:{market}", tools.get_index_ticker_list, date, market
+            )
+            for ticker in (listing or {}).get("data", []):
+                step(f"index_name:{ticker}", tools.get_index_ticker_name, ticker)
+
+        for ticker in warmup_indices():
+            step(
+                f"index_portfolio:{ticker}",
+                tools.get_index_portfolio_deposit_file,
+                ticker,
+                date,
+            )
+    except Exception as e:
+        logger.warning(f"Cache warm-up aborted: {e}")
+        state.fail("warmup", e)
+    finally:
+        state.finish()
+
+    snapshot = state.snapshot()
+    logger.info(
+        f"Cache warm-up complete for {snapshot['date']}: {snapshot['calls']} calls, "
+        f"{snapshot['error_count']} errors in {snapshot['elapsed_seconds']}s"
+    )
+
+
+def start_warmup(state: WarmupState = warmup_state) -> threading.Thread | None:
+    """
+    Start the warm-up on a background thread if it is enabled.
+
+    The state switches to "running" before this returns, so health checks
+    issued right after start-up already report the instance as not ready.
+
+    Returns:
+        The warm-up thread, or None when warm-up is disabled
+    """
+    if not warmup_enabled():
+        return None
+    state.start()
+    thread = threading.Thread(
+        target=run_warmup, args=(state,), name="pykrx-warmup", daemon=True
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,89 @@
+"""Tests for the benchmark suite's fake pykrx backend and result comparison."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from cases import TOOL_CASES  # noqa: E402
+from compare import compare  # noqa: E402
+from fake_pykrx import FakeStock  # noqa: E402
+
+from pykrx_mcp import tools  # noqa: E402
+from pykrx_mcp.utils import cache, pagination  # noqa: E402
+from pykrx_mcp.utils.ticker_master import set_ticker_master  # noqa: E402
+from pykrx_mcp.utils.trading_calendar import configure_trading_calendar  # noqa: E402
+
+
+@pytest.fixture
+def fake_stock():
+    """Serve a small fake pykrx backend and reset the state it fills."""
+    for name in {name for _, name, _ in TOOL_CASES}:
+        tools.load_tool(name)
+    fake = FakeStock(tickers=100, etfs=20)
+    with fake.installed():
+        yield fake
+    set_ticker_master(None)
+    configure_trading_calendar(None)
+    cache._snapshot_memory.clear()
+    pagination._page_frames.clear()
+
+
+class TestFakeStock:
+    """Test the offline pykrx stand-in."""
+
+    def test_every_case_succeeds(self, fake_stock):
+        """Should answer every benchmark case without an error."""
+        for label, name, kwargs in TOOL_CASES:
+            result = tools.load_tool(name)(**kwargs)
+            assert "error" not in result, f"{label}: {result.get('error')}"
+        assert "get_market_ohlcv" in fake_stock.calls
+
+    def test_deterministic(self):
+        """Should return identical frames for identical calls."""
+        first = FakeStock(tickers=50).get_market_ohlcv("20240105", "ALL")
+        second = FakeStock(tickers=50).get_market_ohlcv("20240105", "ALL")
+
+        assert len(first) == 50
+        assert first.equals(second)
+
+    def test_history_size(self):
+        """Should return one row per business day of the range."""
+        df = FakeStock(tickers=10).get_market_ohlcv_by_date(
+            "20040102", "20231229", "005930"
+        )
+
+        assert 5_000 < len(df) < 5_300
+        assert list(df.columns[:4]) == ["시가", "고가", "저가", "종가"]
+
+
+class TestCompare:
+    """Test regression detection between result files."""
+
+    def test_flags_regressions(self):
+        """Should flag slower tools and lower REST throughput only."""
+        base = {
+            "tools": {"a": {"median_ms": 100.0}, "b": {"median_ms": 100.0}},
+            "rest": {"a": {"requests_per_sec": 50.0}},
+        }
+        head = {
+            "tools": {"a": {"median_ms": 130.0}, "b": {"median_ms": 70.0}},
+            "rest": {"a": {"requests_per_sec": 30.0}},
+        }
+
+        changes = compare(base, head, threshold=10, min_ms=0.5)
+
+        regressed = {(case, metric) for case, metric, *_, worse in changes if worse}
+        assert regressed == {
+            ("tools/a", "median_ms"),
+            ("rest/a", "requests_per_sec"),
+        }
+
+    def test_ignores_noise(self):
+        """Should ignore changes below the threshold or the ms floor."""
+        base = {"tools": {"a": {"median_ms": 1.0}, "b": {"median_ms": 100.0}}}
+        head = {"tools": {"a": {"median_ms": 1.4}, "b": {"median_ms": 105.0}}}
+
+        assert compare(base, head, threshold=10, min_ms=0.5) == []
@@ -0,0 +1,800 @@
+"""Tests for the pykrx query caches."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from pykrx_mcp.utils import cache
+from pykrx_mcp.utils.cache import (
+    ADJUSTED_TTL,
+    DiskCache,
+    MemoryCache,
+    cached_call,
+    cached_range_call,
+    compute_ttl,
+    configure_disk_cache,
+    make_cache_key,
+    missing_intervals,
+    split_range,
+)
+from pykrx_mcp.utils.trading_calendar import configure_trading_calendar
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Enable the shared disk cache in a temporary directory."""
+    yield configure_disk_cache(tmp_path, today_ttl=60)
+    configure_disk_cache(None)
+
+
+class TestMakeCacheKey:
+    """Test cache key normalization."""
+
+    def test_case_insensitive_strings(self):
+        """Should map differently-cased arguments to the same key."""
+        key1 = make_cache_key("get_market_ohlcv", ("20240102",), {"market": "kospi"})
+        key2 = make_cache_key("get_market_ohlcv", ("20240102",), {"market": "KOSPI"})
+        assert key1 == key2
+
+    def test_kwargs_order_independent(self):
+        """Should ignore keyword argument order."""
+        key1 = make_cache_key("f", (), {"a": 1, "b": 2})
+        key2 = make_cache_key("f", (), {"b": 2, "a": 1})
+        assert key1 == key2
+
+    def test_different_functions(self):
+        """Should separate keys by function name."""
+        assert make_cache_key("f", (), {}) != make_cache_key("g", (), {})
+
+
+class TestComputeTTL:
+    """Test expiry policy."""
+
+    @patch("pykrx_mcp.utils.cache.today_kst", return_value="20240110")
+    def test_closed_range_never_expires(self, _):
+        """Should not expire ranges that ended before today."""
+        assert compute_ttl(("20240101", "20240109"), {}, 60) is None
+
+    @patch("pykrx_mcp.utils.cache.closing_settled", return_value=False)
+    @patch("pykrx_mcp.utils.cache.today_kst", return_value="20240110")
+    def test_range_touching_today(self, *_):
+        """Should use the short TTL when the range includes today."""
+        assert compute_ttl(("20240101", "20240110"), {}, 60) == 60
+
+    @patch("pykrx_mcp.utils.cache.closing_settled", return_value=True)
+    @patch("pykrx_mcp.utils.cache.today_kst", return_value="20240110")
+    def test_today_after_close_settles(self, *_):
+        """Should treat today as closed once its closing data has settled."""
+        assert compute_ttl(("20240110",), {"market": "ALL"}, 60) is None
+        assert compute_ttl(("20240101", "20240111"), {}, 60) == 60
+
+    @patch("pykrx_mcp.utils.cache.today_kst", return_value="20240110")
+    def test_no_dates(self, _):
+        """Should use the short TTL when the call has no date."""
+        assert compute_ttl(("005930",), {}, 60) == 60
+
+    @patch("pykrx_mcp.utils.cache.today_kst", return_value="20240110")
+    def test_adjusted_prices(self, _):
+        """Should expire adjusted prices even for closed ranges."""
+        ttl = compute_ttl((), {"fromdate": "20240101", "adjusted": True}, 60)
+        assert ttl == ADJUSTED_TTL
+
+
+class TestDiskCache:
+    """Test the on-disk store."""
+
+    def test_roundtrip_dataframe(self, tmp_path):
+        """Should persist and restore DataFrames."""
+        store = DiskCache(tmp_path)
+        df = pd.DataFrame({"종가": [70000, 71000]})
+        store.set("abcd", df)
+
+        pd.testing.assert_frame_equal(store.get("abcd"), df)
+
+    def test_missing_key(self, tmp_path):
+        """Should return None for unknown keys."""
+        assert DiskCache(tmp_path).get("ffff") is None
+
+    def test_expired_entry(self, tmp_path):
+        """Should drop entries whose TTL has passed."""
+        store = DiskCache(tmp_path)
+        store.set("abcd", [1, 2, 3], ttl=-1)
+
+        assert store.get("abcd") is None
+
+    def test_corrupted_entry(self, tmp_path):
+        """Should treat unreadable files as misses."""
+        store = DiskCache(tmp_path)
+        path = tmp_path / "ab" / "abcd.pkl"
+        path.parent.mkdir()
+        path.write_bytes(b"not a pickle")
+
+        assert store.get("abcd") is None
+        assert not path.exists()
+
+
+class TestCachedCall:
+    """Test the pykrx call wrapper."""
+
+    def test_disabled_passthrough(self):
+        """Should call pykrx directly when no cache is configured."""
+        configure_disk_cache(None)
+        module = MagicMock()
+        module.get_market_ohlcv.return_value = pd.DataFrame({"종가": [1]})
+
+        cached_call(module, "get_market_ohlcv", "20240102", market="KOSPI")
+        cached_call(module, "get_market_ohlcv", "20240102", market="KOSPI")
+
+        assert module.get_market_ohlcv.call_count == 2
+
+    def test_repeated_call_hits_cache(self, disk_cache):
+        """Should fetch from pykrx only once for identical calls."""
+        module = MagicMock()
+        module.get_market_ohlcv.return_value = pd.DataFrame({"종가": [1]})
+
+        first = cached_call(module, "get_market_ohlcv", "20240102", market="KOSPI")
+        second = cached_call(module, "get_market_ohlcv", "20240102", market="kospi")
+
+        module.get_market_ohlcv.assert_called_once_with("20240102", market="KOSPI")
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_empty_result_not_cached(self, disk_cache):
+        """Should not cache empty results."""
+        module = MagicMock()
+        module.get_market_ohlcv.return_value = pd.DataFrame()
+
+        cached_call(module, "get_market_ohlcv", "20240101")
+        cached_call(module, "get_market_ohlcv", "20240101")
+
+        assert module.get_market_ohlcv.call_count == 2
+
+    def test_configured_from_environment(self, tmp_path, monkeypatch):
+        """Should read the cache directory from PYKRX_MCP_CACHE_DIR."""
+        monkeypatch.setenv("PYKRX_MCP_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(cache, "_disk_cache", cache._UNSET)
+
+        try:
+            assert cache.get_disk_cache().directory == tmp_path
+        finally:
+            configure_disk_cache(None)
+
+
+class TestMemoryCache:
+    """Test the in-process LRU tier."""
+
+    def test_hit_and_miss_counters(self):
+        """Should count hits and misses."""
+        memory = MemoryCache(max_entries=10)
+        memory.set("a", {"x": 1}, size=10)
+
+        assert memory.get("a") == {"x": 1}
+        assert memory.get("b") is None
+        stats = memory.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self):
+        """Should evict the least recently used entry when full."""
+        memory = MemoryCache(max_entries=2)
+        memory.set("a", 1, size=1)
+        memory.set("b", 2, size=1)
+        memory.get("a")
+        memory.set("c", 3, size=1)
+
+        assert memory.get("b") is None
+        assert memory.get("a") == 1
+        assert memory.stats()["evictions"] == 1
+
+    def test_byte_bound(self):
+        """Should evict entries to stay under the byte limit."""
+        memory = MemoryCache(max_entries=10, max_bytes=100)
+        memory.set("a", 1, size=60)
+        memory.set("b", 2, size=60)
+
+        assert memory.get("a") is None
+        assert memory.stats()["bytes"] == 60
+
+    def test_oversized_value_skipped(self):
+        """Should not store values larger than the byte limit."""
+        memory = MemoryCache(max_entries=10, max_bytes=100)
+        memory.set("a", 1, size=200)
+
+        assert memory.stats()["entries"] == 0
+
+    def test_expired_entry(self):
+        """Should drop entries whose TTL has passed."""
+        memory = MemoryCache(max_entries=10)
+        memory.set("a", 1, size=1, ttl=-1)
+
+        assert memory.get("a") is None
+        assert memory.stats()["bytes"] == 0
+
+
+def ohlcv_snapshot(date: str, tickers=("005930", "000660")) -> pd.DataFrame:
+    """Build a full-market OHLCV snapshot; January 1 is a holiday (all zeros)."""
+    price = 0 if date == "20240101" else int(date[-2:]) * 100
+    return pd.DataFrame(
+        {
+            column: [price] * len(tickers)
+            for column in (
+                "시가",
+                "고가",
+                "저가",
+                "종가",
+                "거래량",
+                "거래대금",
+                "등락률",
+            )
+        },
+        index=pd.Index(list(tickers), name="티커"),
+    )
+
+
+@pytest.fixture
+def snapshot_slicing(monkeypatch):
+    """Enable snapshot slicing with an empty snapshot memory and calendar."""
+    monkeypatch.setenv("PYKRX_MCP_SNAPSHOT_MAX_DAYS", "31")
+    configure_disk_cache(None)
+    configure_trading_calendar(None)
+    cache._snapshot_memory.clear()
+    yield
+    cache._snapshot_memory.clear()
+    configure_trading_calendar(None)
+
+
+class TestSnapshotSlicing:
+    """Test rebuilding single-ticker ranges from daily snapshots."""
+
+    def test_tickers_share_snapshots(self, snapshot_slicing):
+        """Should fetch each day once, however many tickers are asked for."""
+        module = MagicMock()
+        module.get_market_ohlcv_by_ticker.side_effect = lambda date, market: (
+            ohlcv_snapshot(date)
+        )
+
+        for ticker in ("005930", "000660"):
+            df = cached_call(
+                module,
+                "get_market_ohlcv_by_date",
+                fromdate="20240101",
+                todate="20240105",
+                ticker=ticker,
+                adjusted=False,
+            )
+            # January 1 is a holiday (all zeros) and is skipped
+            assert list(df.index.strftime("%Y%m%d")) == [
+                "20240102",
+                "20240103",
+                "20240104",
+                "20240105",
+            ]
+            assert df.index.name == "날짜"
+
+        assert module.get_market_ohlcv_by_ticker.call_count == 5
+        module.get_market_ohlcv_by_date.assert_not_called()
+
+    def test_known_holidays_not_fetched(self, snapshot_slicing):
+        """Should skip snapshots of days the trading calendar knows are closed."""
+        module = MagicMock()
+        module.get_market_ohlcv_by_ticker.side_effect = lambda date, market: (
+            ohlcv_snapshot(date)
+        )
+        args = {"fromdate": "20240101", "todate": "20240105", "adjusted": False}
+
+        cached_call(module, "get_market_ohlcv_by_date", ticker="005930", **args)
+        cache._snapshot_memory.clear()
+        cached_call(module, "get_market_ohlcv_by_date", ticker="000660", **args)
+
+        # January 1 was learned as a holiday on the first call
+        assert module.get_market_ohlcv_by_ticker.call_count == 5 + 4
+
+    def test_adjusted_prices_fetched_directly(self, snapshot_slicing):
+        """Should not rebuild adjusted OHLCV from raw snapshots."""
+        module = MagicMock()
+        module.get_market_ohlcv_by_date.return_value = pd.DataFrame({"종가": [1]})
+
+        cached_call(
+            module,
+            "get_market_ohlcv_by_date",
+            fromdate="20240102",
+            todate="20240105",
+            ticker="005930",
+            adjusted=True,
+        )
+
+        module.get_market_ohlcv_by_ticker.assert_not_called()
+
+    def test_long_range_fetched_directly(self, snapshot_slicing):
+        """Should fetch ranges longer than the limit per ticker."""
+        module = MagicMock()
+        module.get_market_cap_by_date.return_value = pd.DataFrame({"시가총액": [1]})
+
+        cached_call(
+            module,
+            "get_market_cap_by_date",
+            fromdate="20240101",
+            todate="20240331",
+            ticker="005930",
+        )
+
+        module.get_market_cap_by_ticker.assert_not_called()
+
+    def test_unknown_ticker_falls_back(self, snapshot_slicing):
+        """Should fetch directly when the ticker is in no snapshot."""
+        module = MagicMock()
+        module.get_market_ohlcv_by_ticker.side_effect = lambda date, market: (
+            ohlcv_snapshot(date)
+        )
+        module.get_market_ohlcv_by_date.return_value = pd.DataFrame({"종가": [1]})
+
+        cached_call(
+            module,
+            "get_market_ohlcv_by_date",
+            fromdate="20240102",
+            todate="20240103",
+            ticker="069500",
+            adjusted=False,
+        )
+
+        module.get_market_ohlcv_by_date.assert_called_once()
+
+
+def daily_frame(fromdate, todate, ticker):
+    """Stand-in for a pykrx range function: one row per weekday."""
+    days = pd.bdate_range(fromdate, todate, name="날짜")
+    return pd.DataFrame({"종가": range(len(days))}, index=days)
+
+
+@pytest.fixture
+def range_module(monkeypatch):
+    """A module whose range calls are chunked by month."""
+    monkeypatch.setenv("PYKRX_MCP_RANGE_CHUNK_MONTHS", "1")
+    module = MagicMock()
+    module.get_shorting_status_by_date.side_effect = daily_frame
+    return module
+
+
+class TestSplitRange:
+    """Test calendar chunking of date ranges."""
+
+    def test_month_chunks(self):
+        """Should cover the range with whole, aligned months."""
+        assert split_range("20240115", "20240310", 1) == [
+            ("20240101", "20240131"),
+            ("20240201", "20240229"),
+            ("20240301", "20240331"),
+        ]
+
+    def test_chunks_aligned_to_grid(self):
+        """Should align multi-month chunks to the calendar, not the start."""
+        assert split_range("20231201", "20240301", 6) == [
+            ("20230701", "20231231"),
+            ("20240101", "20240630"),
+        ]
+
+
+class TestCachedRangeCall:
+    """Test chunked, parallel range fetching."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Should make a single call without PYKRX_MCP_RANGE_CHUNK_MONTHS."""
+        monkeypatch.delenv("PYKRX_MCP_RANGE_CHUNK_MONTHS", raising=False)
+        module = MagicMock()
+        module.get_shorting_status_by_date.side_effect = daily_frame
+
+        cached_range_call(
+            module, "get_shorting_status_by_date", "20200101", "20241231", ticker="A"
+        )
+
+        module.get_shorting_status_by_date.assert_called_once_with(
+            fromdate="20200101", todate="20241231", ticker="A"
+        )
+
+    def test_stitches_chunks(self, range_module):
+        """Should return exactly the requested days, fetched per month."""
+        configure_disk_cache(None)
+
+        df = cached_range_call(
+            range_module,
+            "get_shorting_status_by_date",
+            "20240115",
+            "20240310",
+            ticker="A",
+        )
+
+        expected = pd.bdate_range("20240115", "20240310")
+        assert list(df.index) == list(expected)
+        calls = range_module.get_shorting_status_by_date.call_args_list
+        # Without a disk cache the edge chunks are clipped to the range
+        assert sorted((c.kwargs["fromdate"], c.kwargs["todate"]) for c in calls) == [
+            ("20240115", "20240131"),
+            ("20240201", "20240229"),
+            ("20240301", "20240310"),
+        ]
+
+    def test_overlapping_query_fetches_delta(self, range_module, disk_cache):
+        """Should reuse cached chunks and fetch only the missing months."""
+        cached_range_call(
+            range_module,
+            "get_shorting_status_by_date",
+            "20230101",
+            "20230630",
+            ticker="A",
+        )
+        range_module.get_shorting_status_by_date.reset_mock()
+
+        df = cached_range_call(
+            range_module,
+            "get_shorting_status_by_date",
+            "20230401",
+            "20230831",
+            ticker="A",
+        )
+
+        fetched = sorted(
+            c.kwargs["fromdate"]
+            for c in range_module.get_shorting_status_by_date.call_args_list
+        )
+        assert fetched == ["20230701", "20230801"]
+        assert df.index[0] == pd.Timestamp("20230403")
+        assert df.index[-1] == pd.Timestamp("20230831")
+
+    def test_empty_interior_chunk_refetched(self, range_module):
+        """Should refetch a transiently empty chunk between filled ones."""
+        configure_disk_cache(None)
+        failures = iter([True])
+
+        def flaky(fromdate, todate, ticker):
+            if fromdate == "20240201" and next(failures, False):
+                return pd.DataFrame()
+            return daily_frame(fromdate, todate, ticker)
+
+        range_module.get_shorting_status_by_date.side_effect = flaky
+
+        df = cached_range_call(
+            range_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240331",
+            ticker="A",
+        )
+
+        assert list(df.index) == list(pd.bdate_range("20240101", "20240331"))
+        assert range_module.get_shorting_status_by_date.call_count == 4
+
+    def test_persistent_interior_hole_fails(self, range_module):
+        """Should fail rather than return a frame with a missing month."""
+        configure_disk_cache(None)
+        range_module.get_shorting_status_by_date.side_effect = (
+            lambda fromdate, todate, ticker: (
+                pd.DataFrame()
+                if fromdate == "20240201"
+                else daily_frame(fromdate, todate, ticker)
+            )
+        )
+
+        with pytest.raises(RuntimeError, match="20240201-20240229"):
+            cached_range_call(
+                range_module,
+                "get_shorting_status_by_date",
+                "20240101",
+                "20240331",
+                ticker="A",
+            )
+
+    def test_empty_edge_chunk_not_covered(self, range_module, disk_cache):
+        """Should refetch an empty edge chunk instead of caching its absence."""
+        func = range_module.get_shorting_status_by_date
+        func.side_effect = lambda fromdate, todate, ticker: (
+            pd.DataFrame()
+            if fromdate == "20230301"
+            else daily_frame(fromdate, todate, ticker)
+        )
+        cached_range_call(
+            range_module,
+            "get_shorting_status_by_date",
+            "20230101",
+            "20230331",
+            ticker="A",
+        )
+        func.reset_mock()
+        func.side_effect = daily_frame
+
+        df = cached_range_call(
+            range_module,
+            "get_shorting_status_by_date",
+            "20230101",
+            "20230331",
+            ticker="A",
+        )
+
+        assert fetched_ranges(func) == [("20230301", "20230331")]
+        assert df.index[-1] == pd.Timestamp("20230331")
+
+
+def fetched_ranges(mock_func):
+    return [
+        (c.kwargs["fromdate"], c.kwargs["todate"]) for c in mock_func.call_args_list
+    ]
+
+
+@pytest.fixture
+def series_module(monkeypatch):
+    """A range module with chunking off and an empty trading calendar."""
+    monkeypatch.delenv("PYKRX_MCP_RANGE_CHUNK_MONTHS", raising=False)
+    configure_trading_calendar(None)
+    module = MagicMock()
+    module.get_shorting_status_by_date.side_effect = daily_frame
+    yield module
+    configure_trading_calendar(None)
+
+
+class TestMissingIntervals:
+    """Test coverage gap computation."""
+
+    def test_extension(self):
+        """Should return only the uncovered tail."""
+        assert missing_intervals(
+            [("20240101", "20240630")], "20240101", "20240930"
+        ) == [("20240701", "20240930")]
+
+    def test_holes_and_edges(self):
+        """Should return every uncovered part, including the edges."""
+        covered = [("20240110", "20240115"), ("20240120", "20240125")]
+
+        assert missing_intervals(covered, "20240101", "20240131") == [
+            ("20240101", "20240109"),
+            ("20240116", "20240119"),
+            ("20240126", "20240131"),
+        ]
+
+    def test_fully_covered(self):
+        """Should return nothing inside a covered interval."""
+        assert (
+            missing_intervals([("20240101", "20241231")], "20240301", "20240331") == []
+        )
+
+
+class TestIntervalFill:
+    """Test gap-aware filling of range queries from the disk cache."""
+
+    def test_extended_range_fetches_only_new_days(self, series_module, disk_cache):
+        """Should fetch just the extension and merge it with cached rows."""
+        func = series_module.get_shorting_status_by_date
+        cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240630",
+            ticker="A",
+        )
+        func.reset_mock()
+
+        df = cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240930",
+            ticker="A",
+        )
+
+        assert fetched_ranges(func) == [("20240701", "20240930")]
+        assert list(df.index) == list(pd.bdate_range("20240101", "20240930"))
+
+    def test_covered_subrange_not_fetched(self, series_module, disk_cache):
+        """Should answer a range inside the coverage without fetching."""
+        func = series_module.get_shorting_status_by_date
+        cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240630",
+            ticker="A",
+        )
+        func.reset_mock()
+
+        df = cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240301",
+            "20240315",
+            ticker="A",
+        )
+
+        func.assert_not_called()
+        assert list(df.index) == list(pd.bdate_range("20240301", "20240315"))
+
+    def test_weekend_gap_not_fetched(self, series_module, disk_cache):
+        """Should not fetch gaps made only of weekend days."""
+        func = series_module.get_shorting_status_by_date
+        cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240105",
+            ticker="A",
+        )
+        func.reset_mock()
+
+        cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240107",
+            ticker="A",
+        )
+
+        func.assert_not_called()
+
+    def test_series_are_separate(self, series_module, disk_cache):
+        """Should keep one coverage per ticker."""
+        func = series_module.get_shorting_status_by_date
+        cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240131",
+            ticker="A",
+        )
+        cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240131",
+            ticker="B",
+        )
+
+        assert func.call_count == 2
+
+    def test_empty_interior_gap_refetches_whole_range(self, series_module, disk_cache):
+        """Should not answer with only the cached part when a hole is empty."""
+        func = series_module.get_shorting_status_by_date
+        for fromdate, todate in (("20240101", "20240331"), ("20240701", "20240930")):
+            cached_range_call(
+                series_module,
+                "get_shorting_status_by_date",
+                fromdate,
+                todate,
+                ticker="A",
+            )
+        func.reset_mock()
+        # The April-June fetch fails transiently, the retry succeeds
+        func.side_effect = [pd.DataFrame(), daily_frame("20240101", "20240930", "A")]
+
+        df = cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240930",
+            ticker="A",
+        )
+        func.side_effect = daily_frame
+        again = cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240930",
+            ticker="A",
+        )
+
+        assert fetched_ranges(func) == [
+            ("20240401", "20240630"),
+            ("20240101", "20240930"),
+        ]
+        assert list(df.index) == list(pd.bdate_range("20240101", "20240930"))
+        assert again.equals(df)
+
+    @patch("pykrx_mcp.utils.cache.closing_settled", return_value=False)
+    @patch("pykrx_mcp.utils.cache.today_kst", return_value="20261019")
+    def test_empty_days_from_today_cached_briefly(
+        self, _today, _settled, series_module, disk_cache
+    ):
+        """Should remember days not traded yet for the today TTL only."""
+        func = series_module.get_shorting_status_by_date
+        func.side_effect = lambda fromdate, todate, ticker: daily_frame(
+            fromdate, min(todate, "20261016"), ticker
+        )
+        cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20261001",
+            "20261031",
+            ticker="A",
+        )
+        # Once today's interval has expired, the empty days are fetched once
+        # and then remembered for the today TTL
+        with patch("pykrx_mcp.utils.cache.time.time", return_value=1e12):
+            for _ in range(3):
+                df = cached_range_call(
+                    series_module,
+                    "get_shorting_status_by_date",
+                    "20261001",
+                    "20261031",
+                    ticker="A",
+                )
+
+        assert df.index[-1] == pd.Timestamp("20261016")
+        assert fetched_ranges(func) == [
+            ("20261001", "20261031"),
+            ("20261019", "20261031"),
+        ]
+
+    def test_gaps_stored_once(self, series_module, disk_cache):
+        """Should keep fetched rows only in the series' interval entry."""
+        for todate in ("20240131", "20240229", "20240331"):
+            cached_range_call(
+                series_module,
+                "get_shorting_status_by_date",
+                "20240101",
+                todate,
+                ticker="A",
+            )
+
+        assert len(list(disk_cache.directory.glob("*/*.pkl"))) == 1
+
+    def test_lock_released_while_fetching(self, series_module, disk_cache):
+        """Should not make other series wait on a slow fetch."""
+        started, release = threading.Event(), threading.Event()
+
+        def slow_frame(fromdate, todate, ticker):
+            if ticker == "A":
+                started.set()
+                release.wait(5)
+            return daily_frame(fromdate, todate, ticker)
+
+        series_module.get_shorting_status_by_date.side_effect = slow_frame
+        # Every series shares one lock stripe
+        with patch.object(cache, "_SERIES_LOCKS", [threading.Lock()]):
+            slow = threading.Thread(
+                target=cached_range_call,
+                args=(series_module, "get_shorting_status_by_date"),
+                kwargs={"fromdate": "20240101", "todate": "20240131", "ticker": "A"},
+            )
+            slow.start()
+            assert started.wait(5)
+            try:
+                df = cached_range_call(
+                    series_module,
+                    "get_shorting_status_by_date",
+                    "20240101",
+                    "20240131",
+                    ticker="B",
+                )
+                assert slow.is_alive()
+            finally:
+                release.set()
+                slow.join(5)
+
+        assert len(df) == len(pd.bdate_range("20240101", "20240131"))
+
+    @patch("pykrx_mcp.utils.cache.closing_settled", return_value=False)
+    @patch("pykrx_mcp.utils.cache.today_kst")
+    def test_rolling_window_refetches_newest_days(
+        self, today, _, series_module, disk_cache
+    ):
+        """Should refetch only today's interval and the new day."""
+        func = series_module.get_shorting_status_by_date
+        today.return_value = "20240110"
+        cached_range_call(
+            series_module,
+            "get_shorting_status_by_date",
+            "20240101",
+            "20240110",
+            ticker="A",
+        )
+        func.reset_mock()
+
+        # A day later, yesterday's (then-today) interval has expired
+        today.return_value = "20240111"
+        with patch("pykrx_mcp.utils.cache.time.time", return_value=1e12):
+            cached_range_call(
+                series_module,
+                "get_shorting_status_by_date",
+                "20240101",
+                "20240111",
+                ticker="A",
+            )
+
+        assert fetched_ranges(func) == [("20240110", "20240111")]
@@ -0,0 +1,87 @@
+"""Tests for MCP tool decorators."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from pykrx_mcp.tools.stock_price import get_stock_ohlcv
+from pykrx_mcp.utils.cache import configure_memory_cache
+from pykrx_mcp.utils.decorators import mcp_tool_error_handler
+
+
+@pytest.fixture
+def memory_cache():
+    """Enable the tool response memory cache for one test."""
+    yield configure_memory_cache(max_entries=100)
+    configure_memory_cache(0)
+
+
+class TestMcpToolErrorHandler:
+    """Test error handling and memoization."""
+
+    def test_exception_converted_to_error(self):
+        """Should convert exceptions into error dicts."""
+
+        @mcp_tool_error_handler
+        def failing(ticker: str) -> dict:
+            raise ValueError("boom")
+
+        result = failing(ticker="005930")
+
+        assert result == {"error": "boom", "function": "failing", "ticker": "005930"}
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_memoizes_repeated_calls(self, mock_stock, memory_cache):
+        """Should skip pykrx for repeated identical calls."""
+        mock_stock.get_market_ohlcv_by_date.return_value = pd.DataFrame(
+            {"종가": [70000, 71000]}
+        )
+
+        first = get_stock_ohlcv("005930", "20240101", "20240105", True)
+        second = get_stock_ohlcv(
+            ticker="005930", start_date="20240101", end_date="20240105"
+        )
+
+        mock_stock.get_market_ohlcv_by_date.assert_called_once()
+        assert first == second
+        assert memory_cache.stats()["hits"] == 1
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_errors_not_memoized(self, mock_stock, memory_cache):
+        """Should not cache error responses."""
+        mock_stock.get_market_ohlcv_by_date.return_value = pd.DataFrame()
+
+        get_stock_ohlcv("005930", "20240101", "20240105")
+        get_stock_ohlcv("005930", "20240101", "20240105")
+
+        assert mock_stock.get_market_ohlcv_by_date.call_count == 2
+
+    def test_per_tool_ttl(self, memory_cache):
+        """Should honor a fixed per-tool TTL policy."""
+        calls = []
+
+        @mcp_tool_error_handler(cache_ttl=-1)
+        def tool(ticker: str) -> dict:
+            calls.append(ticker)
+            return {"ticker": ticker}
+
+        tool("005930")
+        tool("005930")
+
+        assert len(calls) == 2
+
+    def test_disabled_by_default(self):
+        """Should not memoize when the memory cache is disabled."""
+        configure_memory_cache(0)
+        calls = []
+
+        @mcp_tool_error_handler
+        def tool(ticker: str) -> dict:
+            calls.append(ticker)
+            return {"ticker": ticker}
+
+        tool("005930")
+        tool("005930")
+
+        assert len(calls) == 2
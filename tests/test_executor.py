@@ -0,0 +1,88 @@
+"""Tests for the bounded worker pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from pykrx_mcp.utils.executor import (
+    BoundedExecutor,
+    WorkerPoolSaturatedError,
+    run_tool,
+)
+from pykrx_mcp.utils.stats import tool_stats
+
+
+class TestBoundedExecutor:
+    """Test worker pool limits."""
+
+    def test_runs_function(self):
+        """Should return the function result."""
+        pool = BoundedExecutor(max_workers=2, max_queue=2)
+        try:
+            assert pool.submit(lambda x: x * 2, 21).result() == 42
+        finally:
+            pool.shutdown()
+
+    def test_rejects_when_saturated(self):
+        """Should raise once workers and queue are full."""
+        pool = BoundedExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+        try:
+            pool.submit(release.wait)
+            pool.submit(release.wait)
+
+            with pytest.raises(WorkerPoolSaturatedError):
+                pool.submit(release.wait)
+
+            assert pool.stats()["in_flight"] == 2
+            assert pool.stats()["queued"] == 1
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_slots_released_after_completion(self):
+        """Should accept new work after earlier tasks finish."""
+        pool = BoundedExecutor(max_workers=1, max_queue=0)
+        try:
+            pool.submit(lambda: None).result()
+            pool.submit(lambda: None).result()
+            assert pool.stats()["in_flight"] == 0
+        finally:
+            pool.shutdown()
+
+    def test_async_run(self):
+        """Should await results from the event loop."""
+        pool = BoundedExecutor(max_workers=2, max_queue=0)
+        try:
+            result = asyncio.run(pool.run(lambda a, b: a + b, 1, b=2))
+            assert result == 3
+        finally:
+            pool.shutdown()
+
+
+class TestRunTool:
+    """Test dispatching tools through the shared pool."""
+
+    def test_records_latency(self):
+        """Should record a latency sample for the tool."""
+        tool_stats.reset()
+
+        def get_something(ticker: str) -> dict:
+            return {"ticker": ticker}
+
+        result = asyncio.run(run_tool(get_something, "005930"))
+
+        assert result == {"ticker": "005930"}
+        assert tool_stats.snapshot()["get_something"]["count"] == 1
+
+    def test_error_response_counted(self):
+        """Should count error responses as errors."""
+        tool_stats.reset()
+
+        def get_failing() -> dict:
+            return {"error": "No data"}
+
+        asyncio.run(run_tool(get_failing))
+
+        assert tool_stats.snapshot()["get_failing"]["errors"] == 1
@@ -1,10 +1,13 @@
 """Tests for response formatters."""
 
 import pandas as pd
+import pytest
 
 from pykrx_mcp.utils.formatters import (
     format_dataframe_response,
+    format_dict_response,
     format_error_response,
+    iter_dataframe_chunks,
 )
 
 
@@ -57,6 +60,133 @@ class TestFormatDataFrameResponse:
         assert result["adjusted"] is True
         assert result["row_count"] == 1
 
+    def test_table_only(self):
+        """Should return table text without data records."""
+        df = pd.DataFrame({"Close": [70000]}, index=["2024-01-02"])
+        result = format_dataframe_response(df, "table")
+
+        assert "data" not in result
+        assert "2024-01-02" in result["table"]
+        assert result["row_count"] == 1
+
+    def test_both(self):
+        """Should return data records and table text."""
+        df = pd.DataFrame({"Close": [70000]})
+        result = format_dataframe_response(df, "both")
+
+        assert len(result["data"]) == 1
+        assert "table" in result
+
+    def test_env_default(self, monkeypatch):
+        """Should take the default format from PYKRX_MCP_RESPONSE_FORMAT."""
+        monkeypatch.setenv("PYKRX_MCP_RESPONSE_FORMAT", "table")
+        result = format_dataframe_response(pd.DataFrame({"Close": [1]}))
+
+        assert "data" not in result
+        assert "table" in result
+
+    def test_columns(self):
+        """Should return column-oriented data with ISO date index."""
+        df = pd.DataFrame(
+            {"시가": [70000, 71000], "종가": [70500, 71500]},
+            index=pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        )
+        result = format_dataframe_response(df, "columns", ticker="005930")
+
+        assert result["row_count"] == 2
+        assert "table" not in result
+        assert result["data"] == {
+            "columns": ["시가", "종가"],
+            "index": ["2024-01-02", "2024-01-03"],
+            "values": [[70000, 70500], [71000, 71500]],
+        }
+
+    def test_invalid_format(self):
+        """Should reject unknown formats."""
+        with pytest.raises(ValueError):
+            format_dataframe_response(pd.DataFrame({"Close": [1]}), "xml")
+
+
+class TestFormatDictResponse:
+    """Test index-keyed response formatting."""
+
+    def test_default_both(self):
+        """Should include data and table by default."""
+        df = pd.DataFrame({"종가": [70000]}, index=["005930"])
+        result = format_dict_response(df, market="KOSPI")
+
+        assert result["market"] == "KOSPI"
+        assert result["data"] == {"005930": {"종가": 70000}}
+        assert "005930" in result["table"]
+
+    def test_records_drops_table(self):
+        """Should omit the duplicated table text for records."""
+        df = pd.DataFrame({"종가": [70000]}, index=["005930"])
+        result = format_dict_response(df, "records")
+
+        assert "table" not in result
+        assert result["data"] == {"005930": {"종가": 70000}}
+
+    def test_columns(self):
+        """Should return column-oriented data keyed by string labels."""
+        df = pd.DataFrame({"종가": [70000, 150000]}, index=["005930", "000660"])
+        result = format_dict_response(df, "columns")
+
+        assert "table" not in result
+        assert result["data"] == {
+            "columns": ["종가"],
+            "index": ["005930", "000660"],
+            "values": [[70000], [150000]],
+        }
+
+    def test_table_drops_data(self):
+        """Should omit data for table."""
+        df = pd.DataFrame({"종가": [70000]}, index=["005930"])
+        result = format_dict_response(df, "table")
+
+        assert "data" not in result
+        assert "table" in result
+
+
+class TestIterDataFrameChunks:
+    """Test batched NDJSON/CSV encoding for streaming."""
+
+    @pytest.fixture
+    def frame(self):
+        return pd.DataFrame(
+            {"종가": [70000, 71000, 72000]},
+            index=pd.DatetimeIndex(
+                ["2024-01-02", "2024-01-03", "2024-01-04"], name="날짜"
+            ),
+        )
+
+    def test_ndjson_batches(self, frame):
+        """Should emit one JSON object per row, batch_rows rows per chunk."""
+        chunks = list(iter_dataframe_chunks(frame, "ndjson", 2, ticker="005930"))
+
+        assert len(chunks) == 2
+        assert chunks[0].splitlines()[0] == (
+            '{"ticker":"005930","날짜":"2024-01-02","종가":70000}'
+        )
+        assert chunks[1] == '{"ticker":"005930","날짜":"2024-01-04","종가":72000}\n'
+
+    def test_csv_single_header(self, frame):
+        """Should write the header only once, before the first chunk."""
+        text = "".join(iter_dataframe_chunks(frame, "csv", 2))
+
+        assert text.splitlines() == [
+            "날짜,종가",
+            "2024-01-02,70000",
+            "2024-01-03,71000",
+            "2024-01-04,72000",
+        ]
+
+    def test_csv_without_header(self, frame):
+        """Should omit the header when continuing an earlier stream."""
+        text = "".join(iter_dataframe_chunks(frame, "csv", header=False))
+
+        assert text.splitlines()[0] == "2024-01-02,70000"
+
 
 class TestFormatErrorResponse:
     """Test error response formatting."""
@@ -0,0 +1,81 @@
+"""Tests for server-side DataFrame selection."""
+
+import pandas as pd
+import pytest
+
+from pykrx_mcp.utils.frames import parse_predicate, select_frame
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {"종가": [100, 300, 200], "등락률": [1.5, -2.0, 3.0]},
+        index=pd.Index(["A", "B", "C"], name="티커"),
+    )
+
+
+class TestSelectFrame:
+    """Test sorting, limiting and projection."""
+
+    def test_noop(self, frame):
+        """Should return the frame untouched when nothing is requested."""
+        assert select_frame(frame) is frame
+
+    def test_sort_top_n_and_project(self, frame):
+        """Should sort descending, keep N rows and the requested columns."""
+        result = select_frame(frame, columns=["등락률"], sort_by="등락률", top_n=2)
+
+        assert list(result.index) == ["C", "A"]
+        assert list(result.columns) == ["등락률"]
+
+    def test_ascending(self, frame):
+        """Should sort ascending when asked."""
+        result = select_frame(frame, sort_by="종가", ascending=True)
+
+        assert list(result.index) == ["A", "C", "B"]
+
+    def test_tickers(self, frame):
+        """Should keep only the requested index labels."""
+        result = select_frame(frame, tickers=["C", "A", "Z"])
+
+        assert list(result.index) == ["A", "C"]
+
+    def test_where(self, frame):
+        """Should keep rows matching every predicate."""
+        result = select_frame(frame, where=["등락률 > 0", "종가 <= 150"])
+
+        assert list(result.index) == ["A"]
+
+    def test_filters_before_top_n(self, frame):
+        """Should apply filters before taking the top rows."""
+        result = select_frame(frame, where=["등락률 > 0"], sort_by="종가", top_n=1)
+
+        assert list(result.index) == ["C"]
+
+    def test_invalid_arguments(self, frame):
+        """Should reject unknown columns and non-positive top_n."""
+        with pytest.raises(ValueError, match="Unknown columns: 시가"):
+            select_frame(frame, columns=["시가"])
+        with pytest.raises(ValueError, match="sort_by"):
+            select_frame(frame, sort_by="PER")
+        with pytest.raises(ValueError, match="top_n"):
+            select_frame(frame, top_n=0)
+        with pytest.raises(ValueError, match="filter columns: PER"):
+            select_frame(frame, where=["PER < 10"])
+        with pytest.raises(ValueError, match="Cannot compare"):
+            select_frame(frame, where=["종가 > abc"])
+
+
+class TestParsePredicate:
+    """Test row filter parsing."""
+
+    def test_numbers_and_strings(self):
+        """Should parse numbers (with separators) and quoted strings."""
+        assert parse_predicate("거래량 >= 1,000,000") == ("거래량", ">=", 1000000.0)
+        assert parse_predicate("등락률<-2") == ("등락률", "<", -2.0)
+        assert parse_predicate("시장 == 'KOSPI'") == ("시장", "==", "KOSPI")
+
+    def test_invalid(self):
+        """Should reject expressions without a comparison."""
+        with pytest.raises(ValueError, match="Invalid filter"):
+            parse_predicate("등락률 top 5")
@@ -3,8 +3,14 @@
 from unittest.mock import patch
 
 import pandas as pd
+import pytest
 
-from pykrx_mcp.tools.fundamental import get_market_fundamental_by_date
+from pykrx_mcp.tools.fundamental import (
+    get_market_fundamental_by_date,
+    get_market_fundamental_by_ticker,
+)
+from pykrx_mcp.utils import cache
+from pykrx_mcp.utils.trading_calendar import configure_trading_calendar
 
 
 class TestGetMarketFundamentalByDate:
@@ -75,3 +81,86 @@ class TestGetMarketFundamentalByDate:
 
         assert "error" in result
         assert "Network error" in result["error"]
+
+
+class TestGetMarketFundamentalByTicker:
+    """Test whole-market fundamental retrieval."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        """Start from an empty snapshot memory and trading calendar."""
+        configure_trading_calendar(None)
+        cache._snapshot_memory.clear()
+        yield
+        cache._snapshot_memory.clear()
+        configure_trading_calendar(None)
+
+    @staticmethod
+    def _snapshot():
+        return pd.DataFrame(
+            {
+                "BPS": [50000, 100000, 20000],
+                "PER": [8.0, 15.0, 5.0],
+                "PBR": [0.9, 1.5, 0.5],
+                "EPS": [6000, 9000, 2000],
+                "DIV": [2.5, 1.0, 4.0],
+                "DPS": [1500, 1200, 400],
+            },
+            index=pd.Index(["005930", "000660", "035720"], name="티커"),
+        )
+
+    @patch("pykrx_mcp.tools.fundamental.stock")
+    def test_whole_market_in_one_call(self, mock_stock):
+        """Should return every ticker from a single upstream call."""
+        mock_stock.get_market_fundamental_by_ticker.return_value = self._snapshot()
+
+        result = get_market_fundamental_by_ticker("20240104", "KOSDAQ")
+
+        mock_stock.get_market_fundamental_by_ticker.assert_called_once_with(
+            "20240104", market="KOSDAQ"
+        )
+        assert result["market"] == "KOSDAQ"
+        assert result["total"] == result["count"] == 3
+        assert set(result["data"]) == {"005930", "000660", "035720"}
+
+    @patch("pykrx_mcp.tools.fundamental.stock")
+    def test_defaults_to_all_markets(self, mock_stock):
+        """Should query every market by default, like get_market_cap_by_ticker."""
+        mock_stock.get_market_fundamental_by_ticker.return_value = self._snapshot()
+
+        result = get_market_fundamental_by_ticker("20240104")
+
+        mock_stock.get_market_fundamental_by_ticker.assert_called_once_with(
+            "20240104", market="ALL"
+        )
+        assert result["market"] == "ALL"
+
+    @patch("pykrx_mcp.tools.fundamental.stock")
+    def test_projection_and_top_n(self, mock_stock):
+        """Should return only the requested columns of the top N rows."""
+        mock_stock.get_market_fundamental_by_ticker.return_value = self._snapshot()
+
+        result = get_market_fundamental_by_ticker(
+            "20240104", "KOSDAQ", columns=["DIV"], sort_by="DIV", top_n=2
+        )
+
+        assert result["data"] == {"035720": {"DIV": 4.0}, "005930": {"DIV": 2.5}}
+        assert result["total"] == 3
+        assert result["count"] == 2
+
+    @patch("pykrx_mcp.tools.fundamental.stock")
+    def test_unknown_column(self, mock_stock):
+        """Should reject columns the dataset does not have."""
+        mock_stock.get_market_fundamental_by_ticker.return_value = self._snapshot()
+
+        result = get_market_fundamental_by_ticker("20240104", "KOSDAQ", columns=["ROE"])
+
+        assert "Unknown columns: ROE" in result["error"]
+
+    @patch("pykrx_mcp.tools.fundamental.stock")
+    def test_invalid_market(self, mock_stock):
+        """Should reject unknown markets."""
+        result = get_market_fundamental_by_ticker("20240104", "NYSE")
+
+        mock_stock.get_market_fundamental_by_ticker.assert_not_called()
+        assert "Invalid market" in result["error"]
@@ -0,0 +1,131 @@
+"""Tests for the market-data ingestion command."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from pykrx_mcp.ingest import (  # noqa: E402
+    default_end_date,
+    ingest_range,
+    main,
+    plan_ranges,
+)
+from pykrx_mcp.utils.cache import KST  # noqa: E402
+from pykrx_mcp.utils.store import MarketStore  # noqa: E402
+
+
+def fake_stock(trading_days: list[str]) -> MagicMock:
+    """Build a pykrx stand-in with KOSPI-only fundamentals."""
+    module = MagicMock()
+    module.get_previous_business_days.side_effect = lambda fromdate, todate: [
+        pd.Timestamp(day) for day in trading_days if fromdate <= day <= todate
+    ]
+
+    def fundamental(date, market):
+        if market != "KOSPI":
+            return pd.DataFrame()
+        return pd.DataFrame(
+            {
+                "BPS": [1],
+                "PER": [10.0],
+                "PBR": [1.0],
+                "EPS": [1],
+                "DIV": [2.0],
+                "DPS": [1],
+            },
+            index=pd.Index(["005930"], name="티커"),
+        )
+
+    module.get_market_fundamental_by_ticker.side_effect = fundamental
+    return module
+
+
+class TestPlanRanges:
+    """Test backfill/append planning."""
+
+    def test_first_run_requires_start(self):
+        """Should refuse to guess a start date for an empty store."""
+        with pytest.raises(ValueError):
+            plan_ranges(None, None, "20240131")
+
+    def test_append_only_new_days(self):
+        """Should only ingest days after the current coverage."""
+        ranges = plan_ranges(("20240101", "20240115"), None, "20240131")
+
+        assert ranges == [("20240116", "20240131", False)]
+
+    def test_backfill_and_append(self):
+        """Should extend coverage in both directions."""
+        ranges = plan_ranges(("20240101", "20240115"), "20231201", "20240131")
+
+        assert ranges == [
+            ("20231201", "20231231", True),
+            ("20240116", "20240131", False),
+        ]
+
+    def test_up_to_date(self):
+        """Should do nothing when already covered."""
+        assert plan_ranges(("20240101", "20240131"), None, "20240131") == []
+
+
+class TestIngestRange:
+    """Test fetching and writing trading days."""
+
+    def test_writes_trading_days(self, tmp_path):
+        """Should store each trading day and extend coverage."""
+        store = MarketStore(tmp_path)
+        module = fake_stock(["20240102", "20240103", "20240201"])
+
+        written = ingest_range(store, "fundamental", "20240101", "20240210", module)
+
+        assert written == 3
+        assert store.coverage("fundamental") == ("20240101", "20240210")
+        df = store.read_ticker("fundamental", "005930", "20240101", "20240210")
+        assert len(df) == 3
+
+    def test_backfill_extends_backwards(self, tmp_path):
+        """Should ingest newest month first when backfilling."""
+        store = MarketStore(tmp_path)
+        store.extend_coverage("fundamental", "20240201", "20240210")
+        module = fake_stock(["20231228", "20240102"])
+
+        ingest_range(store, "fundamental", "20231201", "20240131", module, True)
+
+        assert store.coverage("fundamental") == ("20231201", "20240210")
+
+    def test_missing_day_stops_ingestion(self, tmp_path):
+        """Should not mark a day covered when pykrx returns nothing."""
+        store = MarketStore(tmp_path)
+        module = fake_stock(["20240102"])
+        module.get_market_fundamental_by_ticker.side_effect = None
+        module.get_market_fundamental_by_ticker.return_value = pd.DataFrame()
+
+        with pytest.raises(RuntimeError):
+            ingest_range(store, "fundamental", "20240101", "20240131", module)
+
+        assert store.coverage("fundamental") is None
+
+
+class TestMain:
+    """Test the command line entry point."""
+
+    def test_default_end_date(self):
+        """Should only include today after the market has settled."""
+        assert default_end_date(datetime(2024, 1, 5, 9, tzinfo=KST)) == "20240104"
+        assert default_end_date(datetime(2024, 1, 5, 19, tzinfo=KST)) == "20240105"
+
+    def test_requires_store(self, monkeypatch):
+        """Should exit with a usage error when no store is configured."""
+        monkeypatch.delenv("PYKRX_MCP_STORE_DIR", raising=False)
+
+        with pytest.raises(SystemExit):
+            main(["--start", "20240101"])
+
+    def test_unknown_dataset(self, tmp_path):
+        """Should reject unknown dataset names."""
+        with pytest.raises(SystemExit):
+            main(["--store", str(tmp_path), "--datasets", "bogus"])
@@ -3,8 +3,11 @@
 from unittest.mock import patch
 
 import pandas as pd
+import pytest
 
-from pykrx_mcp.tools.market_cap import get_market_cap_by_date
+from pykrx_mcp.tools.market_cap import get_market_cap_by_date, get_market_cap_by_ticker
+from pykrx_mcp.utils import cache
+from pykrx_mcp.utils.trading_calendar import configure_trading_calendar
 
 
 class TestGetMarketCapByDate:
@@ -79,3 +82,52 @@ class TestGetMarketCapByDate:
 
         assert "error" in result
         assert "Network error" in result["error"]
+
+
+class TestGetMarketCapByTicker:
+    """Test whole-market market cap retrieval."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        """Start from an empty snapshot memory and trading calendar."""
+        configure_trading_calendar(None)
+        cache._snapshot_memory.clear()
+        yield
+        cache._snapshot_memory.clear()
+        configure_trading_calendar(None)
+
+    @patch("pykrx_mcp.tools.market_cap.stock")
+    def test_top_n_from_shared_snapshot(self, mock_stock):
+        """Should serve market="ALL" from the shared full-market snapshot."""
+        mock_stock.get_market_cap_by_ticker.return_value = pd.DataFrame(
+            {
+                "종가": [70000, 140000, 40000],
+                "시가총액": [400e12, 100e12, 50e9],
+                "거래량": [1000, 2000, 3000],
+                "거래대금": [1e9, 2e9, 3e9],
+                "상장주식수": [5e9, 7e8, 1.25e6],
+            },
+            index=pd.Index(["005930", "000660", "035720"], name="티커"),
+        )
+
+        first = get_market_cap_by_ticker("20240103", columns=["시가총액"], top_n=2)
+        second = get_market_cap_by_ticker("20240103", sort_by="거래량", top_n=1)
+
+        mock_stock.get_market_cap_by_ticker.assert_called_once_with(
+            "20240103", market="ALL"
+        )
+        assert first["data"] == {
+            "005930": {"시가총액": 400e12},
+            "000660": {"시가총액": 100e12},
+        }
+        assert first["total"] == 3
+        assert list(second["data"]) == ["035720"]
+
+    @patch("pykrx_mcp.tools.market_cap.stock")
+    def test_no_data(self, mock_stock):
+        """Should report an empty market."""
+        mock_stock.get_market_cap_by_ticker.return_value = pd.DataFrame()
+
+        result = get_market_cap_by_ticker("20240103", "KONEX")
+
+        assert "No market cap data found" in result["error"]
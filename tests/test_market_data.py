@@ -1,5 +1,9 @@
 """Tests for market-wide data tools."""
 
+from unittest.mock import patch
+
+import pandas as pd
+
 from pykrx_mcp.tools.market_data import (
     get_market_ohlcv_by_date,
     get_market_price_change,
@@ -42,3 +46,67 @@ def test_get_market_price_change_invalid_date():
 
     assert "error" in result
     assert "Invalid date" in result["error"]
+
+
+@patch("pykrx_mcp.tools.market_data.stock")
+def test_get_market_ohlcv_selection(mock_stock):
+    """Test server-side filtering, sorting, top-N and column projection."""
+    mock_stock.get_market_ohlcv.return_value = pd.DataFrame(
+        {
+            "종가": [70000, 140000, 40000, 5000],
+            "거래량": [100, 200, 300, 400],
+            "등락률": [1.5, -2.0, 7.5, 4.0],
+        },
+        index=pd.Index(["005930", "000660", "035720", "091990"], name="티커"),
+    )
+
+    result = get_market_ohlcv_by_date(
+        "20240105",
+        "KOSDAQ",
+        "records",
+        columns=["종가", "등락률"],
+        where=["거래량 >= 150"],
+        sort_by="등락률",
+        top_n=2,
+    )
+
+    assert result["data"] == {
+        "035720": {"종가": 40000, "등락률": 7.5},
+        "091990": {"종가": 5000, "등락률": 4.0},
+    }
+    assert result["count"] == 2
+
+
+@patch("pykrx_mcp.tools.market_data.stock")
+def test_get_market_ohlcv_invalid_selection(mock_stock):
+    """Test that unknown selection columns are reported as errors."""
+    mock_stock.get_market_ohlcv.return_value = pd.DataFrame(
+        {"종가": [70000]}, index=pd.Index(["005930"], name="티커")
+    )
+
+    result = get_market_ohlcv_by_date("20240105", "KOSDAQ", columns=["PER"])
+
+    assert "Unknown columns: PER" in result["error"]
+
+
+@patch("pykrx_mcp.tools.market_data.stock")
+def test_get_market_ohlcv_pagination(mock_stock):
+    """Test that later pages are served without another upstream call."""
+    mock_stock.get_market_ohlcv.return_value = pd.DataFrame(
+        {"종가": [70000, 140000, 40000]},
+        index=pd.Index(["005930", "000660", "035720"], name="티커"),
+    )
+
+    first = get_market_ohlcv_by_date("20240105", "KOSDAQ", "records", page_size=2)
+    second = get_market_ohlcv_by_date(
+        "20240105", "KOSDAQ", "records", cursor=first["next_cursor"]
+    )
+
+    assert list(first["data"]) == ["005930", "000660"]
+    assert first["total_rows"] == 3
+    assert list(second["data"]) == ["035720"]
+    assert second["next_cursor"] is None
+    assert mock_stock.get_market_ohlcv.call_count == 1
+
+    other = get_market_ohlcv_by_date("20240105", "KOSPI", cursor=first["next_cursor"])
+    assert "does not belong" in other["error"]
@@ -0,0 +1,134 @@
+"""Tests for Prometheus metrics."""
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from pykrx_mcp.utils import cache
+from pykrx_mcp.utils.cache import cached_call, configure_disk_cache
+from pykrx_mcp.utils.decorators import mcp_tool_error_handler
+from pykrx_mcp.utils.metrics import Histogram, registry, render_metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Start every test with empty metrics."""
+    registry.reset()
+    yield
+    registry.reset()
+
+
+class TestHistogram:
+    """Test histogram bucketing."""
+
+    def test_cumulative_buckets(self):
+        """Should render cumulative bucket counts, sum and count."""
+        histogram = Histogram("latency_seconds", "help", (0.1, 1))
+        for value in (0.05, 0.5, 5):
+            histogram.observe(value, tool="t")
+
+        samples = {
+            (name, dict(labels).get("le")): value
+            for name, labels, value in histogram.samples()
+        }
+
+        assert samples[("latency_seconds_bucket", "0.1")] == 1
+        assert samples[("latency_seconds_bucket", "1.0")] == 2
+        assert samples[("latency_seconds_bucket", "+Inf")] == 3
+        assert samples[("latency_seconds_sum", None)] == 5.55
+        assert samples[("latency_seconds_count", None)] == 3
+
+
+class TestRenderMetrics:
+    """Test metric collection and exposition."""
+
+    def test_tool_metrics(self):
+        """Should count tool calls by status and record latency and size."""
+
+        @mcp_tool_error_handler
+        def sample_tool(fail: bool = False) -> dict:
+            if fail:
+                raise ValueError("boom")
+            return {"data": [1, 2, 3]}
+
+        sample_tool()
+        sample_tool(fail=True)
+
+        text = render_metrics()
+
+        assert 'pykrx_mcp_tool_requests_total{status="ok",tool="sample_tool"} 1' in text
+        assert (
+            'pykrx_mcp_tool_requests_total{status="error",tool="sample_tool"} 1' in text
+        )
+        assert 'pykrx_mcp_tool_latency_seconds_count{tool="sample_tool"} 2' in text
+        assert 'pykrx_mcp_tool_response_bytes_count{tool="sample_tool"} 1' in text
+        assert 'pykrx_mcp_tool_in_flight{tool="sample_tool"} 0' in text
+
+    def test_response_size_sampled(self, monkeypatch):
+        """Should measure only sampled responses without the memory cache."""
+        monkeypatch.setenv("PYKRX_MCP_METRICS_SIZE_SAMPLE", "3")
+
+        @mcp_tool_error_handler
+        def sample_tool(n: int) -> dict:
+            return {"data": [n]}
+
+        for n in range(6):
+            sample_tool(n)
+
+        text = render_metrics()
+
+        assert 'pykrx_mcp_tool_requests_total{status="ok",tool="sample_tool"} 6' in text
+        assert 'pykrx_mcp_tool_response_bytes_count{tool="sample_tool"} 2' in text
+
+    def test_upstream_and_disk_cache_metrics(self, tmp_path):
+        """Should time upstream calls and count disk cache hits and misses."""
+        calls = []
+
+        def get_market_ohlcv(date, market="KOSPI"):
+            calls.append(date)
+            return pd.DataFrame({"종가": [1]})
+
+        module = SimpleNamespace(get_market_ohlcv=get_market_ohlcv)
+        configure_disk_cache(tmp_path)
+        try:
+            cached_call(module, "get_market_ohlcv", "20240102")
+            cached_call(module, "get_market_ohlcv", "20240102")
+            text = render_metrics()
+        finally:
+            configure_disk_cache(None)
+            cache._snapshot_memory.clear()
+
+        assert len(calls) == 1
+        assert (
+            'pykrx_mcp_upstream_latency_seconds_count{function="get_market_ohlcv"} 1'
+            in text
+        )
+        assert 'pykrx_mcp_cache_hits_total{cache="disk"} 1' in text
+        assert 'pykrx_mcp_cache_misses_total{cache="disk"} 1' in text
+
+    def test_upstream_errors(self):
+        """Should count upstream calls that raise."""
+
+        def get_market_ohlcv(date, market="KOSPI"):
+            raise ConnectionError("KRX unavailable")
+
+        module = SimpleNamespace(get_market_ohlcv=get_market_ohlcv)
+        with pytest.raises(ConnectionError):
+            cached_call(module, "get_market_ohlcv", "20240102")
+
+        text = render_metrics()
+
+        assert 'pykrx_mcp_upstream_errors_total{function="get_market_ohlcv"} 1' in text
+
+    def test_rest_endpoint(self):
+        """Should serve the text exposition format at /metrics."""
+        from pykrx_mcp.rest_api import app
+
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE pykrx_mcp_tool_latency_seconds histogram" in response.text
+        assert "pykrx_mcp_worker_pool_max_workers" in response.text
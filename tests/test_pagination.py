@@ -0,0 +1,107 @@
+"""Tests for cursor pagination of full-market responses."""
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from pykrx_mcp.utils import pagination
+from pykrx_mcp.utils.pagination import Pager, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {"종가": [100, 200, 300, 400, 500]},
+        index=pd.Index(["A", "B", "C", "D", "E"], name="티커"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_page_frames():
+    pagination._page_frames.clear()
+    yield
+    pagination._page_frames.clear()
+
+
+def walk(frame, page_size, **query):
+    """Fetch every page of a query, returning (pages, fetch mock)."""
+    fetch = MagicMock(return_value=frame)
+    pages, cursor = [], None
+    while True:
+        pager = Pager("tool", page_size, cursor, **query)
+        page, meta = pager.page(pager.load(fetch))
+        pages.append(list(page.index))
+        cursor = meta["next_cursor"]
+        if cursor is None:
+            return pages, fetch
+
+
+class TestCursor:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        """Should decode what it encodes."""
+        assert decode_cursor(encode_cursor("abc", 40, 20)) == ("abc", 40, 20)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "eyJxIjogMX0"])
+    def test_invalid(self, cursor):
+        """Should reject malformed cursors."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
+
+
+class TestPager:
+    """Test paging over a memoized frame."""
+
+    def test_inactive(self, frame):
+        """Should return the whole frame without pagination arguments."""
+        pager = Pager("tool", None, None, date="20240105")
+        page, meta = pager.page(pager.load(lambda: frame))
+
+        assert page is frame
+        assert meta == {}
+
+    def test_walks_all_pages_with_one_fetch(self, frame):
+        """Should cut stable pages from a single fetch."""
+        pages, fetch = walk(frame, 2, date="20240105")
+
+        assert pages == [["A", "B"], ["C", "D"], ["E"]]
+        fetch.assert_called_once()
+
+    def test_metadata(self, frame):
+        """Should report the position and the next cursor."""
+        pager = Pager("tool", 2, None, date="20240105")
+        _, meta = pager.page(pager.load(lambda: frame))
+
+        assert meta["offset"] == 0
+        assert meta["page_size"] == 2
+        assert meta["total_rows"] == 5
+        assert decode_cursor(meta["next_cursor"])[1:] == (2, 2)
+
+    def test_refetches_after_expiry(self, frame):
+        """Should fall back to fetching when the memoized frame is gone."""
+        pager = Pager("tool", 2, None, date="20240105")
+        _, meta = pager.page(pager.load(lambda: frame))
+        pagination._page_frames.clear()
+
+        fetch = MagicMock(return_value=frame)
+        pager = Pager("tool", None, meta["next_cursor"], date="20240105")
+        page, _ = pager.page(pager.load(fetch))
+
+        assert list(page.index) == ["C", "D"]
+        fetch.assert_called_once()
+
+    def test_cursor_bound_to_query(self, frame):
+        """Should reject a cursor replayed with different arguments."""
+        pager = Pager("tool", 2, None, date="20240105")
+        _, meta = pager.page(pager.load(lambda: frame))
+
+        with pytest.raises(ValueError, match="does not belong"):
+            Pager("tool", 2, meta["next_cursor"], date="20240108")
+
+    @pytest.mark.parametrize("page_size", [0, pagination.MAX_PAGE_SIZE + 1])
+    def test_page_size_bounds(self, page_size):
+        """Should reject page sizes outside 1-1000."""
+        with pytest.raises(ValueError, match="page_size"):
+            Pager("tool", page_size, None)
@@ -0,0 +1,165 @@
+"""Tests for the scheduled end-of-day refresh."""
+
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from pykrx_mcp.refresh import (
+    INVESTORS,
+    MARKETS,
+    OHLCV_MARKETS,
+    SNAPSHOT_DATASETS,
+    RefreshScheduler,
+    next_run_time,
+    parse_refresh_time,
+    refresh_day,
+    start_refresh_scheduler,
+)
+from pykrx_mcp.utils import cache
+from pykrx_mcp.utils.trading_calendar import configure_trading_calendar
+from pykrx_mcp.warmup import KST
+
+
+@pytest.fixture
+def fake_tools():
+    fake = MagicMock()
+    for name in (
+        "get_market_ohlcv_by_date",
+        "get_shorting_volume_by_ticker",
+        "get_shorting_balance_top50",
+        "get_shorting_volume_top50",
+        "get_market_trading_volume_by_investor",
+        "get_market_trading_value_by_investor",
+        "get_market_net_purchases_of_equities",
+    ):
+        getattr(fake, name).return_value = {"row_count": 1}
+    with (
+        patch("pykrx_mcp.refresh.tools", fake),
+        patch("pykrx_mcp.utils.cache.fetch_snapshot") as fetch_snapshot,
+        patch("pykrx_mcp.refresh.refresh_store", return_value=0),
+        patch("pykrx_mcp.utils.ticker_master.get_ticker_master"),
+    ):
+        fake.fetch_snapshot = fetch_snapshot
+        yield fake
+
+
+class TestSchedule:
+    """Test refresh time handling."""
+
+    def test_parse_refresh_time(self):
+        """Should parse HH:MM and reject invalid times."""
+        assert parse_refresh_time("18:30") == (18, 30)
+        with pytest.raises(ValueError):
+            parse_refresh_time("25:00")
+        with pytest.raises(ValueError):
+            parse_refresh_time("evening")
+
+    def test_next_run_later_today(self):
+        """Should schedule today when the refresh time is still ahead."""
+        now = datetime(2024, 1, 5, 10, 0, tzinfo=KST)
+        assert next_run_time(now, (18, 30)) == datetime(2024, 1, 5, 18, 30, tzinfo=KST)
+
+    def test_next_run_tomorrow(self):
+        """Should schedule tomorrow once today's refresh time has passed."""
+        now = datetime(2024, 1, 5, 18, 30, tzinfo=KST)
+        assert next_run_time(now, (18, 30)) == datetime(2024, 1, 6, 18, 30, tzinfo=KST)
+
+
+class TestRefreshDay:
+    """Test the end-of-day fetch sequence."""
+
+    def test_fetches_market_shorting_and_investor_data(self, fake_tools):
+        """Should call the market-wide tools for the trading day."""
+        errors = refresh_day("20240105", MagicMock())
+
+        assert errors == []
+        assert fake_tools.fetch_snapshot.call_count == len(SNAPSHOT_DATASETS)
+        assert fake_tools.get_market_ohlcv_by_date.call_count == len(OHLCV_MARKETS)
+        fake_tools.get_shorting_volume_by_ticker.assert_any_call("20240105", "KOSPI")
+        fake_tools.get_market_trading_value_by_investor.assert_any_call(
+            "20240105", "20240105", "KOSDAQ"
+        )
+        assert fake_tools.get_market_net_purchases_of_equities.call_count == len(
+            MARKETS
+        ) * len(INVESTORS)
+
+    def test_collects_errors(self, fake_tools):
+        """Should keep going and report failing steps."""
+        fake_tools.get_shorting_balance_top50.return_value = {"error": "No data"}
+        fake_tools.get_market_ohlcv_by_date.side_effect = RuntimeError("KRX down")
+
+        errors = refresh_day("20240105", MagicMock())
+
+        assert len(errors) == len(OHLCV_MARKETS) + len(MARKETS)
+        assert fake_tools.get_market_net_purchases_of_equities.called
+
+
+class TestRefreshedDayCaching:
+    """Test that an evening refresh outlives the night."""
+
+    @pytest.fixture
+    def disk_cache(self, tmp_path):
+        yield cache.configure_disk_cache(tmp_path)
+        cache.configure_disk_cache(None)
+        cache._snapshot_memory.clear()
+        configure_trading_calendar(None)
+
+    def test_refreshed_day_hits_next_morning(self, disk_cache):
+        """Should serve the refreshed snapshot from cache the next morning."""
+        stock = MagicMock()
+        stock.get_market_ohlcv_by_ticker.return_value = pd.DataFrame(
+            {"종가": [70000]}, index=pd.Index(["005930"], name="티커")
+        )
+
+        # 18:30 on the trading day
+        with (
+            patch("pykrx_mcp.utils.cache.today_kst", return_value="20240105"),
+            patch("pykrx_mcp.utils.cache.closing_settled", return_value=True),
+        ):
+            cache.fetch_snapshot(stock, "ohlcv", "20240105")
+
+        # 09:00 the next morning, 14.5 hours later
+        later = 14.5 * 3600
+        with (
+            patch("pykrx_mcp.utils.cache.today_kst", return_value="20240106"),
+            patch("pykrx_mcp.utils.cache.closing_settled", return_value=False),
+            patch("time.time", return_value=time.time() + later),
+            patch("time.monotonic", return_value=time.monotonic() + later),
+        ):
+            cache.fetch_snapshot(stock, "ohlcv", "20240105")
+            cache._snapshot_memory.clear()
+            cache.fetch_snapshot(stock, "ohlcv", "20240105")
+
+        stock.get_market_ohlcv_by_ticker.assert_called_once()
+
+
+class TestRefreshScheduler:
+    """Test once-per-trading-day behaviour."""
+
+    def test_skips_already_refreshed_day(self):
+        """Should refresh each trading day only once."""
+        stock = MagicMock()
+        stock.get_nearest_business_day_in_a_week.return_value = "20240105"
+        scheduler = RefreshScheduler((18, 30), module=stock)
+        now = datetime(2024, 1, 6, 18, 30, tzinfo=KST)
+
+        with patch("pykrx_mcp.refresh.refresh_day", return_value=[]) as mock_refresh:
+            assert scheduler.run_once(now) == "20240105"
+            # Saturday's latest trading day is still Friday
+            assert scheduler.run_once(now) is None
+
+        mock_refresh.assert_called_once_with("20240105", stock)
+
+    def test_disabled_by_default(self):
+        """Should not start without PYKRX_MCP_REFRESH."""
+        with patch.dict("os.environ", {}, clear=True):
+            assert start_refresh_scheduler() is None
+
+    def test_invalid_time_disables(self):
+        """Should not start with an invalid refresh time."""
+        env = {"PYKRX_MCP_REFRESH": "1", "PYKRX_MCP_REFRESH_TIME": "6pm"}
+        with patch.dict("os.environ", env, clear=True):
+            assert start_refresh_scheduler() is None
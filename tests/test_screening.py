@@ -0,0 +1,131 @@
+"""Tests for the server-side stock screening tool."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from pykrx_mcp.tools.screening import screen_stocks
+from pykrx_mcp.utils import cache
+from pykrx_mcp.utils.trading_calendar import configure_trading_calendar
+
+FUNDAMENTAL = pd.DataFrame(
+    {
+        "BPS": [50000, 100000, 20000, 8000],
+        "PER": [8.0, 15.0, 5.0, 0.0],
+        "PBR": [0.9, 1.5, 0.5, 0.7],
+        "EPS": [6000, 9000, 2000, -500],
+        "DIV": [2.5, 1.0, 4.0, 0.0],
+        "DPS": [1500, 1200, 400, 0],
+    },
+    index=pd.Index(["005930", "000660", "035720", "091990"], name="티커"),
+)
+
+MARKET_CAP = pd.DataFrame(
+    {
+        "종가": [70000, 140000, 40000, 5000],
+        "시가총액": [400e12, 100e12, 50e9, 30e9],
+        "거래량": [1000, 2000, 3000, 4000],
+        "거래대금": [1e9, 2e9, 3e9, 4e9],
+        "상장주식수": [5e9, 7e8, 1.25e6, 6e6],
+    },
+    index=pd.Index(["005930", "000660", "035720", "091990"], name="티커"),
+)
+
+
+@pytest.fixture
+def mock_stock():
+    """Full-market snapshots with an empty snapshot memory and calendar."""
+    configure_trading_calendar(None)
+    cache._snapshot_memory.clear()
+    with patch("pykrx_mcp.tools.screening.stock") as mock_stock:
+        mock_stock.get_market_fundamental_by_ticker.return_value = FUNDAMENTAL
+        mock_stock.get_market_cap_by_ticker.return_value = MARKET_CAP
+        mock_stock.get_market_ticker_list.return_value = ["005930", "000660"]
+        mock_stock.get_market_ticker_name.side_effect = lambda t: f"name-{t}"
+        yield mock_stock
+    cache._snapshot_memory.clear()
+    configure_trading_calendar(None)
+
+
+class TestScreenStocks:
+    """Test filtering and sorting over the full-market snapshots."""
+
+    def test_filters_and_sorts(self, mock_stock):
+        """Should return only the matching stocks, sorted by PER."""
+        result = screen_stocks("20240105", "ALL", max_per=10, max_pbr=1)
+
+        assert list(result["data"]) == ["035720", "005930"]
+        assert result["matched"] == 2
+        assert result["count"] == 2
+        assert result["data"]["035720"]["종목명"] == "name-035720"
+        assert result["data"]["005930"]["시가총액"] == 400e12
+        mock_stock.get_market_fundamental_by_ticker.assert_called_once_with(
+            "20240105", market="ALL"
+        )
+
+    def test_names_cached_without_master(self, mock_stock, tmp_path):
+        """Should look up names through the cache when no master is loaded."""
+        cache.configure_disk_cache(tmp_path)
+        try:
+            screen_stocks("20240105", "ALL", max_per=10, max_pbr=1)
+            screen_stocks("20240105", "ALL", max_per=10, max_pbr=1)
+        finally:
+            cache.configure_disk_cache(None)
+
+        assert mock_stock.get_market_ticker_name.call_count == 2
+
+    def test_exclude_loss(self, mock_stock):
+        """Should drop stocks with non-positive PER/EPS unless asked not to."""
+        assert "091990" not in screen_stocks("20240105", "ALL")["data"]
+
+        result = screen_stocks("20240105", "ALL", exclude_loss=False)
+        assert "091990" in result["data"]
+
+    def test_market_cap_in_eok(self, mock_stock):
+        """Should compare market caps in 억원."""
+        result = screen_stocks("20240105", "ALL", min_market_cap=1000)
+
+        assert set(result["data"]) == {"005930", "000660"}
+
+    def test_market_filter(self, mock_stock):
+        """Should restrict the screen to the market's ticker list."""
+        result = screen_stocks("20240105", "KOSPI", sort_by="MarketCap")
+
+        assert result["market"] == "KOSPI"
+        assert result["sort_by"] == "시가총액"
+        assert list(result["data"]) == ["000660", "005930"]
+
+    def test_limit_and_descending(self, mock_stock):
+        """Should return the top rows of the sorted matches."""
+        result = screen_stocks(
+            "20240105", "ALL", sort_by="DIV", ascending=False, limit=1
+        )
+
+        assert list(result["data"]) == ["035720"]
+        assert result["matched"] == 3
+        assert result["count"] == 1
+
+    def test_snapshots_are_shared(self, mock_stock):
+        """Should answer repeated screens from the cached snapshots."""
+        screen_stocks("20240105", "ALL", max_per=10)
+        screen_stocks("20240105", "ALL", max_pbr=1, sort_by="PBR")
+
+        assert mock_stock.get_market_fundamental_by_ticker.call_count == 1
+        assert mock_stock.get_market_cap_by_ticker.call_count == 1
+
+    def test_invalid_arguments(self, mock_stock):
+        """Should reject invalid markets, sort columns and limits."""
+        assert "Invalid market" in screen_stocks("20240105", "NYSE")["error"]
+        assert "Invalid sort_by" in screen_stocks("20240105", sort_by="ROE")["error"]
+        assert "limit" in screen_stocks("20240105", limit=0)["error"]
+        assert "YYYYMMDD" in screen_stocks("2024-01-05")["error"]
+        mock_stock.get_market_fundamental_by_ticker.assert_not_called()
+
+    def test_no_data(self, mock_stock):
+        """Should report an error when the snapshots are empty."""
+        mock_stock.get_market_fundamental_by_ticker.return_value = pd.DataFrame()
+
+        result = screen_stocks("20240105", "ALL")
+
+        assert "No data" in result["error"]
@@ -0,0 +1,123 @@
+"""Tests for request coalescing."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from pykrx_mcp.utils.cache import cached_call
+from pykrx_mcp.utils.singleflight import SingleFlight
+
+
+def _run_concurrently(target, count: int) -> list:
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(target())) for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent calls."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Should run the function once for concurrent identical keys."""
+        flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            return "result"
+
+        results = _run_concurrently(lambda: flight.do("key", fetch), 5)
+
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert flight.coalesced == 4
+
+    def test_sequential_calls_execute_again(self):
+        """Should not reuse results once the call has finished."""
+        flight = SingleFlight()
+        calls = []
+
+        flight.do("key", lambda: calls.append(1))
+        flight.do("key", lambda: calls.append(1))
+
+        assert len(calls) == 2
+        assert flight.in_flight() == 0
+
+    def test_error_propagates_to_waiters(self):
+        """Should raise the leader's exception in every caller."""
+        flight = SingleFlight()
+        errors = []
+
+        def fetch():
+            time.sleep(0.2)
+            raise ValueError("Network error")
+
+        def call():
+            try:
+                flight.do("key", fetch)
+            except ValueError as e:
+                errors.append(str(e))
+
+        _run_concurrently(call, 3)
+
+        assert errors == ["Network error"] * 3
+        with pytest.raises(ValueError):
+            flight.do("key", fetch)
+
+
+class TestCachedCallCoalescing:
+    """Test coalescing at the pykrx call sites."""
+
+    def test_normalized_arguments_collapse(self):
+        """Should share one upstream fetch for "kospi" and "KOSPI"."""
+        module = MagicMock()
+
+        def slow_fetch(date, market):
+            time.sleep(0.2)
+            return pd.DataFrame({"종가": [1]})
+
+        module.get_market_ohlcv.side_effect = slow_fetch
+        markets = iter(["kospi", "KOSPI", "Kospi"])
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                market = next(markets)
+            return cached_call(module, "get_market_ohlcv", "20240102", market=market)
+
+        results = _run_concurrently(call, 3)
+
+        assert module.get_market_ohlcv.call_count == 1
+        assert len(results) == 3
+
+    def test_shared_frame_is_safe_to_read_concurrently(self):
+        """Should hand coalesced callers a frame whose index is already built."""
+        module = MagicMock()
+        dates = pd.bdate_range("2019-01-01", periods=1500, name="날짜")
+
+        def slow_fetch(fromdate, todate, ticker):
+            time.sleep(0.1)
+            return pd.DataFrame({"종가": range(len(dates))}, index=dates)
+
+        module.get_market_ohlcv_by_date.side_effect = slow_fetch
+
+        def call():
+            df = cached_call(
+                module, "get_market_ohlcv_by_date", "20190101", "20241231", "005930"
+            )
+            return len(df.to_dict(orient="index"))
+
+        results = _run_concurrently(call, 8)
+
+        assert module.get_market_ohlcv_by_date.call_count == 1
+        assert results == [len(dates)] * 8
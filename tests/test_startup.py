@@ -0,0 +1,67 @@
+"""Tests for lazy tool loading and server start-up imports."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pykrx_mcp import tools
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+class TestServerStartup:
+    """Test that importing the server stays cheap."""
+
+    def test_server_import_does_not_load_pykrx_or_pandas(self):
+        """Should register the server without importing pykrx or pandas."""
+        code = (
+            "import sys, pykrx_mcp.server as s;"
+            "print(len(s.mcp._tool_manager.list_tools()));"
+            "print(sorted(m for m in ('pykrx', 'pandas') if m in sys.modules))"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={"PYTHONPATH": str(SRC_DIR)},
+            check=True,
+        )
+        tool_count, loaded = proc.stdout.split("\n")[:2]
+        assert int(tool_count) == len(tools._TOOL_MODULES)
+        assert loaded == "[]"
+
+
+class TestLazyTools:
+    """Test on-demand tool resolution."""
+
+    def test_attribute_access_resolves_tool(self):
+        """Should import the defining module on attribute access."""
+        from pykrx_mcp.tools.stock_price import get_stock_ohlcv
+
+        assert tools.get_stock_ohlcv is get_stock_ohlcv
+
+    def test_unknown_tool(self):
+        """Should raise AttributeError for unknown names."""
+        with pytest.raises(AttributeError):
+            tools.get_nothing  # noqa: B018
+        with pytest.raises(AttributeError):
+            tools.lazy_tool("get_nothing")
+
+    @patch("pykrx_mcp.tools.ticker_info.stock")
+    def test_lazy_tool_calls_implementation(self, mock_stock):
+        """Should keep the tool name and forward calls."""
+        mock_stock.get_market_ticker_name.return_value = "삼성전자"
+
+        func = tools.lazy_tool("get_market_ticker_name")
+        result = func("005930")
+
+        assert func.__name__ == "get_market_ticker_name"
+        assert result["name"] == "삼성전자"
+
+    def test_every_exported_tool_resolves(self):
+        """Should map every exported tool to its module."""
+        for name in tools._TOOL_MODULES:
+            assert callable(getattr(tools, name))
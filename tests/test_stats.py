@@ -0,0 +1,52 @@
+"""Tests for per-tool latency statistics."""
+
+from pykrx_mcp.utils.stats import ToolLatencyStats
+
+
+class TestToolLatencyStats:
+    """Test latency recording and summaries."""
+
+    def test_snapshot_summary(self):
+        """Should summarize counts and latency percentiles per tool."""
+        stats = ToolLatencyStats()
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            stats.record("get_stock_ohlcv", latency, wait=0.01)
+
+        summary = stats.snapshot()["get_stock_ohlcv"]
+
+        assert summary["count"] == 4
+        assert summary["max_ms"] == 400.0
+        assert summary["mean_ms"] == 250.0
+        assert summary["p50_ms"] in (200.0, 300.0)
+        assert summary["wait_mean_ms"] == 10.0
+
+    def test_errors_and_rejections(self):
+        """Should count failed and rejected calls separately."""
+        stats = ToolLatencyStats()
+        stats.record("get_stock_ohlcv", 0.1, error=True)
+        stats.record_rejected("get_stock_ohlcv")
+
+        summary = stats.snapshot()["get_stock_ohlcv"]
+
+        assert summary["count"] == 1
+        assert summary["errors"] == 1
+        assert summary["rejected"] == 1
+
+    def test_window_bounds_samples(self):
+        """Should compute percentiles over the most recent samples only."""
+        stats = ToolLatencyStats(window=2)
+        for latency in (10.0, 0.1, 0.1):
+            stats.record("tool", latency)
+
+        summary = stats.snapshot()["tool"]
+
+        assert summary["p99_ms"] == 100.0
+        assert summary["max_ms"] == 10000.0
+
+    def test_reset(self):
+        """Should clear all tools."""
+        stats = ToolLatencyStats()
+        stats.record("tool", 0.1)
+        stats.reset()
+
+        assert stats.snapshot() == {}
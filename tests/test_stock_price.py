@@ -1,10 +1,17 @@
 """Tests for stock price tools."""
 
+import json
 from unittest.mock import patch
 
 import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
 
-from pykrx_mcp.tools.stock_price import get_stock_ohlcv
+from pykrx_mcp.tools.stock_price import (
+    MAX_BATCH_TICKERS,
+    get_stock_ohlcv,
+    get_stock_ohlcv_batch,
+)
 
 
 class TestGetStockOHLCV:
@@ -111,3 +118,241 @@ class TestGetStockOHLCV:
             fromdate="20240101", todate="20240105", ticker="005930", adjusted=False
         )
         assert result["adjusted"] is False
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_columns_format(self, mock_stock):
+        """Should return column-oriented data when requested."""
+        mock_df = pd.DataFrame(
+            {"시가": [70000, 71000], "종가": [71000, 72000]},
+            index=pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        )
+        mock_stock.get_market_ohlcv_by_date.return_value = mock_df
+
+        result = get_stock_ohlcv(
+            "005930", "20240101", "20240105", response_format="columns"
+        )
+
+        assert result["data"]["columns"] == ["시가", "종가"]
+        assert result["data"]["index"] == ["2024-01-02", "2024-01-03"]
+        assert result["data"]["values"] == [[70000, 71000], [71000, 72000]]
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_invalid_response_format(self, mock_stock):
+        """Should reject unknown response formats before calling pykrx."""
+        result = get_stock_ohlcv(
+            "005930", "20240101", "20240105", response_format="xml"
+        )
+
+        assert "error" in result
+        mock_stock.get_market_ohlcv_by_date.assert_not_called()
+
+
+class TestGetStockOHLCVBatch:
+    """Test multi-ticker OHLCV retrieval tool."""
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_valid_request(self, mock_stock):
+        """Should return one entry per ticker."""
+        mock_stock.get_market_ohlcv_by_date.return_value = pd.DataFrame(
+            {"종가": [71000, 72000]}
+        )
+
+        result = get_stock_ohlcv_batch(["005930", "000660"], "20240101", "20240105")
+
+        assert result["ticker_count"] == 2
+        assert result["error_count"] == 0
+        assert set(result["results"]) == {"005930", "000660"}
+        assert result["results"]["000660"]["ticker"] == "000660"
+        assert mock_stock.get_market_ohlcv_by_date.call_count == 2
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_per_ticker_errors_isolated(self, mock_stock):
+        """Should report failing tickers without failing the batch."""
+
+        def fake_fetch(fromdate, todate, ticker, adjusted):
+            if ticker == "000660":
+                raise Exception("Network error")
+            return pd.DataFrame({"종가": [71000]})
+
+        mock_stock.get_market_ohlcv_by_date.side_effect = fake_fetch
+
+        result = get_stock_ohlcv_batch(
+            ["005930", "000660", "12345"], "20240101", "20240105"
+        )
+
+        assert "error" not in result
+        assert list(result["results"]) == ["005930"]
+        assert "Network error" in result["errors"]["000660"]
+        assert "6-digit" in result["errors"]["12345"]
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_duplicate_tickers(self, mock_stock):
+        """Should fetch each ticker only once."""
+        mock_stock.get_market_ohlcv_by_date.return_value = pd.DataFrame(
+            {"종가": [71000]}
+        )
+
+        result = get_stock_ohlcv_batch(["005930", "005930"], "20240101", "20240105")
+
+        assert result["ticker_count"] == 1
+        mock_stock.get_market_ohlcv_by_date.assert_called_once()
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_selection_per_ticker(self, mock_stock):
+        """Should apply the row and column selection to every ticker."""
+        mock_stock.get_market_ohlcv_by_date.return_value = pd.DataFrame(
+            {"종가": [71000, 73000, 72000], "거래량": [10, 30, 20]}
+        )
+
+        result = get_stock_ohlcv_batch(
+            ["005930", "000660"],
+            "20240101",
+            "20240105",
+            columns=["종가"],
+            sort_by="종가",
+            top_n=1,
+        )
+
+        for response in result["results"].values():
+            assert response["data"] == [{"index": 1, "종가": 73000}]
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_empty_tickers(self, mock_stock):
+        """Should reject an empty ticker list."""
+        result = get_stock_ohlcv_batch([], "20240101", "20240105")
+
+        assert "error" in result
+        mock_stock.get_market_ohlcv_by_date.assert_not_called()
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_too_many_tickers(self, mock_stock):
+        """Should reject batches above the ticker limit."""
+        tickers = [f"{i:06d}" for i in range(MAX_BATCH_TICKERS + 1)]
+
+        result = get_stock_ohlcv_batch(tickers, "20240101", "20240105")
+
+        assert "error" in result
+        mock_stock.get_market_ohlcv_by_date.assert_not_called()
+
+
+class TestStreamStockOHLCV:
+    """Test the REST streaming endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        from pykrx_mcp.rest_api import app
+
+        return TestClient(app)
+
+    @pytest.fixture
+    def mock_stock(self):
+        with patch("pykrx_mcp.tools.stock_price.stock") as mock_stock:
+            mock_stock.get_market_ohlcv_by_date.return_value = pd.DataFrame(
+                {"종가": [72000, 73000]},
+                index=pd.DatetimeIndex(["2024-01-02", "2024-01-03"], name="날짜"),
+            )
+            yield mock_stock
+
+    def test_ndjson(self, client, mock_stock):
+        """Should stream one JSON line per row for every ticker."""
+        response = client.post(
+            "/stream/get_stock_ohlcv",
+            json={
+                "tickers": ["005930", "000660"],
+                "start_date": "20240101",
+                "end_date": "20240105",
+                "batch_rows": 1,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["ticker"] for row in rows] == ["005930"] * 2 + ["000660"] * 2
+        assert rows[0] == {"ticker": "005930", "날짜": "2024-01-02", "종가": 72000}
+
+    def test_csv(self, client, mock_stock):
+        """Should stream CSV with a single header row."""
+        response = client.post(
+            "/stream/get_stock_ohlcv",
+            json={
+                "tickers": ["005930", "000660"],
+                "start_date": "20240101",
+                "end_date": "20240105",
+                "stream_format": "csv",
+                "columns": ["종가"],
+            },
+        )
+
+        assert response.status_code == 200
+        lines = response.text.splitlines()
+        assert lines[0] == "ticker,날짜,종가"
+        assert len(lines) == 5
+
+    def test_later_ticker_error(self, client, mock_stock):
+        """Should report a failing later ticker as an error line."""
+        frame = mock_stock.get_market_ohlcv_by_date.return_value
+        mock_stock.get_market_ohlcv_by_date.side_effect = [frame, pd.DataFrame()]
+
+        response = client.post(
+            "/stream/get_stock_ohlcv",
+            json={
+                "tickers": ["005930", "000660"],
+                "start_date": "20240101",
+                "end_date": "20240105",
+            },
+        )
+
+        last = json.loads(response.text.splitlines()[-1])
+        assert last["ticker"] == "000660"
+        assert "No data" in last["error"]
+
+    def test_first_ticker_error(self, client, mock_stock):
+        """Should report a failing first ticker like any other ticker."""
+        frame = mock_stock.get_market_ohlcv_by_date.return_value
+        mock_stock.get_market_ohlcv_by_date.side_effect = [pd.DataFrame(), frame]
+
+        response = client.post(
+            "/stream/get_stock_ohlcv",
+            json={
+                "tickers": ["005930", "000660"],
+                "start_date": "20240101",
+                "end_date": "20240105",
+            },
+        )
+
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert rows[0]["ticker"] == "005930"
+        assert "No data" in rows[0]["error"]
+        assert [row["ticker"] for row in rows[1:]] == ["000660"] * 2
+
+    def test_invalid_selection(self, client, mock_stock):
+        """Should reject a bad selection with 400 without fetching."""
+        for selection in ({"columns": ["없는열"]}, {"where": ["종가 ~ 1"]}):
+            response = client.post(
+                "/stream/get_stock_ohlcv",
+                json={
+                    "tickers": ["005930", "000660"],
+                    "start_date": "20240101",
+                    "end_date": "20240105",
+                    **selection,
+                },
+            )
+            assert response.status_code == 400
+        mock_stock.get_market_ohlcv_by_date.assert_not_called()
+
+    def test_invalid_request(self, client, mock_stock):
+        """Should answer invalid arguments with 400 before streaming."""
+        for body in (
+            {"tickers": [], "start_date": "20240101", "end_date": "20240105"},
+            {
+                "tickers": ["005930"],
+                "start_date": "20240101",
+                "end_date": "20240105",
+                "stream_format": "xml",
+            },
+            {"tickers": ["005930"], "start_date": "2024-01-01", "end_date": "20240105"},
+        ):
+            response = client.post("/stream/get_stock_ohlcv", json=body)
+            assert response.status_code == 400
@@ -0,0 +1,183 @@
+"""Tests for the local Parquet market-data store."""
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from pykrx_mcp.utils import store as store_module  # noqa: E402
+from pykrx_mcp.utils.cache import cached_call, configure_disk_cache  # noqa: E402
+from pykrx_mcp.utils.store import (  # noqa: E402
+    MarketStore,
+    configure_market_store,
+    snapshot_frame,
+)
+
+
+def ohlcv_snapshot(close: int) -> pd.DataFrame:
+    """Build a two-ticker full-market OHLCV snapshot."""
+    df = pd.DataFrame(
+        {
+            "시가": [close, close * 2],
+            "고가": [close, close * 2],
+            "저가": [close, close * 2],
+            "종가": [close, close * 2],
+            "거래량": [100, 200],
+            "거래대금": [close * 100, close * 400],
+            "등락률": [0.5, -0.5],
+            "시가총액": [close * 1000, close * 4000],
+        },
+        index=pd.Index(["005930", "000660"], name="티커"),
+    )
+    return df
+
+
+@pytest.fixture
+def market_store(tmp_path):
+    """Store holding OHLCV for 2024-01-02/03 (KOSPI), covering early January."""
+    market_store = MarketStore(tmp_path)
+    market_store.write_days(
+        "ohlcv",
+        {
+            "20240102": snapshot_frame(ohlcv_snapshot(100), "20240102", "KOSPI"),
+            "20240103": snapshot_frame(ohlcv_snapshot(110), "20240103", "KOSPI"),
+        },
+    )
+    market_store.extend_coverage("ohlcv", "20240101", "20240105")
+    return market_store
+
+
+class TestCoverage:
+    """Test manifest bookkeeping."""
+
+    def test_empty_store(self, tmp_path):
+        """Should report no coverage before ingestion."""
+        assert MarketStore(tmp_path).coverage("ohlcv") is None
+
+    def test_extend_contiguous(self, market_store):
+        """Should merge adjacent ranges."""
+        market_store.extend_coverage("ohlcv", "20240106", "20240110")
+
+        assert market_store.coverage("ohlcv") == ("20240101", "20240110")
+
+    def test_reject_gap(self, market_store):
+        """Should refuse ranges that would leave a hole."""
+        with pytest.raises(ValueError):
+            market_store.extend_coverage("ohlcv", "20240201", "20240210")
+
+
+class TestReads:
+    """Test range and snapshot reads."""
+
+    def test_read_ticker(self, market_store):
+        """Should return one ticker's rows indexed by date."""
+        df = market_store.read_ticker("ohlcv", "005930", "20240101", "20240105")
+
+        assert list(df.index) == [
+            pd.Timestamp("2024-01-02"),
+            pd.Timestamp("2024-01-03"),
+        ]
+        assert list(df.columns) == [
+            "시가",
+            "고가",
+            "저가",
+            "종가",
+            "거래량",
+            "거래대금",
+            "등락률",
+        ]
+        assert list(df["종가"]) == [100, 110]
+
+    def test_read_ticker_outside_coverage(self, market_store):
+        """Should miss when the range is not fully ingested."""
+        assert (
+            market_store.read_ticker("ohlcv", "005930", "20240101", "20240110") is None
+        )
+
+    def test_read_snapshot(self, market_store):
+        """Should return a full-market snapshot indexed by ticker."""
+        df = market_store.read_snapshot("ohlcv", "20240103", "KOSPI")
+
+        assert set(df.index) == {"005930", "000660"}
+        assert df.loc["000660", "종가"] == 220
+        assert "시장" not in df.columns
+
+    def test_rewrite_replaces_day(self, market_store):
+        """Should replace rows when a day is ingested again."""
+        market_store.write_days(
+            "ohlcv",
+            {"20240102": snapshot_frame(ohlcv_snapshot(999), "20240102", "KOSPI")},
+        )
+
+        df = market_store.read_ticker("ohlcv", "005930", "20240102", "20240102")
+        assert list(df["종가"]) == [999]
+
+
+class TestLookup:
+    """Test mapping of pykrx calls onto the store."""
+
+    def test_unadjusted_range(self, market_store):
+        """Should serve unadjusted single-ticker OHLCV."""
+        df = market_store.lookup(
+            "get_market_ohlcv_by_date",
+            (),
+            {
+                "fromdate": "20240101",
+                "todate": "20240105",
+                "ticker": "005930",
+                "adjusted": False,
+            },
+        )
+
+        assert len(df) == 2
+
+    def test_adjusted_range_not_served(self, market_store):
+        """Should leave adjusted prices to pykrx."""
+        df = market_store.lookup(
+            "get_market_ohlcv_by_date",
+            (),
+            {"fromdate": "20240101", "todate": "20240105", "ticker": "005930"},
+        )
+
+        assert df is None
+
+    def test_snapshot_positional(self, market_store):
+        """Should serve full-market snapshot calls."""
+        df = market_store.lookup("get_market_ohlcv", ("20240102",), {"market": "KOSPI"})
+
+        assert len(df) == 2
+
+    def test_unsupported_function(self, market_store):
+        """Should ignore functions the store does not hold."""
+        assert market_store.lookup("get_index_ohlcv", ("20240102",), {}) is None
+
+
+class TestCachedCallIntegration:
+    """Test that cached_call reads the store first."""
+
+    def test_served_without_upstream(self, market_store):
+        """Should not call pykrx for covered queries."""
+        configure_disk_cache(None)
+        configure_market_store(market_store.root)
+        module = MagicMock()
+
+        try:
+            df = cached_call(module, "get_market_ohlcv", "20240102", market="KOSPI")
+        finally:
+            configure_market_store(None)
+
+        assert len(df) == 2
+        module.get_market_ohlcv.assert_not_called()
+
+    def test_missing_pyarrow_disables_store(self, tmp_path, monkeypatch):
+        """Should fall back to live data when pyarrow is unavailable."""
+        monkeypatch.setenv("PYKRX_MCP_STORE_DIR", str(tmp_path))
+        monkeypatch.setattr(store_module, "_market_store", store_module._UNSET)
+        monkeypatch.setattr(store_module.importlib.util, "find_spec", lambda name: None)
+
+        try:
+            assert store_module.get_market_store() is None
+        finally:
+            configure_market_store(None)
@@ -2,10 +2,15 @@
 
 from unittest.mock import patch
 
+import pytest
+
 from pykrx_mcp.tools.ticker_info import (
     get_market_ticker_list,
     get_market_ticker_name,
+    get_ticker_info,
+    search_tickers,
 )
+from pykrx_mcp.utils.ticker_master import TickerEntry, TickerMaster, set_ticker_master
 
 
 class TestGetMarketTickerList:
@@ -101,3 +106,78 @@ class TestGetMarketTickerName:
 
         assert "error" in result
         assert "not found" in result["error"]
+
+
+@pytest.fixture
+def loaded_master():
+    """Install a small shared ticker master."""
+    master = TickerMaster(
+        [
+            TickerEntry("005930", "삼성전자", "KOSPI"),
+            TickerEntry("005935", "삼성전자우", "KOSPI"),
+            TickerEntry("035720", "카카오", "KOSPI", listed=False),
+        ],
+        "20240105",
+    )
+    set_ticker_master(master)
+    with patch("pykrx_mcp.tools.ticker_info.get_ticker_master", return_value=master):
+        yield master
+    set_ticker_master(None)
+
+
+class TestSearchTickers:
+    """Test name search over the ticker master."""
+
+    @patch("pykrx_mcp.tools.ticker_info.stock")
+    def test_search(self, mock_stock, loaded_master):
+        """Should return ranked matches without upstream calls."""
+        result = search_tickers("삼성")
+
+        assert result["count"] == 2
+        assert result["results"][0]["ticker"] == "005930"
+        assert result["results"][0]["match"] == "prefix"
+        mock_stock.get_market_ticker_name.assert_not_called()
+
+    def test_delisted_excluded_by_default(self, loaded_master):
+        """Should only include delisted companies on request."""
+        assert search_tickers("카카오")["count"] == 0
+        result = search_tickers("카카오", include_delisted=True)
+        assert result["results"][0]["listed"] is False
+
+    def test_market_case_insensitive(self, loaded_master):
+        """Should accept lower-case market names like the other tools."""
+        result = search_tickers("삼성", market="kospi")
+
+        assert result["market"] == "KOSPI"
+        assert result["count"] == 2
+
+    def test_invalid_arguments(self, loaded_master):
+        """Should reject empty queries, unknown markets and bad limits."""
+        assert "error" in search_tickers("  ")
+        assert "error" in search_tickers("삼성", market="NYSE")
+        assert "error" in search_tickers("삼성", limit=0)
+
+
+class TestGetTickerInfo:
+    """Test ticker master lookups."""
+
+    def test_known_ticker(self, loaded_master):
+        """Should return name, market and listing status."""
+        result = get_ticker_info("035720")
+
+        assert result["name"] == "카카오"
+        assert result["market"] == "KOSPI"
+        assert result["listed"] is False
+        assert result["master_date"] == "20240105"
+
+    def test_unknown_ticker(self, loaded_master):
+        """Should report tickers missing from the master."""
+        assert "not found" in get_ticker_info("999999")["error"]
+
+    @patch("pykrx_mcp.tools.ticker_info.stock")
+    def test_ticker_name_served_from_master(self, mock_stock, loaded_master):
+        """Should answer get_market_ticker_name from a loaded master."""
+        result = get_market_ticker_name("005935")
+
+        assert result == {"ticker": "005935", "name": "삼성전자우"}
+        mock_stock.get_market_ticker_name.assert_not_called()
@@ -0,0 +1,148 @@
+"""Tests for the in-memory ticker master."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pykrx_mcp.utils import cache, ticker_master
+from pykrx_mcp.utils.ticker_master import (
+    TickerEntry,
+    TickerMaster,
+    build_ticker_master,
+    chosung,
+    get_ticker_master,
+    set_ticker_master,
+)
+
+LISTINGS = {
+    "KOSPI": {"005930": "삼성전자", "005935": "삼성전자우", "000660": "SK하이닉스"},
+    "KOSDAQ": {"035720": "카카오게임즈", "247540": "에코프로비엠"},
+    "KONEX": {},
+}
+
+
+def fake_stock(listings=LISTINGS):
+    names = {t: n for market in listings.values() for t, n in market.items()}
+    stock = MagicMock()
+    stock.get_market_ticker_list.side_effect = lambda date, market: list(
+        listings[market]
+    )
+    stock.get_market_ticker_name.side_effect = names.get
+    return stock
+
+
+@pytest.fixture
+def master():
+    return build_ticker_master(fake_stock(), "20240105")
+
+
+@pytest.fixture
+def shared_master(monkeypatch, tmp_path):
+    """Reset the shared master and persist it under tmp_path."""
+    monkeypatch.setenv("PYKRX_MCP_TICKER_MASTER_PATH", str(tmp_path / "master.json"))
+    set_ticker_master(None)
+    with patch(
+        "pykrx_mcp.utils.ticker_master.resolve_trading_date",
+        return_value=("20240105", None),
+    ):
+        yield
+    set_ticker_master(None)
+
+
+class TestTickerMaster:
+    """Test lookups and search."""
+
+    def test_lookup(self, master):
+        """Should map tickers to names and markets both ways."""
+        assert master.get("000660") == TickerEntry("000660", "SK하이닉스", "KOSPI")
+        assert master.lookup_name("sk 하이닉스")[0].ticker == "000660"
+        assert master.get("999999") is None
+
+    def test_search_ranks_exact_then_prefix(self, master):
+        """Should rank the exact name above longer prefix matches."""
+        results = master.search("삼성전자")
+        assert [(e.ticker, match) for e, match, _ in results] == [
+            ("005930", "exact"),
+            ("005935", "prefix"),
+        ]
+
+    def test_search_substring_and_market(self, master):
+        """Should match inside names and filter by market."""
+        assert [e.ticker for e, _, _ in master.search("하이닉스")] == ["000660"]
+        assert master.search("하이닉스", market="KOSDAQ") == []
+
+    def test_search_chosung(self, master):
+        """Should match Korean initial consonants."""
+        assert chosung("삼성전자") == "ㅅㅅㅈㅈ"
+        results = master.search("ㅇㅋㅍㄹ")
+        assert [(e.ticker, match) for e, match, _ in results] == [("247540", "chosung")]
+
+    def test_search_fuzzy(self, master):
+        """Should tolerate small misspellings."""
+        results = master.search("에코프로빔")
+        assert results[0][0].ticker == "247540"
+        assert results[0][1] == "fuzzy"
+
+    def test_delisted_carried_over(self, master):
+        """Should keep tickers that left the lists as delisted."""
+        listings = {**LISTINGS, "KOSDAQ": {"035720": "카카오게임즈"}}
+        rebuilt = build_ticker_master(fake_stock(listings), "20240108", master)
+
+        assert rebuilt.get("247540").listed is False
+        assert rebuilt.search("에코프로비엠") == []
+        assert (
+            rebuilt.search("에코프로비엠", include_delisted=True)[0][0].listed is False
+        )
+
+    def test_build_uses_disk_cache(self, tmp_path):
+        """Should fetch ticker lists, but not names, through the disk cache."""
+        listings = {**LISTINGS, "KONEX": {"217320": "선진뷰티사이언스"}}
+        cache.configure_disk_cache(tmp_path)
+        try:
+            build_ticker_master(fake_stock(listings), "20240105")
+            stock = fake_stock(listings)
+            rebuilt = build_ticker_master(stock, "20240105")
+        finally:
+            cache.configure_disk_cache(None)
+
+        assert rebuilt.get("005930").name == "삼성전자"
+        stock.get_market_ticker_list.assert_not_called()
+        assert stock.get_market_ticker_name.call_count == 6
+        assert len(list(tmp_path.glob("*/*.pkl"))) == 3
+
+    def test_json_round_trip(self, master):
+        """Should serialize and restore all entries."""
+        restored = TickerMaster.from_json(master.to_json())
+        assert restored.date == "20240105"
+        assert restored.by_ticker == master.by_ticker
+
+
+class TestSharedMaster:
+    """Test the once-per-day shared master."""
+
+    def test_built_once_and_persisted(self, shared_master, tmp_path):
+        """Should build once per day and reload from disk."""
+        stock = fake_stock()
+
+        first = get_ticker_master(stock)
+        assert get_ticker_master(stock) is first
+        assert stock.get_market_ticker_list.call_count == 3
+        assert (tmp_path / "master.json").exists()
+
+        set_ticker_master(None)
+        reloaded = get_ticker_master(stock)
+        assert reloaded.get("005930").name == "삼성전자"
+        assert stock.get_market_ticker_list.call_count == 3
+
+    def test_falls_back_to_previous_session(self, shared_master):
+        """Should use the previous session while today's lists are empty."""
+        stock = fake_stock()
+        stock.get_market_ticker_list.side_effect = lambda date, market: (
+            [] if date == "20240105" else list(LISTINGS[market])
+        )
+
+        master = get_ticker_master(stock)
+
+        assert master.date == "20240105"
+        assert len(master) == 5
+        assert ticker_master.peek_ticker_master() is master
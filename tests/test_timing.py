@@ -0,0 +1,89 @@
+"""Tests for per-stage tool call timing."""
+
+from unittest.mock import patch
+
+import pandas as pd
+
+from pykrx_mcp.tools.stock_price import get_stock_ohlcv
+from pykrx_mcp.utils.decorators import mcp_tool_error_handler
+from pykrx_mcp.utils.metrics import registry, render_metrics
+from pykrx_mcp.utils.timing import StageTimer, stage, start_timer, stop_timer
+
+
+class TestStageTimer:
+    """Test span bookkeeping."""
+
+    def test_nested_spans_are_exclusive(self):
+        """Should not count a child span's time in its parent stage."""
+        timer = StageTimer()
+        timer.start("validate")
+        timer.start("fetch")
+        timer.stop()
+        timer.stop()
+
+        stages = timer.finish(total=10.0)
+
+        assert set(stages) == {"validate", "fetch", "other"}
+        assert sum(stages.values()) == 10.0
+        assert stages["validate"] < stages["other"]
+
+    def test_stage_outside_tool_call_is_noop(self):
+        """Should record nothing when no timer is active."""
+        with stage("fetch"):
+            pass
+
+        timer, token = start_timer()
+        stop_timer(token)
+        with stage("fetch"):
+            pass
+
+        assert timer.stages == {}
+
+
+class TestTimingField:
+    """Test the _timing debug field."""
+
+    def test_absent_by_default(self, monkeypatch):
+        """Should not add _timing unless PYKRX_MCP_TIMING is set."""
+        monkeypatch.delenv("PYKRX_MCP_TIMING", raising=False)
+
+        @mcp_tool_error_handler
+        def sample_tool() -> dict:
+            return {"data": []}
+
+        assert sample_tool() == {"data": []}
+
+    @patch("pykrx_mcp.tools.stock_price.stock")
+    def test_reports_stages(self, mock_stock, monkeypatch):
+        """Should report validate, fetch, transform and size accounting stages."""
+        monkeypatch.setenv("PYKRX_MCP_TIMING", "1")
+        monkeypatch.setenv("PYKRX_MCP_METRICS_SIZE_SAMPLE", "1")
+        mock_stock.get_market_ohlcv_by_date.return_value = pd.DataFrame(
+            {"종가": [70000, 71000]},
+            index=pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        )
+
+        result = get_stock_ohlcv("005930", "20240102", "20240103")
+
+        timing = result["_timing"]
+        assert {"validate", "fetch", "transform", "size_accounting", "other"} <= set(
+            timing["stages_ms"]
+        )
+        assert abs(sum(timing["stages_ms"].values()) - timing["total_ms"]) < 0.01
+
+    def test_stage_histogram(self):
+        """Should record stage durations in the metrics histogram."""
+        registry.reset()
+
+        @mcp_tool_error_handler
+        def sample_tool() -> dict:
+            with stage("fetch"):
+                return {"data": []}
+
+        sample_tool()
+
+        text = render_metrics()
+        assert (
+            'pykrx_mcp_tool_stage_seconds_count{stage="fetch",tool="sample_tool"} 1'
+            in text
+        )
@@ -0,0 +1,135 @@
+"""Tests for the KRX trading-calendar index."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from pykrx_mcp.tools.market_data import get_market_ohlcv_by_date
+from pykrx_mcp.tools.shorting import get_shorting_volume_top50
+from pykrx_mcp.utils.trading_calendar import (
+    TradingCalendar,
+    configure_trading_calendar,
+    resolve_trading_date,
+)
+
+
+@pytest.fixture
+def calendar():
+    """Fresh shared calendar with 2024-01-01 (Mon) known as a holiday."""
+    calendar = configure_trading_calendar(None)
+    calendar.record(
+        "20240101", "20240105", ["20240102", "20240103", "20240104", "20240105"]
+    )
+    yield calendar
+    configure_trading_calendar(None)
+
+
+class TestTradingCalendar:
+    """Test the calendar index."""
+
+    def test_status(self, calendar):
+        """Should know weekends, recorded holidays and trading days."""
+        assert calendar.status("20240106") is False  # Saturday
+        assert calendar.status("20240101") is False
+        assert calendar.status("20240102") is True
+        assert calendar.status("20240108") is None
+
+    def test_record_leaves_today_unknown(self):
+        """Should not record closures for today or later."""
+        calendar = TradingCalendar()
+        with patch("pykrx_mcp.utils.trading_calendar._today", return_value="20240103"):
+            calendar.record("20240101", "20240105", ["20240102"])
+            calendar.mark("20240104", False)
+
+        assert calendar.status("20240101") is False
+        assert calendar.status("20240103") is None
+        assert calendar.status("20240104") is None
+
+    def test_persistence(self, tmp_path):
+        """Should reload recorded days from its JSON file."""
+        path = tmp_path / "calendar.json"
+        TradingCalendar(path).record("20240101", "20240105", ["20240102"])
+
+        reloaded = TradingCalendar(path)
+        assert reloaded.status("20240101") is False
+        assert reloaded.status("20240102") is True
+
+    def test_previous_trading_day(self, calendar):
+        """Should walk back over weekends and known holidays."""
+        assert calendar.previous_trading_day("20240102") == "20231229"
+        assert calendar.previous_trading_day("20240108") == "20240105"
+
+    def test_expected_sessions(self, calendar):
+        """Should count sessions only for fully known ranges."""
+        assert calendar.expected_sessions("20240101", "20240107") == 4
+        assert calendar.expected_sessions("20240101", "20240110") is None
+
+
+class TestResolveTradingDate:
+    """Test single-date resolution."""
+
+    def test_trading_and_unknown_days_pass(self, calendar):
+        """Should pass trading days and unobserved weekdays through."""
+        assert resolve_trading_date(None, "20240102") == ("20240102", None)
+        assert resolve_trading_date(None, "20240108") == ("20240108", None)
+
+    def test_closed_day_rejected(self, calendar):
+        """Should reject closed days with a hint."""
+        date, msg = resolve_trading_date(None, "20240106")
+        assert date is None
+        assert "not a KRX trading day" in msg
+        assert "20240105" in msg
+
+    def test_closed_day_snapped(self, calendar):
+        """Should snap to the previous session when asked."""
+        assert resolve_trading_date(None, "20240107", snap=True) == ("20240105", None)
+
+    def test_month_lookup(self, calendar, monkeypatch):
+        """Should look up unknown months when fetching is enabled."""
+        monkeypatch.setenv("PYKRX_MCP_CALENDAR_FETCH", "1")
+
+        class FakeStock:
+            calls = 0
+
+            def get_previous_business_days(self, fromdate, todate):
+                FakeStock.calls += 1
+                return [datetime(2024, 2, 8), datetime(2024, 2, 13)]
+
+        date, msg = resolve_trading_date(FakeStock(), "20240209")
+        assert date is None and "20240208" in msg
+        assert resolve_trading_date(FakeStock(), "20240212", snap=True) == (
+            "20240208",
+            None,
+        )
+        assert FakeStock.calls == 1
+
+
+class TestSingleDateTools:
+    """Test calendar checks in the single-date tools."""
+
+    @patch("pykrx_mcp.tools.market_data.stock")
+    def test_weekend_rejected_without_scrape(self, mock_stock, calendar):
+        """Should answer weekends without calling pykrx."""
+        result = get_market_ohlcv_by_date("20240106", "KOSPI")
+
+        assert "not a KRX trading day" in result["error"]
+        mock_stock.get_market_ohlcv.assert_not_called()
+
+    @patch("pykrx_mcp.tools.shorting.stock")
+    def test_snap_to_trading_day(self, mock_stock, calendar):
+        """Should query the previous session and report both dates."""
+        mock_stock.get_shorting_volume_top50.return_value = pd.DataFrame(
+            {"순위": [1]}, index=["005930"]
+        )
+
+        result = get_shorting_volume_top50(
+            "20240101", "KOSPI", snap_to_trading_day=True
+        )
+
+        assert result["date"] == "20231229"
+        assert result["requested_date"] == "20240101"
+        mock_stock.get_shorting_volume_top50.assert_called_once_with(
+            "20231229", "KOSPI"
+        )
@@ -1,6 +1,10 @@
 """Tests for input validators."""
 
-from pykrx_mcp.utils.validators import validate_date_format, validate_ticker_format
+from pykrx_mcp.utils.validators import (
+    validate_date_format,
+    validate_response_format,
+    validate_ticker_format,
+)
 
 
 class TestValidateDateFormat:
@@ -100,3 +104,24 @@ class TestValidateTickerFormat:
         """Tickers with leading zeros should be preserved."""
         valid, _ = validate_ticker_format("000001")
         assert valid
+
+
+class TestValidateResponseFormat:
+    """Test response format validation."""
+
+    def test_none_uses_default(self):
+        """None should pass (tool default applies)."""
+        valid, _ = validate_response_format(None)
+        assert valid
+
+    def test_known_formats(self):
+        """Supported formats should pass case-insensitively."""
+        for fmt in ("records", "table", "both", "columns", "TABLE"):
+            valid, _ = validate_response_format(fmt)
+            assert valid
+
+    def test_unknown_format(self):
+        """Unknown formats should fail."""
+        valid, msg = validate_response_format("xml")
+        assert not valid
+        assert "xml" in msg
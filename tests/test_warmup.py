@@ -0,0 +1,153 @@
+"""Tests for the start-up cache warm-up."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from pykrx_mcp import warmup
+from pykrx_mcp.warmup import (
+    KST,
+    WarmupState,
+    health_status,
+    latest_trading_day,
+    run_warmup,
+    start_warmup,
+)
+
+
+@pytest.fixture
+def fake_tools():
+    """Tool stand-ins returning small successful responses."""
+    fake = MagicMock()
+    fake.get_market_ohlcv_by_date.return_value = {"row_count": 2}
+    fake.get_market_ticker_list.side_effect = lambda date, market: (
+        {"tickers": ["005930", "000660"]}
+        if market == "KOSPI"
+        else {"error": f"No tickers found for {market}"}
+    )
+    fake.get_index_ticker_list.return_value = {"data": ["1001"]}
+    fake.get_index_ticker_name.return_value = {"name": "코스피"}
+    fake.get_index_portfolio_deposit_file.return_value = {"count": 1}
+    with (
+        patch("pykrx_mcp.warmup.tools", fake),
+        patch("pykrx_mcp.warmup.get_ticker_master") as get_ticker_master,
+    ):
+        fake.get_ticker_master = get_ticker_master
+        yield fake
+
+
+@pytest.fixture
+def fake_stock():
+    stock = MagicMock()
+    stock.get_nearest_business_day_in_a_week.return_value = "20240105"
+    return stock
+
+
+class TestLatestTradingDay:
+    """Test latest settled trading day lookup."""
+
+    def test_after_close_uses_today(self, fake_stock):
+        """Should look up from today once the session has settled."""
+        now = datetime(2024, 1, 5, 19, tzinfo=KST)
+        assert latest_trading_day(fake_stock, now) == "20240105"
+        fake_stock.get_nearest_business_day_in_a_week.assert_called_with("20240105")
+
+    def test_before_close_uses_yesterday(self, fake_stock):
+        """Should look up from yesterday before the session settles."""
+        now = datetime(2024, 1, 5, 10, tzinfo=KST)
+        latest_trading_day(fake_stock, now)
+        fake_stock.get_nearest_business_day_in_a_week.assert_called_with("20240104")
+
+
+class TestRunWarmup:
+    """Test the warm-up sequence."""
+
+    def test_prefetches_latest_day(self, fake_tools, fake_stock):
+        """Should prefetch OHLCV, listings, the ticker master and constituents."""
+        state = WarmupState()
+        with patch.dict("os.environ", {"PYKRX_MCP_WARMUP_INDICES": "1001,2001"}):
+            run_warmup(state, fake_stock)
+
+        fake_tools.get_market_ohlcv_by_date.assert_called_once_with("20240105", "ALL")
+        assert fake_tools.get_market_ticker_list.call_count == 3
+        fake_tools.get_ticker_master.assert_called_once_with(fake_stock)
+        assert fake_tools.get_index_ticker_list.call_count == 2
+        assert fake_tools.get_index_portfolio_deposit_file.call_count == 2
+
+        snapshot = state.snapshot()
+        assert snapshot["status"] == "complete"
+        assert snapshot["date"] == "20240105"
+        # KOSDAQ and KONEX listings returned errors
+        assert snapshot["error_count"] == 2
+        assert state.ready()
+
+    def test_failures_do_not_block_readiness(self, fake_tools, fake_stock):
+        """Should finish (and become ready) even if steps raise."""
+        fake_tools.get_market_ohlcv_by_date.side_effect = RuntimeError("KRX down")
+        fake_stock.get_nearest_business_day_in_a_week.side_effect = RuntimeError(
+            "KRX down"
+        )
+        state = WarmupState()
+
+        run_warmup(state, fake_stock)
+
+        assert state.ready()
+        assert state.snapshot()["error_count"] == 1
+
+
+class TestHealth:
+    """Test readiness reporting."""
+
+    def test_disabled_is_ready(self):
+        """Should report healthy when warm-up is disabled."""
+        with patch.object(warmup, "warmup_state", WarmupState()):
+            status_code, body = health_status()
+        assert status_code == 200
+        assert body["warmup"] == {"status": "disabled"}
+
+    def test_running_is_not_ready(self):
+        """Should report 503 while warm-up runs."""
+        state = WarmupState()
+        state.start()
+        with patch.object(warmup, "warmup_state", state):
+            status_code, body = health_status()
+        assert status_code == 503
+        assert body["status"] == "warming_up"
+
+    def test_rest_health_endpoint(self):
+        """Should expose readiness on the REST /health endpoint."""
+        from pykrx_mcp.rest_api import app
+
+        state = WarmupState()
+        state.start()
+        client = TestClient(app)
+        with patch.object(warmup, "warmup_state", state):
+            assert client.get("/health").status_code == 503
+            state.finish()
+            response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["warmup"]["status"] == "complete"
+
+
+class TestStartWarmup:
+    """Test background start-up."""
+
+    def test_disabled_by_default(self):
+        """Should not start without PYKRX_MCP_WARMUP."""
+        with patch.dict("os.environ", {}, clear=True):
+            assert start_warmup(WarmupState()) is None
+
+    def test_starts_thread(self):
+        """Should mark the state running before the thread finishes."""
+        state = WarmupState()
+        with (
+            patch.dict("os.environ", {"PYKRX_MCP_WARMUP": "1"}),
+            patch("pykrx_mcp.warmup.run_warmup") as mock_run,
+        ):
+            thread = start_warmup(state)
+            thread.join(timeout=5)
+
+        assert state.status == "running"
+        mock_run.assert_called_once_with(state)